@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import ChainMap, defaultdict, deque
+from copy import copy
 from dataclasses import asdict, dataclass
 from os import getenv
 from textwrap import dedent
@@ -32,11 +33,15 @@ from globalgenie.exceptions import ModelProviderError, StopAgentRun
 from globalgenie.knowledge.agent import AgentKnowledge
 from globalgenie.media import Audio, AudioArtifact, AudioResponse, File, Image, ImageArtifact, Video, VideoArtifact
 from globalgenie.memory.agent import AgentMemory, AgentRun
+from globalgenie.memory.v2.context import ContextManager
 from globalgenie.memory.v2.memory import Memory, SessionSummary
+from globalgenie.memory.v2.pipeline import MemoryPipeline
 from globalgenie.memory.v2.schema import UserMemory
 from globalgenie.models.base import Model
+from globalgenie.models.cache.base import ResponseCache
 from globalgenie.models.message import Citations, Message, MessageMetrics, MessageReferences
 from globalgenie.models.response import ModelResponse, ModelResponseEvent, ToolExecution
+from globalgenie.reasoning.cache import ReasoningCache, ReasoningTrace
 from globalgenie.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from globalgenie.run.base import RunResponseExtraData, RunStatus
 from globalgenie.run.messages import RunMessages
@@ -99,6 +104,8 @@ class Agent:
     # --- Agent settings ---
     # Model for this Agent
     model: Optional[Model] = None
+    # Reuse Model responses for identical or semantically similar requests
+    response_cache: Optional[ResponseCache] = None
     # Agent name
     name: Optional[str] = None
     # Agent UUID (autogenerated if not set)
@@ -150,6 +157,8 @@ class Agent:
     num_history_responses: Optional[int] = None
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
+    # Keeps the history within a token budget, dropping or summarizing the oldest turns
+    context_manager: Optional[ContextManager] = None
 
     # --- Agent Knowledge ---
     knowledge: Optional[AgentKnowledge] = None
@@ -198,6 +207,8 @@ class Agent:
     reasoning_agent: Optional[Agent] = None
     reasoning_min_steps: int = 1
     reasoning_max_steps: int = 10
+    # Reuse reasoning steps for repeated or near-identical user inputs
+    reasoning_cache: Optional[ReasoningCache] = None
 
     # --- Default tools ---
     # Add a tool that allows the Model to read the chat history.
@@ -243,6 +254,9 @@ class Agent:
     timezone_identifier: Optional[str] = None
     # If True, add the session state variables in the user and system messages
     add_state_in_messages: bool = False
+    # If True, the system message is laid out as a static prefix followed by the content that changes between runs
+    # (datetime, location, memories and session summaries), so providers can cache the prefix
+    cache_system_prefix: bool = False
 
     # --- Extra Messages ---
     # A list of extra messages added after the system message and before the user message.
@@ -344,6 +358,7 @@ class Agent:
         self,
         *,
         model: Optional[Model] = None,
+        response_cache: Optional[ResponseCache] = None,
         name: Optional[str] = None,
         agent_id: Optional[str] = None,
         introduction: Optional[str] = None,
@@ -366,6 +381,7 @@ class Agent:
         add_history_to_messages: bool = False,
         num_history_responses: Optional[int] = None,
         num_history_runs: int = 3,
+        context_manager: Optional[ContextManager] = None,
         knowledge: Optional[AgentKnowledge] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         enable_agentic_knowledge_filters: Optional[bool] = None,
@@ -384,6 +400,7 @@ class Agent:
         reasoning_agent: Optional[Agent] = None,
         reasoning_min_steps: int = 1,
         reasoning_max_steps: int = 10,
+        reasoning_cache: Optional[ReasoningCache] = None,
         read_chat_history: bool = False,
         search_knowledge: bool = True,
         update_knowledge: bool = False,
@@ -403,6 +420,7 @@ class Agent:
         add_location_to_instructions: bool = False,
         timezone_identifier: Optional[str] = None,
         add_state_in_messages: bool = False,
+        cache_system_prefix: bool = False,
         add_messages: Optional[List[Union[Dict, Message]]] = None,
         user_message: Optional[Union[List, Dict, str, Callable, Message]] = None,
         user_message_role: str = "user",
@@ -433,6 +451,7 @@ class Agent:
         telemetry: bool = True,
     ):
         self.model = model
+        self.response_cache = response_cache
         self.name = name
         self.agent_id = agent_id
         self.introduction = introduction
@@ -460,6 +479,7 @@ class Agent:
         self.add_history_to_messages = add_history_to_messages
         self.num_history_responses = num_history_responses
         self.num_history_runs = num_history_runs
+        self.context_manager = context_manager
 
         self.knowledge = knowledge
         self.knowledge_filters = knowledge_filters
@@ -482,6 +502,7 @@ class Agent:
         self.reasoning_agent = reasoning_agent
         self.reasoning_min_steps = reasoning_min_steps
         self.reasoning_max_steps = reasoning_max_steps
+        self.reasoning_cache = reasoning_cache
 
         self.read_chat_history = read_chat_history
         self.search_knowledge = search_knowledge
@@ -504,6 +525,7 @@ class Agent:
         self.add_location_to_instructions = add_location_to_instructions
         self.timezone_identifier = timezone_identifier
         self.add_state_in_messages = add_state_in_messages
+        self.cache_system_prefix = cache_system_prefix
         self.add_messages = add_messages
 
         self.user_message = user_message
@@ -574,6 +596,11 @@ class Agent:
 
         self._memory_deepcopy_done: bool = False
 
+        # Reasoning model and agent, reused across runs
+        self._reasoning_model: Optional[Model] = None
+        self._reasoning_model_source: Optional[Model] = None
+        self._reasoning_agent_cache: Optional[Tuple[Tuple[Any, ...], Agent]] = None
+
     def set_agent_id(self) -> str:
         if self.agent_id is None:
             self.agent_id = str(uuid4())
@@ -799,6 +826,7 @@ class Agent:
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
             response_format=response_format,
+            response_cache=self.response_cache,
         )
 
         # If a parser model is provided, structure the response separately
@@ -1217,6 +1245,7 @@ class Agent:
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
             response_format=response_format,
+            response_cache=self.response_cache,
         )
 
         # If a parser model is provided, structure the response separately
@@ -1488,8 +1517,10 @@ class Agent:
                     files=files,
                     messages=messages,
                     knowledge_filters=effective_filters,
+                    fit_history=False,
                     **kwargs,
                 )
+                await self.afit_run_history(run_messages, session_id=session_id)
                 if len(run_messages.messages) == 0:
                     log_error("No messages to be sent to the model.")
 
@@ -1851,6 +1882,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            response_cache=self.response_cache,
         )
 
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -2249,6 +2281,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            response_cache=self.response_cache,
         )
 
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -3026,6 +3059,7 @@ class Agent:
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
             stream_model_response=stream_model_response,
+            response_cache=self.response_cache,
         ):
             yield from self._handle_model_response_chunk(
                 run_response=run_response,
@@ -3093,6 +3127,7 @@ class Agent:
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
             stream_model_response=stream_model_response,
+            response_cache=self.response_cache,
         )  # type: ignore
 
         async for model_response_event in model_response_stream:  # type: ignore
@@ -3430,6 +3465,11 @@ class Agent:
         self.run_response = cast(RunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
 
+        # Hand off to the background pipeline, so the response does not wait for memories and summaries
+        if self.memory.pipeline is not None:
+            self._submit_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures = []
 
@@ -3503,6 +3543,12 @@ class Agent:
     ) -> AsyncIterator[RunResponseEvent]:
         self.run_response = cast(RunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
+
+        # Hand off to the background pipeline, so the response does not wait for memories and summaries
+        if self.memory.pipeline is not None:
+            self._submit_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         tasks = []
 
         # Create user memories from single message
@@ -3561,6 +3607,43 @@ class Agent:
                     create_memory_update_completed_event(from_run_response=self.run_response), self.run_response
                 )
 
+    def _submit_memories_and_summaries(
+        self,
+        run_messages: RunMessages,
+        session_id: str,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """Queue memory and summary creation on the memory pipeline"""
+        self.memory = cast(Memory, self.memory)
+        pipeline = cast(MemoryPipeline, self.memory.pipeline)
+
+        messages: List[Message] = []
+        if self.enable_user_memories:
+            if run_messages.user_message is not None:
+                user_message_str = run_messages.user_message.get_content_string()
+                if user_message_str:
+                    messages.append(Message(role="user", content=user_message_str))
+            for _im in run_messages.extra_messages or []:
+                if isinstance(_im, Message):
+                    messages.append(_im)
+                elif isinstance(_im, dict):
+                    try:
+                        messages.append(Message(**_im))
+                    except Exception as e:
+                        log_warning(f"Failed to validate message during memory update: {e}")
+                else:
+                    log_warning(f"Unsupported message type: {type(_im)}")
+
+        if messages or self.enable_session_summaries:
+            log_debug("Queueing memories and session summary on the memory pipeline.")
+            pipeline.submit(
+                memory=self.memory,
+                session_id=session_id,
+                user_id=user_id,
+                messages=messages,
+                create_summary=self.enable_session_summaries,
+            )
+
     def _raise_if_async_tools(self) -> None:
         """Raise an exception if any tools contain async functions"""
         if self.tools is None:
@@ -3780,6 +3863,19 @@ class Agent:
                         except Exception as e:
                             log_warning(f"Could not add tool {tool}: {e}")
 
+                # Add the functions to page through tool results that exceed their size limit
+                if any(func.result_policy is not None for func in self._functions_for_model.values()):
+                    from globalgenie.tools.result_policy import get_tool_result_functions
+
+                    for func in get_tool_result_functions():
+                        if func.name not in self._functions_for_model:
+                            func._agent = self
+                            if strict:
+                                func.strict = True
+                            self._functions_for_model[func.name] = func
+                            self._tools_for_model.append({"type": "function", "function": func.to_dict()})
+                            log_debug(f"Added tool {func.name}")
+
     def _model_should_return_structured_output(self):
         self.model = cast(Model, self.model)
         return bool(
@@ -3876,7 +3972,7 @@ class Agent:
             agent_data["model"] = self.model.to_dict()
         return agent_data
 
-    def get_session_data(self) -> Dict[str, Any]:
+    def get_session_data(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         session_data: Dict[str, Any] = {}
         if self.session_name is not None:
             session_data["session_name"] = self.session_name
@@ -3896,6 +3992,10 @@ class Agent:
             session_data["videos"] = [vid.to_dict() for vid in self.videos]  # type: ignore
         if self.audio is not None:
             session_data["audio"] = [aud.to_dict() for aud in self.audio]  # type: ignore
+        # Only persist the compressed history of this session, the context manager holds it for all sessions
+        session_id = session_id or self.session_id
+        if self.context_manager is not None and session_id in self.context_manager.summaries:
+            session_data["context_summaries"] = self.context_manager.to_dict(session_id=session_id)
         return session_data
 
     def get_agent_session(self, session_id: str, user_id: Optional[str] = None) -> AgentSession:
@@ -3933,7 +4033,7 @@ class Agent:
             workflow_session_id=self.workflow_session_id,
             memory=memory_dict,
             agent_data=self.get_agent_data(),
-            session_data=self.get_session_data(),
+            session_data=self.get_session_data(session_id=session_id),
             extra_data=self.extra_data,
             created_at=int(time()),
         )
@@ -4042,6 +4142,12 @@ class Agent:
                         self.audio = []
                     self.audio.extend([AudioArtifact.model_validate(aud) for aud in audio_from_db])
 
+            # Get the compressed history summaries from the database
+            if self.context_manager is not None and "context_summaries" in session.session_data:
+                context_summaries_from_db = session.session_data.get("context_summaries")
+                if context_summaries_from_db is not None and isinstance(context_summaries_from_db, dict):
+                    self.context_manager.load_summaries(context_summaries_from_db, session_id=session.session_id)
+
         # Read extra_data from the database
         if session.extra_data is not None:
             # If extra_data is set in the agent, update the database extra_data with the agent's extra_data
@@ -4418,6 +4524,8 @@ class Agent:
 
         # 3.2 Build a list of additional information for the system message
         additional_information: List[str] = []
+        # Information that changes between runs, kept out of the static prefix if cache_system_prefix is True
+        run_information: List[str] = additional_information if not self.cache_system_prefix else []
         # 3.2.1 Add instructions for using markdown
         if self.markdown and self.response_model is None:
             additional_information.append("Use markdown to format your answers.")
@@ -4437,7 +4545,7 @@ class Agent:
 
             time = datetime.now(tz) if tz else datetime.now()
 
-            additional_information.append(f"The current time is {time}.")
+            run_information.append(f"The current time is {time}.")
 
         # 3.2.3 Add the current location
         if self.add_location_to_instructions:
@@ -4449,7 +4557,7 @@ class Agent:
                     filter(None, [location.get("city"), location.get("region"), location.get("country")])
                 )
                 if location_str:
-                    additional_information.append(f"Your approximate location is: {location_str}.")
+                    run_information.append(f"Your approximate location is: {location_str}.")
 
         # 3.2.4 Add agent name if provided
         if self.name is not None and self.add_name_to_instructions:
@@ -4546,6 +4654,10 @@ class Agent:
             system_message_content += f"{self.success_criteria}\n"
             system_message_content += "</success_criteria>\n"
             system_message_content += "Stop running when the success_criteria is met.\n\n"
+        # Memories and summaries change between runs, so they are added after the static prefix
+        static_content = system_message_content
+        if self.cache_system_prefix:
+            system_message_content = ""
         # 3.3.10 Then add memories to the system prompt
         if self.memory:
             if isinstance(self.memory, AgentMemory) and self.memory.create_user_memories:
@@ -4629,6 +4741,11 @@ class Agent:
                         "You should ALWAYS prefer information from this conversation over the past summary.\n\n"
                     )
 
+        run_content = ""
+        if self.cache_system_prefix:
+            run_content = system_message_content
+            system_message_content = static_content
+
         # 3.3.12 Add the system message from the Model
         system_message_from_model = self.model.get_system_message_for_model(self._tools_for_model)
         if system_message_from_model is not None:
@@ -4650,6 +4767,25 @@ class Agent:
         if self.response_model is not None and self.parser_model is not None:
             system_message_content += f"{get_response_model_format_prompt(self.response_model)}"
 
+        # 3.3.15 Add the content that changes between runs after the static prefix
+        if self.cache_system_prefix:
+            static_prefix = system_message_content.strip()
+            if len(run_information) > 0:
+                run_content = (
+                    "<additional_information>"
+                    + "".join(f"\n- {_ri}" for _ri in run_information)
+                    + "\n</additional_information>\n\n"
+                    + run_content
+                )
+            system_message_content = "\n\n".join(part for part in (static_prefix, run_content.strip()) if part)
+            if not system_message_content:
+                return None
+            return Message(
+                role=self.system_message_role,
+                content=system_message_content,
+                cache_prefix_length=len(static_prefix),
+            )
+
         # Return the system message
         return (
             Message(role=self.system_message_role, content=system_message_content.strip())  # type: ignore
@@ -4818,6 +4954,31 @@ class Agent:
             **kwargs,
         )
 
+    async def afit_run_history(self, run_messages: RunMessages, session_id: str) -> None:
+        """Fit the history in run_messages within the token budget of the context manager, without blocking
+        the event loop when dropped turns are summarized. Used with get_run_messages(fit_history=False).
+        """
+        if self.context_manager is None:
+            return
+        history_positions = [i for i, msg in enumerate(run_messages.messages) if msg.from_history]
+        if len(history_positions) == 0:
+            return
+
+        if self.context_manager.summarize and self.model is not None:
+            self.context_manager.set_model(self.model)
+        model_id = self.model.id if self.model is not None else None
+        # The history directly follows the system message and extra messages
+        start, end = history_positions[0], history_positions[-1] + 1
+        reserved_tokens = sum(
+            self.context_manager.count_tokens(msg, model_id=model_id) for msg in run_messages.messages[:start]
+        )
+        run_messages.messages[start:end] = await self.context_manager.afit_history(
+            session_id=session_id,
+            history=run_messages.messages[start:end],
+            model_id=model_id,
+            reserved_tokens=reserved_tokens,
+        )
+
     def get_run_messages(
         self,
         *,
@@ -4830,6 +4991,7 @@ class Agent:
         files: Optional[Sequence[File]] = None,
         messages: Optional[Sequence[Union[Dict, Message]]] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
+        fit_history: bool = True,
         **kwargs: Any,
     ) -> RunMessages:
         """This function returns a RunMessages object with the following attributes:
@@ -4914,6 +5076,18 @@ class Agent:
                     agent_id=self.agent_id if self.team_session_id is not None else None,
                 )
 
+            # Fit the history within the token budget. Async runs fit it afterwards with afit_run_history.
+            if fit_history and self.context_manager is not None and len(history) > 0:
+                if self.context_manager.summarize and self.model is not None:
+                    self.context_manager.set_model(self.model)
+                model_id = self.model.id if self.model is not None else None
+                reserved_tokens = sum(
+                    self.context_manager.count_tokens(msg, model_id=model_id) for msg in run_messages.messages
+                )
+                history = self.context_manager.fit_history(
+                    session_id=session_id, history=history, model_id=model_id, reserved_tokens=reserved_tokens
+                )
+
             if len(history) > 0:
                 # Create a deep copy of the history messages to avoid modifying the original messages
                 history_copy = [deepcopy(msg) for msg in history]
@@ -5553,6 +5727,15 @@ class Agent:
                         aggregated_metrics[k].append(v)
         if aggregated_metrics is not None:
             aggregated_metrics = dict(aggregated_metrics)
+
+        # Share of the prompt tokens that were read from the provider's prompt cache
+        cached_tokens = sum(aggregated_metrics.get("cached_tokens", []))
+        if cached_tokens > 0:
+            prompt_tokens = sum(aggregated_metrics.get("input_tokens", []))
+            if self.model is not None and not self.model.input_tokens_include_cached:
+                prompt_tokens += cached_tokens + sum(aggregated_metrics.get("cache_write_tokens", []))
+            if prompt_tokens > 0:
+                aggregated_metrics["cache_hit_ratio"] = [round(cached_tokens / prompt_tokens, 4)]
         return aggregated_metrics
 
     def calculate_metrics(self, messages: List[Message]) -> SessionMetrics:
@@ -5779,6 +5962,114 @@ class Agent:
 
         return updated_reasoning_content
 
+    def _get_reasoning_model(self) -> Optional[Model]:
+        """Return the reasoning model, or a copy of the Agent's model that is made once and reused across runs"""
+        if self.reasoning_model is not None:
+            return self.reasoning_model
+        if self.model is None:
+            return None
+        if self._reasoning_model is None or self._reasoning_model_source is not self.model:
+            from copy import deepcopy
+
+            self._reasoning_model = deepcopy(self.model)
+            self._reasoning_model_source = self.model
+        return self._reasoning_model
+
+    def _get_reasoning_agent(self, reasoning_model: Model, default_reasoning: bool) -> Optional[Agent]:
+        """Return the reasoning agent, reusing the one built for a previous run while the configuration is unchanged"""
+        if self.reasoning_agent is not None:
+            return self.reasoning_agent
+
+        from globalgenie.reasoning.helpers import get_tools_key
+
+        config = (
+            default_reasoning,
+            id(reasoning_model),
+            self.reasoning_min_steps,
+            self.reasoning_max_steps,
+            get_tools_key(self.tools),
+            self.use_json_mode,
+            self.monitoring,
+            self.telemetry,
+            self.debug_mode,
+            self.debug_level,
+        )
+        if self._reasoning_agent_cache is None or self._reasoning_agent_cache[0] != config:
+            reasoning_agent = self._build_reasoning_agent(
+                reasoning_model=reasoning_model, default_reasoning=default_reasoning
+            )
+            if reasoning_agent is None:
+                return None
+            self._reasoning_agent_cache = (config, reasoning_agent)
+
+        # Concurrent runs share the cached reasoning agent, so each run gets its own shallow copy
+        reasoning_agent = copy(self._reasoning_agent_cache[1])
+        # Runs of the reasoning agent are not needed after reasoning, start each run with a fresh memory
+        reasoning_agent.memory = None
+        return reasoning_agent
+
+    def _build_reasoning_agent(self, reasoning_model: Model, default_reasoning: bool) -> Optional[Agent]:
+        if default_reasoning:
+            from globalgenie.reasoning.default import get_default_reasoning_agent
+
+            reasoning_agent = get_default_reasoning_agent(
+                reasoning_model=reasoning_model,
+                min_steps=self.reasoning_min_steps,
+                max_steps=self.reasoning_max_steps,
+                tools=self.tools,
+                use_json_mode=self.use_json_mode,
+                monitoring=self.monitoring,
+                telemetry=self.telemetry,
+                debug_mode=self.debug_mode,
+                debug_level=self.debug_level,
+            )
+        else:
+            from globalgenie.reasoning.helpers import get_reasoning_agent
+
+            reasoning_agent = get_reasoning_agent(
+                reasoning_model=reasoning_model,
+                monitoring=self.monitoring,
+                telemetry=self.telemetry,
+                debug_mode=self.debug_mode,
+                debug_level=self.debug_level,
+            )
+        return reasoning_agent
+
+    def _get_reasoning_trace(
+        self, run_messages: RunMessages, reasoning_model: Model
+    ) -> Tuple[Optional[str], Optional[ReasoningTrace]]:
+        """Return the reasoning cache key for the run input and the cached reasoning trace, if any"""
+        if self.reasoning_cache is None:
+            return None, None
+        cache_key = self.reasoning_cache.get_key(
+            messages=run_messages.get_input_messages(),
+            reasoning_model=reasoning_model,
+            min_steps=self.reasoning_min_steps,
+            max_steps=self.reasoning_max_steps,
+        )
+        if cache_key is None:
+            return None, None
+        return cache_key, self.reasoning_cache.get(cache_key)
+
+    def _cache_reasoning_trace(self, cache_key: Optional[str], reasoning_trace: ReasoningTrace) -> None:
+        if self.reasoning_cache is not None and cache_key is not None:
+            self.reasoning_cache.set(cache_key, reasoning_trace)
+
+    def _apply_reasoning_trace(self, run_messages: RunMessages, reasoning_trace: ReasoningTrace) -> None:
+        """Add a cached reasoning trace to the run messages and run response"""
+        from globalgenie.reasoning.helpers import update_messages_with_reasoning
+
+        if reasoning_trace.native:
+            run_messages.messages.extend(reasoning_trace.reasoning_messages)
+        else:
+            update_messages_with_reasoning(
+                run_messages=run_messages, reasoning_messages=reasoning_trace.reasoning_messages
+            )
+        self.update_run_response_with_reasoning(
+            reasoning_steps=reasoning_trace.reasoning_steps,
+            reasoning_agent_messages=reasoning_trace.reasoning_agent_messages,
+        )
+
     def reason(self, run_messages: RunMessages) -> Iterator[RunResponseEvent]:
         self.run_response = cast(RunResponse, self.run_response)
         # Yield a reasoning started event
@@ -5790,32 +6081,39 @@ class Agent:
         use_default_reasoning = False
 
         # Get the reasoning model
-        reasoning_model: Optional[Model] = self.reasoning_model
-        reasoning_model_provided = reasoning_model is not None
-        if reasoning_model is None and self.model is not None:
-            from copy import deepcopy
-
-            reasoning_model = deepcopy(self.model)
+        reasoning_model: Optional[Model] = self._get_reasoning_model()
+        reasoning_model_provided = self.reasoning_model is not None
         if reasoning_model is None:
             log_warning("Reasoning error. Reasoning model is None, continuing regular session...")
             return
 
+        # Reuse the reasoning of a previous run with the same input
+        reasoning_cache_key, reasoning_trace = self._get_reasoning_trace(
+            run_messages=run_messages, reasoning_model=reasoning_model
+        )
+        if reasoning_trace is not None:
+            log_debug("Using cached reasoning", center=True, symbol="=")
+            self._apply_reasoning_trace(run_messages=run_messages, reasoning_trace=reasoning_trace)
+            if self.stream_intermediate_steps:
+                yield self._handle_event(
+                    create_reasoning_completed_event(
+                        from_run_response=self.run_response,
+                        content=ReasoningSteps(reasoning_steps=reasoning_trace.reasoning_steps),
+                        content_type=ReasoningSteps.__name__,
+                    ),
+                    self.run_response,
+                )
+            return
+
         # If a reasoning model is provided, use it to generate reasoning
         if reasoning_model_provided:
             from globalgenie.reasoning.azure_ai_foundry import is_ai_foundry_reasoning_model
             from globalgenie.reasoning.deepseek import is_deepseek_reasoning_model
             from globalgenie.reasoning.groq import is_groq_reasoning_model
-            from globalgenie.reasoning.helpers import get_reasoning_agent
             from globalgenie.reasoning.ollama import is_ollama_reasoning_model
             from globalgenie.reasoning.openai import is_openai_reasoning_model
 
-            reasoning_agent = self.reasoning_agent or get_reasoning_agent(
-                reasoning_model=reasoning_model,
-                monitoring=self.monitoring,
-                telemetry=self.telemetry,
-                debug_mode=self.debug_mode,
-                debug_level=self.debug_level,
-            )
+            reasoning_agent = self._get_reasoning_agent(reasoning_model=reasoning_model, default_reasoning=False)
             is_deepseek = is_deepseek_reasoning_model(reasoning_model)
             is_groq = is_groq_reasoning_model(reasoning_model)
             is_openai = is_openai_reasoning_model(reasoning_model)
@@ -5869,6 +6167,15 @@ class Agent:
                     reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
                     reasoning_agent_messages=[reasoning_message],
                 )
+                self._cache_reasoning_trace(
+                    cache_key=reasoning_cache_key,
+                    reasoning_trace=ReasoningTrace(
+                        reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
+                        reasoning_messages=[reasoning_message],
+                        reasoning_agent_messages=[reasoning_message],
+                        native=True,
+                    ),
+                )
                 if self.stream_intermediate_steps:
                     yield self._handle_event(
                         create_reasoning_completed_event(
@@ -5888,23 +6195,12 @@ class Agent:
             use_default_reasoning = True
 
         if use_default_reasoning:
-            from globalgenie.reasoning.default import get_default_reasoning_agent
             from globalgenie.reasoning.helpers import get_next_action, update_messages_with_reasoning
 
             # Get default reasoning agent
-            reasoning_agent: Optional[Agent] = self.reasoning_agent  # type: ignore
-            if reasoning_agent is None:
-                reasoning_agent = get_default_reasoning_agent(
-                    reasoning_model=reasoning_model,
-                    min_steps=self.reasoning_min_steps,
-                    max_steps=self.reasoning_max_steps,
-                    tools=self.tools,
-                    use_json_mode=self.use_json_mode,
-                    monitoring=self.monitoring,
-                    telemetry=self.telemetry,
-                    debug_mode=self.debug_mode,
-                    debug_level=self.debug_level,
-                )
+            reasoning_agent: Optional[Agent] = self._get_reasoning_agent(  # type: ignore
+                reasoning_model=reasoning_model, default_reasoning=True
+            )
 
             # Validate reasoning agent
             if reasoning_agent is None:
@@ -5925,6 +6221,7 @@ class Agent:
             next_action = NextAction.CONTINUE
             reasoning_messages: List[Message] = []
             all_reasoning_steps: List[ReasoningStep] = []
+            all_reasoning_agent_messages: List[Message] = []
             log_debug("Starting Reasoning", center=True, symbol="=")
             while next_action == NextAction.CONTINUE and step_count < self.reasoning_max_steps:
                 log_debug(f"Step {step_count}", center=True, symbol="=")
@@ -5972,6 +6269,7 @@ class Agent:
                     self.update_run_response_with_reasoning(
                         reasoning_steps=reasoning_steps, reasoning_agent_messages=reasoning_agent_response.messages
                     )
+                    all_reasoning_agent_messages.extend(reasoning_agent_response.messages)
                     # Get the next action
                     next_action = get_next_action(reasoning_steps[-1])
                     if next_action == NextAction.FINAL_ANSWER:
@@ -5990,6 +6288,15 @@ class Agent:
                 run_messages=run_messages,
                 reasoning_messages=reasoning_messages,
             )
+            if all_reasoning_steps and reasoning_messages:
+                self._cache_reasoning_trace(
+                    cache_key=reasoning_cache_key,
+                    reasoning_trace=ReasoningTrace(
+                        reasoning_steps=all_reasoning_steps,
+                        reasoning_messages=reasoning_messages,
+                        reasoning_agent_messages=all_reasoning_agent_messages,
+                    ),
+                )
 
             # Yield the final reasoning completed event
             if self.stream_intermediate_steps:
@@ -6013,32 +6320,39 @@ class Agent:
         use_default_reasoning = False
 
         # Get the reasoning model
-        reasoning_model: Optional[Model] = self.reasoning_model
-        reasoning_model_provided = reasoning_model is not None
-        if reasoning_model is None and self.model is not None:
-            from copy import deepcopy
-
-            reasoning_model = deepcopy(self.model)
+        reasoning_model: Optional[Model] = self._get_reasoning_model()
+        reasoning_model_provided = self.reasoning_model is not None
         if reasoning_model is None:
             log_warning("Reasoning error. Reasoning model is None, continuing regular session...")
             return
 
+        # Reuse the reasoning of a previous run with the same input
+        reasoning_cache_key, reasoning_trace = self._get_reasoning_trace(
+            run_messages=run_messages, reasoning_model=reasoning_model
+        )
+        if reasoning_trace is not None:
+            log_debug("Using cached reasoning", center=True, symbol="=")
+            self._apply_reasoning_trace(run_messages=run_messages, reasoning_trace=reasoning_trace)
+            if self.stream_intermediate_steps:
+                yield self._handle_event(
+                    create_reasoning_completed_event(
+                        from_run_response=self.run_response,
+                        content=ReasoningSteps(reasoning_steps=reasoning_trace.reasoning_steps),
+                        content_type=ReasoningSteps.__name__,
+                    ),
+                    self.run_response,
+                )
+            return
+
         # If a reasoning model is provided, use it to generate reasoning
         if reasoning_model_provided:
             from globalgenie.reasoning.azure_ai_foundry import is_ai_foundry_reasoning_model
             from globalgenie.reasoning.deepseek import is_deepseek_reasoning_model
             from globalgenie.reasoning.groq import is_groq_reasoning_model
-            from globalgenie.reasoning.helpers import get_reasoning_agent
             from globalgenie.reasoning.ollama import is_ollama_reasoning_model
             from globalgenie.reasoning.openai import is_openai_reasoning_model
 
-            reasoning_agent = self.reasoning_agent or get_reasoning_agent(
-                reasoning_model=reasoning_model,
-                monitoring=self.monitoring,
-                telemetry=self.telemetry,
-                debug_mode=self.debug_mode,
-                debug_level=self.debug_level,
-            )
+            reasoning_agent = self._get_reasoning_agent(reasoning_model=reasoning_model, default_reasoning=False)
             is_deepseek = is_deepseek_reasoning_model(reasoning_model)
             is_groq = is_groq_reasoning_model(reasoning_model)
             is_openai = is_openai_reasoning_model(reasoning_model)
@@ -6092,6 +6406,15 @@ class Agent:
                     reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
                     reasoning_agent_messages=[reasoning_message],
                 )
+                self._cache_reasoning_trace(
+                    cache_key=reasoning_cache_key,
+                    reasoning_trace=ReasoningTrace(
+                        reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
+                        reasoning_messages=[reasoning_message],
+                        reasoning_agent_messages=[reasoning_message],
+                        native=True,
+                    ),
+                )
                 if self.stream_intermediate_steps:
                     yield self._handle_event(
                         create_reasoning_completed_event(
@@ -6111,23 +6434,12 @@ class Agent:
             use_default_reasoning = True
 
         if use_default_reasoning:
-            from globalgenie.reasoning.default import get_default_reasoning_agent
             from globalgenie.reasoning.helpers import get_next_action, update_messages_with_reasoning
 
             # Get default reasoning agent
-            reasoning_agent: Optional[Agent] = self.reasoning_agent  # type: ignore
-            if reasoning_agent is None:
-                reasoning_agent = get_default_reasoning_agent(
-                    reasoning_model=reasoning_model,
-                    min_steps=self.reasoning_min_steps,
-                    max_steps=self.reasoning_max_steps,
-                    tools=self.tools,
-                    use_json_mode=self.use_json_mode,
-                    monitoring=self.monitoring,
-                    telemetry=self.telemetry,
-                    debug_mode=self.debug_mode,
-                    debug_level=self.debug_level,
-                )
+            reasoning_agent: Optional[Agent] = self._get_reasoning_agent(  # type: ignore
+                reasoning_model=reasoning_model, default_reasoning=True
+            )
 
             # Validate reasoning agent
             if reasoning_agent is None:
@@ -6149,6 +6461,7 @@ class Agent:
             next_action = NextAction.CONTINUE
             reasoning_messages: List[Message] = []
             all_reasoning_steps: List[ReasoningStep] = []
+            all_reasoning_agent_messages: List[Message] = []
             log_debug("Starting Reasoning", center=True, symbol="=")
             while next_action == NextAction.CONTINUE and step_count < self.reasoning_max_steps:
                 log_debug(f"Step {step_count}", center=True, symbol="=")
@@ -6195,6 +6508,7 @@ class Agent:
                     self.update_run_response_with_reasoning(
                         reasoning_steps=reasoning_steps, reasoning_agent_messages=reasoning_agent_response.messages
                     )
+                    all_reasoning_agent_messages.extend(reasoning_agent_response.messages)
 
                     # Get the next action
                     next_action = get_next_action(reasoning_steps[-1])
@@ -6212,6 +6526,15 @@ class Agent:
                 run_messages=run_messages,
                 reasoning_messages=reasoning_messages,
             )
+            if all_reasoning_steps and reasoning_messages:
+                self._cache_reasoning_trace(
+                    cache_key=reasoning_cache_key,
+                    reasoning_trace=ReasoningTrace(
+                        reasoning_steps=all_reasoning_steps,
+                        reasoning_messages=reasoning_messages,
+                        reasoning_agent_messages=all_reasoning_agent_messages,
+                    ),
+                )
 
             # Yield the final reasoning completed event
             if self.stream_intermediate_steps:
@@ -6503,7 +6826,7 @@ class Agent:
                 return ""
             if len(tool_calls) == 0:
                 return ""
-            log_debug(f"tool_calls: {tool_calls}")
+            log_debug(lambda: f"tool_calls: {tool_calls}")
             return json.dumps(tool_calls)
 
         return get_tool_call_history
@@ -22,6 +22,10 @@ class SessionMetrics:
     prompt_tokens_details: Optional[dict] = None
     completion_tokens_details: Optional[dict] = None
 
+    # Model requests answered from, or missed in, the response cache
+    response_cache_hits: int = 0
+    response_cache_misses: int = 0
+
     additional_metrics: Optional[dict] = None
 
     time: Optional[float] = None
@@ -58,6 +62,8 @@ class SessionMetrics:
             cached_tokens=self.cached_tokens + other.cached_tokens,
             cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
             reasoning_tokens=self.reasoning_tokens + other.reasoning_tokens,
+            response_cache_hits=self.response_cache_hits + other.response_cache_hits,
+            response_cache_misses=self.response_cache_misses + other.response_cache_misses,
         )
 
         # Handle prompt_tokens_details
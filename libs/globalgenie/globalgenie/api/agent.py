@@ -1,4 +1,5 @@
 from globalgenie.api.api import api
+from globalgenie.api.exporter import get_exporter
 from globalgenie.api.routes import ApiRoutes
 from globalgenie.api.schemas.agent import AgentCreate, AgentRunCreate, AgentSessionCreate
 from globalgenie.cli.settings import globalgenie_cli_settings
@@ -6,49 +7,30 @@ from globalgenie.utils.log import log_debug
 
 
 def create_agent_session(session: AgentSessionCreate, monitor: bool = False) -> None:
+    """Queue the Agent session for export. Returns immediately, the session is sent in the background."""
     if not globalgenie_cli_settings.api_enabled:
         return
 
     log_debug("Logging Agent Session")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            api_client.post(
-                ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE,
-                json={"session": session.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            log_debug(f"Could not create Agent session: {e}")
-    return
+    get_exporter().enqueue(
+        ApiRoutes.AGENT_SESSION_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_SESSION_CREATE,
+        {"session": session.model_dump(exclude_none=True)},
+    )
 
 
 def create_agent_run(run: AgentRunCreate, monitor: bool = False) -> None:
+    """Queue the Agent run for export. Returns immediately, the run is sent in the background."""
     if not globalgenie_cli_settings.api_enabled:
         return
 
-    with api.AuthenticatedClient() as api_client:
-        try:
-            api_client.post(
-                ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            log_debug(f"Could not create Agent run: {e}")
-    return
+    get_exporter().enqueue(
+        ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
+        {"run": run.model_dump(exclude_none=True)},
+    )
 
 
 async def acreate_agent_run(run: AgentRunCreate, monitor: bool = False) -> None:
-    if not globalgenie_cli_settings.api_enabled:
-        return
-
-    async with api.AuthenticatedAsyncClient() as api_client:
-        try:
-            await api_client.post(
-                ApiRoutes.AGENT_RUN_CREATE if monitor else ApiRoutes.AGENT_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-        except Exception as e:
-            log_debug(f"Could not create Agent run: {e}")
-    return
+    create_agent_run(run=run, monitor=monitor)
 
 
 def create_agent(agent: AgentCreate) -> None:
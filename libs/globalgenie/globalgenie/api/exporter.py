@@ -0,0 +1,247 @@
+import atexit
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from os import getenv
+from pathlib import Path
+from time import monotonic, time
+from typing import Any, Deque, Dict, List, Optional, Union
+
+from globalgenie.utils.log import log_debug
+
+# Environment variable to write telemetry events to a local file instead of the API
+TELEMETRY_FILE_ENV_VAR = "GLOBALGENIE_TELEMETRY_FILE"
+
+
+@dataclass
+class TelemetryEvent:
+    """A single telemetry or monitoring payload, sent to `route` as json"""
+
+    route: str
+    payload: Dict[str, Any]
+    created_at: float
+    # Monotonic time the event was queued at, used for the flush interval
+    queued_at: float
+
+
+class TelemetrySink:
+    """Destination of exported telemetry events"""
+
+    def export(self, events: List[TelemetryEvent]) -> int:
+        """Export a batch of events and return the number of events that were exported"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class HttpSink(TelemetrySink):
+    """Sends events to the GlobalGenie API, reusing one long-lived client"""
+
+    def __init__(self):
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            from globalgenie.api.api import api
+
+            self._client = api.AuthenticatedClient()
+        return self._client
+
+    def export(self, events: List[TelemetryEvent]) -> int:
+        client = self._get_client()
+        exported = 0
+        for event in events:
+            try:
+                response = client.post(event.route, json=event.payload)
+                response.raise_for_status()
+                exported += 1
+            except Exception as e:
+                log_debug(f"Could not export telemetry event to {event.route}: {e}")
+        return exported
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+class FileSink(TelemetrySink):
+    """Appends events to a local file as json lines, useful to inspect telemetry offline"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def export(self, events: List[TelemetryEvent]) -> int:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            for event in events:
+                record = {"route": event.route, "created_at": event.created_at, "payload": event.payload}
+                f.write(json.dumps(record, default=str) + "\n")
+        return len(events)
+
+
+class TelemetryExporter:
+    """Exports telemetry and monitoring events from a background thread.
+
+    Events are added to a bounded in-memory queue and the caller returns immediately. The worker thread
+    exports events in batches, once `batch_size` events are queued or `flush_interval` seconds have passed.
+    When the queue is full, new events are dropped and counted instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[TelemetrySink] = None,
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+    ):
+        """
+        Args:
+            sink: Where events are exported to. Defaults to a FileSink if GLOBALGENIE_TELEMETRY_FILE is set,
+                otherwise to the GlobalGenie API.
+            max_queue_size: Maximum number of events waiting to be exported.
+            batch_size: Export as soon as this many events are queued.
+            flush_interval: Maximum number of seconds an event waits before it is exported.
+        """
+        if sink is None:
+            telemetry_file = getenv(TELEMETRY_FILE_ENV_VAR)
+            sink = FileSink(telemetry_file) if telemetry_file else HttpSink()
+        self.sink = sink
+        self.max_queue_size = max_queue_size
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Condition()
+        self._queue: Deque[TelemetryEvent] = deque()
+        self._worker: Optional[threading.Thread] = None
+        self._exporting = 0
+        self._flush_requested = False
+        self._shutdown = False
+
+        # Counters reported by status()
+        self._exported = 0
+        self._dropped = 0
+        self._failed = 0
+
+    # -*- Public Functions
+    def enqueue(self, route: str, payload: Dict[str, Any]) -> bool:
+        """Queue an event for export. Never blocks, returns False if the event was dropped."""
+        with self._lock:
+            if self._shutdown or len(self._queue) >= self.max_queue_size:
+                self._dropped += 1
+                return False
+            self._queue.append(TelemetryEvent(route=route, payload=payload, created_at=time(), queued_at=monotonic()))
+            if self._worker is None:
+                self._start()
+            if len(self._queue) == 1 or len(self._queue) >= self.batch_size:
+                self._lock.notify_all()
+        return True
+
+    def status(self) -> Dict[str, int]:
+        """Return the number of queued, exported, failed and dropped events"""
+        with self._lock:
+            return {
+                "queued": len(self._queue),
+                "exported": self._exported,
+                "failed": self._failed,
+                "dropped": self._dropped,
+            }
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Export all queued events now and wait for them to finish.
+        Returns False if the timeout expired before all events were exported.
+        """
+        deadline = monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            self._flush_requested = True
+            self._lock.notify_all()
+            while self._queue or self._exporting:
+                if self._worker is None:
+                    return False
+                remaining = deadline - monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._lock.wait(timeout=remaining)
+        return True
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """Export the queued events and stop the worker thread"""
+        if self._shutdown:
+            return
+        self.flush(timeout=timeout)
+        with self._lock:
+            self._shutdown = True
+            self._lock.notify_all()
+        try:
+            self.sink.close()
+        except Exception as e:
+            log_debug(f"Could not close telemetry sink: {e}")
+
+    # -*- Internal Functions
+    def _start(self) -> None:
+        # Called with the lock held
+        self._worker = threading.Thread(target=self._run, name="telemetry-exporter", daemon=True)
+        self._worker.start()
+        atexit.register(self.shutdown)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._shutdown:
+                    if self._flush_requested and self._queue or len(self._queue) >= self.batch_size:
+                        break
+                    if not self._queue:
+                        # Idle until an event is queued
+                        self._flush_requested = False
+                        self._lock.notify_all()
+                        self._lock.wait()
+                        continue
+                    remaining = self._queue[0].queued_at + self.flush_interval - monotonic()
+                    if remaining <= 0:
+                        break
+                    self._lock.wait(timeout=remaining)
+                if self._shutdown:
+                    return
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                if not self._queue:
+                    self._flush_requested = False
+                self._exporting = len(batch)
+
+            exported = 0
+            if batch:
+                try:
+                    exported = self.sink.export(batch)
+                except Exception as e:
+                    log_debug(f"Could not export telemetry: {e}")
+
+            with self._lock:
+                self._exported += exported
+                self._failed += len(batch) - exported
+                self._exporting = 0
+                self._lock.notify_all()
+
+
+_exporter: Optional[TelemetryExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def get_exporter() -> TelemetryExporter:
+    """Return the process-wide telemetry exporter"""
+    global _exporter
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                _exporter = TelemetryExporter()
+    return _exporter
+
+
+def set_exporter(exporter: TelemetryExporter) -> None:
+    """Replace the process-wide telemetry exporter, e.g. to export to a FileSink"""
+    global _exporter
+    with _exporter_lock:
+        previous = _exporter
+        _exporter = exporter
+    if previous is not None and previous is not exporter:
+        previous.shutdown()
@@ -1,4 +1,5 @@
 from globalgenie.api.api import api
+from globalgenie.api.exporter import get_exporter
 from globalgenie.api.routes import ApiRoutes
 from globalgenie.api.schemas.team import TeamCreate, TeamRunCreate, TeamSessionCreate
 from globalgenie.cli.settings import globalgenie_cli_settings
@@ -6,53 +7,29 @@ from globalgenie.utils.log import log_debug
 
 
 def create_team_run(run: TeamRunCreate, monitor: bool = False) -> None:
+    """Queue the Team run for export. Returns immediately, the run is sent in the background."""
     if not globalgenie_cli_settings.api_enabled:
         return
 
     log_debug("--**-- Logging Team Run")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            response = api_client.post(
-                ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-            response.raise_for_status()
-        except Exception as e:
-            log_debug(f"Could not create Team run: {e}")
-    return
+    get_exporter().enqueue(
+        ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE,
+        {"run": run.model_dump(exclude_none=True)},
+    )
 
 
 async def acreate_team_run(run: TeamRunCreate, monitor: bool = False) -> None:
-    if not globalgenie_cli_settings.api_enabled:
-        return
-
-    log_debug("--**-- Logging Team Run")
-    async with api.AuthenticatedAsyncClient() as api_client:
-        try:
-            response = await api_client.post(
-                ApiRoutes.TEAM_RUN_CREATE if monitor else ApiRoutes.TEAM_TELEMETRY_RUN_CREATE,
-                json={"run": run.model_dump(exclude_none=True)},
-            )
-            response.raise_for_status()
-        except Exception as e:
-            log_debug(f"Could not create Team run: {e}")
+    create_team_run(run=run, monitor=monitor)
 
 
 def upsert_team_session(session: TeamSessionCreate, monitor: bool = False) -> None:
+    """Queue the Team session for export. Returns immediately, the session is sent in the background."""
     if not globalgenie_cli_settings.api_enabled:
         return
 
     log_debug("--**-- Logging Team Session")
-    with api.AuthenticatedClient() as api_client:
-        try:
-            if monitor:
-                api_client.post(
-                    ApiRoutes.TEAM_SESSION_CREATE,
-                    json={"session": session.model_dump(exclude_none=True)},
-                )
-        except Exception as e:
-            log_debug(f"Could not create Agent session: {e}")
-    return
+    if monitor:
+        get_exporter().enqueue(ApiRoutes.TEAM_SESSION_CREATE, {"session": session.model_dump(exclude_none=True)})
 
 
 def create_team(team: TeamCreate) -> None:
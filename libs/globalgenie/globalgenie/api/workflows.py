@@ -1,33 +1,16 @@
-from globalgenie.api.api import api
+from globalgenie.api.exporter import get_exporter
 from globalgenie.api.routes import ApiRoutes
 from globalgenie.api.schemas.workflows import WorkflowCreate
 from globalgenie.cli.settings import globalgenie_cli_settings
-from globalgenie.utils.log import log_debug
 
 
 def create_workflow(workflow: WorkflowCreate) -> None:
+    """Queue the Workflow for export. Returns immediately, the Workflow is sent in the background."""
     if not globalgenie_cli_settings.api_enabled:
         return
 
-    with api.AuthenticatedClient() as api_client:
-        try:
-            api_client.post(
-                ApiRoutes.WORKFLOW_CREATE,
-                json=workflow.model_dump(exclude_none=True),
-            )
-        except Exception as e:
-            log_debug(f"Could not create Workflow: {e}")
+    get_exporter().enqueue(ApiRoutes.WORKFLOW_CREATE, workflow.model_dump(exclude_none=True))
 
 
 async def acreate_workflow(workflow: WorkflowCreate) -> None:
-    if not globalgenie_cli_settings.api_enabled:
-        return
-
-    async with api.AuthenticatedAsyncClient() as api_client:
-        try:
-            await api_client.post(
-                ApiRoutes.WORKFLOW_CREATE,
-                json=workflow.model_dump(exclude_none=True),
-            )
-        except Exception as e:
-            log_debug(f"Could not create Team: {e}")
+    create_workflow(workflow=workflow)
@@ -0,0 +1,176 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set
+
+from globalgenie.utils.log import log_debug, log_error, log_warning
+
+# Merges a new item into the last queued item of a session. Returns None if the items can not be merged.
+MergeFunction = Callable[[Any, Any], Optional[Any]]
+
+
+@dataclass
+class _QueuedItem:
+    item: Any
+    handler: Callable[[Any], Awaitable[Any]]
+    tenant: Optional[str]
+    merge: Optional[MergeFunction]
+    enqueued_at: float = field(default_factory=monotonic)
+
+
+@dataclass
+class _SessionQueue:
+    items: Deque[_QueuedItem] = field(default_factory=deque)
+    # The item being handled, which can no longer be merged into
+    running: Optional[_QueuedItem] = None
+
+
+class SessionDispatcher:
+    """Dispatches incoming messages to their handlers in per-session FIFO queues.
+
+    Messages of the same session are handled one at a time, in the order they arrive, so they do not race on the
+    session. Different sessions are handled concurrently, at most `max_concurrency` at a time, and at most
+    `max_concurrency_per_tenant` at a time for the same tenant, e.g. a Slack workspace.
+
+    Mergeable messages, submitted with a merge function, wait `coalesce_window` seconds before they are handled.
+    Mergeable messages of the same session that arrive in the meantime, or while the previous message is handled,
+    are merged into the waiting message, so a burst of short messages gets a single response.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        max_concurrency_per_tenant: Optional[int] = 4,
+        coalesce_window: float = 1.0,
+        max_queue_size: int = 1000,
+    ):
+        """
+        Args:
+            max_concurrency: Maximum number of messages handled at the same time.
+            max_concurrency_per_tenant: Maximum number of messages of the same tenant handled at the same time.
+            coalesce_window: Seconds to wait for more messages of a session before handling a mergeable message.
+            max_queue_size: Maximum number of queued messages. New messages are dropped when the queue is full.
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_concurrency_per_tenant = max(1, max_concurrency_per_tenant) if max_concurrency_per_tenant else None
+        self.coalesce_window = coalesce_window
+        self.max_queue_size = max_queue_size
+
+        self._queues: Dict[str, _SessionQueue] = {}
+        self._workers: Set[asyncio.Task] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tenant_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._queued = 0
+        self._active = 0
+        self._processed = 0
+        self._coalesced = 0
+        self._dropped = 0
+        self._failed = 0
+
+    def submit(
+        self,
+        session_key: str,
+        item: Any,
+        handler: Callable[[Any], Awaitable[Any]],
+        tenant: Optional[str] = None,
+        merge: Optional[MergeFunction] = None,
+    ) -> bool:
+        """Queue an item to be handled by `handler` after the previous items of the session. Returns immediately.
+
+        Must be called from a running event loop.
+
+        Returns:
+            bool: False if the item was dropped because the queue is full.
+        """
+        queue = self._queues.get(session_key)
+        if queue is not None and queue.items and merge is not None:
+            last = queue.items[-1]
+            if last is not queue.running and last.merge is not None:
+                merged = last.merge(last.item, item)
+                if merged is not None:
+                    last.item = merged
+                    self._coalesced += 1
+                    log_debug(f"Merged message into the queue of session {session_key}")
+                    return True
+
+        if self._queued >= self.max_queue_size:
+            self._dropped += 1
+            log_warning(f"Message queue is full ({self._queued} messages), dropping message of session {session_key}")
+            return False
+
+        if queue is None:
+            queue = _SessionQueue()
+            self._queues[session_key] = queue
+            worker = asyncio.ensure_future(self._run_session(session_key, queue))
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+        queue.items.append(_QueuedItem(item=item, handler=handler, tenant=tenant, merge=merge))
+        self._queued += 1
+        return True
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Created on first use, so it is bound to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _get_tenant_semaphore(self, tenant: Optional[str]) -> Optional[asyncio.Semaphore]:
+        if tenant is None or self.max_concurrency_per_tenant is None:
+            return None
+        if tenant not in self._tenant_semaphores:
+            self._tenant_semaphores[tenant] = asyncio.Semaphore(self.max_concurrency_per_tenant)
+        return self._tenant_semaphores[tenant]
+
+    async def _run_session(self, session_key: str, queue: _SessionQueue) -> None:
+        try:
+            while queue.items:
+                queued_item = queue.items[0]
+                if queued_item.merge is not None:
+                    # Wait for more messages of a burst, which are merged into this one
+                    delay = queued_item.enqueued_at + self.coalesce_window - monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                # Wait for a slot of the tenant first, so a busy tenant does not hold the slots of other tenants
+                tenant_semaphore = self._get_tenant_semaphore(queued_item.tenant)
+                if tenant_semaphore is not None:
+                    await tenant_semaphore.acquire()
+                try:
+                    async with self._get_semaphore():
+                        queue.running = queued_item
+                        self._active += 1
+                        try:
+                            log_debug(f"Handling message of session {session_key}, {len(queue.items) - 1} more queued")
+                            await queued_item.handler(queued_item.item)
+                            self._processed += 1
+                        except Exception as e:
+                            self._failed += 1
+                            log_error(f"Error handling message of session {session_key}: {e}")
+                        finally:
+                            self._active -= 1
+                            queue.running = None
+                finally:
+                    if tenant_semaphore is not None:
+                        tenant_semaphore.release()
+                queue.items.popleft()
+                self._queued -= 1
+        finally:
+            # Items that were not handled, e.g. if the worker was cancelled on shutdown
+            self._queued -= len(queue.items)
+            if self._queues.get(session_key) is queue:
+                del self._queues[session_key]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return the queue depths and counters of the dispatcher"""
+        depths = [len(queue.items) for queue in self._queues.values()]
+        return {
+            "queued": self._queued,
+            "active": self._active,
+            "sessions": len(depths),
+            "max_session_depth": max(depths, default=0),
+            "processed": self._processed,
+            "coalesced": self._coalesced,
+            "dropped": self._dropped,
+            "failed": self._failed,
+        }
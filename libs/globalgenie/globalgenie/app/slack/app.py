@@ -1,8 +1,10 @@
 import logging
+from typing import Optional
 
 from fastapi.routing import APIRouter
 
 from globalgenie.app.base import BaseAPIApp
+from globalgenie.app.dispatcher import SessionDispatcher
 from globalgenie.app.slack.async_router import get_async_router
 from globalgenie.app.slack.sync_router import get_sync_router
 
@@ -12,8 +14,17 @@ logger = logging.getLogger(__name__)
 class SlackAPI(BaseAPIApp):
     type = "slack"
 
+    def __init__(self, *args, dispatcher: Optional[SessionDispatcher] = None, **kwargs):
+        """
+        Args:
+            dispatcher: Queues incoming messages per session and bounds how many are handled at the same time.
+                A default SessionDispatcher is used if not provided.
+        """
+        super().__init__(*args, **kwargs)
+        self.dispatcher: Optional[SessionDispatcher] = dispatcher
+
     def get_router(self) -> APIRouter:
         return get_sync_router(agent=self.agent, team=self.team)
 
     def get_async_router(self) -> APIRouter:
-        return get_async_router(agent=self.agent, team=self.team)
+        return get_async_router(agent=self.agent, team=self.team, dispatcher=self.dispatcher)
@@ -1,19 +1,28 @@
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request
 
 from globalgenie.agent.agent import Agent
+from globalgenie.app.dispatcher import SessionDispatcher
 from globalgenie.app.slack.security import verify_slack_signature
 from globalgenie.team.team import Team
 from globalgenie.tools.slack import SlackTools
 from globalgenie.utils.log import log_info
 
 
-def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None) -> APIRouter:
+def get_async_router(
+    agent: Optional[Agent] = None, team: Optional[Team] = None, dispatcher: Optional[SessionDispatcher] = None
+) -> APIRouter:
     router = APIRouter()
+    # Events of the same thread are handled in order, events are acknowledged before they are handled
+    dispatcher = dispatcher or SessionDispatcher()
+
+    @router.get("/slack/queue")
+    async def slack_queue():
+        return dispatcher.get_metrics()
 
     @router.post("/slack/events")
-    async def slack_events(request: Request, background_tasks: BackgroundTasks):
+    async def slack_events(request: Request):
         body = await request.body()
         timestamp = request.headers.get("X-Slack-Request-Timestamp")
         slack_signature = request.headers.get("X-Slack-Signature", "")
@@ -37,10 +46,25 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
                 log_info("bot event")
                 pass
             else:
-                background_tasks.add_task(_process_slack_event, event)
+                thread_ts = event.get("thread_ts") or event.get("ts", "")
+                dispatcher.submit(
+                    session_key=f"{event.get('channel', '')}:{thread_ts}",
+                    item=event,
+                    handler=_process_slack_event,
+                    tenant=data.get("team_id"),
+                    merge=_merge_slack_events,
+                )
 
         return {"status": "ok"}
 
+    def _merge_slack_events(queued_event: dict, event: dict) -> Optional[dict]:
+        """Merge consecutive messages of the same user in a thread, so they get a single response"""
+        if queued_event.get("type") != "message" or event.get("type") != "message":
+            return None
+        if queued_event.get("user") != event.get("user"):
+            return None
+        return {**queued_event, "text": f"{queued_event.get('text') or ''}\n{event.get('text') or ''}"}
+
     async def _process_slack_event(event: dict):
         if event.get("type") == "message":
             user = None
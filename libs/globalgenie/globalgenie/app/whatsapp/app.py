@@ -1,6 +1,9 @@
+from typing import Optional
+
 from fastapi.routing import APIRouter
 
 from globalgenie.app.base import BaseAPIApp
+from globalgenie.app.dispatcher import SessionDispatcher
 from globalgenie.app.whatsapp.async_router import get_async_router
 from globalgenie.app.whatsapp.sync_router import get_sync_router
 
@@ -8,8 +11,17 @@ from globalgenie.app.whatsapp.sync_router import get_sync_router
 class WhatsappAPI(BaseAPIApp):
     type = "whatsapp"
 
+    def __init__(self, *args, dispatcher: Optional[SessionDispatcher] = None, **kwargs):
+        """
+        Args:
+            dispatcher: Queues incoming messages per session and bounds how many are handled at the same time.
+                A default SessionDispatcher is used if not provided.
+        """
+        super().__init__(*args, **kwargs)
+        self.dispatcher: Optional[SessionDispatcher] = dispatcher
+
     def get_router(self) -> APIRouter:
         return get_sync_router(agent=self.agent, team=self.team)
 
     def get_async_router(self) -> APIRouter:
-        return get_async_router(agent=self.agent, team=self.team)
+        return get_async_router(agent=self.agent, team=self.team, dispatcher=self.dispatcher)
@@ -2,10 +2,11 @@ import base64
 from os import getenv
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 
 from globalgenie.agent.agent import Agent
+from globalgenie.app.dispatcher import SessionDispatcher
 from globalgenie.media import Audio, File, Image, Video
 from globalgenie.team.team import Team
 from globalgenie.tools.whatsapp import WhatsAppTools
@@ -15,16 +16,25 @@ from globalgenie.utils.whatsapp import get_media_async, send_image_message_async
 from .security import validate_webhook_signature
 
 
-def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None) -> APIRouter:
+def get_async_router(
+    agent: Optional[Agent] = None, team: Optional[Team] = None, dispatcher: Optional[SessionDispatcher] = None
+) -> APIRouter:
     router = APIRouter()
 
     if agent is None and team is None:
         raise ValueError("Either agent or team must be provided.")
 
+    # Messages of the same user are handled in order, messages are acknowledged before they are handled
+    dispatcher = dispatcher or SessionDispatcher()
+
     @router.get("/status")
     async def status():
         return {"status": "available"}
 
+    @router.get("/queue")
+    async def queue():
+        return dispatcher.get_metrics()
+
     @router.get("/webhook")
     async def verify_webhook(request: Request):
         """Handle WhatsApp webhook verification"""
@@ -44,7 +54,7 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
         raise HTTPException(status_code=403, detail="Invalid verify token or mode")
 
     @router.post("/webhook")
-    async def webhook(request: Request, background_tasks: BackgroundTasks):
+    async def webhook(request: Request):
         """Handle incoming WhatsApp messages"""
         try:
             # Get raw payload for signature validation
@@ -66,13 +76,20 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
             # Process messages in background
             for entry in body.get("entry", []):
                 for change in entry.get("changes", []):
-                    messages = change.get("value", {}).get("messages", [])
+                    value = change.get("value", {})
+                    messages = value.get("messages", [])
 
                     if not messages:
                         continue
 
                     message = messages[0]
-                    background_tasks.add_task(process_message, message, agent, team)
+                    dispatcher.submit(
+                        session_key=message.get("from", ""),
+                        item=message,
+                        handler=_handle_message,
+                        tenant=value.get("metadata", {}).get("phone_number_id"),
+                        merge=_merge_text_messages,
+                    )
 
             return {"status": "processing"}
 
@@ -80,6 +97,16 @@ def get_async_router(agent: Optional[Agent] = None, team: Optional[Team] = None)
             log_error(f"Error processing webhook: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    async def _handle_message(message: dict):
+        await process_message(message, agent, team)
+
+    def _merge_text_messages(queued_message: dict, message: dict) -> Optional[dict]:
+        """Merge consecutive text messages of the same user, so they get a single response"""
+        if queued_message.get("type") != "text" or message.get("type") != "text":
+            return None
+        text = f"{queued_message['text']['body']}\n{message['text']['body']}"
+        return {**queued_message, "text": {**queued_message["text"], "body": text}}
+
     async def process_message(message: dict, agent: Optional[Agent], team: Optional[Team]):
         """Process a single WhatsApp message in the background"""
         try:
@@ -1,5 +1,6 @@
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 
 __all__ = [
     "Document",
+    "get_document_id",
 ]
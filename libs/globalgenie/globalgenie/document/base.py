@@ -1,8 +1,29 @@
+import json
+import uuid
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from globalgenie.embedder import Embedder
 
+# Namespace of the uuid5 ids of documents, so the same content always gets the same id
+DOCUMENT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_OID, "globalgenie.document")
+
+
+def get_document_id(content: str, source: Optional[str] = None, position: Optional[Any] = None) -> str:
+    """Return a stable id for a document, derived from its source, its position in the source and its content.
+
+    Whitespace is normalized before hashing, so re-reading an unchanged source gives the same ids, and existing
+    documents can be skipped or upserted instead of being inserted again.
+
+    Args:
+        content: The content of the document.
+        source: The file, url or parent document the content was read from.
+        position: The position of the content in the source, e.g. a page, row or chunk number.
+    """
+    normalized_content = " ".join(content.split())
+    key = json.dumps([source, position, normalized_content], default=str)
+    return str(uuid.uuid5(DOCUMENT_ID_NAMESPACE, key))
+
 
 @dataclass
 class Document:
@@ -1,62 +1,138 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from globalgenie.document.base import Document
 from globalgenie.document.chunking.strategy import ChunkingStrategy
 from globalgenie.models.base import Model
+from globalgenie.models.cache.base import ResponseCache
 from globalgenie.models.defaults import DEFAULT_OPENAI_MODEL_ID
 from globalgenie.models.message import Message
+from globalgenie.models.response import ModelResponse
+from globalgenie.utils.log import log_debug
+
+# Structural boundaries the document is split into windows on, in order of preference
+WINDOW_SEPARATORS = ["\n\n", "\n", ". ", " "]
+
+
+def split_into_windows(text: str, window_size: int) -> List[str]:
+    """Split text into windows of at most window_size characters, at the strongest structural boundary available"""
+    windows: List[str] = []
+    while len(text) > window_size:
+        end = window_size
+        for separator in WINDOW_SEPARATORS:
+            # Only split on a separator in the second half of the window, so windows are not too small
+            position = text.rfind(separator, window_size // 2, window_size)
+            if position != -1:
+                end = position + len(separator)
+                break
+        windows.append(text[:end])
+        text = text[end:]
+    if text:
+        windows.append(text)
+    return windows
 
 
 class AgenticChunking(ChunkingStrategy):
-    """Chunking strategy that uses an LLM to determine natural breakpoints in the text"""
+    """Chunking strategy that uses an LLM to determine natural breakpoints in the text
 
-    def __init__(self, model: Optional[Model] = None, max_chunk_size: int = 5000):
+    If `window_size` is set, the document is first split into windows of `window_size` characters on paragraph
+    and sentence boundaries, and the breakpoints of the windows are found concurrently, at most
+    `max_concurrency` windows at a time. Chunks are returned in document order either way.
+
+    With a `response_cache`, the breakpoints of unchanged text are read from the cache, so re-indexing a
+    document that did not change makes no model calls.
+    """
+
+    def __init__(
+        self,
+        model: Optional[Model] = None,
+        max_chunk_size: int = 5000,
+        window_size: Optional[int] = None,
+        max_concurrency: int = 4,
+        response_cache: Optional[ResponseCache] = None,
+    ):
         if model is None:
             try:
                 from globalgenie.models.openai import OpenAIChat
             except Exception:
                 raise ValueError("`openai` isn't installed. Please install it with `pip install openai`")
             model = OpenAIChat(DEFAULT_OPENAI_MODEL_ID)
+        if window_size is not None and window_size < max_chunk_size:
+            raise ValueError(
+                f"Invalid parameters: window_size ({window_size}) must be at least max_chunk_size ({max_chunk_size})."
+            )
         self.max_chunk_size = max_chunk_size
         self.model = model
+        self.window_size = window_size
+        self.max_concurrency = max(1, max_concurrency)
+        self.response_cache = response_cache
 
-    def chunk(self, document: Document) -> List[Document]:
-        """Split text into chunks using LLM to determine natural breakpoints based on context"""
-        if len(document.content) <= self.max_chunk_size:
-            return [document]
-
-        chunks: List[Document] = []
-        remaining_text = self.clean_text(document.content)
-        chunk_meta_data = document.meta_data
-        chunk_number = 1
-
-        while remaining_text:
-            # Ask model to find a good breakpoint within max_chunk_size
-            prompt = f"""Analyze this text and determine a natural breakpoint within the first {self.max_chunk_size} characters.
+    def _get_messages(self, text: str) -> List[Message]:
+        # Ask model to find a good breakpoint within max_chunk_size
+        prompt = f"""Analyze this text and determine a natural breakpoint within the first {self.max_chunk_size} characters.
             Consider semantic completeness, paragraph boundaries, and topic transitions.
             Return only the character position number of where to break the text:
 
-            {remaining_text[: self.max_chunk_size]}"""
+            {text[: self.max_chunk_size]}"""
+        return [Message(role="user", content=prompt)]
 
+    def _get_break_point(self, response: Optional[ModelResponse]) -> int:
+        if response and response.content:
+            break_point = min(int(response.content.strip()), self.max_chunk_size)
+            # Fallback to max size if the model returns a position that would not make progress
+            if break_point > 0:
+                return break_point
+        return self.max_chunk_size
+
+    def _chunk_text(self, text: str) -> List[str]:
+        """Split text into chunks, asking the model for one breakpoint at a time"""
+        chunks: List[str] = []
+        remaining_text = text
+        while remaining_text:
             try:
-                response = self.model.response([Message(role="user", content=prompt)])
-                if response and response.content:
-                    break_point = min(int(response.content.strip()), self.max_chunk_size)
-                else:
-                    break_point = self.max_chunk_size
+                response = self.model.response(self._get_messages(remaining_text), response_cache=self.response_cache)
+                break_point = self._get_break_point(response)
             except Exception:
                 # Fallback to max size if model fails
                 break_point = self.max_chunk_size
 
             # Extract chunk and update remaining text
-            chunk = remaining_text[:break_point].strip()
+            chunks.append(remaining_text[:break_point].strip())
+            remaining_text = remaining_text[break_point:].strip()
+        return chunks
+
+    async def _achunk_text(self, text: str) -> List[str]:
+        """Split text into chunks, asking the model for one breakpoint at a time without blocking the event loop"""
+        chunks: List[str] = []
+        remaining_text = text
+        while remaining_text:
+            try:
+                response = await self.model.aresponse(
+                    self._get_messages(remaining_text), response_cache=self.response_cache
+                )
+                break_point = self._get_break_point(response)
+            except Exception:
+                # Fallback to max size if model fails
+                break_point = self.max_chunk_size
+
+            chunks.append(remaining_text[:break_point].strip())
+            remaining_text = remaining_text[break_point:].strip()
+        return chunks
+
+    def _get_windows(self, document: Document) -> List[str]:
+        # Split the raw content, as cleaning the text removes the line breaks between paragraphs
+        windows = split_into_windows(document.content, self.window_size)  # type: ignore
+        return [self.clean_text(window) for window in windows]
+
+    def _make_chunks(self, document: Document, texts: List[str]) -> List[Document]:
+        chunks: List[Document] = []
+        chunk_meta_data = document.meta_data
+        # Skip chunks of windows that only contain whitespace
+        for chunk_number, chunk in enumerate([text for text in texts if text], start=1):
             meta_data = chunk_meta_data.copy()
             meta_data["chunk"] = chunk_number
-            chunk_id = None
-            if document.id:
-                chunk_id = f"{document.id}_{chunk_number}"
-            elif document.name:
-                chunk_id = f"{document.name}_{chunk_number}"
+            chunk_id = self.get_chunk_id(document, chunk_number, chunk)
             meta_data["chunk_size"] = len(chunk)
             chunks.append(
                 Document(
@@ -66,11 +142,37 @@ class AgenticChunking(ChunkingStrategy):
                     content=chunk,
                 )
             )
-            chunk_number += 1
+        return chunks
 
-            remaining_text = remaining_text[break_point:].strip()
+    def chunk(self, document: Document) -> List[Document]:
+        """Split text into chunks using LLM to determine natural breakpoints based on context"""
+        if len(document.content) <= self.max_chunk_size:
+            return [document]
 
-            if not remaining_text:
-                break
+        if self.window_size is None:
+            return self._make_chunks(document, self._chunk_text(self.clean_text(document.content)))
 
-        return chunks
+        windows = self._get_windows(document)
+        log_debug(f"Chunking {len(windows)} windows of {document.name or document.id or 'document'}")
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(windows))) as executor:
+            window_chunks = list(executor.map(self._chunk_text, windows))
+        return self._make_chunks(document, [chunk for chunks in window_chunks for chunk in chunks])
+
+    async def achunk(self, document: Document) -> List[Document]:
+        """Split text into chunks like `chunk`, running the model calls of the windows concurrently"""
+        if len(document.content) <= self.max_chunk_size:
+            return [document]
+
+        if self.window_size is None:
+            return self._make_chunks(document, await self._achunk_text(self.clean_text(document.content)))
+
+        windows = self._get_windows(document)
+        log_debug(f"Chunking {len(windows)} windows of {document.name or document.id or 'document'}")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def chunk_window(window: str) -> List[str]:
+            async with semaphore:
+                return await self._achunk_text(window)
+
+        window_chunks = await asyncio.gather(*[chunk_window(window) for window in windows])
+        return self._make_chunks(document, [chunk for chunks in window_chunks for chunk in chunks])
@@ -34,11 +34,7 @@ class DocumentChunking(ChunkingStrategy):
             else:
                 meta_data = chunk_meta_data.copy()
                 meta_data["chunk"] = chunk_number
-                chunk_id = None
-                if document.id:
-                    chunk_id = f"{document.id}_{chunk_number}"
-                elif document.name:
-                    chunk_id = f"{document.name}_{chunk_number}"
+                chunk_id = self.get_chunk_id(document, chunk_number, "\n\n".join(current_chunk))
                 meta_data["chunk_size"] = len("\n\n".join(current_chunk))
                 if current_chunk:
                     chunks.append(
@@ -46,17 +42,14 @@ class DocumentChunking(ChunkingStrategy):
                             id=chunk_id, name=document.name, meta_data=meta_data, content="\n\n".join(current_chunk)
                         )
                     )
+                    chunk_number += 1
                 current_chunk = [para]
                 current_size = para_size
 
         if current_chunk:
             meta_data = chunk_meta_data.copy()
             meta_data["chunk"] = chunk_number
-            chunk_id = None
-            if document.id:
-                chunk_id = f"{document.id}_{chunk_number}"
-            elif document.name:
-                chunk_id = f"{document.name}_{chunk_number}"
+            chunk_id = self.get_chunk_id(document, chunk_number, "\n\n".join(current_chunk))
             meta_data["chunk_size"] = len("\n\n".join(current_chunk))
             chunks.append(
                 Document(id=chunk_id, name=document.name, meta_data=meta_data, content="\n\n".join(current_chunk))
@@ -70,10 +63,8 @@ class DocumentChunking(ChunkingStrategy):
                     # Add overlap from previous chunk
                     prev_text = chunks[i - 1].content[-self.overlap :]
                     meta_data = chunk_meta_data.copy()
-                    meta_data["chunk"] = chunk_number
-                    chunk_id = None
-                    if document.id:
-                        chunk_id = f"{document.id}_{chunk_number}"
+                    meta_data["chunk"] = chunks[i].meta_data["chunk"]
+                    chunk_id = chunks[i].id
                     meta_data["chunk_size"] = len(prev_text + chunks[i].content)
                     if prev_text:
                         overlapped_chunks.append(
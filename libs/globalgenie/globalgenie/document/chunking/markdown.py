@@ -91,11 +91,7 @@ class MarkdownChunking(ChunkingStrategy):
             else:
                 meta_data = chunk_meta_data.copy()
                 meta_data["chunk"] = chunk_number
-                chunk_id = None
-                if document.id:
-                    chunk_id = f"{document.id}_{chunk_number}"
-                elif document.name:
-                    chunk_id = f"{document.name}_{chunk_number}"
+                chunk_id = self.get_chunk_id(document, chunk_number, "\n\n".join(current_chunk))
                 meta_data["chunk_size"] = len("\n\n".join(current_chunk))
 
                 if current_chunk:
@@ -112,11 +108,7 @@ class MarkdownChunking(ChunkingStrategy):
         if current_chunk:
             meta_data = chunk_meta_data.copy()
             meta_data["chunk"] = chunk_number
-            chunk_id = None
-            if document.id:
-                chunk_id = f"{document.id}_{chunk_number}"
-            elif document.name:
-                chunk_id = f"{document.name}_{chunk_number}"
+            chunk_id = self.get_chunk_id(document, chunk_number, "\n\n".join(current_chunk))
             meta_data["chunk_size"] = len("\n\n".join(current_chunk))
             chunks.append(
                 Document(id=chunk_id, name=document.name, meta_data=meta_data, content="\n\n".join(current_chunk))
@@ -39,7 +39,7 @@ class SemanticChunking(ChunkingStrategy):
         for i, chunk in enumerate(chunks, 1):
             meta_data = document.meta_data.copy()
             meta_data["chunk"] = i
-            chunk_id = f"{document.id}_{i}" if document.id else None
+            chunk_id = self.get_chunk_id(document, i, chunk.text)
             meta_data["chunk_size"] = len(chunk.text)
 
             chunked_documents.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk.text))
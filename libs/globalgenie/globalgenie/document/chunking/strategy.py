@@ -1,7 +1,12 @@
+import asyncio
+import re
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, List
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
+
+# Runs of whitespace, collapsed to a single space when cleaning text
+WHITESPACE_PATTERN = re.compile(r"\s+")
 
 
 class ChunkingStrategy(ABC):
@@ -11,21 +16,14 @@ class ChunkingStrategy(ABC):
     def chunk(self, document: Document) -> List[Document]:
         raise NotImplementedError
 
+    async def achunk(self, document: Document) -> List[Document]:
+        """Split a document without blocking the event loop. Runs `chunk` in a thread unless overridden."""
+        return await asyncio.to_thread(self.chunk, document)
+
+    def get_chunk_id(self, document: Document, position: Any, content: str) -> str:
+        """Return a stable id for a chunk of a document, derived from the document, its position and its content"""
+        return get_document_id(content, source=document.id or document.name, position=position)
+
     def clean_text(self, text: str) -> str:
-        """Clean the text by replacing multiple newlines with a single newline"""
-        import re
-
-        # Replace multiple newlines with a single newline
-        cleaned_text = re.sub(r"\n+", "\n", text)
-        # Replace multiple spaces with a single space
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
-        # Replace multiple tabs with a single tab
-        cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
-        # Replace multiple carriage returns with a single carriage return
-        cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
-        # Replace multiple form feeds with a single form feed
-        cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
-        # Replace multiple vertical tabs with a single vertical tab
-        cleaned_text = re.sub(r"\v+", "\v", cleaned_text)
-
-        return cleaned_text
+        """Clean the text by replacing runs of whitespace (newlines, tabs, etc.) with a single space, in one pass"""
+        return WHITESPACE_PATTERN.sub(" ", text)
@@ -0,0 +1,210 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from globalgenie.document.base import Document, get_document_id
+from globalgenie.document.chunking.strategy import WHITESPACE_PATTERN, ChunkingStrategy
+
+# Text pieces that are one token or more for BPE tokenizers: words, numbers and runs of punctuation,
+# with their leading space
+_TOKEN_PATTERN = re.compile(r" ?[^\W\d_]+| ?\d{1,3}| ?(?:[^\s\w]|_)+|\s+(?!\S)|\s+")
+
+
+class Tokenizer(ABC):
+    """Splits text into tokens and joins them back. decode(encode(text)) must return the text."""
+
+    @abstractmethod
+    def encode(self, text: str) -> List[Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, tokens: List[Any]) -> str:
+        raise NotImplementedError
+
+
+class RegexTokenizer(Tokenizer):
+    """Approximates BPE tokenizers by splitting text on words, numbers and punctuation.
+
+    Each piece is at least one token for the tokenizers of common embedders, so chunks never exceed their limit.
+    """
+
+    def encode(self, text: str) -> List[Any]:
+        return _TOKEN_PATTERN.findall(text)
+
+    def decode(self, tokens: List[Any]) -> str:
+        return "".join(tokens)
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Counts tokens exactly with a `tiktoken` encoding, e.g. cl100k_base used by the OpenAI embedders"""
+
+    def __init__(self, encoding_name: str = "cl100k_base"):
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError("`tiktoken` not installed. Please install using `pip install tiktoken`")
+
+        self.encoding = tiktoken.get_encoding(encoding_name)
+
+    def encode(self, text: str) -> List[Any]:
+        return self.encoding.encode(text, disallowed_special=())
+
+    def decode(self, tokens: List[Any]) -> str:
+        return self.encoding.decode(tokens)
+
+
+def get_default_tokenizer() -> Tokenizer:
+    """Return a TiktokenTokenizer if `tiktoken` is installed, otherwise a RegexTokenizer"""
+    try:
+        return TiktokenTokenizer()
+    except ImportError:
+        return RegexTokenizer()
+
+
+class _StreamCleaner:
+    """Cleans a stream of text like ChunkingStrategy.clean_text, also collapsing whitespace split across pieces"""
+
+    def __init__(self):
+        self.last_is_space = False
+
+    def clean(self, text: str) -> str:
+        cleaned = WHITESPACE_PATTERN.sub(" ", text)
+        if self.last_is_space and cleaned.startswith(" "):
+            cleaned = cleaned[1:]
+        if cleaned:
+            self.last_is_space = cleaned.endswith(" ")
+        return cleaned
+
+
+class TokenChunking(ChunkingStrategy):
+    """Chunking strategy that splits text into chunks of `chunk_size` tokens, overlapping by `overlap` tokens.
+
+    Chunk sizes are measured with the tokenizer of the embedder, so chunks fit its token limit exactly.
+    `chunk_stream` chunks text as it is read, so large files do not need to be loaded whole.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 512,
+        overlap: int = 0,
+        tokenizer: Optional[Tokenizer] = None,
+        clean: bool = True,
+        buffer_size: int = 64 * 1024,
+    ):
+        """
+        Args:
+            chunk_size: Maximum number of tokens per chunk.
+            overlap: Number of tokens repeated at the start of the next chunk.
+            tokenizer: Tokenizer used to count tokens, by default tiktoken's cl100k_base if it is installed.
+            clean: If True, runs of whitespace are replaced with a single space.
+            buffer_size: Number of characters of a stream tokenized at a time.
+        """
+        # overlap must be less than chunk size
+        if overlap >= chunk_size:
+            raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
+
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.tokenizer = tokenizer or get_default_tokenizer()
+        self.clean = clean
+        self.buffer_size = buffer_size
+
+    def chunk(self, document: Document) -> List[Document]:
+        """Split document into chunks of chunk_size tokens"""
+        content = document.content
+        pieces = (content[i : i + self.buffer_size] for i in range(0, len(content), self.buffer_size))
+        return list(self.chunk_stream(pieces, name=document.name, id=document.id, meta_data=document.meta_data))
+
+    def chunk_stream(
+        self,
+        text_stream: Iterable[str],
+        name: Optional[str] = None,
+        id: Optional[str] = None,
+        meta_data: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Document]:
+        """Yield chunks of a stream of text, e.g. the blocks of a file, as soon as they are complete"""
+        chunker = _StreamChunker(self, name=name, id=id, meta_data=meta_data)
+        cleaner = _StreamCleaner() if self.clean else None
+        for text in text_stream:
+            yield from chunker.add(cleaner.clean(text) if cleaner is not None else text)
+        yield from chunker.finish()
+
+    async def achunk_stream(
+        self,
+        text_stream: AsyncIterable[str],
+        name: Optional[str] = None,
+        id: Optional[str] = None,
+        meta_data: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Document]:
+        """Yield chunks of an async stream of text as soon as they are complete"""
+        chunker = _StreamChunker(self, name=name, id=id, meta_data=meta_data)
+        cleaner = _StreamCleaner() if self.clean else None
+        async for text in text_stream:
+            for chunk in chunker.add(cleaner.clean(text) if cleaner is not None else text):
+                yield chunk
+        for chunk in chunker.finish():
+            yield chunk
+
+
+class _StreamChunker:
+    """Tokenizes text as it arrives and cuts it into chunks of exactly chunk_size tokens"""
+
+    def __init__(
+        self,
+        strategy: TokenChunking,
+        name: Optional[str] = None,
+        id: Optional[str] = None,
+        meta_data: Optional[Dict[str, Any]] = None,
+    ):
+        self.strategy = strategy
+        self.name = name
+        self.id = id
+        self.meta_data = meta_data or {}
+        self.chunk_number = 1
+        # Text not tokenized yet, as a token may continue in the next piece of text
+        self.pending_text = ""
+        self.tokens: List[Any] = []
+
+    def add(self, text: str) -> Iterator[Document]:
+        self.pending_text += text
+        if len(self.pending_text) < self.strategy.buffer_size:
+            return
+        # Tokenize up to the last whitespace, as tokens start with the space before a word
+        split_at = max(self.pending_text.rfind(" "), self.pending_text.rfind("\n"))
+        if split_at <= 0:
+            return
+        self.tokens.extend(self.strategy.tokenizer.encode(self.pending_text[:split_at]))
+        self.pending_text = self.pending_text[split_at:]
+        yield from self._emit_full_chunks()
+
+    def finish(self) -> Iterator[Document]:
+        if self.pending_text:
+            self.tokens.extend(self.strategy.tokenizer.encode(self.pending_text))
+            self.pending_text = ""
+        yield from self._emit_full_chunks()
+        # The rest is a chunk, unless it was already included as the overlap of the previous chunk
+        if self.tokens and (self.chunk_number == 1 or len(self.tokens) > self.strategy.overlap):
+            yield self._make_chunk(self.tokens)
+            self.tokens = []
+
+    def _emit_full_chunks(self) -> Iterator[Document]:
+        chunk_size = self.strategy.chunk_size
+        step = chunk_size - self.strategy.overlap
+        # Drop the emitted tokens once at the end, as removing them per chunk copies the rest of the list each time
+        start = 0
+        try:
+            while len(self.tokens) - start > chunk_size:
+                yield self._make_chunk(self.tokens[start : start + chunk_size])
+                start += step
+        finally:
+            del self.tokens[:start]
+
+    def _make_chunk(self, tokens: List[Any]) -> Document:
+        content = self.strategy.tokenizer.decode(tokens)
+        meta_data = self.meta_data.copy()
+        meta_data["chunk"] = self.chunk_number
+        meta_data["chunk_size"] = len(content)
+        meta_data["chunk_tokens"] = len(tokens)
+        chunk_id = get_document_id(content, source=self.id or self.name, position=self.chunk_number)
+        self.chunk_number += 1
+        return Document(id=chunk_id, name=self.name, meta_data=meta_data, content=content)
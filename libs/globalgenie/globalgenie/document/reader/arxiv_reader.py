@@ -1,7 +1,7 @@
 import asyncio
 from typing import List
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.reader.base import Reader
 
 try:
@@ -33,7 +33,7 @@ class ArxivReader(Reader):
             documents.append(
                 Document(
                     name=result.title,
-                    id=result.title,
+                    id=get_document_id(result.summary, source=str(result.entry_id)),
                     meta_data={"pdf_url": str(result.pdf_url), "article_links": links},
                     content=result.summary,
                 )
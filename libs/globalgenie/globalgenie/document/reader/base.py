@@ -39,7 +39,9 @@ class Reader:
         """
 
         async def _chunk_document_async(doc: Document) -> List[Document]:
-            return await asyncio.to_thread(self.chunk_document, doc)
+            if self.chunking_strategy is None:
+                self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
+            return await self.chunking_strategy.achunk(doc)
 
         # Process chunking in parallel for all documents
         chunked_lists = await asyncio.gather(*[_chunk_document_async(doc) for doc in documents])
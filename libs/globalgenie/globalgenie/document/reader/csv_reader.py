@@ -5,7 +5,6 @@ import os
 from pathlib import Path
 from typing import IO, Any, List, Optional, Union
 from urllib.parse import urlparse
-from uuid import uuid4
 
 from globalgenie.utils.http import async_fetch_with_retry, fetch_with_retry
 
@@ -14,7 +13,7 @@ try:
 except ImportError:
     raise ImportError("`aiofiles` not installed. Please install it with `pip install aiofiles`")
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.reader.base import Reader
 from globalgenie.utils.log import logger
 
@@ -44,7 +43,7 @@ class CSVReader(Reader):
             documents = [
                 Document(
                     name=csv_name,
-                    id=str(uuid4()),
+                    id=get_document_id(csv_content, source=csv_name),
                     content=csv_content,
                 )
             ]
@@ -98,7 +97,7 @@ class CSVReader(Reader):
                 documents = [
                     Document(
                         name=csv_name,
-                        id=str(uuid4()),
+                        id=get_document_id(csv_content, source=csv_name),
                         content=csv_content,
                     )
                 ]
@@ -114,7 +113,7 @@ class CSVReader(Reader):
 
                     return Document(
                         name=csv_name,
-                        id=str(uuid4()),
+                        id=get_document_id(page_content, source=csv_name, position=page_number),
                         meta_data={"page": page_number, "start_row": start_row, "rows": len(page_rows)},
                         content=page_content,
                     )
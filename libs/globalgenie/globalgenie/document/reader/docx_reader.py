@@ -1,9 +1,8 @@
 import asyncio
 from pathlib import Path
 from typing import IO, Any, List, Union
-from uuid import uuid4
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.reader.base import Reader
 from globalgenie.utils.log import log_info, logger
 
@@ -35,7 +34,7 @@ class DocxReader(Reader):
             documents = [
                 Document(
                     name=doc_name,
-                    id=str(uuid4()),
+                    id=get_document_id(doc_content, source=doc_name),
                     content=doc_content,
                 )
             ]
@@ -2,7 +2,7 @@ import asyncio
 from dataclasses import dataclass
 from typing import Dict, List, Literal, Optional
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.chunking.strategy import ChunkingStrategy
 from globalgenie.document.reader.base import Reader
 from globalgenie.utils.log import log_debug, logger
@@ -70,10 +70,11 @@ class FirecrawlReader(Reader):
             logger.warning(f"No content received for URL: {url}")
 
         documents = []
+        document = Document(name=url, id=get_document_id(content, source=url), content=content)
         if self.chunk and content:  # Only chunk if there's content
-            documents.extend(self.chunk_document(Document(name=url, id=url, content=content)))
+            documents.extend(self.chunk_document(document))
         else:
-            documents.append(Document(name=url, id=url, content=content))
+            documents.append(document)
         return documents
 
     async def async_scrape(self, url: str) -> List[Document]:
@@ -123,10 +124,11 @@ class FirecrawlReader(Reader):
                 content = getattr(result, "markdown", "")
 
             if content:  # Only create document if content exists
+                document = Document(name=url, id=get_document_id(content, source=url), content=content)
                 if self.chunk:
-                    documents.extend(self.chunk_document(Document(name=url, id=url, content=content)))
+                    documents.extend(self.chunk_document(document))
                 else:
-                    documents.append(Document(name=url, id=url, content=content))
+                    documents.append(document)
 
         return documents
 
@@ -3,9 +3,8 @@ import json
 from io import BytesIO
 from pathlib import Path
 from typing import IO, Any, List, Union
-from uuid import uuid4
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.reader.base import Reader
 from globalgenie.utils.log import log_info
 
@@ -36,15 +35,17 @@ class JSONReader(Reader):
             if isinstance(json_contents, dict):
                 json_contents = [json_contents]
 
-            documents = [
-                Document(
-                    name=json_name,
-                    id=str(uuid4()),
-                    meta_data={"page": page_number},
-                    content=json.dumps(content),
+            documents = []
+            for page_number, content in enumerate(json_contents, start=1):
+                page_content = json.dumps(content)
+                documents.append(
+                    Document(
+                        name=json_name,
+                        id=get_document_id(page_content, source=json_name, position=page_number),
+                        meta_data={"page": page_number},
+                        content=page_content,
+                    )
                 )
-                for page_number, content in enumerate(json_contents, start=1)
-            ]
             if self.chunk:
                 chunked_documents = []
                 for document in documents:
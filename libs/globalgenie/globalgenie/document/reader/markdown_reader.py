@@ -1,9 +1,8 @@
 import asyncio
-import uuid
 from pathlib import Path
 from typing import IO, Any, List, Optional, Union
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.chunking.markdown import MarkdownChunking
 from globalgenie.document.chunking.strategy import ChunkingStrategy
 from globalgenie.document.reader.base import Reader
@@ -30,7 +29,8 @@ class MarkdownReader(Reader):
                 file.seek(0)
                 file_contents = file.read().decode("utf-8")
 
-            documents = [Document(name=file_name, id=str({uuid.uuid4()}), content=file_contents)]
+            document_id = get_document_id(file_contents, source=file_name)
+            documents = [Document(name=file_name, id=document_id, content=file_contents)]
             if self.chunk:
                 chunked_documents = []
                 for document in documents:
@@ -66,7 +66,7 @@ class MarkdownReader(Reader):
 
             document = Document(
                 name=file_name,
-                id=str(uuid.uuid4()),  # Fixed an issue with the id creation
+                id=get_document_id(file_contents, source=file_name),
                 content=file_contents,
             )
 
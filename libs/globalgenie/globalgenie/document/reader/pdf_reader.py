@@ -1,9 +1,8 @@
 import asyncio
 from pathlib import Path
 from typing import IO, Any, List, Optional, Union
-from uuid import uuid4
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.reader.base import Reader
 from globalgenie.utils.http import async_fetch_with_retry, fetch_with_retry
 from globalgenie.utils.log import log_info, logger
@@ -43,7 +42,7 @@ def process_image_page(doc_name: str, page_number: int, page: Any) -> Document:
     # Append the document
     return Document(
         name=doc_name,
-        id=str(uuid4()),
+        id=get_document_id(content, source=doc_name, position=page_number),
         meta_data={"page": page_number},
         content=content,
     )
@@ -77,7 +76,7 @@ async def async_process_image_page(doc_name: str, page_number: int, page: Any) -
 
     return Document(
         name=doc_name,
-        id=str(uuid4()),
+        id=get_document_id(content, source=doc_name, position=page_number),
         meta_data={"page": page_number},
         content=content,
     )
@@ -113,12 +112,13 @@ class PDFReader(BasePDFReader):
 
         documents = []
         for page_number, page in enumerate(doc_reader.pages, start=1):
+            page_text = page.extract_text()
             documents.append(
                 Document(
                     name=doc_name,
-                    id=str(uuid4()),
+                    id=get_document_id(page_text, source=doc_name, position=page_number),
                     meta_data={"page": page_number},
-                    content=page.extract_text(),
+                    content=page_text,
                 )
             )
         if self.chunk:
@@ -143,11 +143,12 @@ class PDFReader(BasePDFReader):
             return []
 
         async def _process_document(doc_name: str, page_number: int, page: Any) -> Document:
+            page_text = page.extract_text()
             return Document(
                 name=doc_name,
-                id=str(uuid4()),
+                id=get_document_id(page_text, source=doc_name, position=page_number),
                 meta_data={"page": page_number},
-                content=page.extract_text(),
+                content=page_text,
             )
 
         # Process pages in parallel using asyncio.gather
@@ -186,12 +187,13 @@ class PDFUrlReader(BasePDFReader):
 
         documents = []
         for page_number, page in enumerate(doc_reader.pages, start=1):
+            page_text = page.extract_text()
             documents.append(
                 Document(
                     name=doc_name,
-                    id=f"{doc_name}_{page_number}",
+                    id=get_document_id(page_text, source=url, position=page_number),
                     meta_data={"page": page_number},
-                    content=page.extract_text(),
+                    content=page_text,
                 )
             )
         if self.chunk:
@@ -216,11 +218,12 @@ class PDFUrlReader(BasePDFReader):
         doc_reader = DocumentReader(BytesIO(response.content))
 
         async def _process_document(doc_name: str, page_number: int, page: Any) -> Document:
+            page_text = page.extract_text()
             return Document(
                 name=doc_name,
-                id=f"{doc_name}_{page_number}",
+                id=get_document_id(page_text, source=url, position=page_number),
                 meta_data={"page": page_number},
-                content=page.extract_text(),
+                content=page_text,
             )
 
         # Process pages in parallel using asyncio.gather
@@ -1,9 +1,8 @@
 import asyncio
 from io import BytesIO
 from typing import List
-from uuid import uuid4
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.reader.base import Reader
 from globalgenie.utils.log import log_info
 
@@ -29,15 +28,17 @@ class S3PDFReader(Reader):
             object_body = object_resource.get()["Body"]
             doc_name = s3_object.name.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
             doc_reader = DocumentReader(BytesIO(object_body.read()))
-            documents = [
-                Document(
-                    name=doc_name,
-                    id=str(uuid4()),
-                    meta_data={"page": page_number},
-                    content=page.extract_text(),
+            documents = []
+            for page_number, page in enumerate(doc_reader.pages, start=1):
+                page_text = page.extract_text()
+                documents.append(
+                    Document(
+                        name=doc_name,
+                        id=get_document_id(page_text, source=doc_name, position=page_number),
+                        meta_data={"page": page_number},
+                        content=page_text,
+                    )
                 )
-                for page_number, page in enumerate(doc_reader.pages, start=1)
-            ]
             if self.chunk:
                 chunked_documents = []
                 for document in documents:
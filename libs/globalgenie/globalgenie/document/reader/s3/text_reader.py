@@ -2,7 +2,7 @@ import asyncio
 from pathlib import Path
 from typing import List
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.reader.base import Reader
 from globalgenie.utils.log import log_debug, log_info, logger
 
@@ -30,12 +30,12 @@ class S3TextReader(Reader):
 
             log_info(f"Parsing: {temporary_file}")
             doc_name = s3_object.name.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
-            doc_content = textract.process(temporary_file)
+            doc_content = textract.process(temporary_file).decode("utf-8")
             documents = [
                 Document(
                     name=doc_name,
-                    id=doc_name,
-                    content=doc_content.decode("utf-8"),
+                    id=get_document_id(doc_content, source=s3_object.uri),
+                    content=doc_content,
                 )
             ]
             if self.chunk:
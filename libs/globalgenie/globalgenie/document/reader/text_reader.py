@@ -1,21 +1,43 @@
 import asyncio
-import uuid
 from pathlib import Path
-from typing import IO, Any, List, Union
+from typing import IO, Any, AsyncIterator, List, Union
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
+from globalgenie.document.chunking.token import TokenChunking
 from globalgenie.document.reader.base import Reader
 from globalgenie.utils.log import log_info, logger
 
 
+# Number of characters read from a file at a time when chunking it as a stream
+STREAM_BLOCK_SIZE = 1024 * 1024
+
+
+async def _aread_blocks(file: Any) -> AsyncIterator[str]:
+    while True:
+        block = await file.read(STREAM_BLOCK_SIZE)
+        if not block:
+            return
+        yield block
+
+
 class TextReader(Reader):
-    """Reader for Text files"""
+    """Reader for Text files
+
+    With a TokenChunking strategy, files are read and chunked in blocks, so large files are not loaded whole.
+    """
 
     def read(self, file: Union[Path, IO[Any]]) -> List[Document]:
         try:
             if isinstance(file, Path):
                 if not file.exists():
                     raise FileNotFoundError(f"Could not find file: {file}")
+                if self.chunk and isinstance(self.chunking_strategy, TokenChunking):
+                    log_info(f"Reading and chunking: {file}")
+                    with file.open("r", encoding="utf-8") as f:
+                        blocks = iter(lambda: f.read(STREAM_BLOCK_SIZE), "")
+                        return list(
+                            self.chunking_strategy.chunk_stream(blocks, name=file.stem)
+                        )
                 log_info(f"Reading: {file}")
                 file_name = file.stem
                 file_contents = file.read_text("utf-8")
@@ -28,7 +50,7 @@ class TextReader(Reader):
             documents = [
                 Document(
                     name=file_name,
-                    id=str({uuid.uuid4()}),
+                    id=get_document_id(file_contents, source=file_name),
                     content=file_contents,
                 )
             ]
@@ -54,6 +76,11 @@ class TextReader(Reader):
                 try:
                     import aiofiles
 
+                    if self.chunk and isinstance(self.chunking_strategy, TokenChunking):
+                        async with aiofiles.open(file, "r", encoding="utf-8") as f:
+                            chunks = self.chunking_strategy.achunk_stream(_aread_blocks(f), name=file_name)
+                            return [chunk async for chunk in chunks]
+
                     async with aiofiles.open(file, "r", encoding="utf-8") as f:
                         file_contents = await f.read()
                 except ImportError:
@@ -67,7 +94,7 @@ class TextReader(Reader):
 
             document = Document(
                 name=file_name,
-                id=str({uuid.uuid4()}),
+                id=get_document_id(file_contents, source=file_name),
                 content=file_contents,
             )
 
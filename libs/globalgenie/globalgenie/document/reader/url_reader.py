@@ -3,7 +3,7 @@ from urllib.parse import urlparse
 
 import httpx
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.reader.base import Reader
 from globalgenie.utils.http import async_fetch_with_retry, fetch_with_retry
 from globalgenie.utils.log import log_debug
@@ -53,7 +53,7 @@ class URLReader(Reader):
 
         return Document(
             name=doc_name,
-            id=doc_name,
+            id=get_document_id(content, source=url),
             meta_data={"url": url},
             content=content,
         )
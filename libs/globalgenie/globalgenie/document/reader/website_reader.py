@@ -7,7 +7,7 @@ from urllib.parse import urljoin, urlparse
 
 import httpx
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.reader.base import Reader
 from globalgenie.utils.log import log_debug, logger
 
@@ -339,7 +339,7 @@ class WebsiteReader(Reader):
                         self.chunk_document(
                             Document(
                                 name=url,
-                                id=str(crawled_url),
+                                id=get_document_id(crawled_content, source=str(crawled_url)),
                                 meta_data={"url": str(crawled_url)},
                                 content=crawled_content,
                             )
@@ -349,7 +349,7 @@ class WebsiteReader(Reader):
                     documents.append(
                         Document(
                             name=url,
-                            id=str(crawled_url),
+                            id=get_document_id(crawled_content, source=str(crawled_url)),
                             meta_data={"url": str(crawled_url)},
                             content=crawled_content,
                         )
@@ -380,14 +380,17 @@ class WebsiteReader(Reader):
             async def process_document(crawled_url, crawled_content):
                 if self.chunk:
                     doc = Document(
-                        name=url, id=str(crawled_url), meta_data={"url": str(crawled_url)}, content=crawled_content
+                        name=url,
+                        id=get_document_id(crawled_content, source=str(crawled_url)),
+                        meta_data={"url": str(crawled_url)},
+                        content=crawled_content,
                     )
                     return self.chunk_document(doc)
                 else:
                     return [
                         Document(
                             name=url,
-                            id=str(crawled_url),
+                            id=get_document_id(crawled_content, source=str(crawled_url)),
                             meta_data={"url": str(crawled_url)},
                             content=crawled_content,
                         )
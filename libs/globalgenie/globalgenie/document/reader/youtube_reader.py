@@ -1,7 +1,7 @@
 import asyncio
 from typing import List
 
-from globalgenie.document.base import Document
+from globalgenie.document.base import Document, get_document_id
 from globalgenie.document.reader.base import Reader
 from globalgenie.utils.log import log_info, logger
 
@@ -33,7 +33,7 @@ class YouTubeReader(Reader):
             documents = [
                 Document(
                     name=f"youtube_{video_id}",
-                    id=f"youtube_{video_id}",
+                    id=get_document_id(transcript_text, source=video_url),
                     meta_data={"video_url": video_url, "video_id": video_id},
                     content=transcript_text.strip(),
                 )
@@ -13,3 +13,7 @@ class Embedder:
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed many texts. Embedders with a batch API override this to embed them in as few requests as possible."""
+        return [self.get_embedding(text) for text in texts]
@@ -42,3 +42,6 @@ class SentenceTransformerEmbedder(Embedder):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self.get_embedding(text=texts)  # type: ignore
@@ -1,4 +1,3 @@
-import asyncio
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
 
@@ -60,7 +59,7 @@ class AgentKnowledge(BaseModel):
                 return []
 
             _num_documents = num_documents or self.num_documents
-            log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
+            log_debug(lambda: f"Getting {_num_documents} relevant documents for query: {query}")
             return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
@@ -76,7 +75,7 @@ class AgentKnowledge(BaseModel):
                 return []
 
             _num_documents = num_documents or self.num_documents
-            log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
+            log_debug(lambda: f"Getting {_num_documents} relevant documents for query: {query}")
             try:
                 return await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
             except NotImplementedError:
@@ -223,11 +222,7 @@ class AgentKnowledge(BaseModel):
             log_info(f"Loaded {len(documents)} documents to knowledge base")
         else:
             # Filter out documents which already exist in the vector db
-            documents_to_load = (
-                [document for document in documents if not self.vector_db.doc_exists(document)]
-                if skip_existing
-                else documents
-            )
+            documents_to_load = self.filter_existing_documents(documents) if skip_existing else documents
 
             # Insert documents
             if len(documents_to_load) > 0:
@@ -274,20 +269,7 @@ class AgentKnowledge(BaseModel):
         else:
             # Filter out documents which already exist in the vector db
             if skip_existing:
-                try:
-                    # Parallelize existence checks using asyncio.gather
-                    existence_checks = await asyncio.gather(
-                        *[self.vector_db.async_doc_exists(document) for document in documents], return_exceptions=True
-                    )
-
-                    documents_to_load = [
-                        doc
-                        for doc, exists in zip(documents, existence_checks)
-                        if not (isinstance(exists, bool) and exists)
-                    ]
-                except NotImplementedError:
-                    logger.warning("Vector db does not support async doc_exists")
-                    documents_to_load = [document for document in documents if not self.vector_db.doc_exists(document)]
+                documents_to_load = await self.async_filter_existing_documents(documents)
             else:
                 documents_to_load = documents
 
@@ -420,7 +402,8 @@ class AgentKnowledge(BaseModel):
             log_debug("No vector database configured, skipping document filtering")
             return documents
 
-        # Use set for O(1) lookups
+        # Check the existence of all documents in one round trip, and use sets for O(1) lookups
+        existing_ids = self.vector_db.existing_ids(documents)
         seen_content = set()
         original_count = len(documents)
         filtered_documents = []
@@ -428,7 +411,7 @@ class AgentKnowledge(BaseModel):
         for doc in documents:
             # Check hash and existence in DB
             content_hash = doc.content  # Assuming doc.content is reliable hash key
-            if content_hash not in seen_content and not self.vector_db.doc_exists(doc):
+            if content_hash not in seen_content and self.vector_db.get_document_key(doc) not in existing_ids:
                 seen_content.add(content_hash)
                 filtered_documents.append(doc)
             else:
@@ -457,7 +440,8 @@ class AgentKnowledge(BaseModel):
             log_debug("No vector database configured, skipping document filtering")
             return documents
 
-        # Use set for O(1) lookups
+        # Check the existence of all documents in one round trip, and use sets for O(1) lookups
+        existing_ids = await self.vector_db.async_existing_ids(documents)
         seen_content = set()
         original_count = len(documents)
         filtered_documents = []
@@ -465,7 +449,7 @@ class AgentKnowledge(BaseModel):
         for doc in documents:
             # Check hash and existence in DB
             content_hash = doc.content  # Assuming doc.content is reliable hash key
-            if content_hash not in seen_content and not await self.vector_db.async_doc_exists(doc):
+            if content_hash not in seen_content and self.vector_db.get_document_key(doc) not in existing_ids:
                 seen_content.add(content_hash)
                 filtered_documents.append(doc)
             else:
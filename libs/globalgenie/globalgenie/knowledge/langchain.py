@@ -42,7 +42,7 @@ class LangChainKnowledgeBase(AgentKnowledge):
             raise ValueError(f"Retriever is not of type BaseRetriever: {self.retriever}")
 
         _num_documents = num_documents or self.num_documents
-        log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
+        log_debug(lambda: f"Getting {_num_documents} relevant documents for query: {query}")
         lc_documents: List[LangChainDocument] = self.retriever.invoke(input=query)
         documents = []
         for lc_doc in lc_documents:
@@ -90,7 +90,12 @@ class WebsiteKnowledgeBase(AgentKnowledge):
             if document_list := self.reader.read(url=url):
                 # Filter out documents which already exist in the vector db
                 if not recreate:
-                    document_list = [document for document in document_list if not self.vector_db.doc_exists(document)]
+                    existing_ids = self.vector_db.existing_ids(document_list)
+                    document_list = [
+                        document
+                        for document in document_list
+                        if self.vector_db.get_document_key(document) not in existing_ids
+                    ]
                     if not document_list:
                         continue
                 if upsert and self.vector_db.upsert_available():
@@ -148,11 +153,12 @@ class WebsiteKnowledgeBase(AgentKnowledge):
                 document_list = await reader.async_read(url=url)
 
                 if not recreate:
-                    filtered_documents = []
-                    for document in document_list:
-                        if not await vector_db.async_doc_exists(document):
-                            filtered_documents.append(document)
-                    document_list = filtered_documents
+                    existing_ids = await vector_db.async_existing_ids(document_list)
+                    document_list = [
+                        document
+                        for document in document_list
+                        if vector_db.get_document_key(document) not in existing_ids
+                    ]
 
                 return document_list
             except Exception as e:
@@ -1,7 +1,91 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, PrivateAttr, field_validator, model_validator
+
+from globalgenie.utils.log import log_warning
+
+
+class StoredContent(BaseModel):
+    """Media whose content can be kept in a content-addressed media store instead of inline.
+
+    When a media store is set (see `globalgenie.media_store.set_media_store`), `to_dict` stores the content once
+    and returns a `content_ref` instead of the encoded content. Media loaded from a reference fetches its content
+    from the store on first access.
+    """
+
+    # Name of the field holding the content, and whether it holds text such as base64-encoded audio
+    _content_field: ClassVar[str] = "content"
+    _content_is_text: ClassVar[bool] = False
+
+    # Reference to the content in the media store
+    content_ref: Optional[str] = None
+
+    # id() of the content the content_ref was created for, so changed content is stored again
+    _stored_content_id: Optional[int] = PrivateAttr(default=None)
+
+    def __getattribute__(self, name: str) -> Any:
+        if name == type(self)._content_field:
+            values = object.__getattribute__(self, "__dict__")
+            if values.get(name) is None and values.get("content_ref") is not None:
+                content: Any = _fetch_content(values["content_ref"])
+                if content is not None:
+                    if type(self)._content_is_text:
+                        content = content.decode("utf-8")
+                    values[name] = content
+                    self._stored_content_id = id(content)
+        return super().__getattribute__(name)
+
+    def _store_content(self) -> Optional[str]:
+        """Store the content in the media store and return its reference.
+        Returns None if the content should be inlined, because no media store is set or the content is not bytes
+        (or text, for fields holding text).
+        """
+        values = self.__dict__
+        content = values.get(type(self)._content_field)
+        if content is None:
+            # Content was never fetched, keep the reference
+            return values.get("content_ref")
+        if type(self)._content_is_text and isinstance(content, str):
+            data = content.encode("utf-8")
+        elif not type(self)._content_is_text and isinstance(content, bytes):
+            data = content
+        else:
+            return None
+
+        if values.get("content_ref") is not None and self._stored_content_id == id(content):
+            return values["content_ref"]
+
+        from globalgenie.media_store import get_media_store
+
+        media_store = get_media_store()
+        if media_store is None:
+            return None
+        try:
+            content_ref = media_store.put(data)
+        except Exception as e:
+            log_warning(f"Could not store media content, inlining it instead: {e}")
+            return None
+        values["content_ref"] = content_ref
+        self._stored_content_id = id(content)
+        return content_ref
+
+
+def _fetch_content(content_ref: str) -> Optional[bytes]:
+    from globalgenie.media_store import get_media_store
+
+    media_store = get_media_store()
+    if media_store is None:
+        log_warning(f"Media content {content_ref} is stored in a media store, but no media store is set")
+        return None
+    try:
+        content = media_store.get(content_ref)
+    except Exception as e:
+        log_warning(f"Could not fetch media content {content_ref}: {e}")
+        return None
+    if content is None:
+        log_warning(f"Media content {content_ref} not found in the media store")
+    return content
 
 
 class Media(BaseModel):
@@ -10,7 +94,7 @@ class Media(BaseModel):
     revised_prompt: Optional[str] = None
 
 
-class VideoArtifact(Media):
+class VideoArtifact(Media, StoredContent):
     url: Optional[str] = None  # Remote location for file (if no inline content)
     content: Optional[Union[str, bytes]] = None  # type: ignore
     mime_type: Optional[str] = None  # MIME type of the video content
@@ -18,10 +102,14 @@ class VideoArtifact(Media):
     length: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        content_ref = self._store_content()
         response_dict = {
             "id": self.id,
             "url": self.url,
-            "content": self.content
+            "content_ref": content_ref,
+            "content": None
+            if content_ref is not None
+            else self.content
             if isinstance(self.content, str)
             else self.content.decode("utf-8")
             if self.content
@@ -32,17 +120,21 @@ class VideoArtifact(Media):
         return {k: v for k, v in response_dict.items() if v is not None}
 
 
-class ImageArtifact(Media):
+class ImageArtifact(Media, StoredContent):
     url: Optional[str] = None  # Remote location for file
     content: Optional[bytes] = None  # Actual image bytes content
     mime_type: Optional[str] = None
     alt_text: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        content_ref = self._store_content()
         response_dict = {
             "id": self.id,
             "url": self.url,
-            "content": self.content.decode("utf-8")
+            "content_ref": content_ref,
+            "content": None
+            if content_ref is not None
+            else self.content.decode("utf-8")
             if self.content and isinstance(self.content, bytes)
             else self.content,
             "mime_type": self.mime_type,
@@ -51,7 +143,10 @@ class ImageArtifact(Media):
         return {k: v for k, v in response_dict.items() if v is not None}
 
 
-class AudioArtifact(Media):
+class AudioArtifact(Media, StoredContent):
+    _content_field: ClassVar[str] = "base64_audio"
+    _content_is_text: ClassVar[bool] = True
+
     url: Optional[str] = None  # Remote location for file
     base64_audio: Optional[str] = None  # Base64-encoded audio data
     length: Optional[str] = None
@@ -62,24 +157,29 @@ class AudioArtifact(Media):
         """
         Ensure that either `url` or `base64_audio` is provided, but not both.
         """
+        # to_dict serializes base64_audio as `content`
+        if data.get("content") and not data.get("base64_audio"):
+            data["base64_audio"] = data.pop("content")
         if data.get("url") and data.get("base64_audio"):
             raise ValueError("Provide either `url` or `base64_audio`, not both.")
-        if not data.get("url") and not data.get("base64_audio"):
+        if not data.get("url") and not data.get("base64_audio") and not data.get("content_ref"):
             raise ValueError("Either `url` or `base64_audio` must be provided.")
         return data
 
     def to_dict(self) -> Dict[str, Any]:
+        content_ref = self._store_content()
         response_dict = {
             "id": self.id,
             "url": self.url,
-            "content": self.base64_audio,
+            "content_ref": content_ref,
+            "content": self.base64_audio if content_ref is None else None,
             "mime_type": self.mime_type,
             "length": self.length,
         }
         return {k: v for k, v in response_dict.items() if v is not None}
 
 
-class Video(BaseModel):
+class Video(StoredContent):
     filepath: Optional[Union[Path, str]] = None  # Absolute local location for video
     content: Optional[Any] = None  # Actual video bytes content
     url: Optional[str] = None  # Remote location for video
@@ -110,7 +210,8 @@ class Video(BaseModel):
         data["content"] = content
 
         # Count how many fields are set (not None)
-        count = len([field for field in [filepath, content, url] if field is not None])
+        content_ref = data.get("content_ref")
+        count = len([field for field in [filepath, content or content_ref, url] if field is not None])
 
         if count == 0:
             raise ValueError("One of `filepath` or `content` or `url` must be provided.")
@@ -123,11 +224,13 @@ class Video(BaseModel):
         import base64
         import zlib
 
+        content_ref = self._store_content()
         response_dict = {
+            "content_ref": content_ref,
             "content": base64.b64encode(
                 zlib.compress(self.content) if isinstance(self.content, bytes) else self.content.encode("utf-8")
             ).decode("utf-8")
-            if self.content
+            if self.content and content_ref is None
             else None,
             "filepath": self.filepath,
             "format": self.format,
@@ -139,7 +242,7 @@ class Video(BaseModel):
         return cls(url=artifact.url)
 
 
-class Audio(BaseModel):
+class Audio(StoredContent):
     content: Optional[Any] = None  # Actual audio bytes content
     filepath: Optional[Union[Path, str]] = None  # Absolute local location for audio
     url: Optional[str] = None  # Remote location for audio
@@ -170,7 +273,8 @@ class Audio(BaseModel):
         data["content"] = content
 
         # Count how many fields are set (not None)
-        count = len([field for field in [filepath, content, url] if field is not None])
+        content_ref = data.get("content_ref")
+        count = len([field for field in [filepath, content or content_ref, url] if field is not None])
 
         if count == 0:
             raise ValueError("One of `filepath` or `content` or `url` must be provided.")
@@ -181,10 +285,10 @@ class Audio(BaseModel):
 
     @property
     def audio_url_content(self) -> Optional[bytes]:
-        import httpx
+        from globalgenie.utils.media_fetcher import get_media_fetcher
 
         if self.url:
-            return httpx.get(self.url).content
+            return get_media_fetcher().fetch(self.url).content
         else:
             return None
 
@@ -192,11 +296,13 @@ class Audio(BaseModel):
         import base64
         import zlib
 
+        content_ref = self._store_content()
         response_dict = {
+            "content_ref": content_ref,
             "content": base64.b64encode(
                 zlib.compress(self.content) if isinstance(self.content, bytes) else self.content.encode("utf-8")
             ).decode("utf-8")
-            if self.content
+            if self.content and content_ref is None
             else None,
             "filepath": self.filepath,
             "format": self.format,
@@ -209,7 +315,9 @@ class Audio(BaseModel):
         return cls(url=artifact.url, content=artifact.base64_audio, format=artifact.mime_type)
 
 
-class AudioResponse(BaseModel):
+class AudioResponse(StoredContent):
+    _content_is_text: ClassVar[bool] = True
+
     id: Optional[str] = None
     content: Optional[str] = None  # Base64 encoded
     expires_at: Optional[int] = None
@@ -222,9 +330,13 @@ class AudioResponse(BaseModel):
     def to_dict(self) -> Dict[str, Any]:
         import base64
 
+        content_ref = self._store_content()
         response_dict = {
             "id": self.id,
-            "content": base64.b64encode(self.content).decode("utf-8")
+            "content_ref": content_ref,
+            "content": None
+            if content_ref is not None
+            else base64.b64encode(self.content).decode("utf-8")
             if isinstance(self.content, bytes)
             else self.content,
             "expires_at": self.expires_at,
@@ -236,7 +348,7 @@ class AudioResponse(BaseModel):
         return {k: v for k, v in response_dict.items() if v is not None}
 
 
-class Image(BaseModel):
+class Image(StoredContent):
     url: Optional[str] = None  # Remote location for image
     filepath: Optional[Union[Path, str]] = None  # Absolute local location for image
     content: Optional[Any] = None  # Actual image bytes content
@@ -248,10 +360,10 @@ class Image(BaseModel):
 
     @property
     def image_url_content(self) -> Optional[bytes]:
-        import httpx
+        from globalgenie.utils.media_fetcher import get_media_fetcher
 
         if self.url:
-            return httpx.get(self.url).content
+            return get_media_fetcher().fetch(self.url).content
         else:
             return None
 
@@ -280,7 +392,8 @@ class Image(BaseModel):
         data["content"] = content
 
         # Count how many fields are set (not None)
-        count = len([field for field in [url, filepath, content] if field is not None])
+        content_ref = data.get("content_ref")
+        count = len([field for field in [url, filepath, content or content_ref] if field is not None])
 
         if count == 0:
             raise ValueError("One of `url`, `filepath`, or `content` must be provided.")
@@ -293,11 +406,13 @@ class Image(BaseModel):
         import base64
         import zlib
 
+        content_ref = self._store_content()
         response_dict = {
+            "content_ref": content_ref,
             "content": base64.b64encode(
                 zlib.compress(self.content) if isinstance(self.content, bytes) else self.content.encode("utf-8")
             ).decode("utf-8")
-            if self.content
+            if self.content and content_ref is None
             else None,
             "filepath": self.filepath,
             "url": self.url,
@@ -355,12 +470,10 @@ class File(BaseModel):
 
     @property
     def file_url_content(self) -> Optional[Tuple[bytes, str]]:
-        import httpx
+        from globalgenie.utils.media_fetcher import get_media_fetcher
 
         if self.url:
-            response = httpx.get(self.url)
-            content = response.content
-            mime_type = response.headers.get("Content-Type", "").split(";")[0]
-            return content, mime_type
+            fetched = get_media_fetcher().fetch(self.url)
+            return fetched.content, fetched.mime_type
         else:
             return None
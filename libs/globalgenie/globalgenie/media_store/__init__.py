@@ -0,0 +1,10 @@
+from globalgenie.media_store.base import InMemoryMediaStore, MediaStore, get_media_store, set_media_store
+from globalgenie.media_store.local import LocalMediaStore
+
+__all__ = [
+    "MediaStore",
+    "InMemoryMediaStore",
+    "LocalMediaStore",
+    "get_media_store",
+    "set_media_store",
+]
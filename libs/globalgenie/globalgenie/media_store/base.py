@@ -0,0 +1,139 @@
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Optional
+
+from globalgenie.utils.log import log_debug
+
+# Keys are the hex sha256 of the content
+_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class MediaStore(ABC):
+    """Content-addressed store for media bytes.
+
+    Each artifact is stored once under the sha256 hash of its content, so sessions and run responses only
+    need to keep the returned reference. Fetched content is kept in a size-bounded LRU cache.
+    """
+
+    def __init__(self, cache_max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            cache_max_bytes: Maximum total size of the content kept in the in-memory LRU cache.
+        """
+        self.cache_max_bytes = cache_max_bytes
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def content_key(content: bytes) -> str:
+        return sha256(content).hexdigest()
+
+    @staticmethod
+    def is_valid_key(key: str) -> bool:
+        """Return True if the key is a reference returned by `put`"""
+        return isinstance(key, str) and _KEY_PATTERN.match(key) is not None
+
+    @abstractmethod
+    def _write(self, key: str, content: bytes) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def put(self, content: bytes) -> str:
+        """Store the content if it is not stored yet and return its reference"""
+        key = self.content_key(content)
+        with self._lock:
+            cached = key in self._cache
+        if not cached:
+            if not self._exists(key):
+                log_debug(f"Storing media {key} ({len(content)} bytes)")
+                self._write(key, content)
+            self._cache_put(key, content)
+        return key
+
+    def get(self, ref: str) -> Optional[bytes]:
+        """Return the content for a reference, or None if it is not in the store"""
+        with self._lock:
+            content = self._cache.get(ref)
+            if content is not None:
+                self._cache.move_to_end(ref)
+                return content
+
+        content = self._read(ref)
+        if content is not None:
+            self._cache_put(ref, content)
+        return content
+
+    def exists(self, ref: str) -> bool:
+        with self._lock:
+            if ref in self._cache:
+                return True
+        return self._exists(ref)
+
+    def delete(self, ref: str) -> None:
+        with self._lock:
+            content = self._cache.pop(ref, None)
+            if content is not None:
+                self._cache_bytes -= len(content)
+        self._delete(ref)
+
+    def _cache_put(self, key: str, content: bytes) -> None:
+        if len(content) > self.cache_max_bytes:
+            return
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return
+            self._cache[key] = content
+            self._cache_bytes += len(content)
+            while self._cache_bytes > self.cache_max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+
+
+class InMemoryMediaStore(MediaStore):
+    """Media store that keeps content in process memory, useful for tests and local development"""
+
+    def __init__(self, cache_max_bytes: int = 0):
+        # Content is already in memory, so there is no need for a cache on top of it
+        super().__init__(cache_max_bytes=cache_max_bytes)
+        self._objects: dict = {}
+
+    def _write(self, key: str, content: bytes) -> None:
+        self._objects[key] = content
+
+    def _read(self, key: str) -> Optional[bytes]:
+        return self._objects.get(key)
+
+    def _exists(self, key: str) -> bool:
+        return key in self._objects
+
+    def _delete(self, key: str) -> None:
+        self._objects.pop(key, None)
+
+
+_media_store: Optional[MediaStore] = None
+
+
+def set_media_store(media_store: Optional[MediaStore]) -> None:
+    """Set the media store used when media is serialized. Pass None to inline media content again."""
+    global _media_store
+    _media_store = media_store
+
+
+def get_media_store() -> Optional[MediaStore]:
+    return _media_store
@@ -0,0 +1,94 @@
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from time import time
+from typing import Optional, Union
+
+from globalgenie.media_store.base import MediaStore
+from globalgenie.utils.log import log_debug
+
+
+class LocalMediaStore(MediaStore):
+    """Stores media on the local filesystem, under `<base_dir>/<key[:2]>/<key>`
+
+    With a `ttl`, files that were not written for `ttl` seconds are treated as missing and removed from the
+    directory while new content is written.
+    """
+
+    def __init__(
+        self,
+        base_dir: Union[str, Path] = "tmp/media",
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+    ):
+        """
+        Args:
+            base_dir: Directory the media is stored in.
+            cache_max_bytes: Maximum total size of the content kept in the in-memory LRU cache.
+            ttl: Number of seconds files are kept for. If None, files are kept forever.
+        """
+        super().__init__(cache_max_bytes=cache_max_bytes)
+        self.base_dir = Path(base_dir)
+        self.ttl = ttl
+        self._last_pruned_at = 0.0
+
+    def _path(self, key: str) -> Path:
+        if not self.is_valid_key(key):
+            raise ValueError(f"Invalid media key: {key!r}")
+        path = self.base_dir / key[:2] / key
+        # Keys are hex only, but make sure the path can never point outside of the store
+        base_dir = self.base_dir.resolve()
+        if os.path.commonpath([str(base_dir), str(path.resolve())]) != str(base_dir):
+            raise ValueError(f"Invalid media key: {key!r}")
+        return path
+
+    def _is_expired(self, path: Path) -> bool:
+        return self.ttl is not None and time() - path.stat().st_mtime > self.ttl
+
+    def _write(self, key: str, content: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so readers never see a partially written file
+        with NamedTemporaryFile(dir=path.parent, delete=False) as f:
+            f.write(content)
+        os.replace(f.name, path)
+        self._prune()
+
+    def _read(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            if self._is_expired(path):
+                return None
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _exists(self, key: str) -> bool:
+        path = self._path(key)
+        try:
+            return not self._is_expired(path)
+        except FileNotFoundError:
+            return False
+
+    def _delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _prune(self) -> None:
+        """Remove expired files, at most once per `ttl` (or once per hour for longer ttls)"""
+        if self.ttl is None:
+            return
+        now = time()
+        if now - self._last_pruned_at < min(self.ttl, 3600):
+            return
+        self._last_pruned_at = now
+
+        removed = 0
+        for path in self.base_dir.glob("*/*"):
+            try:
+                if path.is_file() and self.is_valid_key(path.name) and self._is_expired(path):
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        if removed > 0:
+            log_debug(f"Removed {removed} expired files from {self.base_dir}")
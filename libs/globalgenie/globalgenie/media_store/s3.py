@@ -0,0 +1,78 @@
+from typing import Any, Dict, Optional
+
+from globalgenie.media_store.base import MediaStore
+
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+except ImportError:
+    raise ImportError("`boto3` not installed. Please install using `pip install boto3`.")
+
+
+class S3MediaStore(MediaStore):
+    """Stores media in an S3 bucket.
+
+    Works with any S3-compatible object store, e.g. Google Cloud Storage (using HMAC keys and
+    `endpoint_url="https://storage.googleapis.com"`) or MinIO.
+    """
+
+    def __init__(
+        self,
+        bucket_name: str,
+        prefix: str = "media/",
+        region_name: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+        client_kwargs: Optional[Dict[str, Any]] = None,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        Args:
+            bucket_name: The bucket to store media in.
+            prefix: Prefix of the object keys.
+            region_name: AWS region name.
+            endpoint_url: Endpoint of an S3-compatible object store.
+            aws_access_key_id: Access key ID.
+            aws_secret_access_key: Secret access key.
+            client_kwargs: Additional keyword arguments for the boto3 client.
+            cache_max_bytes: Maximum total size of the content kept in the in-memory LRU cache.
+        """
+        super().__init__(cache_max_bytes=cache_max_bytes)
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+        self.client = boto3.client(
+            "s3",
+            region_name=region_name,
+            endpoint_url=endpoint_url,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            **(client_kwargs or {}),
+        )
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _write(self, key: str, content: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket_name, Key=self._object_key(key), Body=content)
+
+    def _read(self, key: str) -> Optional[bytes]:
+        try:
+            response = self.client.get_object(Bucket=self.bucket_name, Key=self._object_key(key))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+        return response["Body"].read()
+
+    def _exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket_name, Key=self._object_key(key))
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404", "NotFound"):
+                return False
+            raise
+
+    def _delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket_name, Key=self._object_key(key))
@@ -1,2 +1,3 @@
 from globalgenie.memory.v2.memory import Memory, MemoryManager, MemoryRow, SessionSummarizer
+from globalgenie.memory.v2.pipeline import MemoryPipeline
 from globalgenie.memory.v2.schema import SessionSummary, UserMemory
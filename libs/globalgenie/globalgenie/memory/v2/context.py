@@ -0,0 +1,310 @@
+import json
+from copy import deepcopy
+from dataclasses import dataclass
+from hashlib import md5
+from textwrap import dedent
+from typing import Any, Dict, List, Optional, Tuple
+
+from globalgenie.models.base import Model
+from globalgenie.models.message import Message
+from globalgenie.utils.log import log_debug, log_warning
+from globalgenie.utils.tokens import count_message_tokens
+
+
+def _content_hash(content: Any) -> str:
+    """Hash of the content of a message, which may be a string or a list of content parts"""
+    if not isinstance(content, str):
+        content = json.dumps(content, sort_keys=True, default=str)
+    return md5(content.encode()).hexdigest()
+
+
+def _message_key(message: Message) -> str:
+    """Key identifying a message in the history of a session"""
+    key = f"{message.role}\x00{message.created_at}\x00{message.tool_call_id}\x00{_content_hash(message.content)}"
+    return md5(key.encode()).hexdigest()
+
+
+@dataclass
+class CompressedHistory:
+    """Summary of the oldest turns of a session, which were removed from the history to fit the token budget"""
+
+    summary: str
+    # created_at of the last message covered by the summary
+    covered_until: int
+    # Key (see `_message_key`) of the last message covered by the summary
+    covered_message: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"summary": self.summary, "covered_until": self.covered_until, "covered_message": self.covered_message}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompressedHistory":
+        return cls(
+            summary=data["summary"], covered_until=data["covered_until"], covered_message=data.get("covered_message")
+        )
+
+
+@dataclass
+class ContextManager:
+    """Keeps the history sent to the Model within a token budget.
+
+    History is split into turns (a user message and everything that follows it), so tool calls are never
+    separated from their results. When the history does not fit, the oldest turns are dropped, or summarized
+    if `summarize` is set. Summaries are cached per session and extended as more turns are dropped.
+    """
+
+    # Maximum number of prompt tokens for the system message and history
+    max_tokens: int = 32000
+    # Summarize dropped turns instead of discarding them
+    summarize: bool = False
+    # Model used to summarize dropped turns
+    model: Optional[Model] = None
+    # Role of the message that carries the summary
+    summary_role: str = "system"
+
+    def __init__(
+        self,
+        max_tokens: int = 32000,
+        summarize: bool = False,
+        model: Optional[Model] = None,
+        summary_role: str = "system",
+    ):
+        self.max_tokens = max_tokens
+        self.summarize = summarize
+        self.model = model
+        self.summary_role = summary_role
+        # Compressed history per session
+        self.summaries: Dict[str, CompressedHistory] = {}
+        # Running token count of the last history per session
+        self.session_tokens: Dict[str, int] = {}
+        # Token counts per message, keyed by the model and a hash of everything the count depends on
+        self._token_cache: Dict[Tuple[Any, ...], int] = {}
+
+    def set_model(self, model: Model) -> None:
+        if self.model is None:
+            self.model = deepcopy(model)
+
+    def count_tokens(self, message: Message, model_id: Optional[str] = None) -> int:
+        """Count the tokens of a message, caching the result"""
+        key = (
+            model_id,
+            _content_hash(message.content),
+            _content_hash(message.tool_calls) if message.tool_calls else None,
+            _content_hash(message.thinking) if message.thinking else None,
+            sum(len(media) for media in (message.images, message.audio, message.videos, message.files) if media),
+        )
+        num_tokens = self._token_cache.get(key)
+        if num_tokens is None:
+            num_tokens = count_message_tokens(message, model_id=model_id)
+            if len(self._token_cache) >= 10000:
+                self._token_cache.clear()
+            self._token_cache[key] = num_tokens
+        return num_tokens
+
+    def fit_history(
+        self,
+        session_id: str,
+        history: List[Message],
+        model_id: Optional[str] = None,
+        reserved_tokens: int = 0,
+    ) -> List[Message]:
+        """Return the history trimmed to fit the token budget, with a summary of the dropped turns if enabled.
+
+        Args:
+            session_id: The session the history belongs to.
+            history: The history messages, oldest first.
+            model_id: The id of the model the messages are sent to, used to select the tokenizer.
+            reserved_tokens: Tokens already used by other messages in the prompt, such as the system message.
+        """
+        trimmed = self._trim_history(session_id, history, model_id=model_id, reserved_tokens=reserved_tokens)
+        if trimmed is None:
+            return history
+
+        turns, total_tokens, compressed, dropped = trimmed
+        if dropped and self.summarize:
+            compressed = self._compress(session_id=session_id, dropped=dropped, previous=compressed)
+        return self._assemble_history(session_id, turns, total_tokens, compressed, model_id=model_id)
+
+    async def afit_history(
+        self,
+        session_id: str,
+        history: List[Message],
+        model_id: Optional[str] = None,
+        reserved_tokens: int = 0,
+    ) -> List[Message]:
+        """Async version of `fit_history`, which summarizes the dropped turns without blocking the event loop"""
+        trimmed = self._trim_history(session_id, history, model_id=model_id, reserved_tokens=reserved_tokens)
+        if trimmed is None:
+            return history
+
+        turns, total_tokens, compressed, dropped = trimmed
+        if dropped and self.summarize:
+            compressed = await self._acompress(session_id=session_id, dropped=dropped, previous=compressed)
+        return self._assemble_history(session_id, turns, total_tokens, compressed, model_id=model_id)
+
+    def to_dict(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Return the summaries of all sessions, or only of the given session"""
+        if session_id is not None:
+            compressed = self.summaries.get(session_id)
+            return {session_id: compressed.to_dict()} if compressed is not None else {}
+        return {session_id: compressed.to_dict() for session_id, compressed in self.summaries.items()}
+
+    def load_summaries(self, data: Dict[str, Any], session_id: Optional[str] = None) -> None:
+        """Load summaries from `to_dict`. If a session_id is given, only the summary of that session is loaded."""
+        for _session_id, compressed in data.items():
+            if session_id is not None and _session_id != session_id:
+                continue
+            if _session_id not in self.summaries:
+                self.summaries[_session_id] = CompressedHistory.from_dict(compressed)
+
+    def _trim_history(
+        self, session_id: str, history: List[Message], model_id: Optional[str], reserved_tokens: int
+    ) -> Optional[Tuple[List[List[Message]], int, Optional[CompressedHistory], List[List[Message]]]]:
+        """Drop the oldest turns until the history fits the budget.
+
+        Returns None if the history fits as is, otherwise the remaining turns, their tokens, the cached summary
+        of the session and the dropped turns.
+        """
+        budget = self.max_tokens - reserved_tokens
+        turns = self._split_turns(history)
+        turn_tokens = [sum(self.count_tokens(m, model_id=model_id) for m in turn) for turn in turns]
+        total_tokens = sum(turn_tokens)
+
+        compressed = self.summaries.get(session_id)
+        if total_tokens <= budget and compressed is None:
+            self.session_tokens[session_id] = total_tokens
+            return None
+
+        # Turns already covered by the cached summary are replaced by it
+        summary_tokens = 0
+        if compressed is not None:
+            num_covered = self._count_covered_turns(turns, compressed)
+            del turns[:num_covered]
+            total_tokens -= sum(turn_tokens[:num_covered])
+            del turn_tokens[:num_covered]
+            summary_tokens = self.count_tokens(self._get_summary_message(compressed), model_id=model_id)
+
+        # Drop the oldest turns until the history fits, always keeping the latest turn
+        dropped: List[List[Message]] = []
+        while len(turns) > 1 and total_tokens + summary_tokens > budget:
+            dropped.append(turns.pop(0))
+            total_tokens -= turn_tokens.pop(0)
+
+        if dropped:
+            log_debug(f"Dropped {len(dropped)} turns from history to fit {budget} tokens")
+        return turns, total_tokens, compressed, dropped
+
+    def _count_covered_turns(self, turns: List[List[Message]], compressed: CompressedHistory) -> int:
+        """Return the number of leading turns covered by the summary"""
+        if compressed.covered_message is not None:
+            for index, turn in enumerate(turns):
+                if any(_message_key(message) == compressed.covered_message for message in turn):
+                    return index + 1
+        # The last covered message is not in the history, e.g. because it is older than the loaded history, or the
+        # summary was stored without it. Whole seconds are ambiguous, so messages created in the same second as the
+        # last covered message are kept.
+        num_covered = 0
+        while num_covered < len(turns) and turns[num_covered][-1].created_at < compressed.covered_until:
+            num_covered += 1
+        return num_covered
+
+    def _assemble_history(
+        self,
+        session_id: str,
+        turns: List[List[Message]],
+        total_tokens: int,
+        compressed: Optional[CompressedHistory],
+        model_id: Optional[str],
+    ) -> List[Message]:
+        fitted = [message for turn in turns for message in turn]
+        summary_tokens = 0
+        if compressed is not None:
+            summary_message = self._get_summary_message(compressed)
+            summary_tokens = self.count_tokens(summary_message, model_id=model_id)
+            fitted.insert(0, summary_message)
+        self.session_tokens[session_id] = total_tokens + summary_tokens
+        return fitted
+
+    def _split_turns(self, history: List[Message]) -> List[List[Message]]:
+        turns: List[List[Message]] = []
+        for message in history:
+            if message.role == "user" or not turns:
+                turns.append([message])
+            else:
+                turns[-1].append(message)
+        return turns
+
+    def _get_summary_message(self, compressed: CompressedHistory) -> Message:
+        return Message(
+            role=self.summary_role,
+            content=f"<previous_conversation_summary>\n{compressed.summary}\n</previous_conversation_summary>",
+            from_history=True,
+        )
+
+    def _get_compress_messages(
+        self, dropped: List[List[Message]], previous: Optional[CompressedHistory]
+    ) -> List[Message]:
+        conversation = ""
+        for turn in dropped:
+            for message in turn:
+                content = message.get_content_string()
+                if message.role in ("user", "assistant", "tool") and content:
+                    conversation += f"{message.role}: {content}\n"
+
+        system_message = dedent("""\
+            You compress conversation history so it can be used as context for the rest of the conversation.
+            Write a concise summary of the conversation below, keeping facts, decisions, open questions and
+            results of tool calls that may be needed later. Do not make anything up.\
+        """)
+        if previous is not None:
+            system_message += f"\n\nExtend this summary of the earlier conversation:\n{previous.summary}"
+
+        return [
+            Message(role="system", content=system_message),
+            Message(role="user", content=f"<conversation>\n{conversation}</conversation>"),
+        ]
+
+    def _get_compressed(
+        self, session_id: str, content: Any, dropped: List[List[Message]], previous: Optional[CompressedHistory]
+    ) -> Optional[CompressedHistory]:
+        if not isinstance(content, str) or not content:
+            return previous
+
+        last_covered = dropped[-1][-1]
+        compressed = CompressedHistory(
+            summary=content.strip(),
+            covered_until=last_covered.created_at,
+            covered_message=_message_key(last_covered),
+        )
+        self.summaries[session_id] = compressed
+        return compressed
+
+    def _compress(
+        self, session_id: str, dropped: List[List[Message]], previous: Optional[CompressedHistory]
+    ) -> Optional[CompressedHistory]:
+        """Summarize the dropped turns, extending the previous summary of the session"""
+        if self.model is None:
+            log_warning("ContextManager has no model to summarize the history, dropping turns instead")
+            return previous
+
+        try:
+            response = self.model.response(messages=self._get_compress_messages(dropped, previous))
+        except Exception as e:
+            log_warning(f"Failed to summarize history: {e}")
+            return previous
+        return self._get_compressed(session_id, response.content, dropped, previous)
+
+    async def _acompress(
+        self, session_id: str, dropped: List[List[Message]], previous: Optional[CompressedHistory]
+    ) -> Optional[CompressedHistory]:
+        """Summarize the dropped turns asynchronously, extending the previous summary of the session"""
+        if self.model is None:
+            log_warning("ContextManager has no model to summarize the history, dropping turns instead")
+            return previous
+
+        try:
+            response = await self.model.aresponse(messages=self._get_compress_messages(dropped, previous))
+        except Exception as e:
+            log_warning(f"Failed to summarize history: {e}")
+            return previous
+        return self._get_compressed(session_id, response.content, dropped, previous)
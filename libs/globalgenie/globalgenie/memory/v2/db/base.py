@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional
 
 from globalgenie.memory.v2.db.schema import MemoryRow
@@ -21,6 +22,19 @@ class MemoryDb(ABC):
     ) -> List[MemoryRow]:
         raise NotImplementedError
 
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        """Return the ids of the stored memories, used to detect deletions during an incremental refresh.
+        Backends should override this with a query that does not load the memory content.
+        """
+        return [memory.id for memory in self.read_memories(user_id=user_id) if memory.id is not None]
+
+    def read_memories_updated_since(self, since: datetime, user_id: Optional[str] = None) -> List[MemoryRow]:
+        """Return the memories created or updated at or after `since`.
+        The `last_updated` of the returned rows is used as the high-water mark for the next refresh.
+        Backends without change tracking fall back to reading all memories.
+        """
+        return self.read_memories(user_id=user_id)
+
     @abstractmethod
     def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
         raise NotImplementedError
@@ -189,29 +189,77 @@ class FirestoreMemoryDb(MemoryDb):
                 if data is None:
                     continue
 
-                # Get timestamps for last_updated
-                updated_at = data.get("updated_at")
-                created_at = data.get("created_at")
-                last_updated = None
-                if updated_at:
-                    last_updated = datetime.fromtimestamp(updated_at, tz=timezone.utc)
-                elif created_at:
-                    last_updated = datetime.fromtimestamp(created_at, tz=timezone.utc)
-
-                memories.append(
-                    MemoryRow(
-                        id=data.get("id"),
-                        user_id=data.get("user_id", user_id),
-                        memory=data.get("memory", {}),
-                        last_updated=last_updated,
-                    )
-                )
+                memories.append(self._data_to_memory(data, user_id=user_id))
 
             return memories
         except Exception as e:
             logger.error(f"Error reading memories: {e}")
             return []
 
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        """
+        Read the ids of the memories of a user, without loading their content.
+
+        Args:
+            user_id: ID of the user to read
+
+        Returns:
+            List[str]: List of memory ids
+        """
+        if user_id is None:
+            return []
+
+        try:
+            return [doc_ref.id for doc_ref in self.get_user_collection(user_id).list_documents()]
+        except Exception as e:
+            logger.error(f"Error reading memory ids: {e}")
+            return []
+
+    def read_memories_updated_since(self, since: datetime, user_id: Optional[str] = None) -> List[MemoryRow]:
+        """
+        Read the memories of a user created or updated at or after `since`.
+
+        Args:
+            since: Only memories updated at or after this time are returned
+            user_id: ID of the user to read
+
+        Returns:
+            List[MemoryRow]: List of memories
+        """
+        memories: List[MemoryRow] = []
+
+        if user_id is None:
+            return memories
+
+        try:
+            self._user_id = user_id
+            query = self.get_user_collection(user_id).where("updated_at", ">=", int(since.timestamp()))
+            for doc in query.stream():
+                data = doc.to_dict()
+                if data is not None:
+                    memories.append(self._data_to_memory(data, user_id=user_id))
+            return memories
+        except Exception as e:
+            logger.error(f"Error reading memories: {e}")
+            return []
+
+    def _data_to_memory(self, data: Dict[str, Any], user_id: str) -> MemoryRow:
+        """Convert a Firestore document to a MemoryRow, using updated_at or created_at as last_updated."""
+        updated_at = data.get("updated_at")
+        created_at = data.get("created_at")
+        last_updated = None
+        if updated_at:
+            last_updated = datetime.fromtimestamp(updated_at, tz=timezone.utc)
+        elif created_at:
+            last_updated = datetime.fromtimestamp(created_at, tz=timezone.utc)
+
+        return MemoryRow(
+            id=data.get("id"),
+            user_id=data.get("user_id", user_id),
+            memory=data.get("memory", {}),
+            last_updated=last_updated,
+        )
+
     def upsert_memory(self, memory: MemoryRow) -> None:
         """
         Upsert a memory into the user-specific collection.
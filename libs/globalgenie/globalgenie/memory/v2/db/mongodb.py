@@ -57,6 +57,7 @@ class MongoMemoryDb(MemoryDb):
             self.collection.create_index("id", unique=True)
             self.collection.create_index("user_id")
             self.collection.create_index("created_at")
+            self.collection.create_index([("user_id", 1), ("updated_at", 1)])
         except PyMongoError as e:
             logger.error(f"Error creating indexes for collection '{self.collection_name}': {e}")
             raise
@@ -101,13 +102,53 @@ class MongoMemoryDb(MemoryDb):
                 cursor = cursor.limit(limit)
 
             for doc in cursor:
-                # Remove MongoDB _id before converting to MemoryRow
-                doc.pop("_id", None)
-                memories.append(MemoryRow(user_id=doc["user_id"], memory=doc["memory"]))
+                memories.append(self._doc_to_memory(doc))
         except PyMongoError as e:
             logger.error(f"Error reading memories: {e}")
         return memories
 
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        """Read the ids of the memories in the collection, without loading their content
+        Args:
+            user_id: ID of the user to read
+        Returns:
+            List[str]: List of memory ids
+        """
+        try:
+            query = {"user_id": user_id} if user_id is not None else {}
+            return [doc["id"] for doc in self.collection.find(query, {"id": 1, "_id": 0}) if "id" in doc]
+        except PyMongoError as e:
+            logger.error(f"Error reading memory ids: {e}")
+            return []
+
+    def read_memories_updated_since(self, since: datetime, user_id: Optional[str] = None) -> List[MemoryRow]:
+        """Read memories created or updated at or after `since`
+        Args:
+            since: Only memories updated at or after this time are returned
+            user_id: ID of the user to read
+        Returns:
+            List[MemoryRow]: List of memories
+        """
+        memories: List[MemoryRow] = []
+        try:
+            query: Dict[str, Any] = {"updated_at": {"$gte": int(since.timestamp())}}
+            if user_id is not None:
+                query["user_id"] = user_id
+            for doc in self.collection.find(query):
+                memories.append(self._doc_to_memory(doc))
+        except PyMongoError as e:
+            logger.error(f"Error reading memories: {e}")
+        return memories
+
+    def _doc_to_memory(self, doc: Dict[str, Any]) -> MemoryRow:
+        timestamp = doc.get("updated_at") or doc.get("created_at")
+        return MemoryRow(
+            id=doc.get("id"),
+            user_id=doc["user_id"],
+            memory=doc["memory"],
+            last_updated=datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp else None,
+        )
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Upsert a memory into the collection
         Args:
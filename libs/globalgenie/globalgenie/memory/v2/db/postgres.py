@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 try:
@@ -6,7 +7,7 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import delete, select, text
+    from sqlalchemy.sql.expression import delete, func, select, text
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed.  Please install using `pip install sqlalchemy 'psycopg[binary]'`")
@@ -112,7 +113,7 @@ class PostgresMemoryDb(MemoryDb):
                 rows = sess.execute(stmt).fetchall()
                 for row in rows:
                     if row is not None:
-                        memories.append(MemoryRow.model_validate(row))
+                        memories.append(self._row_to_memory(row))
         except Exception as e:
             log_debug(f"Exception reading from table: {e}")
             log_debug(f"Table does not exist: {self.table.name}")
@@ -120,6 +121,38 @@ class PostgresMemoryDb(MemoryDb):
             self.create()
         return memories
 
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(self.table.c.id)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                return [row.id for row in sess.execute(stmt).fetchall()]
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+            return []
+
+    def read_memories_updated_since(self, since: datetime, user_id: Optional[str] = None) -> List[MemoryRow]:
+        memories: List[MemoryRow] = []
+        try:
+            with self.Session() as sess, sess.begin():
+                last_updated = func.coalesce(self.table.c.updated_at, self.table.c.created_at)
+                stmt = select(self.table).where(last_updated >= since)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+
+                for row in sess.execute(stmt).fetchall():
+                    if row is not None:
+                        memories.append(self._row_to_memory(row))
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+        return memories
+
+    def _row_to_memory(self, row: Any) -> MemoryRow:
+        memory = MemoryRow.model_validate(row)
+        memory.last_updated = row.updated_at or row.created_at
+        return memory
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Create a new memory if it does not exist, otherwise update the existing memory"""
 
@@ -139,6 +172,7 @@ class PostgresMemoryDb(MemoryDb):
                     set_=dict(
                         user_id=stmt.excluded.user_id,
                         memory=stmt.excluded.memory,
+                        updated_at=text("now()"),
                     ),
                 )
 
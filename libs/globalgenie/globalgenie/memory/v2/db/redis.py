@@ -1,5 +1,6 @@
 import json
 import time
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 try:
@@ -13,6 +14,12 @@ from globalgenie.utils.log import log_debug, log_info, logger
 
 
 class RedisMemoryDb(MemoryDb):
+    """Stores each memory as a JSON string under `<prefix>:<memory_id>`.
+
+    The memories of each user are also indexed in a sorted set under `<prefix>_index:<user_id>`, scored by the
+    time they were last updated, so incremental refreshes read only the ids and changed memories of one user.
+    """
+
     def __init__(
         self,
         prefix: str = "globalgenie_memory",
@@ -58,6 +65,15 @@ class RedisMemoryDb(MemoryDb):
         """Generate Redis key for a memory."""
         return f"{self.prefix}:{memory_id}"
 
+    def _get_index_key(self, user_id: str) -> str:
+        """Generate Redis key for the sorted set indexing the memories of a user."""
+        return f"{self.prefix}_index:{user_id}"
+
+    def _prune_index(self, index_key: str) -> None:
+        """Remove memories whose keys expired from the index. A key expires `expire` seconds after its last update."""
+        if self.expire is not None:
+            self.redis_client.zremrangebyscore(index_key, "-inf", f"({int(time.time()) - self.expire}")
+
     def create(self) -> None:
         """
         Test connection to Redis.
@@ -99,6 +115,10 @@ class RedisMemoryDb(MemoryDb):
                     if user_id is None or data.get("user_id") == user_id:
                         memory_data.append(data)
 
+            if user_id is not None:
+                # Also indexes memories that were written before the index existed
+                self._index_memory_data(user_id, memory_data)
+
             # Sort by created_at timestamp
             if sort == "asc":
                 memory_data.sort(key=lambda x: x.get("created_at", 0))
@@ -111,6 +131,9 @@ class RedisMemoryDb(MemoryDb):
 
             # Convert to MemoryRow objects
             for data in memory_data:
+                timestamp = data.get("updated_at") or data.get("created_at")
+                if timestamp:
+                    data["last_updated"] = datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
                 memories.append(MemoryRow.model_validate(data))
 
         except Exception as e:
@@ -118,6 +141,66 @@ class RedisMemoryDb(MemoryDb):
 
         return memories
 
+    def _index_memory_data(self, user_id: str, memory_data: List[Dict[str, Any]]) -> None:
+        scores = {
+            data["id"]: data.get("updated_at") or data.get("created_at") or 0 for data in memory_data if data.get("id")
+        }
+        if scores:
+            self.redis_client.zadd(self._get_index_key(user_id), scores)
+
+    def read_memory_ids(self, user_id: Optional[str] = None) -> List[str]:
+        """Read the ids of the memories in Redis, from the index of the user if a user_id is given"""
+        if user_id is None:
+            return [data["id"] for data in self._scan_memory_data() if data.get("id")]
+        try:
+            index_key = self._get_index_key(user_id)
+            self._prune_index(index_key)
+            return list(self.redis_client.zrange(index_key, 0, -1))  # type: ignore
+        except Exception as e:
+            logger.error(f"Error reading memory ids: {e}")
+            return []
+
+    def read_memories_updated_since(self, since: datetime, user_id: Optional[str] = None) -> List[MemoryRow]:
+        """Read memories created or updated at or after `since` from Redis.
+        With a user_id, only the memories changed since then are looked up in the index of the user and fetched.
+        """
+        memories: List[MemoryRow] = []
+        try:
+            since_timestamp = int(since.timestamp())
+            if user_id is None:
+                memory_data = self._scan_memory_data()
+            else:
+                index_key = self._get_index_key(user_id)
+                memory_ids = self.redis_client.zrangebyscore(index_key, since_timestamp, "+inf")
+                memory_keys = [self._get_key(memory_id) for memory_id in memory_ids]  # type: ignore
+                memory_data = self._get_memory_data(memory_keys)
+            for data in memory_data:
+                timestamp = data.get("updated_at") or data.get("created_at") or 0
+                if timestamp >= since_timestamp and (user_id is None or data.get("user_id") == user_id):
+                    data["last_updated"] = datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+                    memories.append(MemoryRow.model_validate(data))
+        except Exception as e:
+            logger.error(f"Error reading memories: {e}")
+        return memories
+
+    def _get_memory_data(self, keys: List[str]) -> List[Dict[str, Any]]:
+        """Load the raw memory data for the given keys, fetching values in batches"""
+        memory_data: List[Dict[str, Any]] = []
+        batch_size = 500
+        for i in range(0, len(keys), batch_size):
+            for data_str in self.redis_client.mget(keys[i : i + batch_size]):  # type: ignore
+                if data_str:
+                    memory_data.append(json.loads(data_str))  # type: ignore
+        return memory_data
+
+    def _scan_memory_data(self) -> List[Dict[str, Any]]:
+        """Load the raw memory data for all keys with our prefix"""
+        try:
+            return self._get_memory_data(list(self.redis_client.scan_iter(match=f"{self.prefix}:*")))
+        except Exception as e:
+            logger.error(f"Error reading memories: {e}")
+            return []
+
     def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
         """Upsert a memory in Redis"""
         try:
@@ -133,12 +216,16 @@ class RedisMemoryDb(MemoryDb):
 
             memory_data["updated_at"] = timestamp
 
-            # Save to Redis
+            # Save to Redis, together with the index of the user
             key = self._get_key(memory.id)  # type: ignore
+            pipe = self.redis_client.pipeline()
             if self.expire is not None:
-                self.redis_client.set(key, json.dumps(memory_data), ex=self.expire)
+                pipe.set(key, json.dumps(memory_data), ex=self.expire)
             else:
-                self.redis_client.set(key, json.dumps(memory_data))
+                pipe.set(key, json.dumps(memory_data))
+            if memory.user_id is not None:
+                pipe.zadd(self._get_index_key(memory.user_id), {memory.id: timestamp})  # type: ignore
+            pipe.execute()
 
             return memory
 
@@ -150,7 +237,14 @@ class RedisMemoryDb(MemoryDb):
         """Delete a memory from Redis"""
         try:
             key = self._get_key(memory_id)
-            self.redis_client.delete(key)
+            # Read the user of the memory, to remove it from the index of the user
+            data_str = self.redis_client.get(key)
+            user_id = json.loads(data_str).get("user_id") if data_str else None  # type: ignore
+            pipe = self.redis_client.pipeline()
+            pipe.delete(key)
+            if user_id is not None:
+                pipe.zrem(self._get_index_key(user_id), memory_id)
+            pipe.execute()
             log_debug(f"Deleted memory: {memory_id}")
         except Exception as e:
             logger.error(f"Error deleting memory: {e}")
@@ -176,9 +270,10 @@ class RedisMemoryDb(MemoryDb):
         try:
             pattern = f"{self.prefix}:*"
             keys_to_delete = list(self.redis_client.scan_iter(match=pattern))
+            index_keys = list(self.redis_client.scan_iter(match=f"{self.prefix}_index:*"))
 
-            if keys_to_delete:
-                self.redis_client.delete(*keys_to_delete)
+            if keys_to_delete or index_keys:
+                self.redis_client.delete(*keys_to_delete, *index_keys)
                 log_info(f"Cleared {len(keys_to_delete)} memories with prefix: {self.prefix}")
 
             return True
@@ -0,0 +1,194 @@
+from dataclasses import dataclass
+from hashlib import md5
+from math import sqrt
+from typing import Any, Dict, List, Optional, Tuple
+
+from globalgenie.document import Document
+from globalgenie.embedder import Embedder
+from globalgenie.memory.v2.schema import UserMemory
+from globalgenie.utils.log import log_debug, log_warning
+from globalgenie.vectordb.base import VectorDb
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Number of memories embedded per embedder call
+EMBEDDING_BATCH_SIZE = 100
+
+
+def _memory_hash(memory: UserMemory) -> str:
+    """Hash of the memory text and topics, used to detect memories that need to be re-embedded"""
+    topics = ",".join(sorted(memory.topics)) if memory.topics else ""
+    return md5(f"{memory.memory}\n{topics}".encode()).hexdigest()
+
+
+def _normalize(embedding: List[float]) -> List[float]:
+    norm = sqrt(sum(x * x for x in embedding))
+    return [x / norm for x in embedding] if norm else embedding
+
+
+@dataclass
+class MemoryIndex:
+    """Per-user vector index over user memories, used for semantic memory retrieval.
+
+    Memories are embedded once when they are written (or first seen after a refresh from the db) and are
+    only re-embedded when their content changes. Embeddings are kept in-process, or in the provided vector_db.
+    New memories are embedded in batches, and the in-process index scores all memories of a user at once with
+    numpy if it is installed.
+    """
+
+    # Embedder used to embed memories and queries
+    embedder: Optional[Embedder] = None
+    # Optional vector db to store the memory embeddings in. If not provided, an in-process index is used.
+    vector_db: Optional[VectorDb] = None
+
+    def __init__(self, embedder: Optional[Embedder] = None, vector_db: Optional[VectorDb] = None):
+        self.embedder = embedder
+        self.vector_db = vector_db
+        if self.embedder is None and self.vector_db is not None:
+            self.embedder = getattr(self.vector_db, "embedder", None)
+        # Content hash per memory ID per user
+        self._hashes: Dict[str, Dict[str, str]] = {}
+        # Normalized embedding per memory ID per user, only used for the in-process index
+        self._embeddings: Dict[str, Dict[str, List[float]]] = {}
+        # Memory IDs and the matrix of their embeddings per user, built on the first search after a change
+        self._matrices: Dict[str, Tuple[List[str], Any]] = {}
+
+    def get_embedder(self) -> Embedder:
+        if self.embedder is None:
+            from globalgenie.embedder.openai import OpenAIEmbedder
+
+            self.embedder = OpenAIEmbedder()
+        return self.embedder
+
+    def add(self, user_id: str, memory: UserMemory) -> None:
+        """Embed a memory and add it to the index, skipping memories that are already indexed and unchanged"""
+        self._add_many(user_id=user_id, memories=[memory])
+
+    def _add_many(self, user_id: str, memories: List[UserMemory]) -> None:
+        user_hashes = self._hashes.setdefault(user_id, {})
+        changed: List[Tuple[UserMemory, str]] = []
+        for memory in memories:
+            if memory.memory_id is None:
+                continue
+            content_hash = _memory_hash(memory)
+            if user_hashes.get(memory.memory_id) != content_hash:
+                changed.append((memory, content_hash))
+        if not changed:
+            return
+
+        if self.vector_db is not None:
+            for memory, _ in changed:
+                if memory.memory_id in user_hashes:
+                    # Remove the embedding of the previous content, stored under another document id
+                    self._delete_from_vector_db(user_id=user_id, memory_id=memory.memory_id)  # type: ignore
+            documents = [
+                Document(
+                    id=memory.memory_id,
+                    content=memory.memory,
+                    meta_data={"user_id": user_id, "memory_id": memory.memory_id, "topics": memory.topics or []},
+                )
+                for memory, _ in changed
+            ]
+            self.vector_db.upsert(documents=documents, filters={"user_id": user_id})
+        else:
+            user_embeddings = self._embeddings.setdefault(user_id, {})
+            for start in range(0, len(changed), EMBEDDING_BATCH_SIZE):
+                batch = changed[start : start + EMBEDDING_BATCH_SIZE]
+                embeddings = self.get_embedder().get_embeddings([memory.memory for memory, _ in batch])
+                for (memory, _), embedding in zip(batch, embeddings):
+                    user_embeddings[memory.memory_id] = _normalize(embedding)  # type: ignore
+            self._matrices.pop(user_id, None)
+        for memory, content_hash in changed:
+            user_hashes[memory.memory_id] = content_hash  # type: ignore
+
+    def _delete_from_vector_db(self, user_id: str, memory_id: str) -> None:
+        try:
+            self.vector_db.delete_by_metadata({"user_id": user_id, "memory_id": memory_id})  # type: ignore
+        except NotImplementedError:
+            log_warning(
+                f"{type(self.vector_db).__name__} can not delete by metadata, "
+                "deleted memories are only filtered out of search results"
+            )
+
+    def delete(self, user_id: str, memory_id: str) -> None:
+        """Remove a memory from the index"""
+        self._hashes.get(user_id, {}).pop(memory_id, None)
+        if self.vector_db is not None:
+            # The memory may have been indexed by another process, so always delete it from the vector db
+            self._delete_from_vector_db(user_id=user_id, memory_id=memory_id)
+        if self._embeddings.get(user_id, {}).pop(memory_id, None) is not None:
+            self._matrices.pop(user_id, None)
+
+    def sync(self, user_id: str, memories: Dict[str, UserMemory]) -> None:
+        """Bring the index for a user in line with the given memories, embedding only new or changed memories"""
+        for memory_id in list(self._hashes.get(user_id, {}).keys()):
+            if memory_id not in memories:
+                self.delete(user_id=user_id, memory_id=memory_id)
+        try:
+            self._add_many(user_id=user_id, memories=list(memories.values()))
+        except Exception as e:
+            log_warning(f"Failed to index memories: {e}")
+
+    def _score(self, user_id: str, query_embedding: List[float], candidate_ids: List[str]) -> List[str]:
+        """Return the candidate memory IDs ranked by cosine similarity to the query"""
+        query = _normalize(query_embedding)
+        user_embeddings = self._embeddings.get(user_id, {})
+        if NUMPY_AVAILABLE and user_embeddings:
+            if user_id not in self._matrices:
+                memory_ids = list(user_embeddings.keys())
+                self._matrices[user_id] = (memory_ids, np.array([user_embeddings[i] for i in memory_ids]))
+            memory_ids, matrix = self._matrices[user_id]
+            similarities = matrix @ np.array(query)
+            allowed = set(candidate_ids)
+            order = np.argsort(-similarities, kind="stable")
+            return [memory_ids[i] for i in order if memory_ids[i] in allowed]
+
+        scored: List[Tuple[float, str]] = [
+            (sum(x * y for x, y in zip(query, user_embeddings[memory_id])), memory_id)
+            for memory_id in candidate_ids
+            if memory_id in user_embeddings
+        ]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [memory_id for _, memory_id in scored]
+
+    def search(
+        self,
+        user_id: str,
+        query: str,
+        memories: Dict[str, UserMemory],
+        limit: Optional[int] = None,
+        topics: Optional[List[str]] = None,
+    ) -> List[UserMemory]:
+        """Return the memories most similar to the query, optionally restricted to memories with any of the given topics"""
+        self.sync(user_id=user_id, memories=memories)
+
+        candidate_ids = [
+            memory_id
+            for memory_id, memory in memories.items()
+            if not topics or (memory.topics and any(topic in memory.topics for topic in topics))
+        ]
+        if not candidate_ids:
+            return []
+
+        if self.vector_db is not None:
+            # Over-fetch from the vector db, topic filtering is applied on the results
+            num_results = len(memories) if topics or limit is None else limit
+            documents = self.vector_db.search(query=query, limit=num_results, filters={"user_id": user_id})
+            allowed = set(candidate_ids)
+            # Vector dbs may store documents under their own ids, the memory id is kept in the metadata
+            document_ids = [(doc.meta_data or {}).get("memory_id") or doc.id for doc in documents]
+            ranked_ids = list(dict.fromkeys(doc_id for doc_id in document_ids if doc_id in allowed))
+        else:
+            query_embedding = self.get_embedder().get_embedding(query)
+            ranked_ids = self._score(user_id, query_embedding, candidate_ids)
+
+        if limit is not None and limit > 0:
+            ranked_ids = ranked_ids[:limit]
+        log_debug(f"Semantic memory search returned {len(ranked_ids)} memories")
+        return [memories[memory_id] for memory_id in ranked_ids if memory_id in memories]
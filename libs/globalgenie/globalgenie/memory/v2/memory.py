@@ -1,16 +1,21 @@
 import json
+import threading
 from copy import deepcopy
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
+from time import monotonic
 from os import getenv
 from typing import Any, Dict, List, Literal, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
+from globalgenie.embedder import Embedder
 from globalgenie.media import AudioArtifact, ImageArtifact, VideoArtifact
 from globalgenie.memory.v2.db.base import MemoryDb
 from globalgenie.memory.v2.db.schema import MemoryRow
+from globalgenie.memory.v2.index import MemoryIndex
 from globalgenie.memory.v2.manager import MemoryManager
+from globalgenie.memory.v2.pipeline import MemoryPipeline
 from globalgenie.memory.v2.schema import SessionSummary, UserMemory
 from globalgenie.memory.v2.summarizer import SessionSummarizer
 from globalgenie.models.base import Model
@@ -21,6 +26,7 @@ from globalgenie.run.team import TeamRunResponse
 from globalgenie.utils.log import log_debug, log_warning, logger, set_log_level_to_debug, set_log_level_to_info
 from globalgenie.utils.prompts import get_json_output_prompt
 from globalgenie.utils.string import parse_response_model_str
+from globalgenie.vectordb.base import VectorDb
 
 
 class MemorySearchResponse(BaseModel):
@@ -31,6 +37,10 @@ class MemorySearchResponse(BaseModel):
     )
 
 
+# Window re-read before the last high-water mark on incremental refreshes
+_MEMORY_REFRESH_OVERLAP = timedelta(seconds=2)
+
+
 @dataclass
 class TeamMemberInteraction:
     member_name: str
@@ -94,6 +104,17 @@ class Memory:
     summary_manager: Optional[SessionSummarizer] = None
 
     db: Optional[MemoryDb] = None
+    # Seconds for which memories read from the db are considered fresh.
+    # Within this window, refreshes are skipped. If None, the db is checked for changes on every refresh.
+    memory_refresh_ttl: Optional[float] = None
+
+    # Embedder used for semantic search over user memories
+    embedder: Optional[Embedder] = None
+    # Vector db used to store user memory embeddings for semantic search. If not provided, an in-process index is used.
+    vector_db: Optional[VectorDb] = None
+
+    # Pipeline used to create memories and summaries in the background. If not provided, they are created during the run.
+    pipeline: Optional[MemoryPipeline] = None
 
     # runs per session
     runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None
@@ -115,6 +136,10 @@ class Memory:
         memory_manager: Optional[MemoryManager] = None,
         summarizer: Optional[SessionSummarizer] = None,
         db: Optional[MemoryDb] = None,
+        memory_refresh_ttl: Optional[float] = None,
+        embedder: Optional[Embedder] = None,
+        vector_db: Optional[VectorDb] = None,
+        pipeline: Optional[MemoryPipeline] = None,
         memories: Optional[Dict[str, Dict[str, UserMemory]]] = None,
         summaries: Optional[Dict[str, Dict[str, SessionSummary]]] = None,
         runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None,
@@ -141,6 +166,21 @@ class Memory:
         self.summary_manager = summarizer
 
         self.db = db
+        self.memory_refresh_ttl = memory_refresh_ttl
+        # Guards updates of the memories and summaries, which the pipeline makes from its worker threads.
+        # Updates replace the dict of a user instead of changing it, so readers never see a dict change size.
+        self._lock = threading.RLock()
+        # High-water mark of the last refresh from the db, per user
+        self._memories_high_water: Dict[str, datetime] = {}
+        # Monotonic time of the last refresh from the db, per user
+        self._memories_refreshed_at: Dict[str, float] = {}
+
+        self.embedder = embedder
+        self.vector_db = vector_db
+        # Index used for semantic retrieval, created on first use
+        self._memory_index: Optional[MemoryIndex] = None
+
+        self.pipeline = pipeline
 
         # We are making memories
         if self.model is not None:
@@ -183,19 +223,101 @@ class Memory:
             self.model = OpenAIChat(id="gpt-4o")
         return self.model
 
-    def refresh_from_db(self, user_id: Optional[str] = None):
-        if self.db:
+    def get_memory_index(self) -> MemoryIndex:
+        if self._memory_index is None:
+            self._memory_index = MemoryIndex(embedder=self.embedder, vector_db=self.vector_db)
+        return self._memory_index
+
+    def refresh_from_db(self, user_id: Optional[str] = None, force: bool = False):
+        """Sync the in-process memories with the db.
+
+        When a user_id is provided, only memories changed since the last refresh for that user are read,
+        and memories deleted from the db are dropped. Refreshes within `memory_refresh_ttl` seconds of the
+        previous one are skipped, unless `force` is set.
+        """
+        if not self.db:
+            return
+
+        with self._lock:
             # If no user_id is provided, read all memories
             if user_id is None:
                 all_memories = self.db.read_memories()
-            else:
-                all_memories = self.db.read_memories(user_id=user_id)
 
-            # Reset the memories
-            self.memories = {}
-            for memory in all_memories:
-                if memory.user_id is not None and memory.id is not None:
-                    self.memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
+                # Reset the memories
+                memories: Dict[str, Dict[str, UserMemory]] = {}
+                for memory in all_memories:
+                    if memory.user_id is not None and memory.id is not None:
+                        memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
+                self.memories = memories
+                self._memories_high_water = {}
+                self._memories_refreshed_at = {}
+                return
+
+            refreshed_at = self._memories_refreshed_at.get(user_id)
+            if (
+                not force
+                and refreshed_at is not None
+                and self.memory_refresh_ttl is not None
+                and monotonic() - refreshed_at < self.memory_refresh_ttl
+            ):
+                return
+
+            if self.memories is None:
+                self.memories = {}
+
+            high_water = self._memories_high_water.get(user_id)
+            if high_water is None or user_id not in self.memories:
+                # First refresh for this user: read all memories
+                changed_memories = self.db.read_memories(user_id=user_id)
+                user_memories: Dict[str, UserMemory] = {}
+            else:
+                # Re-read a small window before the high-water mark, to pick up writes with slightly older timestamps
+                changed_memories = self.db.read_memories_updated_since(
+                    since=high_water - _MEMORY_REFRESH_OVERLAP, user_id=user_id
+                )
+                # Drop memories that were deleted from the db
+                stored_ids = set(self.db.read_memory_ids(user_id=user_id))
+                user_memories = {
+                    memory_id: memory
+                    for memory_id, memory in self.memories[user_id].items()
+                    if memory_id in stored_ids
+                }
+
+            for memory in changed_memories:
+                if memory.user_id == user_id and memory.id is not None:
+                    user_memories[memory.id] = UserMemory.from_dict(dict(memory.memory))
+                if memory.last_updated is not None and (high_water is None or memory.last_updated > high_water):
+                    high_water = memory.last_updated
+            self.memories[user_id] = user_memories
+
+            if high_water is not None:
+                self._memories_high_water[user_id] = high_water
+            self._memories_refreshed_at[user_id] = monotonic()
+        log_debug(f"Refreshed {len(changed_memories)} memories from db for user {user_id}")
+
+    def _set_user_memory(self, user_id: str, memory_id: str, memory: Optional[UserMemory]) -> None:
+        """Add, replace or (if memory is None) delete a memory, replacing the dict of the user"""
+        with self._lock:
+            if self.memories is None:
+                self.memories = {}
+            user_memories = dict(self.memories.get(user_id, {}))
+            if memory is None:
+                user_memories.pop(memory_id, None)
+            else:
+                user_memories[memory_id] = memory
+            self.memories[user_id] = user_memories
+
+    def _set_session_summary(self, user_id: str, session_id: str, session_summary: Optional[SessionSummary]) -> None:
+        """Add, replace or (if session_summary is None) delete a session summary, replacing the dict of the user"""
+        with self._lock:
+            if self.summaries is None:
+                self.summaries = {}
+            session_summaries = dict(self.summaries.get(user_id, {}))
+            if session_summary is None:
+                session_summaries.pop(session_id, None)
+            else:
+                session_summaries[session_id] = session_summary
+            self.summaries[user_id] = session_summaries
 
     def set_log_level(self):
         if self.debug_mode or getenv("GLOBALGENIE_DEBUG", "false").lower() == "true":
@@ -304,7 +426,8 @@ class Memory:
         if not memory.last_updated:
             memory.last_updated = datetime.now()
 
-        self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
+        self._set_user_memory(user_id=user_id, memory_id=memory_id, memory=memory)
+        self._index_memory(user_id=user_id, memory=memory)
         if self.db:
             self._upsert_db_memory(
                 memory=MemoryRow(
@@ -347,7 +470,8 @@ class Memory:
             log_warning(f"Memory {memory_id} not found for user {user_id}")
             return None
 
-        self.memories.setdefault(user_id, {})[memory_id] = memory  # type: ignore
+        self._set_user_memory(user_id=user_id, memory_id=memory_id, memory=memory)
+        self._index_memory(user_id=user_id, memory=memory)
         if self.db:
             self._upsert_db_memory(
                 memory=MemoryRow(
@@ -382,7 +506,9 @@ class Memory:
             log_warning(f"Memory {memory_id} not found for user {user_id}")
             return None
 
-        del self.memories[user_id][memory_id]  # type: ignore
+        self._set_user_memory(user_id=user_id, memory_id=memory_id, memory=None)
+        if self._memory_index is not None:
+            self._memory_index.delete(user_id=user_id, memory_id=memory_id)
         if self.db:
             self._delete_db_memory(memory_id=memory_id)
 
@@ -392,7 +518,9 @@ class Memory:
             user_id (str): The user id to delete the memory from
             session_id (str): The id of the session to delete
         """
-        del self.summaries[user_id][session_id]  # type: ignore
+        if session_id not in self.summaries[user_id]:  # type: ignore
+            raise KeyError(session_id)
+        self._set_session_summary(user_id=user_id, session_id=session_id, session_summary=None)
 
     def get_runs(self, session_id: str) -> List[Union[RunResponse, TeamRunResponse]]:
         """Get all runs for a given session id"""
@@ -418,7 +546,7 @@ class Memory:
         session_summary = SessionSummary(
             summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
         )
-        self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
+        self._set_session_summary(user_id=user_id, session_id=session_id, session_summary=session_summary)
 
         return session_summary
 
@@ -440,7 +568,7 @@ class Memory:
         session_summary = SessionSummary(
             summary=summary_response.summary, topics=summary_response.topics, last_updated=datetime.now()
         )
-        self.summaries.setdefault(user_id, {})[session_id] = session_summary  # type: ignore
+        self._set_session_summary(user_id=user_id, session_id=session_id, session_summary=session_summary)
         return session_summary
 
     def create_user_memories(
@@ -488,7 +616,7 @@ class Memory:
         )
 
         # We refresh from the DB
-        self.refresh_from_db(user_id=user_id)
+        self.refresh_from_db(user_id=user_id, force=True)
         return response
 
     async def acreate_user_memories(
@@ -537,7 +665,7 @@ class Memory:
         )
 
         # We refresh from the DB
-        self.refresh_from_db()
+        self.refresh_from_db(user_id=user_id, force=True)
 
         return response
 
@@ -570,7 +698,7 @@ class Memory:
         )
 
         # We refresh from the DB
-        self.refresh_from_db(user_id=user_id)
+        self.refresh_from_db(user_id=user_id, force=True)
 
         return response
 
@@ -604,10 +732,20 @@ class Memory:
         )
 
         # We refresh from the DB
-        self.refresh_from_db(user_id=user_id)
+        self.refresh_from_db(user_id=user_id, force=True)
 
         return response
 
+    # -*- Index Functions
+    def _index_memory(self, user_id: str, memory: UserMemory) -> None:
+        """Embed a memory on write, if semantic search is configured."""
+        if self.embedder is None and self.vector_db is None and self._memory_index is None:
+            return
+        try:
+            self.get_memory_index().add(user_id=user_id, memory=memory)
+        except Exception as e:
+            log_warning(f"Error indexing memory: {e}")
+
     # -*- DB Functions
     def _upsert_db_memory(self, memory: MemoryRow) -> str:
         """Use this function to add a memory to the database."""
@@ -777,20 +915,23 @@ class Memory:
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
         user_id: Optional[str] = None,
         refresh_from_db: bool = True,
+        topics: Optional[List[str]] = None,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query. Required if retrieval_method is "agentic" or "semantic".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
             retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
                 - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "semantic": Return memories most similar to the query, using embedding similarity
             user_id: The user to search for. Optional.
+            topics: Only return memories tagged with at least one of these topics. Used by "semantic" search. Optional.
 
         Returns:
             A list of UserMemory objects matching the search criteria.
@@ -819,6 +960,12 @@ class Memory:
 
             return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit)
 
+        elif retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+
+            return self._search_user_memories_semantic(user_id=user_id, query=query, limit=limit, topics=topics)
+
         elif retrieval_method == "first_n":
             return self._get_first_n_memories(user_id=user_id, limit=limit)
 
@@ -909,6 +1056,22 @@ class Memory:
                 memories_to_return.append(user_memories[memory_id])
         return memories_to_return[:limit]
 
+    def _search_user_memories_semantic(
+        self, user_id: str, query: str, limit: Optional[int] = None, topics: Optional[List[str]] = None
+    ) -> List[UserMemory]:
+        """Search through user memories using embedding similarity."""
+        if not self.memories:
+            return []
+
+        log_debug("Searching for memories (semantic)", center=True)
+        return self.get_memory_index().search(
+            user_id=user_id,
+            query=query,
+            memories=self.memories.get(user_id, {}),
+            limit=limit,
+            topics=topics,
+        )
+
     def _get_last_n_memories(self, user_id: str, limit: Optional[int] = None) -> List[UserMemory]:
         """Get the most recent user memories.
 
@@ -982,6 +1145,9 @@ class Memory:
         self.memories = {}
         self.summaries = {}
         self.runs = {}
+        self._memory_index = None
+        self._memories_high_water = {}
+        self._memories_refreshed_at = {}
 
     # -*- Team Functions
     def add_interaction_to_team_context(
@@ -1090,8 +1256,11 @@ class Memory:
         memo[id(self)] = copied_obj
 
         # Copy attributes, reusing specific objects
-        shared_objects = {"db", "memory_manager", "summary_manager", "team_context"}
+        shared_objects = {"db", "memory_manager", "summary_manager", "team_context", "_memory_index", "pipeline"}
         for k, v in self.__dict__.items():
+            if k == "_lock":
+                continue
             setattr(copied_obj, k, v if k in shared_objects else deepcopy(v, memo))
+        copied_obj._lock = threading.RLock()
 
         return copied_obj
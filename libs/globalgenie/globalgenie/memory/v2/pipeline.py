@@ -0,0 +1,311 @@
+import atexit
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from functools import partial
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from globalgenie.models.message import Message
+from globalgenie.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from globalgenie.memory.v2.memory import Memory
+
+
+@dataclass
+class _PendingMemories:
+    memory: "Memory"
+    user_id: Optional[str]
+    messages: List[Message] = field(default_factory=list)
+    due_at: float = 0.0
+
+
+@dataclass
+class _PendingSummary:
+    memory: "Memory"
+    session_id: str
+    user_id: Optional[str]
+    num_runs: int = 0
+    due_at: Optional[float] = None
+
+
+class MemoryPipeline:
+    """Extracts user memories and session summaries in the background, off the response critical path.
+
+    Messages submitted for the same user are coalesced into a single memory extraction call, and session
+    summaries are debounced to every `summary_every_n_runs` runs or `summary_idle_seconds` after the last run.
+    Jobs run on long-lived worker threads owned by the pipeline, which can be shared by all agents and teams
+    in the process. Pending jobs are flushed when the pipeline is shut down, including at interpreter exit,
+    where the flush waits at most `exit_timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        memory_debounce_seconds: float = 2.0,
+        max_batch_size: int = 20,
+        summary_every_n_runs: int = 5,
+        summary_idle_seconds: Optional[float] = 60.0,
+        exit_timeout: Optional[float] = 30.0,
+    ):
+        """
+        Args:
+            max_workers: Number of worker threads used to run extraction jobs.
+            memory_debounce_seconds: Seconds to wait for more messages from the same user before extracting memories.
+            max_batch_size: Extract memories immediately once this many messages are pending for a user.
+            summary_every_n_runs: Create a session summary after this many runs of a session.
+            summary_idle_seconds: Create a session summary when a session has pending runs and was idle for this many seconds.
+            exit_timeout: Maximum number of seconds to wait for pending jobs at interpreter exit.
+        """
+        self.max_workers = max_workers
+        self.memory_debounce_seconds = memory_debounce_seconds
+        self.max_batch_size = max_batch_size
+        self.summary_every_n_runs = max(1, summary_every_n_runs)
+        self.summary_idle_seconds = summary_idle_seconds
+        self.exit_timeout = exit_timeout
+
+        self._lock = threading.Condition()
+        self._pending_memories: Dict[Tuple[int, Optional[str]], _PendingMemories] = {}
+        self._pending_summaries: Dict[Tuple[int, str, Optional[str]], _PendingSummary] = {}
+        self._in_flight: Set[Tuple[Any, ...]] = set()
+        # Due jobs waiting for a worker
+        self._ready: Deque[Tuple[Tuple[Any, ...], Callable[[], None]]] = deque()
+        self._workers: List[threading.Thread] = []
+        self._scheduler: Optional[threading.Thread] = None
+        self._shutdown = False
+
+        # Counters reported by status()
+        self._submitted_messages = 0
+        self._memory_jobs_completed = 0
+        self._summary_jobs_completed = 0
+        self._jobs_failed = 0
+
+    # -*- Public Functions
+    def submit(
+        self,
+        memory: "Memory",
+        session_id: str,
+        user_id: Optional[str] = None,
+        messages: Optional[List[Message]] = None,
+        create_summary: bool = False,
+    ) -> None:
+        """Queue memory extraction for the given messages and/or a session summary. Returns immediately."""
+        if self._shutdown:
+            raise RuntimeError("MemoryPipeline has been shut down")
+
+        self._start()
+        now = monotonic()
+        with self._lock:
+            if messages:
+                memory_key = (id(memory), user_id)
+                pending = self._pending_memories.get(memory_key)
+                if pending is None:
+                    pending = _PendingMemories(memory=memory, user_id=user_id)
+                    self._pending_memories[memory_key] = pending
+                pending.messages.extend(messages)
+                self._submitted_messages += len(messages)
+                # Debounce: wait for more messages from the same user, unless the batch is full
+                pending.due_at = now if len(pending.messages) >= self.max_batch_size else now + self.memory_debounce_seconds
+
+            if create_summary:
+                summary_key = (id(memory), session_id, user_id)
+                pending_summary = self._pending_summaries.get(summary_key)
+                if pending_summary is None:
+                    pending_summary = _PendingSummary(memory=memory, session_id=session_id, user_id=user_id)
+                    self._pending_summaries[summary_key] = pending_summary
+                pending_summary.num_runs += 1
+                if pending_summary.num_runs >= self.summary_every_n_runs:
+                    pending_summary.due_at = now
+                elif self.summary_idle_seconds is not None:
+                    pending_summary.due_at = now + self.summary_idle_seconds
+            self._lock.notify_all()
+
+    def status(self) -> Dict[str, int]:
+        """Return the number of pending, running, completed and failed jobs"""
+        with self._lock:
+            return {
+                "pending_memory_jobs": len(self._pending_memories),
+                "pending_messages": sum(len(p.messages) for p in self._pending_memories.values()),
+                "pending_summary_jobs": len(self._pending_summaries),
+                "running_jobs": len(self._in_flight),
+                "submitted_messages": self._submitted_messages,
+                "memory_jobs_completed": self._memory_jobs_completed,
+                "summary_jobs_completed": self._summary_jobs_completed,
+                "jobs_failed": self._jobs_failed,
+            }
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Run all pending jobs now and wait for them to finish.
+        Returns False if the timeout expired before all jobs finished.
+        """
+        deadline = monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            self._make_all_due()
+
+            while self._pending_memories or self._pending_summaries or self._in_flight:
+                if not self._is_running():
+                    # The threads were never started or could not be started: run the jobs in this thread
+                    self._run_pending_jobs()
+                    if not self._in_flight:
+                        continue
+                remaining = deadline - monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._lock.wait(timeout=remaining)
+        return True
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> None:
+        """Flush pending jobs (if wait is set) and stop the worker threads"""
+        if self._shutdown:
+            return
+        deadline = monotonic() + timeout if timeout is not None else None
+        if wait:
+            self.flush(timeout=timeout)
+        with self._lock:
+            self._shutdown = True
+            self._lock.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join(timeout=max(0.0, deadline - monotonic()) if deadline is not None else None)
+
+    def _shutdown_at_exit(self) -> None:
+        self.shutdown(wait=True, timeout=self.exit_timeout)
+
+    # -*- Internal Functions
+    def _start(self) -> None:
+        with self._lock:
+            if self._scheduler is not None:
+                return
+            # Daemon threads, so a pipeline that is not shut down never blocks exit. The exit hook flushes the jobs.
+            self._workers = [
+                threading.Thread(target=self._work, name=f"memory-pipeline-{i}", daemon=True)
+                for i in range(max(1, self.max_workers))
+            ]
+            self._scheduler = threading.Thread(target=self._schedule, name="memory-pipeline-scheduler", daemon=True)
+            try:
+                for worker in self._workers:
+                    worker.start()
+                self._scheduler.start()
+            except RuntimeError as e:
+                # e.g. during interpreter shutdown. Jobs are run by flush() instead.
+                log_warning(f"Could not start memory pipeline threads: {e}")
+                self._workers = [worker for worker in self._workers if worker.is_alive()]
+        atexit.register(self._shutdown_at_exit)
+
+    def _make_all_due(self) -> None:
+        now = monotonic()
+        for pending in self._pending_memories.values():
+            pending.due_at = now
+        for pending_summary in self._pending_summaries.values():
+            pending_summary.due_at = now
+        self._lock.notify_all()
+
+    def _is_running(self) -> bool:
+        return (
+            self._scheduler is not None
+            and self._scheduler.is_alive()
+            and any(worker.is_alive() for worker in self._workers)
+        )
+
+    def _schedule(self) -> None:
+        """Hand jobs to the workers as they become due"""
+        with self._lock:
+            while not self._shutdown:
+                next_due = self._queue_due_jobs()
+                now = monotonic()
+                self._lock.wait(timeout=max(0.0, next_due - now) if next_due is not None else None)
+
+    def _queue_due_jobs(self) -> Optional[float]:
+        """Move due jobs to the ready queue. Returns the time the next job is due. Must hold the lock."""
+        now = monotonic()
+        next_due: Optional[float] = None
+
+        for memory_key in list(self._pending_memories.keys()):
+            job_key = ("memories",) + memory_key
+            pending = self._pending_memories[memory_key]
+            if job_key in self._in_flight:
+                # Keep one extraction per user in flight, new messages are picked up after it finishes
+                continue
+            if pending.due_at <= now:
+                del self._pending_memories[memory_key]
+                self._in_flight.add(job_key)
+                self._ready.append((job_key, partial(self._run_memories, job_key, pending)))
+            elif next_due is None or pending.due_at < next_due:
+                next_due = pending.due_at
+
+        for summary_key in list(self._pending_summaries.keys()):
+            job_key = ("summary",) + summary_key
+            pending_summary = self._pending_summaries[summary_key]
+            if job_key in self._in_flight or pending_summary.due_at is None:
+                continue
+            if pending_summary.due_at <= now:
+                del self._pending_summaries[summary_key]
+                self._in_flight.add(job_key)
+                self._ready.append((job_key, partial(self._run_summary, job_key, pending_summary)))
+            elif next_due is None or pending_summary.due_at < next_due:
+                next_due = pending_summary.due_at
+
+        if self._ready:
+            self._lock.notify_all()
+        return next_due
+
+    def _work(self) -> None:
+        """Run ready jobs until the pipeline is shut down and no jobs are left"""
+        while True:
+            with self._lock:
+                while not self._ready and not self._shutdown:
+                    self._lock.wait()
+                if not self._ready:
+                    return
+                _, job = self._ready.popleft()
+            job()
+
+    def _run_pending_jobs(self) -> None:
+        """Run all pending jobs in the calling thread. Must hold the lock, which is released while a job runs."""
+        while True:
+            self._make_all_due()
+            self._queue_due_jobs()
+            if not self._ready:
+                return
+            _, job = self._ready.popleft()
+            self._lock.release()
+            try:
+                job()
+            finally:
+                self._lock.acquire()
+
+    def _run_memories(self, job_key: Tuple[Any, ...], pending: _PendingMemories) -> None:
+        failed = True
+        try:
+            log_debug(f"Creating user memories from {len(pending.messages)} messages in the background")
+            pending.memory.create_user_memories(messages=pending.messages, user_id=pending.user_id)
+            failed = False
+        except Exception as e:
+            log_warning(f"Error creating user memories in the background: {e}")
+        finally:
+            self._finish(job_key, failed=failed, summary=False)
+
+    def _run_summary(self, job_key: Tuple[Any, ...], pending_summary: _PendingSummary) -> None:
+        failed = True
+        try:
+            log_debug(f"Creating session summary for session {pending_summary.session_id} in the background")
+            pending_summary.memory.create_session_summary(
+                session_id=pending_summary.session_id, user_id=pending_summary.user_id
+            )
+            failed = False
+        except Exception as e:
+            log_warning(f"Error creating session summary in the background: {e}")
+        finally:
+            self._finish(job_key, failed=failed, summary=True)
+
+    def _finish(self, job_key: Tuple[Any, ...], failed: bool, summary: bool) -> None:
+        with self._lock:
+            self._in_flight.discard(job_key)
+            if failed:
+                self._jobs_failed += 1
+            elif summary:
+                self._summary_jobs_completed += 1
+            else:
+                self._memory_jobs_completed += 1
+            self._lock.notify_all()
@@ -65,6 +65,9 @@ class Claude(Model):
     name: str = "Claude"
     provider: str = "Anthropic"
 
+    # Anthropic reports cache reads and writes separately from input tokens
+    input_tokens_include_cached: bool = False
+
     # Request parameters
     max_tokens: Optional[int] = 4096
     thinking: Optional[Dict[str, Any]] = None
@@ -151,26 +154,43 @@ class Claude(Model):
 
         return _request_params
 
+    def _get_cache_prefix(self, messages: List[Message]) -> Optional[str]:
+        """
+        Return the static prefix of the system message, if the Agent marked one.
+        """
+        for message in messages:
+            if message.role == "system" and message.cache_prefix_length and isinstance(message.content, str):
+                return message.content[: message.cache_prefix_length]
+        return None
+
     def _prepare_request_kwargs(
-        self, system_message: str, tools: Optional[List[Dict[str, Any]]] = None
+        self, system_message: str, tools: Optional[List[Dict[str, Any]]] = None, cache_prefix: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Prepare the request keyword arguments for the API call.
 
         Args:
             system_message (str): The concatenated system messages.
+            tools (Optional[List[Dict[str, Any]]]): The tools available to the model.
+            cache_prefix (Optional[str]): The static prefix of the system message. A cache breakpoint is placed after it.
 
         Returns:
             Dict[str, Any]: The request keyword arguments.
         """
         request_kwargs = self.get_request_params().copy()
         if system_message:
-            if self.cache_system_prompt:
-                cache_control = (
-                    {"type": "ephemeral", "ttl": "1h"}
-                    if self.extended_cache_time is not None and self.extended_cache_time is True
-                    else {"type": "ephemeral"}
-                )
+            cache_control = (
+                {"type": "ephemeral", "ttl": "1h"}
+                if self.extended_cache_time is not None and self.extended_cache_time is True
+                else {"type": "ephemeral"}
+            )
+            if cache_prefix and system_message.startswith(cache_prefix) and len(system_message) > len(cache_prefix):
+                # Cache the tools and the static prefix, the rest of the system message changes between runs
+                request_kwargs["system"] = [
+                    {"text": cache_prefix, "type": "text", "cache_control": cache_control},
+                    {"text": system_message[len(cache_prefix) :].strip(), "type": "text"},
+                ]
+            elif self.cache_system_prompt or cache_prefix:
                 request_kwargs["system"] = [{"text": system_message, "type": "text", "cache_control": cache_control}]
             else:
                 request_kwargs["system"] = [{"text": system_message, "type": "text"}]
@@ -179,7 +199,7 @@ class Claude(Model):
             request_kwargs["tools"] = self._format_tools_for_model(tools)
 
         if request_kwargs:
-            log_debug(f"Calling {self.provider} with request parameters: {request_kwargs}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {request_kwargs}", log_level=2)
         return request_kwargs
 
     def _format_tools_for_model(self, tools: Optional[List[Dict[str, Any]]] = None) -> Optional[List[Dict[str, Any]]]:
@@ -241,7 +261,9 @@ class Claude(Model):
         """
         try:
             chat_messages, system_message = format_messages(messages)
-            request_kwargs = self._prepare_request_kwargs(system_message, tools)
+            request_kwargs = self._prepare_request_kwargs(
+                system_message, tools, cache_prefix=self._get_cache_prefix(messages)
+            )
 
             if self.mcp_servers is not None:
                 return self.get_client().beta.messages.create(
@@ -292,7 +314,9 @@ class Claude(Model):
             APIStatusError: For other API-related errors
         """
         chat_messages, system_message = format_messages(messages)
-        request_kwargs = self._prepare_request_kwargs(system_message, tools)
+        request_kwargs = self._prepare_request_kwargs(
+            system_message, tools, cache_prefix=self._get_cache_prefix(messages)
+        )
 
         try:
             if self.mcp_servers is not None:
@@ -342,7 +366,9 @@ class Claude(Model):
         """
         try:
             chat_messages, system_message = format_messages(messages)
-            request_kwargs = self._prepare_request_kwargs(system_message, tools)
+            request_kwargs = self._prepare_request_kwargs(
+                system_message, tools, cache_prefix=self._get_cache_prefix(messages)
+            )
 
             if self.mcp_servers is not None:
                 return await self.get_async_client().beta.messages.create(
@@ -394,7 +420,9 @@ class Claude(Model):
         """
         try:
             chat_messages, system_message = format_messages(messages)
-            request_kwargs = self._prepare_request_kwargs(system_message, tools)
+            request_kwargs = self._prepare_request_kwargs(
+                system_message, tools, cache_prefix=self._get_cache_prefix(messages)
+            )
 
             if self.mcp_servers is not None:
                 async with self.get_async_client().beta.messages.stream(
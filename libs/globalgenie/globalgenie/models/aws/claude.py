@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, AsyncIterator, Dict, List, Optional, Type, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -33,6 +33,7 @@ class Claude(AnthropicClaude):
     id: str = "anthropic.claude-3-5-sonnet-20240620-v1:0"
     name: str = "AwsBedrockAnthropicClaude"
     provider: str = "AwsBedrock"
+    prefetch_media_urls: Tuple[str, ...] = ("images",)
 
     aws_access_key: Optional[str] = None
     aws_secret_key: Optional[str] = None
@@ -161,7 +162,7 @@ class Claude(AnthropicClaude):
             _request_params.update(self.request_params)
 
         if _request_params:
-            log_debug(f"Calling {self.provider} with request parameters: {_request_params}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {_request_params}", log_level=2)
         return _request_params
 
     def invoke(
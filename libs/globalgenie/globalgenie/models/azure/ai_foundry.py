@@ -123,7 +123,7 @@ class AzureAIFoundry(Model):
             request_params.update(self.request_params)
 
         if request_params:
-            log_debug(f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
         return request_params
 
     def _get_client_params(self) -> Dict[str, Any]:
@@ -2,11 +2,14 @@ import asyncio
 import collections.abc
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import partial
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
+    TYPE_CHECKING,
     Any,
     AsyncGenerator,
     AsyncIterator,
+    Callable,
     Dict,
     Iterator,
     List,
@@ -24,15 +27,19 @@ from pydantic import BaseModel
 from globalgenie.exceptions import AgentRunException
 from globalgenie.media import AudioResponse, ImageArtifact
 from globalgenie.models.message import Citations, Message, MessageMetrics
+from globalgenie.models.rate_limit import RateLimit, estimate_request_tokens, get_rate_limiter
 from globalgenie.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from globalgenie.run.response import RunResponseContentEvent, RunResponseEvent
 from globalgenie.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
 from globalgenie.run.team import TeamRunResponseEvent
 from globalgenie.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
-from globalgenie.utils.log import log_debug, log_error, log_warning
+from globalgenie.utils.log import debug_enabled, log_debug, log_error, log_warning
 from globalgenie.utils.timer import Timer
 from globalgenie.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
 
+if TYPE_CHECKING:
+    from globalgenie.models.cache.base import CacheLookup, ResponseCache
+
 
 @dataclass
 class MessageData:
@@ -56,6 +63,8 @@ def _log_messages(messages: List[Message]) -> None:
     """
     Log messages for debugging.
     """
+    if not debug_enabled():
+        return
     for m in messages:
         # Don't log metrics for input messages
         m.log(metrics=False)
@@ -256,6 +265,15 @@ class Model(ABC):
     tool_message_role: str = "tool"
     # The role of the assistant message.
     assistant_message_role: str = "assistant"
+    # True if the input tokens reported by the provider include cached tokens (e.g. OpenAI, Gemini).
+    # Used to calculate the prompt cache hit ratio.
+    input_tokens_include_cached: bool = True
+    # Message media ("images", "audio", "videos", "files") whose URLs are downloaded when formatting messages.
+    # Async runs prefetch these URLs concurrently, so formatting never blocks the event loop.
+    prefetch_media_urls: Tuple[str, ...] = ()
+    # Client-side request and token limits, shared by all Models with the same provider, id and API key.
+    # Rate limit errors are retried within the Model call, instead of re-running the Agent.
+    rate_limit: Optional[RateLimit] = None
 
     def __post_init__(self):
         if self.provider is None and self.name is not None:
@@ -269,6 +287,33 @@ class Model(ABC):
     def get_provider(self) -> str:
         return self.provider or self.name or self.__class__.__name__
 
+    def _get_formatted_message(self, message: Message, format_message: Callable[[Message], Any], key: str = "") -> Any:
+        """Format a message for the provider, reusing the formatted message of previous requests.
+
+        `key` must identify the attributes of the Model that change the formatted message, e.g. a role map.
+        """
+        formatter = getattr(format_message, "__name__", "format_message")
+        return message.get_formatted(
+            f"{self.__class__.__qualname__}.{formatter}:{key}", lambda: format_message(message)
+        )
+
+    async def _aprefetch_media(self, messages: List[Message]) -> None:
+        """Download the media URLs the model formats as content, so they are served from the media cache"""
+        if not self.prefetch_media_urls:
+            return
+
+        urls = []
+        for message in messages:
+            for media_type in self.prefetch_media_urls:
+                for media in getattr(message, media_type, None) or []:
+                    url = getattr(media, "url", None)
+                    if url is not None:
+                        urls.append(url)
+        if urls:
+            from globalgenie.utils.media_fetcher import get_media_fetcher
+
+            await get_media_fetcher().aprefetch(urls)
+
     @abstractmethod
     def invoke(self, *args, **kwargs) -> Any:
         pass
@@ -319,6 +364,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        response_cache: Optional["ResponseCache"] = None,
     ) -> ModelResponse:
         """
         Generate a response from the model.
@@ -342,6 +388,7 @@ class Model(ABC):
                 response_format=response_format,
                 tools=tools,
                 tool_choice=tool_choice or self._tool_choice,
+                response_cache=response_cache,
             )
 
             # Add assistant message to messages
@@ -431,6 +478,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        response_cache: Optional["ResponseCache"] = None,
     ) -> ModelResponse:
         """
         Generate an asynchronous response from the model.
@@ -439,6 +487,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        await self._aprefetch_media(messages)
         model_response = ModelResponse()
 
         function_call_count = 0
@@ -453,6 +502,7 @@ class Model(ABC):
                 response_format=response_format,
                 tools=tools,
                 tool_choice=tool_choice or self._tool_choice,
+                response_cache=response_cache,
             )
 
             # Add assistant message to messages
@@ -541,6 +591,7 @@ class Model(ABC):
         response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        response_cache: Optional["ResponseCache"] = None,
     ) -> None:
         """
         Process a single model response and return the assistant message and whether to continue.
@@ -548,18 +599,35 @@ class Model(ABC):
         Returns:
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
-        # Generate response
-        assistant_message.metrics.start_timer()
-        response = self.invoke(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
+        cache_lookup = self._lookup_response_cache(
+            response_cache, assistant_message, messages, response_format, tools, tool_choice
         )
-        assistant_message.metrics.stop_timer()
+        rate_limiter = get_rate_limiter(self)
+        estimated_tokens = 0
+        if cache_lookup is not None and cache_lookup.responses is not None:
+            provider_response: ModelResponse = cache_lookup.responses[0]
+            rate_limiter = None
+        else:
+            invoke = partial(
+                self.invoke,
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+            )
+            # Generate response
+            assistant_message.metrics.start_timer()
+            if rate_limiter is not None:
+                estimated_tokens = estimate_request_tokens(self, messages)
+                response = rate_limiter.call(invoke, estimated_tokens)
+            else:
+                response = invoke()
+            assistant_message.metrics.stop_timer()
 
-        # Parse provider response
-        provider_response: ModelResponse = self.parse_provider_response(response, response_format=response_format)
+            # Parse provider response
+            provider_response = self.parse_provider_response(response, response_format=response_format)
+            if cache_lookup is not None:
+                response_cache.store(cache_lookup, [provider_response])  # type: ignore
 
         # Add parsed data to model response
         if provider_response.parsed is not None:
@@ -567,6 +635,8 @@ class Model(ABC):
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+        if rate_limiter is not None:
+            rate_limiter.record_usage(estimated_tokens, assistant_message.metrics.total_tokens)
 
         # Update model response with assistant message content and audio
         if assistant_message.content is not None:
@@ -597,6 +667,7 @@ class Model(ABC):
         response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        response_cache: Optional["ResponseCache"] = None,
     ) -> None:
         """
         Process a single async model response and return the assistant message and whether to continue.
@@ -604,18 +675,35 @@ class Model(ABC):
         Returns:
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
-        # Generate response
-        assistant_message.metrics.start_timer()
-        response = await self.ainvoke(
-            messages=messages,
-            response_format=response_format,
-            tools=tools,
-            tool_choice=tool_choice or self._tool_choice,
+        cache_lookup = await self._alookup_response_cache(
+            response_cache, assistant_message, messages, response_format, tools, tool_choice
         )
-        assistant_message.metrics.stop_timer()
+        rate_limiter = get_rate_limiter(self)
+        estimated_tokens = 0
+        if cache_lookup is not None and cache_lookup.responses is not None:
+            provider_response: ModelResponse = cache_lookup.responses[0]
+            rate_limiter = None
+        else:
+            invoke = partial(
+                self.ainvoke,
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice or self._tool_choice,
+            )
+            # Generate response
+            assistant_message.metrics.start_timer()
+            if rate_limiter is not None:
+                estimated_tokens = estimate_request_tokens(self, messages)
+                response = await rate_limiter.acall(invoke, estimated_tokens)
+            else:
+                response = await invoke()
+            assistant_message.metrics.stop_timer()
 
-        # Parse provider response
-        provider_response: ModelResponse = self.parse_provider_response(response, response_format=response_format)
+            # Parse provider response
+            provider_response = self.parse_provider_response(response, response_format=response_format)
+            if cache_lookup is not None:
+                await response_cache.astore(cache_lookup, [provider_response])  # type: ignore
 
         # Add parsed data to model response
         if provider_response.parsed is not None:
@@ -623,6 +711,8 @@ class Model(ABC):
 
         # Populate the assistant message
         self._populate_assistant_message(assistant_message=assistant_message, provider_response=provider_response)
+        if rate_limiter is not None:
+            rate_limiter.record_usage(estimated_tokens, assistant_message.metrics.total_tokens)
 
         # Update model response with assistant message content and audio
         if assistant_message.content is not None:
@@ -742,6 +832,7 @@ class Model(ABC):
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
         stream_model_response: bool = True,
+        response_cache: Optional["ResponseCache"] = None,
     ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
         """
         Generate a streaming response from the model.
@@ -759,13 +850,14 @@ class Model(ABC):
             stream_data = MessageData()
             if stream_model_response:
                 # Generate response
-                yield from self.process_response_stream(
+                yield from self._process_response_stream_with_cache(
                     messages=messages,
                     assistant_message=assistant_message,
                     stream_data=stream_data,
                     response_format=response_format,
                     tools=tools,
                     tool_choice=tool_choice or self._tool_choice,
+                    response_cache=response_cache,
                 )
 
                 # Populate assistant message from stream data
@@ -793,6 +885,7 @@ class Model(ABC):
                     response_format=response_format,
                     tools=tools,
                     tool_choice=tool_choice or self._tool_choice,
+                    response_cache=response_cache,
                 )
                 yield model_response
 
@@ -890,6 +983,7 @@ class Model(ABC):
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
         stream_model_response: bool = True,
+        response_cache: Optional["ResponseCache"] = None,
     ) -> AsyncIterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
         """
         Generate an asynchronous streaming response from the model.
@@ -898,6 +992,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Stream Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        await self._aprefetch_media(messages)
 
         function_call_count = 0
 
@@ -907,13 +1002,14 @@ class Model(ABC):
             stream_data = MessageData()
             if stream_model_response:
                 # Generate response
-                async for response in self.aprocess_response_stream(
+                async for response in self._aprocess_response_stream_with_cache(
                     messages=messages,
                     assistant_message=assistant_message,
                     stream_data=stream_data,
                     response_format=response_format,
                     tools=tools,
                     tool_choice=tool_choice or self._tool_choice,
+                    response_cache=response_cache,
                 ):
                     yield response
 
@@ -940,6 +1036,7 @@ class Model(ABC):
                     response_format=response_format,
                     tools=tools,
                     tool_choice=tool_choice or self._tool_choice,
+                    response_cache=response_cache,
                 )
                 yield model_response
 
@@ -1002,6 +1099,176 @@ class Model(ABC):
 
         log_debug(f"{self.get_provider()} Async Response Stream End", center=True, symbol="-")
 
+    def _lookup_response_cache(
+        self,
+        response_cache: Optional["ResponseCache"],
+        assistant_message: Message,
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        stream: bool = False,
+    ) -> Optional["CacheLookup"]:
+        """Look up the request in the response cache, recording the hit or miss in the message metrics"""
+        if response_cache is None:
+            return None
+        cache_lookup = response_cache.lookup(
+            self,
+            messages,
+            response_format=response_format,
+            tools=tools,
+            tool_choice=tool_choice or self._tool_choice,
+            stream=stream,
+        )
+        self._record_response_cache_lookup(assistant_message, cache_lookup)
+        return cache_lookup
+
+    async def _alookup_response_cache(
+        self,
+        response_cache: Optional["ResponseCache"],
+        assistant_message: Message,
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        stream: bool = False,
+    ) -> Optional["CacheLookup"]:
+        """Async version of `_lookup_response_cache`, looking up the request off the event loop"""
+        if response_cache is None:
+            return None
+        cache_lookup = await response_cache.alookup(
+            self,
+            messages,
+            response_format=response_format,
+            tools=tools,
+            tool_choice=tool_choice or self._tool_choice,
+            stream=stream,
+        )
+        self._record_response_cache_lookup(assistant_message, cache_lookup)
+        return cache_lookup
+
+    @staticmethod
+    def _record_response_cache_lookup(assistant_message: Message, cache_lookup: "CacheLookup") -> None:
+        if cache_lookup.responses is not None:
+            log_debug("Model response cache hit")
+            assistant_message.metrics.response_cache_hits += 1
+        else:
+            assistant_message.metrics.response_cache_misses += 1
+
+    @staticmethod
+    def _get_stream_responses_to_cache(
+        responses: List[ModelResponse], stream_data: MessageData
+    ) -> List[ModelResponse]:
+        # Provider data and extra data are not yielded by the stream, cache them as a final delta
+        if stream_data.response_provider_data or stream_data.extra:
+            responses.append(ModelResponse(provider_data=stream_data.response_provider_data, extra=stream_data.extra))
+        return responses
+
+    def _process_response_stream_with_cache(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        stream_data: MessageData,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        response_cache: Optional["ResponseCache"] = None,
+    ) -> Iterator[ModelResponse]:
+        """Process a streaming response within the rate limit, replaying it from the response cache if it is cached"""
+        cache_lookup = self._lookup_response_cache(
+            response_cache, assistant_message, messages, response_format, tools, tool_choice, stream=True
+        )
+        if cache_lookup is not None and cache_lookup.responses is not None:
+            assistant_message.metrics.start_timer()
+            for model_response_delta in cache_lookup.responses:
+                yield from self._populate_stream_data_and_assistant_message(
+                    stream_data=stream_data,
+                    assistant_message=assistant_message,
+                    model_response_delta=model_response_delta,
+                )
+            assistant_message.metrics.stop_timer()
+            return
+
+        process_response_stream = partial(
+            self.process_response_stream,
+            messages=messages,
+            assistant_message=assistant_message,
+            stream_data=stream_data,
+            response_format=response_format,
+            tools=tools,
+            tool_choice=tool_choice,
+        )
+        rate_limiter = get_rate_limiter(self)
+        if rate_limiter is not None:
+            estimated_tokens = estimate_request_tokens(self, messages)
+            stream = rate_limiter.stream(process_response_stream, estimated_tokens)
+        else:
+            stream = process_response_stream()
+
+        responses: List[ModelResponse] = []
+        for model_response_delta in stream:
+            if cache_lookup is not None:
+                responses.append(model_response_delta)
+            yield model_response_delta
+        if rate_limiter is not None:
+            rate_limiter.record_usage(estimated_tokens, assistant_message.metrics.total_tokens)
+        if cache_lookup is not None:
+            responses = self._get_stream_responses_to_cache(responses, stream_data)
+            response_cache.store(cache_lookup, responses)  # type: ignore
+
+    async def _aprocess_response_stream_with_cache(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        stream_data: MessageData,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        response_cache: Optional["ResponseCache"] = None,
+    ) -> AsyncIterator[ModelResponse]:
+        """Process an async streaming response, see `_process_response_stream_with_cache`"""
+        cache_lookup = await self._alookup_response_cache(
+            response_cache, assistant_message, messages, response_format, tools, tool_choice, stream=True
+        )
+        if cache_lookup is not None and cache_lookup.responses is not None:
+            assistant_message.metrics.start_timer()
+            for model_response_delta in cache_lookup.responses:
+                for model_response in self._populate_stream_data_and_assistant_message(
+                    stream_data=stream_data,
+                    assistant_message=assistant_message,
+                    model_response_delta=model_response_delta,
+                ):
+                    yield model_response
+            assistant_message.metrics.stop_timer()
+            return
+
+        process_response_stream = partial(
+            self.aprocess_response_stream,
+            messages=messages,
+            assistant_message=assistant_message,
+            stream_data=stream_data,
+            response_format=response_format,
+            tools=tools,
+            tool_choice=tool_choice,
+        )
+        rate_limiter = get_rate_limiter(self)
+        if rate_limiter is not None:
+            estimated_tokens = estimate_request_tokens(self, messages)
+            stream = rate_limiter.astream(process_response_stream, estimated_tokens)  # type: ignore
+        else:
+            stream = process_response_stream()  # type: ignore
+
+        responses: List[ModelResponse] = []
+        async for model_response_delta in stream:
+            if cache_lookup is not None:
+                responses.append(model_response_delta)
+            yield model_response_delta
+        if rate_limiter is not None:
+            rate_limiter.record_usage(estimated_tokens, assistant_message.metrics.total_tokens)
+        if cache_lookup is not None:
+            responses = self._get_stream_responses_to_cache(responses, stream_data)
+            await response_cache.astore(cache_lookup, responses)  # type: ignore
+
     def _populate_stream_data_and_assistant_message(
         self, stream_data: MessageData, assistant_message: Message, model_response_delta: ModelResponse
     ) -> Iterator[ModelResponse]:
@@ -1235,6 +1502,12 @@ class Model(ABC):
             if function_call.function.show_result:
                 yield ModelResponse(content=function_call_output)
 
+        # Spill results that exceed the size limit of the function
+        if function_call_success and function_call.function.result_policy is not None:
+            function_call_output = function_call.function.result_policy.apply(
+                function_name=function_call.function.name, output=function_call_output
+            )
+
         # Create and yield function call result
         function_call_result = self.create_function_call_result(
             function_call, success=function_call_success, output=function_call_output, timer=function_call_timer
@@ -1609,6 +1882,12 @@ class Model(ABC):
                 if fc.function.show_result:
                     yield ModelResponse(content=function_call_output)
 
+            # Spill results that exceed the size limit of the function
+            if function_call_success and fc.function.result_policy is not None:
+                function_call_output = fc.function.result_policy.apply(
+                    function_name=fc.function.name, output=function_call_output
+                )
+
             # Create and yield function call result
             function_call_result = self.create_function_call_result(
                 fc, success=function_call_success, output=function_call_output, timer=function_call_timer
@@ -0,0 +1,5 @@
+from globalgenie.models.cache.base import CacheLookup, ResponseCache
+from globalgenie.models.cache.memory import InMemoryResponseCache
+from globalgenie.models.cache.sqlite import SqliteResponseCache
+
+__all__ = ["CacheLookup", "ResponseCache", "InMemoryResponseCache", "SqliteResponseCache"]
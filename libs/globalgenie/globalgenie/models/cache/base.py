@@ -0,0 +1,313 @@
+import asyncio
+import json
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from hashlib import sha256
+from time import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from globalgenie.models.message import Citations, Message
+from globalgenie.models.response import ModelResponse
+from globalgenie.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from globalgenie.embedder.base import Embedder
+    from globalgenie.models.base import Model
+
+# Model attributes that do not change the response, e.g. client settings
+_IGNORED_MODEL_ATTRIBUTES = {
+    "name",
+    "provider",
+    "base_url",
+    "timeout",
+    "max_retries",
+    "default_headers",
+    "default_query",
+    "extra_headers",
+    "http_client",
+    "client_params",
+    "system_prompt",
+    "instructions",
+    "prefetch_media_urls",
+    "rate_limit",
+}
+# Fields of a ModelResponse that are cached. Usage is not cached, as a cache hit uses no tokens.
+_CACHED_RESPONSE_FIELDS = (
+    "role",
+    "content",
+    "tool_calls",
+    "provider_data",
+    "thinking",
+    "redacted_thinking",
+    "reasoning_content",
+    "extra",
+)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return sha256(value).hexdigest()
+    if isinstance(value, BaseModel):
+        return value.model_dump(exclude_none=True)
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return value.model_json_schema()
+    return str(value)
+
+
+def _get_model_params(model: "Model") -> Dict[str, Any]:
+    """Return the attributes of the model that change its responses, e.g. temperature or max_tokens"""
+    params: Dict[str, Any] = {"id": model.id, "provider": model.get_provider()}
+    if not is_dataclass(model):
+        return params
+    for model_field in fields(model):
+        name = model_field.name
+        if name.startswith("_") or name in _IGNORED_MODEL_ATTRIBUTES:
+            continue
+        value = getattr(model, name, None)
+        if value is None or isinstance(value, bool) or isinstance(value, (int, float)):
+            params[name] = value
+        elif isinstance(value, str):
+            # Skip credentials
+            if not any(secret in name for secret in ("key", "secret", "token", "password")):
+                params[name] = value
+        elif isinstance(value, (list, tuple, dict)):
+            params[name] = value
+    return params
+
+
+def _get_message_data(message: Message) -> Dict[str, Any]:
+    """Return the content of a message that is sent to the model, without ids, timestamps or metrics"""
+    data = message.model_dump(
+        include={"role", "content", "name", "tool_call_id", "tool_calls", "thinking", "redacted_thinking"},
+        exclude_none=True,
+    )
+    for media_type in ("images", "audio", "videos", "files"):
+        media = getattr(message, media_type, None)
+        if media:
+            data[media_type] = [item.model_dump(exclude={"id"}, exclude_none=True) for item in media]
+    return data
+
+
+def _get_query(messages: List[Message]) -> Optional[str]:
+    """Return the text of the last message if it is a text-only user message"""
+    if not messages or messages[-1].role != "user":
+        return None
+    message = messages[-1]
+    if message.images or message.audio or message.videos or message.files:
+        return None
+    query = message.get_content_string()
+    return query or None
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+@dataclass
+class CacheLookup:
+    """The result of looking up a model request in a ResponseCache"""
+
+    key: str
+    # The cached responses, None on a cache miss
+    responses: Optional[List[ModelResponse]] = None
+    # Set if the request can be cached semantically
+    namespace: Optional[str] = None
+    embedding: Optional[List[float]] = None
+
+
+class ResponseCache(ABC):
+    """Caches the responses of models, keyed by a hash of the request.
+
+    The key covers the provider, model id and parameters (e.g. temperature), the messages, tools, tool choice
+    and response format, so only identical requests share a response. Usage is not cached: a cache hit uses
+    no tokens, and is counted in the `response_cache_hits` metric of the assistant message.
+
+    If an `embedder` is set, a request whose last message is a user message also matches a cached request with
+    the same model, tools and earlier messages, whose last user message has an embedding with a cosine
+    similarity of at least `similarity_threshold`. The embeddings are kept in memory.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 24 * 60 * 60,
+        embedder: Optional["Embedder"] = None,
+        similarity_threshold: float = 0.95,
+        max_semantic_entries: int = 1000,
+    ):
+        """
+        Args:
+            ttl: Seconds after which a cached response expires. Responses never expire if None.
+            embedder: Embedder for semantic matching of user messages. Only exact matches are used if None.
+            similarity_threshold: Minimum cosine similarity of a semantic match.
+            max_semantic_entries: Maximum number of embeddings kept for semantic matching.
+        """
+        self.ttl = ttl
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.max_semantic_entries = max_semantic_entries
+        # Embeddings of cached user messages: (namespace, key) -> embedding
+        self._embeddings: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Return the timestamp and serialized responses stored for a key"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write(self, key: str, created_at: float, data: Any) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def get_key(
+        self,
+        model: "Model",
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        stream: bool = False,
+        exclude_last_message: bool = False,
+    ) -> str:
+        request = {
+            "model": _get_model_params(model),
+            "messages": [_get_message_data(m) for m in (messages[:-1] if exclude_last_message else messages)],
+            "response_format": response_format,
+            "tools": tools,
+            "tool_choice": tool_choice,
+            "stream": stream,
+        }
+        return sha256(json.dumps(request, sort_keys=True, default=_json_default).encode()).hexdigest()
+
+    def lookup(
+        self,
+        model: "Model",
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        stream: bool = False,
+    ) -> CacheLookup:
+        """Look up the cached responses of a request, by its exact key and then semantically"""
+        lookup = CacheLookup(
+            key=self.get_key(model, messages, response_format, tools, tool_choice, stream=stream),
+        )
+        lookup.responses = self._get(lookup.key, response_format)
+        if lookup.responses is not None or self.embedder is None:
+            return lookup
+
+        query = _get_query(messages)
+        if query is None:
+            return lookup
+        try:
+            lookup.embedding = self.embedder.get_embedding(query)
+        except Exception as e:
+            log_warning(f"Could not embed message for the response cache: {e}")
+            return lookup
+        lookup.namespace = self.get_key(
+            model, messages, response_format, tools, tool_choice, stream=stream, exclude_last_message=True
+        )
+
+        best_key, best_similarity = None, self.similarity_threshold
+        with self._lock:
+            candidates = [
+                (key, emb) for (namespace, key), emb in self._embeddings.items() if namespace == lookup.namespace
+            ]
+        for key, embedding in candidates:
+            similarity = _cosine_similarity(lookup.embedding, embedding)
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+        if best_key is not None:
+            lookup.responses = self._get(best_key, response_format)
+            if lookup.responses is not None:
+                log_debug(f"Semantic response cache hit, similarity {best_similarity:.3f}")
+        return lookup
+
+    async def alookup(
+        self,
+        model: "Model",
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        stream: bool = False,
+    ) -> CacheLookup:
+        """Async version of `lookup`. Reading the cache and embedding the message run in a thread."""
+        return await asyncio.to_thread(
+            self.lookup, model, messages, response_format, tools, tool_choice, stream=stream
+        )
+
+    def store(self, lookup: CacheLookup, responses: List[ModelResponse]) -> None:
+        """Cache the responses of a request that was not found by `lookup`"""
+        data = []
+        for response in responses:
+            if response.audio is not None or response.image is not None:
+                # Media outputs are not cached
+                return
+            data.append(self._response_to_dict(response))
+        try:
+            self._write(lookup.key, time(), json.loads(json.dumps(data)))
+        except Exception as e:
+            log_debug(f"Could not cache model response: {e}")
+            return
+
+        if lookup.namespace is not None and lookup.embedding is not None:
+            with self._lock:
+                self._embeddings[(lookup.namespace, lookup.key)] = lookup.embedding
+                self._embeddings.move_to_end((lookup.namespace, lookup.key))
+                while len(self._embeddings) > self.max_semantic_entries:
+                    self._embeddings.popitem(last=False)
+
+    async def astore(self, lookup: CacheLookup, responses: List[ModelResponse]) -> None:
+        """Async version of `store`, writing to the cache in a thread"""
+        await asyncio.to_thread(self.store, lookup, responses)
+
+    def _get(
+        self, key: str, response_format: Optional[Union[Dict, Type[BaseModel]]]
+    ) -> Optional[List[ModelResponse]]:
+        entry = self._read(key)
+        if entry is None:
+            return None
+        created_at, data = entry
+        if self.ttl is not None and time() - created_at > self.ttl:
+            self._delete(key)
+            return None
+        try:
+            return [self._response_from_dict(item, response_format) for item in data]
+        except Exception as e:
+            log_warning(f"Could not read cached model response: {e}")
+            return None
+
+    @staticmethod
+    def _response_to_dict(response: ModelResponse) -> Dict[str, Any]:
+        data = {name: getattr(response, name) for name in _CACHED_RESPONSE_FIELDS if getattr(response, name)}
+        if response.citations is not None:
+            data["citations"] = response.citations.model_dump(exclude_none=True)
+        if isinstance(response.parsed, BaseModel):
+            data["parsed"] = response.parsed.model_dump()
+        return data
+
+    @staticmethod
+    def _response_from_dict(
+        data: Dict[str, Any], response_format: Optional[Union[Dict, Type[BaseModel]]]
+    ) -> ModelResponse:
+        response = ModelResponse(**{name: data[name] for name in _CACHED_RESPONSE_FIELDS if name in data})
+        if "citations" in data:
+            response.citations = Citations.model_validate(data["citations"])
+        if "parsed" in data and isinstance(response_format, type) and issubclass(response_format, BaseModel):
+            response.parsed = response_format.model_validate(data["parsed"])
+        return response
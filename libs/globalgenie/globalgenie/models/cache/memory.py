@@ -0,0 +1,45 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from globalgenie.models.cache.base import ResponseCache
+
+if TYPE_CHECKING:
+    from globalgenie.embedder.base import Embedder
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Keeps model responses in process memory, bounded to `max_entries` least recently used responses"""
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl: Optional[float] = 24 * 60 * 60,
+        embedder: Optional["Embedder"] = None,
+        similarity_threshold: float = 0.95,
+    ):
+        super().__init__(ttl=ttl, embedder=embedder, similarity_threshold=similarity_threshold)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _write(self, key: str, created_at: float, data: Any) -> None:
+        with self._lock:
+            self._entries[key] = (created_at, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._embeddings.clear()
@@ -0,0 +1,61 @@
+import json
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from globalgenie.models.cache.base import ResponseCache
+
+try:
+    from redis import Redis
+except ImportError:
+    raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+if TYPE_CHECKING:
+    from globalgenie.embedder.base import Embedder
+
+
+class RedisResponseCache(ResponseCache):
+    """Stores model responses in Redis, so they are shared by processes and hosts. Entries expire with the ttl."""
+
+    def __init__(
+        self,
+        prefix: str = "globalgenie:model_response",
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        ssl: bool = False,
+        redis_client: Optional[Redis] = None,
+        ttl: Optional[float] = 24 * 60 * 60,
+        embedder: Optional["Embedder"] = None,
+        similarity_threshold: float = 0.95,
+    ):
+        super().__init__(ttl=ttl, embedder=embedder, similarity_threshold=similarity_threshold)
+        self.prefix = prefix
+        self.redis_client = redis_client or Redis(
+            host=host, port=port, db=db, password=password, ssl=ssl, decode_responses=True
+        )
+
+    def _get_redis_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        value = self.redis_client.get(self._get_redis_key(key))
+        if value is None:
+            return None
+        entry = json.loads(value)  # type: ignore
+        return entry["created_at"], entry["data"]
+
+    def _write(self, key: str, created_at: float, data: Any) -> None:
+        self.redis_client.set(
+            self._get_redis_key(key),
+            json.dumps({"created_at": created_at, "data": data}),
+            ex=int(self.ttl) if self.ttl is not None else None,
+        )
+
+    def _delete(self, key: str) -> None:
+        self.redis_client.delete(self._get_redis_key(key))
+
+    def clear(self) -> None:
+        for redis_key in self.redis_client.scan_iter(match=f"{self.prefix}:*"):
+            self.redis_client.delete(redis_key)
+        with self._lock:
+            self._embeddings.clear()
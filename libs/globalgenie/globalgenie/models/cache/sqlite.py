@@ -0,0 +1,77 @@
+import json
+import sqlite3
+from pathlib import Path
+from tempfile import gettempdir
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
+
+from globalgenie.models.cache.base import ResponseCache
+
+if TYPE_CHECKING:
+    from globalgenie.embedder.base import Embedder
+
+
+class SqliteResponseCache(ResponseCache):
+    """Stores model responses in a sqlite database, so they are shared by processes and survive restarts"""
+
+    def __init__(
+        self,
+        db_file: Optional[Union[str, Path]] = None,
+        table_name: str = "model_response_cache",
+        ttl: Optional[float] = 24 * 60 * 60,
+        embedder: Optional["Embedder"] = None,
+        similarity_threshold: float = 0.95,
+    ):
+        """
+        Args:
+            db_file: The database file. Defaults to a file in the temp directory.
+            table_name: The table to store responses in.
+        """
+        super().__init__(ttl=ttl, embedder=embedder, similarity_threshold=similarity_threshold)
+        self.db_file = Path(db_file) if db_file else Path(gettempdir()) / "globalgenie_cache" / "model_responses.db"
+        self.table_name = table_name
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            # The connection is shared by threads, access is serialized by the lock
+            self._connection = sqlite3.connect(str(self.db_file), check_same_thread=False)
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+                "(key TEXT PRIMARY KEY, created_at REAL NOT NULL, data TEXT NOT NULL)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(f"SELECT created_at, data FROM {self.table_name} WHERE key = ?", (key,))
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def _write(self, key: str, created_at: float, data: Any) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, created_at, data) VALUES (?, ?, ?)",
+                (key, created_at, json.dumps(data)),
+            )
+            connection.commit()
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+            connection.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(f"DELETE FROM {self.table_name}")
+            connection.commit()
+            self._embeddings.clear()
@@ -192,7 +192,7 @@ class Cerebras(Model):
             request_params.update(self.request_params)
 
         if request_params:
-            log_debug(f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
         return request_params
 
     def invoke(
@@ -213,7 +213,7 @@ class Cerebras(Model):
         """
         return self.get_client().chat.completions.create(
             model=self.id,
-            messages=[self._format_message(m) for m in messages],  # type: ignore
+            messages=[self._get_formatted_message(m, self._format_message) for m in messages],  # type: ignore
             **self.get_request_params(response_format=response_format, tools=tools),
         )
 
@@ -235,7 +235,7 @@ class Cerebras(Model):
         """
         return await self.get_async_client().chat.completions.create(
             model=self.id,
-            messages=[self._format_message(m) for m in messages],  # type: ignore
+            messages=[self._get_formatted_message(m, self._format_message) for m in messages],  # type: ignore
             **self.get_request_params(response_format=response_format, tools=tools),
         )
 
@@ -257,7 +257,7 @@ class Cerebras(Model):
         """
         yield from self.get_client().chat.completions.create(
             model=self.id,
-            messages=[self._format_message(m) for m in messages],  # type: ignore
+            messages=[self._get_formatted_message(m, self._format_message) for m in messages],  # type: ignore
             stream=True,
             **self.get_request_params(response_format=response_format, tools=tools),
         )  # type: ignore
@@ -280,7 +280,7 @@ class Cerebras(Model):
         """
         async_stream = await self.get_async_client().chat.completions.create(
             model=self.id,
-            messages=[self._format_message(m) for m in messages],  # type: ignore
+            messages=[self._get_formatted_message(m, self._format_message) for m in messages],  # type: ignore
             stream=True,
             **self.get_request_params(response_format=response_format, tools=tools),
         )
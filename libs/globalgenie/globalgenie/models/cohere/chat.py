@@ -31,6 +31,7 @@ class Cohere(Model):
     id: str = "command-r-plus"
     name: str = "cohere"
     provider: str = "Cohere"
+    prefetch_media_urls: Tuple[str, ...] = ("images",)
 
     # -*- Request parameters
     temperature: Optional[float] = None
@@ -142,7 +143,7 @@ class Cohere(Model):
             _request_params.update(self.request_params)
 
         if _request_params:
-            log_debug(f"Calling {self.provider} with request parameters: {_request_params}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {_request_params}", log_level=2)
         return _request_params
 
     def invoke(
@@ -1,9 +1,10 @@
 import json
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from hashlib import md5
 from os import getenv
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 from uuid import uuid4
 
 from pydantic import BaseModel
@@ -23,6 +24,7 @@ try:
     from google.genai.errors import ClientError, ServerError
     from google.genai.types import (
         Content,
+        CreateCachedContentConfig,
         DynamicRetrievalConfig,
         GenerateContentConfig,
         GenerateContentResponse,
@@ -59,6 +61,7 @@ class Gemini(Model):
     provider: str = "Google"
 
     supports_native_structured_outputs: bool = True
+    prefetch_media_urls: Tuple[str, ...] = ("images", "audio", "files")
 
     # Request parameters
     function_declarations: Optional[List[Any]] = None
@@ -81,6 +84,10 @@ class Gemini(Model):
     response_modalities: Optional[list[str]] = None  # "Text" and/or "Image"
     speech_config: Optional[dict[str, Any]] = None
     cached_content: Optional[Any] = None
+    # Cache the static prefix of the system message (marked by the Agent) and the tools with context caching
+    cache_system_prompt: bool = False
+    # Time to live of the context caches, in seconds
+    cache_ttl: int = 3600
     thinking_budget: Optional[int] = None  # Thinking budget for Gemini 2.5 models
     include_thoughts: Optional[bool] = None  # Include thought summaries in response
     request_params: Optional[Dict[str, Any]] = None
@@ -95,6 +102,9 @@ class Gemini(Model):
     # Gemini client
     client: Optional[GeminiClient] = None
 
+    # Context cache name and expiry per cached prefix
+    _prompt_caches: Dict[str, Tuple[Optional[str], float]] = field(default_factory=dict)
+
     # The role to map the Gemini response
     role_map = {
         "model": "assistant",
@@ -143,9 +153,12 @@ class Gemini(Model):
         system_message: Optional[str] = None,
         response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
+        cached_content: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Returns the request keyword arguments for the GenerativeModel client.
+
+        If cached_content is provided, the system message and tools are already part of the cache and are not sent.
         """
         request_params = {}
         # User provides their own generation config
@@ -174,7 +187,7 @@ class Gemini(Model):
                 "seed": self.seed,
                 "response_modalities": self.response_modalities,
                 "speech_config": self.speech_config,
-                "cached_content": self.cached_content,
+                "cached_content": cached_content or self.cached_content,
             }
         )
 
@@ -219,7 +232,7 @@ class Gemini(Model):
             log_info("Search enabled. External tools will be disabled.")
             config["tools"] = [Tool(google_search=GoogleSearch())]
 
-        elif tools:
+        elif tools and cached_content is None:
             config["tools"] = [format_function_definitions(tools)]
 
         config = {k: v for k, v in config.items() if v is not None}
@@ -232,7 +245,7 @@ class Gemini(Model):
             request_params.update(self.request_params)
 
         if request_params:
-            log_debug(f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
         return request_params
 
     def invoke(
@@ -246,7 +259,10 @@ class Gemini(Model):
         Invokes the model with a list of messages and returns the response.
         """
         formatted_messages, system_message = self._format_messages(messages)
-        request_kwargs = self.get_request_params(system_message, response_format=response_format, tools=tools)
+        cached_content, system_message = self._apply_prompt_cache(messages, formatted_messages, system_message, tools)
+        request_kwargs = self.get_request_params(
+            system_message, response_format=response_format, tools=tools, cached_content=cached_content
+        )
         try:
             return self.get_client().models.generate_content(
                 model=self.id,
@@ -277,8 +293,10 @@ class Gemini(Model):
         Invokes the model with a list of messages and returns the response as a stream.
         """
         formatted_messages, system_message = self._format_messages(messages)
-
-        request_kwargs = self.get_request_params(system_message, response_format=response_format, tools=tools)
+        cached_content, system_message = self._apply_prompt_cache(messages, formatted_messages, system_message, tools)
+        request_kwargs = self.get_request_params(
+            system_message, response_format=response_format, tools=tools, cached_content=cached_content
+        )
         try:
             yield from self.get_client().models.generate_content_stream(
                 model=self.id,
@@ -308,8 +326,12 @@ class Gemini(Model):
         Invokes the model with a list of messages and returns the response.
         """
         formatted_messages, system_message = self._format_messages(messages)
-
-        request_kwargs = self.get_request_params(system_message, response_format=response_format, tools=tools)
+        cached_content, system_message = await self._aapply_prompt_cache(
+            messages, formatted_messages, system_message, tools
+        )
+        request_kwargs = self.get_request_params(
+            system_message, response_format=response_format, tools=tools, cached_content=cached_content
+        )
 
         try:
             return await self.get_client().aio.models.generate_content(
@@ -340,8 +362,12 @@ class Gemini(Model):
         Invokes the model with a list of messages and returns the response as a stream.
         """
         formatted_messages, system_message = self._format_messages(messages)
-
-        request_kwargs = self.get_request_params(system_message, response_format=response_format, tools=tools)
+        cached_content, system_message = await self._aapply_prompt_cache(
+            messages, formatted_messages, system_message, tools
+        )
+        request_kwargs = self.get_request_params(
+            system_message, response_format=response_format, tools=tools, cached_content=cached_content
+        )
 
         try:
             async_stream = await self.get_client().aio.models.generate_content_stream(
@@ -363,6 +389,118 @@ class Gemini(Model):
             log_error(f"Unknown error from Gemini API: {e}")
             raise ModelProviderError(message=str(e), model_name=self.name, model_id=self.id) from e
 
+    def _get_prompt_cache_prefix(
+        self, messages: List[Message], system_message: Optional[str], tools: Optional[List[Dict[str, Any]]] = None
+    ) -> Optional[Tuple[str, str]]:
+        """Return the key and the static prefix of the system message to cache, or None if no cache is used"""
+        if not self.cache_system_prompt or self.cached_content is not None or self.search or self.grounding:
+            return None
+
+        cache_prefix: Optional[str] = None
+        for message in messages:
+            if (
+                message.role in ["system", "developer"]
+                and message.cache_prefix_length
+                and isinstance(message.content, str)
+            ):
+                cache_prefix = message.content[: message.cache_prefix_length]
+        if not cache_prefix or system_message is None or not system_message.startswith(cache_prefix):
+            return None
+
+        cache_key = md5(json.dumps([self.id, cache_prefix, tools], sort_keys=True, default=str).encode()).hexdigest()
+        return cache_key, cache_prefix
+
+    def _get_cache_config(
+        self, cache_prefix: str, tools: Optional[List[Dict[str, Any]]] = None
+    ) -> CreateCachedContentConfig:
+        return CreateCachedContentConfig(
+            system_instruction=cache_prefix,
+            tools=[format_function_definitions(tools)] if tools else None,
+            ttl=f"{self.cache_ttl}s",
+        )
+
+    def _set_prompt_cache(self, cache_key: str, cache_name: Optional[str]) -> None:
+        # Refresh the cache a minute before it expires. Failures are not retried until then either, as the prefix
+        # may be too short to cache
+        self._prompt_caches[cache_key] = (cache_name, time.time() + max(self.cache_ttl - 60, 0))
+
+    def _use_prompt_cache(
+        self, cache_prefix: str, cache_name: Optional[str], formatted_messages: List[Any], system_message: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        if cache_name is None:
+            return None, system_message
+
+        # The content after the prefix changes between runs, so it is moved to the start of formatted_messages
+        run_content = system_message[len(cache_prefix) :].strip()
+        if run_content:
+            formatted_messages.insert(0, Content(role="user", parts=[Part.from_text(text=run_content)]))
+        return cache_name, None
+
+    def _apply_prompt_cache(
+        self,
+        messages: List[Message],
+        formatted_messages: List[Any],
+        system_message: Optional[str],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Use a context cache for the static prefix of the system message and the tools, if enabled.
+
+        The content after the prefix changes between runs, so it is moved to the start of formatted_messages.
+
+        Returns:
+            Tuple[Optional[str], Optional[str]]: The name of the context cache and the system message to send.
+        """
+        prompt_cache = self._get_prompt_cache_prefix(messages, system_message, tools)
+        if prompt_cache is None:
+            return None, system_message
+
+        cache_key, cache_prefix = prompt_cache
+        cache_name, expires_at = self._prompt_caches.get(cache_key, (None, 0.0))
+        if expires_at <= time.time():
+            try:
+                cache = self.get_client().caches.create(
+                    model=self.id, config=self._get_cache_config(cache_prefix, tools)
+                )
+                cache_name = cache.name
+                log_debug(f"Created context cache: {cache_name}")
+            except Exception as e:
+                log_warning(f"Could not create context cache: {e}")
+                cache_name = None
+            self._set_prompt_cache(cache_key, cache_name)
+
+        return self._use_prompt_cache(cache_prefix, cache_name, formatted_messages, system_message)  # type: ignore
+
+    async def _aapply_prompt_cache(
+        self,
+        messages: List[Message],
+        formatted_messages: List[Any],
+        system_message: Optional[str],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Async version of _apply_prompt_cache, creating the context cache with the async client.
+        """
+        prompt_cache = self._get_prompt_cache_prefix(messages, system_message, tools)
+        if prompt_cache is None:
+            return None, system_message
+
+        cache_key, cache_prefix = prompt_cache
+        cache_name, expires_at = self._prompt_caches.get(cache_key, (None, 0.0))
+        if expires_at <= time.time():
+            try:
+                cache = await self.get_client().aio.caches.create(
+                    model=self.id, config=self._get_cache_config(cache_prefix, tools)
+                )
+                cache_name = cache.name
+                log_debug(f"Created context cache: {cache_name}")
+            except Exception as e:
+                log_warning(f"Could not create context cache: {e}")
+                cache_name = None
+            self._set_prompt_cache(cache_key, cache_name)
+
+        return self._use_prompt_cache(cache_prefix, cache_name, formatted_messages, system_message)  # type: ignore
+
     def _format_messages(self, messages: List[Message]):
         """
         Converts a list of Message objects to the Gemini-compatible format.
@@ -371,7 +509,6 @@ class Gemini(Model):
             messages (List[Message]): The list of messages to convert.
         """
         formatted_messages: List = []
-        file_content: Optional[Union[GeminiFile, Part]] = None
         system_message = None
         for message in messages:
             role = message.role
@@ -379,104 +516,121 @@ class Gemini(Model):
                 system_message = message.content
                 continue
 
-            # Set the role for the message according to Gemini's requirements
-            role = self.reverse_role_map.get(role, role)
-
-            # Add content to the message for the model
-            content = message.content
-            # Initialize message_parts to be used for Gemini
-            message_parts: List[Any] = []
-
-            # Function calls
-            if (not content or role == "model") and message.tool_calls is not None and len(message.tool_calls) > 0:
-                for tool_call in message.tool_calls:
-                    message_parts.append(
-                        Part.from_function_call(
-                            name=tool_call["function"]["name"],
-                            args=json.loads(tool_call["function"]["arguments"]),
-                        )
-                    )
-            # Function results
-            elif message.tool_calls is not None and len(message.tool_calls) > 0:
-                for tool_call in message.tool_calls:
-                    message_parts.append(
-                        Part.from_function_response(
-                            name=tool_call["tool_name"], response={"result": tool_call["content"]}
-                        )
-                    )
-            # Regular text content
-            else:
-                if isinstance(content, str):
-                    message_parts = [Part.from_text(text=content)]
-
-            if role == "user" and message.tool_calls is None:
-                # Add images to the message for the model
-                if message.images is not None:
-                    for image in message.images:
-                        if image.content is not None and isinstance(image.content, GeminiFile):
-                            # Google recommends that if using a single image, place the text prompt after the image.
-                            message_parts.insert(0, image.content)
-                        else:
-                            image_content = format_image_for_message(image)
-                            if image_content:
-                                message_parts.append(Part.from_bytes(**image_content))
-
-                # Add videos to the message for the model
-                if message.videos is not None:
-                    try:
-                        for video in message.videos:
-                            # Case 1: Video is a file_types.File object (Recommended)
-                            # Add it as a File object
-                            if video.content is not None and isinstance(video.content, GeminiFile):
-                                # Google recommends that if using a single video, place the text prompt after the video.
-                                if video.content.uri and video.content.mime_type:
-                                    message_parts.insert(
-                                        0, Part.from_uri(file_uri=video.content.uri, mime_type=video.content.mime_type)
-                                    )
-                            else:
-                                video_file = self._format_video_for_message(video)
-                                if video_file is not None:
-                                    message_parts.insert(0, video_file)
-                    except Exception as e:
-                        log_warning(f"Failed to load video from {message.videos}: {e}")
-                        continue
+            # Messages are formatted once per run, so media is not encoded or uploaded again on every request
+            formatted_message = self._get_formatted_message(message, self._format_message)
+            if formatted_message is None:
+                continue
+            for content in formatted_message:
+                if isinstance(content, GeminiFile):
+                    formatted_messages.insert(0, content)
+                else:
+                    formatted_messages.append(content)
 
-                # Add audio to the message for the model
-                if message.audio is not None:
-                    try:
-                        for audio_snippet in message.audio:
-                            if audio_snippet.content is not None and isinstance(audio_snippet.content, GeminiFile):
-                                # Google recommends that if using a single audio file, place the text prompt after the audio file.
-                                if audio_snippet.content.uri and audio_snippet.content.mime_type:
-                                    message_parts.insert(
-                                        0,
-                                        Part.from_uri(
-                                            file_uri=audio_snippet.content.uri,
-                                            mime_type=audio_snippet.content.mime_type,
-                                        ),
-                                    )
-                            else:
-                                audio_content = self._format_audio_for_message(audio_snippet)
-                                if audio_content:
-                                    message_parts.append(audio_content)
-                    except Exception as e:
-                        log_warning(f"Failed to load audio from {message.audio}: {e}")
-                        continue
+        return formatted_messages, system_message
 
-                # Add files to the message for the model
-                if message.files is not None:
-                    for file in message.files:
-                        file_content = self._format_file_for_message(file)
-                        if isinstance(file_content, Part):
-                            formatted_messages.append(file_content)
+    def _format_message(self, message: Message) -> Optional[List[Any]]:
+        """
+        Converts a Message to the Gemini contents for it: file parts, the message content and uploaded files,
+        which are moved to the start of the contents. Returns None if the media of the message fails to load.
+        """
+        formatted_message: List[Any] = []
+        uploaded_files: List[GeminiFile] = []
+
+        # Set the role for the message according to Gemini's requirements
+        role = self.reverse_role_map.get(message.role, message.role)
+
+        # Add content to the message for the model
+        content = message.content
+        # Initialize message_parts to be used for Gemini
+        message_parts: List[Any] = []
+
+        # Function calls
+        if (not content or role == "model") and message.tool_calls is not None and len(message.tool_calls) > 0:
+            for tool_call in message.tool_calls:
+                message_parts.append(
+                    Part.from_function_call(
+                        name=tool_call["function"]["name"],
+                        args=json.loads(tool_call["function"]["arguments"]),
+                    )
+                )
+        # Function results
+        elif message.tool_calls is not None and len(message.tool_calls) > 0:
+            for tool_call in message.tool_calls:
+                message_parts.append(
+                    Part.from_function_response(
+                        name=tool_call["tool_name"], response={"result": tool_call["content"]}
+                    )
+                )
+        # Regular text content
+        else:
+            if isinstance(content, str):
+                message_parts = [Part.from_text(text=content)]
+
+        if role == "user" and message.tool_calls is None:
+            # Add images to the message for the model
+            if message.images is not None:
+                for image in message.images:
+                    if image.content is not None and isinstance(image.content, GeminiFile):
+                        # Google recommends that if using a single image, place the text prompt after the image.
+                        message_parts.insert(0, image.content)
+                    else:
+                        image_content = format_image_for_message(image)
+                        if image_content:
+                            message_parts.append(Part.from_bytes(**image_content))
 
-            final_message = Content(role=role, parts=message_parts)
-            formatted_messages.append(final_message)
+            # Add videos to the message for the model
+            if message.videos is not None:
+                try:
+                    for video in message.videos:
+                        # Case 1: Video is a file_types.File object (Recommended)
+                        # Add it as a File object
+                        if video.content is not None and isinstance(video.content, GeminiFile):
+                            # Google recommends that if using a single video, place the text prompt after the video.
+                            if video.content.uri and video.content.mime_type:
+                                message_parts.insert(
+                                    0, Part.from_uri(file_uri=video.content.uri, mime_type=video.content.mime_type)
+                                )
+                        else:
+                            video_file = self._format_video_for_message(video)
+                            if video_file is not None:
+                                message_parts.insert(0, video_file)
+                except Exception as e:
+                    log_warning(f"Failed to load video from {message.videos}: {e}")
+                    return None
 
-            if isinstance(file_content, GeminiFile):
-                formatted_messages.insert(0, file_content)
+            # Add audio to the message for the model
+            if message.audio is not None:
+                try:
+                    for audio_snippet in message.audio:
+                        if audio_snippet.content is not None and isinstance(audio_snippet.content, GeminiFile):
+                            # Google recommends that if using a single audio file, place the text prompt after the audio file.
+                            if audio_snippet.content.uri and audio_snippet.content.mime_type:
+                                message_parts.insert(
+                                    0,
+                                    Part.from_uri(
+                                        file_uri=audio_snippet.content.uri,
+                                        mime_type=audio_snippet.content.mime_type,
+                                    ),
+                                )
+                        else:
+                            audio_content = self._format_audio_for_message(audio_snippet)
+                            if audio_content:
+                                message_parts.append(audio_content)
+                except Exception as e:
+                    log_warning(f"Failed to load audio from {message.audio}: {e}")
+                    return None
 
-        return formatted_messages, system_message
+            # Add files to the message for the model
+            if message.files is not None:
+                for file in message.files:
+                    file_content = self._format_file_for_message(file)
+                    if isinstance(file_content, Part):
+                        formatted_message.append(file_content)
+                    elif isinstance(file_content, GeminiFile):
+                        uploaded_files.append(file_content)
+
+        formatted_message.append(Content(role=role, parts=message_parts))
+        return formatted_message + uploaded_files
 
     def _format_audio_for_message(self, audio: Audio) -> Optional[Union[Part, GeminiFile]]:
         # Case 1: Audio is a bytes object
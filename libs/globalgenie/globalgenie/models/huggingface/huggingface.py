@@ -159,7 +159,7 @@ class HuggingFace(Model):
             _request_params.update(self.request_params)
 
         if _request_params:
-            log_debug(f"Calling {self.provider} with request parameters: {_request_params}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {_request_params}", log_level=2)
         return _request_params
 
     def to_dict(self) -> Dict[str, Any]:
@@ -238,7 +238,7 @@ class HuggingFace(Model):
         try:
             return self.get_client().chat.completions.create(
                 model=self.id,
-                messages=[self._format_message(m) for m in messages],
+                messages=[self._get_formatted_message(m, self._format_message) for m in messages],
                 **self.get_request_params(tools=tools, tool_choice=tool_choice),
             )
         except InferenceTimeoutError as e:
@@ -262,7 +262,7 @@ class HuggingFace(Model):
             async with self.get_async_client() as client:
                 return await client.chat.completions.create(
                     model=self.id,
-                    messages=[self._format_message(m) for m in messages],
+                    messages=[self._get_formatted_message(m, self._format_message) for m in messages],
                     **self.get_request_params(tools=tools, tool_choice=tool_choice),
                 )
         except InferenceTimeoutError as e:
@@ -285,7 +285,7 @@ class HuggingFace(Model):
         try:
             yield from self.get_client().chat.completions.create(
                 model=self.id,
-                messages=[self._format_message(m) for m in messages],
+                messages=[self._get_formatted_message(m, self._format_message) for m in messages],
                 stream=True,
                 stream_options={"include_usage": True},
                 **self.get_request_params(tools=tools, tool_choice=tool_choice),
@@ -311,7 +311,7 @@ class HuggingFace(Model):
             async with self.get_async_client() as client:
                 stream = await client.chat.completions.create(
                     model=self.id,
-                    messages=[self._format_message(m) for m in messages],
+                    messages=[self._get_formatted_message(m, self._format_message) for m in messages],
                     stream=True,
                     stream_options={"include_usage": True},
                     **self.get_request_params(tools=tools, tool_choice=tool_choice),
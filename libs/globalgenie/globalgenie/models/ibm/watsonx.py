@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional, Type, Union
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -31,6 +31,7 @@ class WatsonX(Model):
     id: str = "ibm/granite-20b-code-instruct"
     name: str = "WatsonX"
     provider: str = "IBM"
+    prefetch_media_urls: Tuple[str, ...] = ("images",)
 
     # Request parameters
     frequency_penalty: Optional[float] = None
@@ -124,7 +125,7 @@ class WatsonX(Model):
             request_params.update(self.request_params)
 
         if request_params:
-            log_debug(f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
         return request_params
 
     def _format_message(self, message: Message) -> Dict[str, Any]:
@@ -164,7 +165,7 @@ class WatsonX(Model):
         try:
             client = self.get_client()
 
-            formatted_messages = [self._format_message(m) for m in messages]
+            formatted_messages = [self._get_formatted_message(m, self._format_message) for m in messages]
             request_params = self.get_request_params(
                 response_format=response_format, tools=tools, tool_choice=tool_choice
             )
@@ -189,7 +190,7 @@ class WatsonX(Model):
         """
         try:
             client = self.get_client()
-            formatted_messages = [self._format_message(m) for m in messages]
+            formatted_messages = [self._get_formatted_message(m, self._format_message) for m in messages]
 
             request_params = self.get_request_params(
                 response_format=response_format, tools=tools, tool_choice=tool_choice
@@ -213,7 +214,7 @@ class WatsonX(Model):
         """
         try:
             client = self.get_client()
-            formatted_messages = [self._format_message(m) for m in messages]
+            formatted_messages = [self._get_formatted_message(m, self._format_message) for m in messages]
 
             request_params = self.get_request_params(
                 response_format=response_format, tools=tools, tool_choice=tool_choice
@@ -237,7 +238,7 @@ class WatsonX(Model):
         """
         try:
             client = self.get_client()
-            formatted_messages = [self._format_message(m) for m in messages]
+            formatted_messages = [self._get_formatted_message(m, self._format_message) for m in messages]
 
             # Get parameters for chat
             request_params = self.get_request_params(
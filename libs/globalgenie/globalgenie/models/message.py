@@ -1,14 +1,27 @@
 import json
 from dataclasses import asdict, dataclass
 from time import time
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from globalgenie.media import Audio, AudioResponse, File, Image, ImageArtifact, Video
-from globalgenie.utils.log import log_debug, log_error, log_info, log_warning
+from globalgenie.utils.log import debug_enabled, log_debug, log_error, log_info, log_warning
 from globalgenie.utils.timer import Timer
 
+T = TypeVar("T")
+
+
+def _copy_containers(value: T) -> T:
+    """Copy the dicts and lists of a formatted message, sharing their values, so callers can modify the copy"""
+    if isinstance(value, dict):
+        return {k: _copy_containers(v) for k, v in value.items()}  # type: ignore
+    if isinstance(value, list):
+        return [_copy_containers(v) for v in value]  # type: ignore
+    if isinstance(value, tuple):
+        return tuple(_copy_containers(v) for v in value)  # type: ignore
+    return value
+
 
 class MessageReferences(BaseModel):
     """References added to user message"""
@@ -66,6 +79,10 @@ class MessageMetrics:
     prompt_tokens_details: Optional[dict] = None
     completion_tokens_details: Optional[dict] = None
 
+    # Model requests answered from, or missed in, the response cache
+    response_cache_hits: int = 0
+    response_cache_misses: int = 0
+
     additional_metrics: Optional[dict] = None
 
     time: Optional[float] = None
@@ -112,6 +129,8 @@ class MessageMetrics:
             cached_tokens=self.cached_tokens + other.cached_tokens,
             cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
             reasoning_tokens=self.reasoning_tokens + other.reasoning_tokens,
+            response_cache_hits=self.response_cache_hits + other.response_cache_hits,
+            response_cache_misses=self.response_cache_misses + other.response_cache_misses,
         )
 
         # Handle prompt_tokens_details
@@ -193,6 +212,9 @@ class Message(BaseModel):
 
     # Data from the provider we might need on subsequent messages
     provider_data: Optional[Dict[str, Any]] = None
+    # Number of leading characters of the content that do not change between runs.
+    # Providers that support prompt caching place a cache breakpoint after this prefix.
+    cache_prefix_length: Optional[int] = None
 
     # Citations received from the model
     citations: Optional[Citations] = None
@@ -219,8 +241,47 @@ class Message(BaseModel):
     # The Unix timestamp the message was created.
     created_at: int = Field(default_factory=lambda: int(time()))
 
+    # The message formatted for the Model providers, keyed by formatter
+    _formatted: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
     model_config = ConfigDict(extra="allow", populate_by_name=True, arbitrary_types_allowed=True)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            # The formatted message is stale once a field is set
+            self._formatted = {}
+
+    # model_copy() copies through __copy__ or __deepcopy__, and sets the fields of model_copy(update=...) without
+    # __setattr__, so copies start with an empty formatted message instead of sharing the one of this message
+    def __copy__(self) -> "Message":
+        copied = super().__copy__()
+        copied._formatted = {}
+        return copied
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "Message":
+        copied = super().__deepcopy__(memo)
+        copied._formatted = {}
+        return copied
+
+    def get_formatted(self, key: str, format_message: Callable[[], T]) -> T:
+        """Return the message formatted for a Model provider, formatting it on the first call for the key.
+
+        Formatting (e.g. base64 encoding media) then runs once per message, instead of on every request of a
+        tool call loop. The formatted message is reset when a field of the message is set, but not when a field
+        is changed in place, e.g. by appending to `images`. Call `clear_formatted()` after such changes.
+        A None result, e.g. when media failed to load, is not cached, so formatting is retried on the next call.
+        """
+        if key not in self._formatted:
+            formatted = format_message()
+            if formatted is None:
+                return formatted
+            self._formatted[key] = formatted
+        return _copy_containers(self._formatted[key])
+
+    def clear_formatted(self) -> None:
+        self._formatted = {}
+
     def get_content_string(self) -> str:
         """Returns the content as a string."""
         if isinstance(self.content, str):
@@ -293,6 +354,9 @@ class Message(BaseModel):
             level (str): The level to log the message at. One of debug, info, warning, or error.
                 Defaults to debug.
         """
+        if level in (None, "debug") and not debug_enabled():
+            return
+
         _logger = log_debug
         if level == "info":
             _logger = log_info
@@ -139,7 +139,7 @@ class MistralChat(Model):
             _request_params.update(self.request_params)
 
         if _request_params:
-            log_debug(f"Calling {self.provider} with request parameters: {_request_params}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {_request_params}", log_level=2)
         return _request_params
 
     def to_dict(self) -> Dict[str, Any]:
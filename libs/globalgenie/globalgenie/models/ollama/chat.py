@@ -1,6 +1,6 @@
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, List, Mapping, Optional, Type, Union
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -31,6 +31,7 @@ class Ollama(Model):
     provider: str = "Ollama"
 
     supports_native_structured_outputs: bool = True
+    prefetch_media_urls: Tuple[str, ...] = ("images",)
 
     # Request parameters
     format: Optional[Any] = None
@@ -106,7 +107,7 @@ class Ollama(Model):
             request_params.update(self.request_params)
 
         if request_params:
-            log_debug(f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
         return request_params
 
     def to_dict(self) -> Dict[str, Any]:
@@ -193,7 +194,7 @@ class Ollama(Model):
 
         return self.get_client().chat(
             model=self.id.strip(),
-            messages=[self._format_message(m) for m in messages],  # type: ignore
+            messages=[self._get_formatted_message(m, self._format_message) for m in messages],  # type: ignore
             **request_kwargs,
         )  # type: ignore
 
@@ -211,7 +212,7 @@ class Ollama(Model):
 
         return await self.get_async_client().chat(
             model=self.id.strip(),
-            messages=[self._format_message(m) for m in messages],  # type: ignore
+            messages=[self._get_formatted_message(m, self._format_message) for m in messages],  # type: ignore
             **request_kwargs,
         )  # type: ignore
 
@@ -227,7 +228,7 @@ class Ollama(Model):
         """
         yield from self.get_client().chat(
             model=self.id,
-            messages=[self._format_message(m) for m in messages],  # type: ignore
+            messages=[self._get_formatted_message(m, self._format_message) for m in messages],  # type: ignore
             stream=True,
             **self.get_request_params(tools=tools),
         )  # type: ignore
@@ -244,7 +245,7 @@ class Ollama(Model):
         """
         async_stream = await self.get_async_client().chat(
             model=self.id.strip(),
-            messages=[self._format_message(m) for m in messages],  # type: ignore
+            messages=[self._get_formatted_message(m, self._format_message) for m in messages],  # type: ignore
             stream=True,
             **self.get_request_params(tools=tools),
         )
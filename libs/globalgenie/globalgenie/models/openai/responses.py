@@ -33,6 +33,7 @@ class OpenAIResponses(Model):
     id: str = "gpt-4o"
     name: str = "OpenAIResponses"
     provider: str = "OpenAI"
+    prefetch_media_urls: Tuple[str, ...] = ("files",)
     supports_native_structured_outputs: bool = True
 
     # Request parameters
@@ -244,7 +245,7 @@ class OpenAIResponses(Model):
             request_params.update(self.request_params)
 
         if request_params:
-            log_debug(f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
         return request_params
 
     def _upload_file(self, file: File) -> Optional[str]:
@@ -0,0 +1,400 @@
+import asyncio
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from globalgenie.exceptions import ModelRateLimitError
+from globalgenie.models.message import Message
+from globalgenie.utils.log import log_debug, log_warning
+from globalgenie.utils.tokens import count_message_tokens
+
+if TYPE_CHECKING:
+    from globalgenie.models.base import Model
+
+T = TypeVar("T")
+
+# Headers with the number of seconds to wait after a rate limit error
+_RETRY_AFTER_HEADERS = ("retry-after-ms", "retry-after", "x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+# Headers with the request and token limits of the account, used when no limit is configured
+_REQUEST_LIMIT_HEADERS = ("x-ratelimit-limit-requests", "anthropic-ratelimit-requests-limit")
+_TOKEN_LIMIT_HEADERS = ("x-ratelimit-limit-tokens", "anthropic-ratelimit-tokens-limit")
+# Headers with the number of tokens left in the current window
+_REMAINING_TOKENS_HEADERS = ("x-ratelimit-remaining-tokens", "anthropic-ratelimit-tokens-remaining")
+
+# Output tokens reserved for a request when the model does not set max_tokens
+DEFAULT_OUTPUT_TOKENS = 1024
+
+
+@dataclass
+class RateLimit:
+    """Client-side limits for the requests of a Model.
+
+    The limits are shared by all Models in the process with the same provider, model id and API key, so agents,
+    team members and parallel workflow steps draw from the same budget.
+    """
+
+    # Maximum number of requests per minute
+    requests_per_minute: Optional[int] = None
+    # Maximum number of input and output tokens per minute, estimated from the size of the messages
+    tokens_per_minute: Optional[int] = None
+    # Maximum number of requests in flight. Halved on every rate limit error and increased again on success.
+    max_concurrency: Optional[int] = None
+    # Number of times a request is retried after a rate limit error
+    max_retries: int = 3
+    # Seconds to wait before the first retry, doubled for every following retry
+    initial_backoff: float = 1.0
+    # Maximum number of seconds to wait before a retry
+    max_backoff: float = 60.0
+
+
+class TokenBucket:
+    """A bucket of `capacity` units refilled at `capacity` per minute.
+
+    Reservations are taken immediately, letting the bucket go into debt, and return the number of seconds to wait
+    until the debt is paid back, so concurrent callers are spaced out instead of all waiting for the same refill.
+    """
+
+    def __init__(self, capacity: float):
+        self.capacity = capacity
+        self.level = capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated_at) * self.capacity / 60)
+        self._updated_at = now
+
+    def reserve(self, amount: float) -> float:
+        """Take `amount` units from the bucket and return the seconds to wait before using them"""
+        self._refill()
+        # A request larger than the bucket waits for a full bucket, instead of forever
+        self.level -= min(amount, self.capacity)
+        if self.level >= 0:
+            return 0.0
+        return -self.level * 60 / self.capacity
+
+    def adjust(self, amount: float) -> None:
+        """Take (or give back, if negative) units, e.g. to correct an estimate with the actual usage"""
+        self._refill()
+        self.level = min(self.capacity, self.level - amount)
+
+    def limit_to(self, remaining: float) -> None:
+        """Lower the level to the units the provider reports as remaining"""
+        self._refill()
+        self.level = min(self.level, remaining)
+
+
+def _get_error_headers(error: BaseException) -> Dict[str, str]:
+    """Return the HTTP response headers of a provider error, looking through the chain of exceptions"""
+    current: Optional[BaseException] = error
+    while current is not None:
+        response = getattr(current, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is None and isinstance(response, dict):
+            # botocore ClientError
+            headers = response.get("ResponseMetadata", {}).get("HTTPHeaders")
+        if headers is not None:
+            try:
+                return {str(k).lower(): str(v) for k, v in headers.items()}
+            except Exception:
+                return {}
+        current = current.__cause__
+    return {}
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse a duration in seconds, or in the "1m30s" / "250ms" format used by rate limit reset headers"""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h)", value)
+    if not parts:
+        return None
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(float(amount) * units[unit] for amount, unit in parts)
+
+
+def _get_header_number(headers: Dict[str, str], names: tuple) -> Optional[float]:
+    for name in names:
+        if name in headers:
+            try:
+                return float(headers[name])
+            except ValueError:
+                continue
+    return None
+
+
+def get_retry_after(headers: Dict[str, str]) -> Optional[float]:
+    """Return the seconds the provider asks to wait before retrying, from the headers of a rate limit error"""
+    for name in _RETRY_AFTER_HEADERS:
+        if name in headers:
+            seconds = _parse_duration(headers[name])
+            if seconds is not None:
+                return seconds / 1000 if name == "retry-after-ms" else seconds
+    return None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    if isinstance(error, ModelRateLimitError):
+        return True
+    # Most adapters raise a ModelProviderError with the status code of the response
+    return getattr(error, "status_code", None) == 429
+
+
+class RateLimiter:
+    """Enforces a RateLimit for the requests of one provider account and model.
+
+    Requests wait for a slot of the adaptive concurrency limit and for their estimated requests and tokens in the
+    token buckets. Rate limit errors are retried with jittered exponential backoff, or after the delay the provider
+    asks for, and pause all requests of the limiter until then. The request and token limits reported in the
+    headers of rate limit errors are used when the RateLimit does not set them.
+    """
+
+    def __init__(self, rate_limit: RateLimit, name: str = ""):
+        self.rate_limit = rate_limit
+        self.name = name
+        self._lock = threading.Lock()
+        self._slot_released = threading.Condition(self._lock)
+        self._request_bucket = TokenBucket(rate_limit.requests_per_minute) if rate_limit.requests_per_minute else None
+        self._token_bucket = TokenBucket(rate_limit.tokens_per_minute) if rate_limit.tokens_per_minute else None
+        self._concurrency_limit: Optional[float] = (
+            float(rate_limit.max_concurrency) if rate_limit.max_concurrency else None
+        )
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._requests = 0
+        self._retries = 0
+        self._rate_limit_errors = 0
+
+    def _try_enter(self) -> bool:
+        # Called with the lock held
+        if self._concurrency_limit is not None and self._in_flight >= int(self._concurrency_limit):
+            return False
+        self._in_flight += 1
+        return True
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve a request and its tokens, returning the seconds to wait before sending it"""
+        with self._lock:
+            self._requests += 1
+            wait = max(0.0, self._paused_until - time.monotonic())
+            if self._request_bucket is not None:
+                wait = max(wait, self._request_bucket.reserve(1))
+            if self._token_bucket is not None:
+                wait = max(wait, self._token_bucket.reserve(tokens))
+        if wait > 0:
+            log_debug(f"Rate limiter {self.name}: waiting {wait:.2f}s before sending request")
+        return wait
+
+    def acquire(self, tokens: int) -> None:
+        """Wait for a concurrency slot and for the request budget"""
+        with self._slot_released:
+            while not self._try_enter():
+                self._slot_released.wait()
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int) -> None:
+        """Wait for a concurrency slot and for the request budget, without blocking the event loop"""
+        # The slots are shared with threads, so poll instead of waiting on an asyncio primitive
+        delay = 0.01
+        while True:
+            with self._lock:
+                if self._try_enter():
+                    break
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def release(self, rate_limited: bool = False) -> None:
+        with self._slot_released:
+            self._in_flight -= 1
+            if self._concurrency_limit is not None and self.rate_limit.max_concurrency:
+                if rate_limited:
+                    # Multiplicative decrease on rate limit errors, additive increase on success
+                    self._concurrency_limit = max(1.0, self._concurrency_limit / 2)
+                else:
+                    self._concurrency_limit = min(
+                        float(self.rate_limit.max_concurrency), self._concurrency_limit + 1 / self._concurrency_limit
+                    )
+            self._slot_released.notify_all()
+
+    def record_usage(self, estimated_tokens: int, used_tokens: int) -> None:
+        """Correct the token budget with the tokens a request actually used"""
+        if self._token_bucket is None or used_tokens <= 0:
+            return
+        with self._lock:
+            self._token_bucket.adjust(used_tokens - estimated_tokens)
+
+    def _on_rate_limit_error(self, error: BaseException, attempt: int) -> float:
+        """Update the limits from the error and return the seconds to wait before retrying"""
+        headers = _get_error_headers(error)
+        retry_after = get_retry_after(headers)
+        if retry_after is None:
+            backoff = min(self.rate_limit.max_backoff, self.rate_limit.initial_backoff * 2**attempt)
+            # Equal jitter, so requests that failed together do not retry together
+            delay = backoff / 2 + random.uniform(0, backoff / 2)
+        else:
+            delay = min(self.rate_limit.max_backoff, retry_after) + random.uniform(0, 0.1 * retry_after + 0.1)
+
+        with self._lock:
+            self._rate_limit_errors += 1
+            self._retries += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            request_limit = _get_header_number(headers, _REQUEST_LIMIT_HEADERS)
+            if self._request_bucket is None and request_limit:
+                self._request_bucket = TokenBucket(request_limit)
+            token_limit = _get_header_number(headers, _TOKEN_LIMIT_HEADERS)
+            if self._token_bucket is None and token_limit:
+                self._token_bucket = TokenBucket(token_limit)
+            remaining_tokens = _get_header_number(headers, _REMAINING_TOKENS_HEADERS)
+            if self._token_bucket is not None and remaining_tokens is not None:
+                self._token_bucket.limit_to(remaining_tokens)
+        log_warning(f"Rate limit error from {self.name}, retrying in {delay:.2f}s (retry {attempt + 1})")
+        return delay
+
+    def _get_retry_delay(self, error: Optional[Exception], attempt: int, started: bool = False) -> Optional[float]:
+        """Return the seconds to wait before retrying a failed request, or None if it should not be retried"""
+        if started or error is None or not is_rate_limit_error(error) or attempt >= self.rate_limit.max_retries:
+            return None
+        return self._on_rate_limit_error(error, attempt)
+
+    def call(self, func: Callable[[], T], tokens: int) -> T:
+        """Call `func` within the limits, retrying it after rate limit errors"""
+        attempt = 0
+        while True:
+            self.acquire(tokens)
+            try:
+                result = func()
+            except Exception as e:
+                self.release(rate_limited=is_rate_limit_error(e))
+                delay = self._get_retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self.release()
+            return result
+
+    async def acall(self, func: Callable[[], Awaitable[T]], tokens: int) -> T:
+        """Await `func` within the limits, retrying it after rate limit errors"""
+        attempt = 0
+        while True:
+            await self.aacquire(tokens)
+            try:
+                result = await func()
+            except Exception as e:
+                self.release(rate_limited=is_rate_limit_error(e))
+                delay = self._get_retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self.release()
+            return result
+
+    def stream(self, func: Callable[[], Iterator[T]], tokens: int) -> Iterator[T]:
+        """Iterate over the stream returned by `func` within the limits.
+
+        Rate limit errors raised before the first item are retried, errors raised later are not, as the items were
+        already yielded.
+        """
+        attempt = 0
+        while True:
+            self.acquire(tokens)
+            error: Optional[Exception] = None
+            started = False
+            try:
+                for item in func():
+                    started = True
+                    yield item
+            except Exception as e:
+                error = e
+            finally:
+                self.release(rate_limited=error is not None and is_rate_limit_error(error))
+            if error is None:
+                return
+            delay = self._get_retry_delay(error, attempt, started=started)
+            if delay is None:
+                raise error
+            time.sleep(delay)
+            attempt += 1
+
+    async def astream(self, func: Callable[[], AsyncIterator[T]], tokens: int) -> AsyncIterator[T]:
+        """Iterate over the async stream returned by `func` within the limits, see `stream`"""
+        attempt = 0
+        while True:
+            await self.aacquire(tokens)
+            error: Optional[Exception] = None
+            started = False
+            try:
+                async for item in func():
+                    started = True
+                    yield item
+            except Exception as e:
+                error = e
+            finally:
+                self.release(rate_limited=error is not None and is_rate_limit_error(error))
+            if error is None:
+                return
+            delay = self._get_retry_delay(error, attempt, started=started)
+            if delay is None:
+                raise error
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "retries": self._retries,
+                "rate_limit_errors": self._rate_limit_errors,
+                "in_flight": self._in_flight,
+                "concurrency_limit": int(self._concurrency_limit) if self._concurrency_limit is not None else None,
+            }
+
+
+def estimate_request_tokens(model: "Model", messages: List[Message]) -> int:
+    """Estimate the tokens of a request: the tokens of the messages plus the output tokens the model may use"""
+    input_tokens = sum(count_message_tokens(message, model.id) for message in messages)
+    output_tokens = (
+        getattr(model, "max_completion_tokens", None) or getattr(model, "max_tokens", None) or DEFAULT_OUTPUT_TOKENS
+    )
+    return input_tokens + int(output_tokens)
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model: "Model") -> Optional[RateLimiter]:
+    """Return the process-wide RateLimiter of the model's provider, model id and API key.
+
+    Returns None if the model has no rate_limit. The limiter is created with the rate_limit of the first model
+    that uses it.
+    """
+    if model.rate_limit is None:
+        return None
+    api_key = getattr(model, "api_key", None)
+    api_key_hash = sha256(api_key.encode()).hexdigest()[:16] if isinstance(api_key, str) else ""
+    key = f"{model.get_provider()}:{model.id}:{api_key_hash}"
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = RateLimiter(model.rate_limit, name=f"{model.get_provider()} ({model.id})")
+        return _rate_limiters[key]
+
+
+def clear_rate_limiters() -> None:
+    """Forget all rate limiters, e.g. after changing the limits"""
+    with _rate_limiters_lock:
+        _rate_limiters.clear()
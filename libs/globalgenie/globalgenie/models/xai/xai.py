@@ -61,7 +61,7 @@ class xAI(OpenAILike):
             request_params["extra_body"] = existing_body
 
         if request_params:
-            log_debug(f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
+            log_debug(lambda: f"Calling {self.provider} with request parameters: {request_params}", log_level=2)
 
         return request_params
 
@@ -0,0 +1,106 @@
+import re
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass, field
+from hashlib import sha256
+from time import time
+from typing import List, Optional
+
+from globalgenie.models.base import Model
+from globalgenie.models.message import Message
+from globalgenie.reasoning.step import ReasoningStep
+from globalgenie.utils.log import log_debug
+
+_WHITESPACE = re.compile(r"\s+")
+# The current time added to the system message by add_datetime_to_instructions, only its date is part of the key
+_CURRENT_TIME = re.compile(
+    r"(The current time is \d{4}-\d{2}-\d{2})[ T]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[+-]\d{2}:\d{2})?"
+)
+
+
+@dataclass
+class ReasoningTrace:
+    """The result of reasoning about an input, which can be reused for the same input"""
+
+    reasoning_steps: List[ReasoningStep]
+    # Messages added to the run messages
+    reasoning_messages: List[Message]
+    # Messages of the reasoning agent, added to the run response
+    reasoning_agent_messages: List[Message]
+    # True if the trace was created by a native reasoning model
+    native: bool = False
+    created_at: float = field(default_factory=time)
+
+
+class ReasoningCache:
+    """LRU cache of reasoning traces, keyed by the normalized user input, the context and the reasoning configuration.
+
+    Repeated or near-identical prompts (differing only in case, whitespace or trailing punctuation) reuse the
+    reasoning steps of a previous run instead of calling the reasoning model again. The context, i.e. the system
+    message and the other non-user messages, must match exactly, so traces built from the memories or state of
+    one user are never reused for another user or after the state changed. Volatile context, like the time of day
+    added by add_datetime_to_instructions, is left out of the key. Inputs with images, audio,
+    videos or files are never cached. Only share a cache between agents with the same instructions and tools.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = 3600.0):
+        """
+        Args:
+            max_entries: Maximum number of cached traces.
+            ttl: Seconds after which a cached trace expires. Traces never expire if None.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._traces: "OrderedDict[str, ReasoningTrace]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return _WHITESPACE.sub(" ", text).strip().rstrip(".?!").strip().lower()
+
+    def get_key(
+        self, messages: List[Message], reasoning_model: Model, min_steps: int, max_steps: int
+    ) -> Optional[str]:
+        """Return the cache key for the input in the messages, or None if the input can not be cached"""
+        user_inputs = []
+        context = sha256()
+        for message in messages:
+            if message.role != "user":
+                # Context messages, e.g. the system message with user memories, session state and instructions
+                content = _CURRENT_TIME.sub(r"\1", message.get_content_string())
+                context.update(f"{message.role}\x00{content}\x00".encode())
+                continue
+            if message.images or message.audio or message.videos or message.files:
+                return None
+            user_inputs.append(self.normalize(message.get_content_string()))
+        if not user_inputs:
+            return None
+
+        namespace = f"{reasoning_model.get_provider()}:{reasoning_model.id}:{min_steps}:{max_steps}"
+        return sha256("\n".join([namespace, context.hexdigest()] + user_inputs).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[ReasoningTrace]:
+        with self._lock:
+            trace = self._traces.get(key)
+            if trace is None:
+                return None
+            if self.ttl is not None and time() - trace.created_at > self.ttl:
+                del self._traces[key]
+                return None
+            self._traces.move_to_end(key)
+        log_debug("Reasoning cache hit")
+        # Return a copy, as the messages are modified when they are added to a run
+        return deepcopy(trace)
+
+    def set(self, key: str, trace: ReasoningTrace) -> None:
+        trace = deepcopy(trace)
+        with self._lock:
+            self._traces[key] = trace
+            self._traces.move_to_end(key)
+            while len(self._traces) > self.max_entries:
+                self._traces.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
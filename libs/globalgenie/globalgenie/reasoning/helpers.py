@@ -1,4 +1,5 @@
-from typing import List, Literal
+import json
+from typing import Any, List, Literal, Optional, Tuple
 
 from globalgenie.models.base import Model
 from globalgenie.models.message import Message
@@ -25,6 +26,27 @@ def get_reasoning_agent(
     )
 
 
+def get_tools_key(tools: Optional[List[Any]]) -> Tuple[Any, ...]:
+    """Return a hashable key for the names and definitions of the tools, used to detect tool changes"""
+    from globalgenie.tools.function import Function
+    from globalgenie.tools.toolkit import Toolkit
+
+    def _function_key(function: Function) -> Tuple[Any, ...]:
+        return (function.name, function.description, json.dumps(function.parameters, sort_keys=True, default=str))
+
+    key: List[Any] = []
+    for tool in tools or []:
+        if isinstance(tool, Toolkit):
+            key.append((type(tool).__name__, tool.name, tuple(_function_key(f) for f in tool.functions.values())))
+        elif isinstance(tool, Function):
+            key.append(_function_key(tool))
+        elif isinstance(tool, dict):
+            key.append(json.dumps(tool, sort_keys=True, default=str))
+        else:
+            key.append((getattr(tool, "__module__", None), getattr(tool, "__qualname__", repr(tool)), tool.__doc__))
+    return tuple(key)
+
+
 def get_next_action(reasoning_step: ReasoningStep) -> NextAction:
     next_action = reasoning_step.next_action or NextAction.FINAL_ANSWER
     if isinstance(next_action, str):
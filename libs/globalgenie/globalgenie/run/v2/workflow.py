@@ -10,7 +10,7 @@ from globalgenie.run.base import RunStatus
 from globalgenie.utils.log import log_error
 
 if TYPE_CHECKING:
-    from globalgenie.workflow.v2.types import StepOutput, WorkflowMetrics
+    from globalgenie.workflow.v2.types import StepOutput, WorkflowCheckpoint, WorkflowMetrics
 
 
 class WorkflowRunEvent(str, Enum):
@@ -430,6 +430,9 @@ class WorkflowRunResponse:
     # Workflow metrics aggregated from all steps
     workflow_metrics: Optional["WorkflowMetrics"] = None
 
+    # Progress of the run, used to resume it from the last completed step
+    checkpoint: Optional["WorkflowCheckpoint"] = None
+
     extra_data: Optional[Dict[str, Any]] = None
     created_at: int = field(default_factory=lambda: int(time()))
 
@@ -454,6 +457,7 @@ class WorkflowRunResponse:
                 "step_responses",
                 "events",
                 "workflow_metrics",
+                "checkpoint",
             ]
         }
 
@@ -489,6 +493,9 @@ class WorkflowRunResponse:
         if self.workflow_metrics is not None:
             _dict["workflow_metrics"] = self.workflow_metrics.to_dict()
 
+        if self.checkpoint is not None:
+            _dict["checkpoint"] = self.checkpoint.to_dict()
+
         if self.content and isinstance(self.content, BaseModel):
             _dict["content"] = self.content.model_dump(exclude_none=True)
 
@@ -522,6 +529,13 @@ class WorkflowRunResponse:
                 # Reconstruct StepOutput from dict
                 parsed_step_responses.append(StepOutput.from_dict(step_output_dict))
 
+        checkpoint_dict = data.pop("checkpoint", None)
+        checkpoint = None
+        if checkpoint_dict:
+            from globalgenie.workflow.v2.types import WorkflowCheckpoint
+
+            checkpoint = WorkflowCheckpoint.from_dict(checkpoint_dict)
+
         extra_data = data.pop("extra_data", None)
 
         images = data.pop("images", [])
@@ -547,6 +561,7 @@ class WorkflowRunResponse:
             response_audio=response_audio,
             events=events,
             workflow_metrics=workflow_metrics,
+            checkpoint=checkpoint,
             **data,
         )
 
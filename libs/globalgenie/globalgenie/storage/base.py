@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, List, Literal, Optional
 
 from globalgenie.storage.session import Session
 
+if TYPE_CHECKING:
+    from globalgenie.run.v2.workflow import WorkflowRunResponse
+    from globalgenie.storage.session.v2.workflow import WorkflowSession as WorkflowSessionV2
+
 
 class Storage(ABC):
     def __init__(self, mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent"):
@@ -58,3 +62,26 @@ class Storage(ABC):
     @abstractmethod
     def upgrade_schema(self) -> None:
         raise NotImplementedError
+
+    @property
+    def stores_runs_separately(self) -> bool:
+        """True if workflow runs are saved one by one, instead of as part of their session"""
+        return False
+
+    def upsert_workflow_run(self, session: "WorkflowSessionV2", run: "WorkflowRunResponse") -> None:
+        """Save a run of a workflow session. By default the whole session is saved with all its runs."""
+        session.upsert_run(run)
+        if self.upsert(session) is not None:
+            session.mark_runs_saved(session.get_changed_runs())
+
+    def read_workflow_session(self, session_id: str, max_runs: Optional[int] = None) -> Optional[Session]:
+        """Read a workflow session. Storages that save runs separately only read the newest `max_runs` runs and
+        the runs in progress. By default the whole session is read with all its runs.
+        """
+        return self.read(session_id=session_id)
+
+    def read_workflow_run(self, session_id: str, run_id: str) -> Optional["WorkflowRunResponse"]:
+        """Read a run of a workflow session. By default the whole session is read."""
+        session = self.read(session_id=session_id)
+        get_run = getattr(session, "get_run", None)
+        return get_run(run_id) if get_run is not None else None
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Set
 
+from globalgenie.run.base import RunStatus
 from globalgenie.run.v2.workflow import WorkflowRunResponse
 from globalgenie.utils.log import logger
 
@@ -36,43 +37,104 @@ class WorkflowSession:
     # The unix timestamp when this session was last updated
     updated_at: Optional[int] = None
 
+    # Position of each run in `runs`, by run_id. Built on first use, and reset when `runs` is replaced
+    _run_index: Optional[Dict[str, int]] = field(default=None, init=False, repr=False, compare=False)
+    # Runs added or updated with upsert_run that were not saved yet, by run_id
+    _changed_run_ids: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.runs is None:
             self.runs = []
 
-    def upsert_run(self, run: WorkflowRunResponse) -> None:
-        """Add or update a workflow run (upsert behavior)"""
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "runs":
+            super().__setattr__("_run_index", None)
+
+    def invalidate_run_index(self) -> None:
+        """Rebuild the run index on next use. Call this after adding or removing runs in `runs` in place."""
+        self._run_index = None
+
+    def _get_run_index(self) -> Dict[str, int]:
         if self.runs is None:
             self.runs = []
+        if self._run_index is None:
+            self._run_index = {run.run_id: i for i, run in enumerate(self.runs) if run.run_id is not None}
+        return self._run_index
 
-        # Find existing run and update it, or append new one
-        for i, existing_run in enumerate(self.runs):
-            if existing_run.run_id == run.run_id:
-                # Update existing run
-                self.runs[i] = run
-                return
+    def upsert_run(self, run: WorkflowRunResponse) -> None:
+        """Add or update a workflow run (upsert behavior)"""
+        run_index = self._get_run_index()
+        if run.run_id is not None:
+            self._changed_run_ids.add(run.run_id)
+        position = run_index.get(run.run_id) if run.run_id is not None else None
+        if position is not None:
+            # Update existing run
+            self.runs[position] = run  # type: ignore[index]
+            return
 
         # Run not found, append new one
-        self.runs.append(run)
+        self.runs.append(run)  # type: ignore[union-attr]
+        if run.run_id is not None:
+            run_index[run.run_id] = len(self.runs) - 1  # type: ignore[arg-type]
+
+    def get_changed_runs(self) -> List[WorkflowRunResponse]:
+        """Return the runs in memory that were added or updated with upsert_run since they were last saved"""
+        if not self._changed_run_ids:
+            return []
+        return [run for run in self.runs or [] if run.run_id in self._changed_run_ids]
+
+    def mark_runs_saved(self, runs: List[WorkflowRunResponse]) -> None:
+        for run in runs:
+            self._changed_run_ids.discard(run.run_id)  # type: ignore[arg-type]
+
+    def get_run(self, run_id: str) -> Optional[WorkflowRunResponse]:
+        """Get a run in memory by its run_id"""
+        position = self._get_run_index().get(run_id)
+        return self.runs[position] if position is not None else None  # type: ignore[index]
+
+    def trim_runs(self, max_runs: int) -> int:
+        """Remove the oldest runs from memory, keeping at most `max_runs` runs. Runs in progress are kept.
+        Only use this if the storage saves runs separately, as the removed runs are no longer saved with the session.
+
+        Returns:
+            int: The number of runs removed.
+        """
+        if self.runs is None or len(self.runs) <= max_runs:
+            return 0
+
+        in_progress = (RunStatus.pending, RunStatus.running, RunStatus.paused)
+        to_remove = len(self.runs) - max_runs
+        kept_runs: List[WorkflowRunResponse] = []
+        for run in self.runs:
+            if to_remove > 0 and run.status not in in_progress:
+                to_remove -= 1
+                continue
+            kept_runs.append(run)
+
+        removed = len(self.runs) - len(kept_runs)
+        self.runs = kept_runs
+        return removed
+
+    @staticmethod
+    def run_to_dict(run: WorkflowRunResponse) -> Dict[str, Any]:
+        """Serialize a run for storage"""
+        try:
+            return run.to_dict()
+        except Exception as e:
+            # If run serialization fails, create a minimal representation
+            return {
+                "run_id": getattr(run, "run_id", "unknown"),
+                "status": str(getattr(run, "status", "unknown")),
+                "error": f"Serialization failed: {str(e)}",
+            }
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage, serializing runs to dicts"""
 
         runs_data = None
         if self.runs:
-            runs_data = []
-            for run in self.runs:
-                try:
-                    runs_data.append(run.to_dict())
-                except Exception as e:
-                    # If run serialization fails, create a minimal representation
-                    runs_data.append(
-                        {
-                            "run_id": getattr(run, "run_id", "unknown"),
-                            "status": str(getattr(run, "status", "unknown")),
-                            "error": f"Serialization failed: {str(e)}",
-                        }
-                    )
+            runs_data = [self.run_to_dict(run) for run in self.runs]
         return {
             "session_id": self.session_id,
             "user_id": self.user_id,
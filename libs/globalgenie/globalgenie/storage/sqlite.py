@@ -1,7 +1,9 @@
 import time
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
+from globalgenie.run.base import RunStatus
+from globalgenie.run.v2.workflow import WorkflowRunResponse
 from globalgenie.storage.base import Storage
 from globalgenie.storage.session import Session
 from globalgenie.storage.session.agent import AgentSession
@@ -83,6 +85,8 @@ class SqliteStorage(Storage):
         self.SqlSession: sessionmaker[SqlSession] = sessionmaker(bind=self.db_engine)
         # Database table for storage
         self.table: Table = self.get_table()
+        # Database table for the runs of workflow_v2 sessions, which are saved one by one
+        self.runs_table: Table = self.get_runs_table()
 
     @property
     def mode(self) -> Optional[Literal["agent", "team", "workflow", "workflow_v2"]]:
@@ -95,6 +99,7 @@ class SqliteStorage(Storage):
         super(SqliteStorage, type(self)).mode.fset(self, value)  # type: ignore
         if value is not None:
             self.table = self.get_table()
+            self.runs_table = self.get_runs_table()
 
     def get_table_v1(self) -> Table:
         """
@@ -152,6 +157,32 @@ class SqliteStorage(Storage):
 
         return table
 
+    def get_runs_table(self) -> Table:
+        """
+        Define the table schema for the runs of workflow_v2 sessions.
+
+        Returns:
+            Table: SQLAlchemy Table object representing the schema.
+        """
+        table_name = f"{self.table_name}_runs"
+        # Reuse the table if it is already defined, as redefining it would add its indexes again
+        if table_name in self.metadata.tables:
+            return self.metadata.tables[table_name]
+        return Table(
+            table_name,
+            self.metadata,
+            Column("run_id", String, primary_key=True),
+            Column("session_id", String, index=True),
+            Column("status", String),
+            Column("run_data", sqlite.JSON),
+            Column("created_at", sqlite.INTEGER, index=True),
+            Column("updated_at", sqlite.INTEGER),
+        )
+
+    @property
+    def stores_runs_separately(self) -> bool:
+        return self.mode == "workflow_v2"
+
     def get_table(self) -> Table:
         """
         Get the table schema based on the schema version.
@@ -226,13 +257,18 @@ class SqliteStorage(Storage):
                 logger.error(f"Error creating table: {e}")
                 raise
 
-    def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        if self.mode == "workflow_v2":
+            self.runs_table.create(self.db_engine, checkfirst=True)
+
+    def read(self, session_id: str, user_id: Optional[str] = None, max_runs: Optional[int] = None) -> Optional[Session]:
         """
         Read a Session from the database.
 
         Args:
             session_id (str): ID of the session to read.
             user_id (Optional[str]): User ID to filter by. Defaults to None.
+            max_runs (Optional[int]): In workflow_v2 mode, only read the newest `max_runs` runs and the runs in
+                progress. Defaults to None, reading all runs.
 
         Returns:
             Optional[Session]: Session object if found, None otherwise.
@@ -250,7 +286,15 @@ class SqliteStorage(Storage):
                 elif self.mode == "workflow":
                     return WorkflowSession.from_dict(result._mapping) if result is not None else None  # type: ignore
                 elif self.mode == "workflow_v2":
-                    return WorkflowSessionV2.from_dict(result._mapping) if result is not None else None  # type: ignore
+                    if result is None:
+                        return None
+                    session = WorkflowSessionV2.from_dict(result._mapping)
+                    if session is not None:
+                        legacy_runs = session.runs
+                        session.runs = self._merge_runs(legacy_runs, self._read_runs(sess, session_id, max_runs))
+                        if legacy_runs and max_runs is not None:
+                            session.trim_runs(max_runs)
+                    return session
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -528,8 +572,10 @@ class SqliteStorage(Storage):
                         ),
                     )
                 elif self.mode == "workflow_v2":
-                    # Convert session to dict to ensure proper serialization
-                    session_dict = session.to_dict()
+                    # Runs are saved to the runs table, only the runs that changed since they were last saved.
+                    # The runs column is only read, for sessions saved before.
+                    changed_runs = session.get_changed_runs()  # type: ignore
+                    self._upsert_runs(sess, session.session_id, changed_runs)
 
                     # Create an insert statement for WorkflowSessionV2
                     stmt = sqlite.insert(self.table).values(
@@ -537,7 +583,6 @@ class SqliteStorage(Storage):
                         workflow_id=session.workflow_id,  # type: ignore
                         workflow_name=session.workflow_name,  # type: ignore
                         user_id=session.user_id,
-                        runs=session_dict.get("runs"),
                         workflow_data=session.workflow_data,  # type: ignore
                         session_data=session.session_data,
                         extra_data=session.extra_data,
@@ -550,7 +595,6 @@ class SqliteStorage(Storage):
                             workflow_id=session.workflow_id,  # type: ignore
                             workflow_name=session.workflow_name,  # type: ignore
                             user_id=session.user_id,
-                            runs=session_dict.get("runs"),
                             workflow_data=session.workflow_data,  # type: ignore
                             session_data=session.session_data,
                             extra_data=session.extra_data,
@@ -565,12 +609,20 @@ class SqliteStorage(Storage):
                 log_debug("Creating table and retrying upsert")
                 self.create()
                 return self.upsert(session, create_and_retry=False)
+            elif create_and_retry and self.mode == "workflow_v2":
+                # The runs table is missing in databases created before runs were saved separately
+                self.create()
+                return self.upsert(session, create_and_retry=False)
             else:
                 log_warning(f"Exception upserting into table: {e}")
                 log_warning(
                     "A table upgrade might be required, please review these docs for more information: https://globalgenie.link/upgrade-schema"
                 )
                 return None
+        if self.mode == "workflow_v2":
+            session.mark_runs_saved(changed_runs)  # type: ignore
+            # Read back as many runs as the session holds in memory
+            return self.read(session_id=session.session_id, max_runs=len(session.runs or []))  # type: ignore
         return self.read(session_id=session.session_id)
 
     def delete_session(self, session_id: Optional[str] = None):
@@ -592,6 +644,8 @@ class SqliteStorage(Storage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.mode == "workflow_v2" and self._runs_table_exists():
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -607,9 +661,144 @@ class SqliteStorage(Storage):
             log_debug(f"Deleting table: {self.table_name}")
             # Drop with checkfirst=True to avoid errors if the table doesn't exist
             self.table.drop(self.db_engine, checkfirst=True)
+            if self.mode == "workflow_v2":
+                self.runs_table.drop(self.db_engine, checkfirst=True)
             # Clear metadata to ensure indexes are recreated properly
             self.metadata = MetaData()
             self.table = self.get_table()
+            self.runs_table = self.get_runs_table()
+
+    def _runs_table_exists(self) -> bool:
+        with self.SqlSession() as sess:
+            result = sess.execute(
+                text("SELECT name FROM sqlite_master WHERE type='table' AND name=:table_name"),
+                {"table_name": self.runs_table.name},
+            ).scalar()
+            return result is not None
+
+    def _read_runs(
+        self, sess: SqlSession, session_id: str, max_runs: Optional[int] = None
+    ) -> List[WorkflowRunResponse]:
+        """Read the runs of a session, oldest first. If max_runs is set, only the newest `max_runs` runs and the
+        runs in progress are read.
+        """
+        if not self._runs_table_exists():
+            return []
+        columns = select(self.runs_table.c.run_id, self.runs_table.c.run_data, self.runs_table.c.created_at).where(
+            self.runs_table.c.session_id == session_id
+        )
+        if max_runs is None:
+            rows = sess.execute(columns.order_by(self.runs_table.c.created_at)).fetchall()
+        else:
+            newest = columns.order_by(self.runs_table.c.created_at.desc()).limit(max_runs)
+            in_progress = columns.where(
+                self.runs_table.c.status.in_([RunStatus.pending.value, RunStatus.running.value, RunStatus.paused.value])
+            )
+            rows_by_id = {row[0]: row for row in sess.execute(in_progress).fetchall()}
+            rows_by_id.update({row[0]: row for row in sess.execute(newest).fetchall()})
+            rows = sorted(rows_by_id.values(), key=lambda row: row[2] or 0)
+        return [WorkflowRunResponse.from_dict(row[1]) for row in rows]
+
+    @staticmethod
+    def _merge_runs(
+        legacy_runs: Optional[List[WorkflowRunResponse]], runs: List[WorkflowRunResponse]
+    ) -> List[WorkflowRunResponse]:
+        """Merge the runs saved in the session row by older versions with the runs from the runs table"""
+        if not legacy_runs:
+            return runs
+        run_ids = {run.run_id for run in runs}
+        merged = [run for run in legacy_runs if run.run_id not in run_ids] + runs
+        return sorted(merged, key=lambda run: run.created_at or 0)
+
+    def _upsert_runs(self, sess: SqlSession, session_id: str, runs: List[WorkflowRunResponse]) -> None:
+        now = int(time.time())
+        for run in runs:
+            if run.run_id is None:
+                continue
+            status = getattr(run.status, "value", run.status)
+            run_data: Dict[str, Any] = WorkflowSessionV2.run_to_dict(run)
+            stmt = sqlite.insert(self.runs_table).values(
+                run_id=run.run_id,
+                session_id=session_id,
+                status=status,
+                run_data=run_data,
+                created_at=run.created_at or now,
+                updated_at=now,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["run_id"],
+                set_=dict(status=status, run_data=run_data, updated_at=now),
+            )
+            sess.execute(stmt)
+
+    def upsert_workflow_run(self, session: WorkflowSessionV2, run: WorkflowRunResponse) -> None:
+        """
+        Save a single run of a workflow_v2 session, without rewriting the session or its other runs.
+
+        Args:
+            session (WorkflowSessionV2): The session of the run.
+            run (WorkflowRunResponse): The run to save.
+        """
+        if self.mode != "workflow_v2":
+            super().upsert_workflow_run(session, run)
+            return
+
+        session.upsert_run(run)
+        try:
+            # Also save the other runs that changed since they were last saved
+            changed_runs = session.get_changed_runs()
+            with self.SqlSession() as sess, sess.begin():
+                self._upsert_runs(sess, session.session_id, changed_runs)
+                result = sess.execute(
+                    self.table.update()
+                    .where(self.table.c.session_id == session.session_id)
+                    .values(updated_at=int(time.time()))
+                )
+                session_exists = result.rowcount > 0
+            session.mark_runs_saved(changed_runs)
+        except Exception as e:
+            log_debug(f"Could not save workflow run, saving the session instead: {e}")
+            session_exists = False
+        if not session_exists:
+            self.upsert(session)
+
+    def read_workflow_session(self, session_id: str, max_runs: Optional[int] = None) -> Optional[Session]:
+        """
+        Read a workflow session with its newest `max_runs` runs and the runs in progress.
+
+        Args:
+            session_id (str): ID of the session to read.
+            max_runs (Optional[int]): Maximum number of finished runs to read. Defaults to None, reading all runs.
+
+        Returns:
+            Optional[Session]: Session object if found, None otherwise.
+        """
+        return self.read(session_id=session_id, max_runs=max_runs)
+
+    def read_workflow_run(self, session_id: str, run_id: str) -> Optional[WorkflowRunResponse]:
+        """
+        Read a single run of a workflow_v2 session.
+
+        Args:
+            session_id (str): ID of the session of the run.
+            run_id (str): ID of the run to read.
+
+        Returns:
+            Optional[WorkflowRunResponse]: The run if found, None otherwise.
+        """
+        if self.mode == "workflow_v2":
+            try:
+                with self.SqlSession() as sess:
+                    stmt = select(self.runs_table.c.run_data).where(
+                        self.runs_table.c.run_id == run_id, self.runs_table.c.session_id == session_id
+                    )
+                    row = sess.execute(stmt).fetchone()
+                    if row is not None:
+                        return WorkflowRunResponse.from_dict(row[0])
+            except Exception as e:
+                log_debug(f"Exception reading from runs table: {e}")
+        # The run may be stored in the session row by an older version
+        return super().read_workflow_run(session_id, run_id)
 
     def __deepcopy__(self, memo):
         """
@@ -630,7 +819,7 @@ class SqliteStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
             elif k in {"db_engine", "SqlSession"}:
@@ -642,5 +831,6 @@ class SqliteStorage(Storage):
         copied_obj.metadata = MetaData()
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table()
 
         return copied_obj
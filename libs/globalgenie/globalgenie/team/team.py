@@ -1,7 +1,7 @@
 import asyncio
 import json
 from collections import ChainMap, defaultdict, deque
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import asdict, dataclass, replace
 from os import getenv
 from textwrap import dedent
@@ -35,9 +35,11 @@ from globalgenie.media import Audio, AudioArtifact, AudioResponse, File, Image,
 from globalgenie.memory.agent import AgentMemory
 from globalgenie.memory.team import TeamMemory, TeamRun
 from globalgenie.memory.v2.memory import Memory, SessionSummary
+from globalgenie.memory.v2.pipeline import MemoryPipeline
 from globalgenie.models.base import Model
 from globalgenie.models.message import Citations, Message, MessageReferences
 from globalgenie.models.response import ModelResponse, ModelResponseEvent, ToolExecution
+from globalgenie.reasoning.cache import ReasoningCache, ReasoningTrace
 from globalgenie.reasoning.step import NextAction, ReasoningStep, ReasoningSteps
 from globalgenie.run.base import RunResponseExtraData, RunStatus
 from globalgenie.run.messages import RunMessages
@@ -270,6 +272,8 @@ class Team:
     reasoning_agent: Optional[Agent] = None
     reasoning_min_steps: int = 1
     reasoning_max_steps: int = 10
+    # Reuse reasoning steps for repeated or near-identical user inputs
+    reasoning_cache: Optional[ReasoningCache] = None
 
     # --- Team Streaming ---
     # Stream the response from the Team
@@ -365,6 +369,7 @@ class Team:
         reasoning_agent: Optional[Agent] = None,
         reasoning_min_steps: int = 1,
         reasoning_max_steps: int = 10,
+        reasoning_cache: Optional[ReasoningCache] = None,
         stream: Optional[bool] = None,
         stream_intermediate_steps: bool = False,
         store_events: bool = False,
@@ -456,6 +461,7 @@ class Team:
         self.reasoning_agent = reasoning_agent
         self.reasoning_min_steps = reasoning_min_steps
         self.reasoning_max_steps = reasoning_max_steps
+        self.reasoning_cache = reasoning_cache
 
         self.stream = stream
         self.stream_intermediate_steps = stream_intermediate_steps
@@ -509,6 +515,11 @@ class Team:
 
         self._memory_deepcopy_done: bool = False
 
+        # Reasoning model and agent, reused across runs
+        self._reasoning_model: Optional[Model] = None
+        self._reasoning_model_source: Optional[Model] = None
+        self._reasoning_agent_cache: Optional[Tuple[Tuple[Any, ...], Agent]] = None
+
     @property
     def should_parse_structured_output(self) -> bool:
         return self.response_model is not None and self.parse_response and self.parser_model is None
@@ -2136,6 +2147,11 @@ class Team:
         self.run_response = cast(TeamRunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
 
+        # Hand off to the background pipeline, so the response does not wait for memories and summaries
+        if self.memory.pipeline is not None:
+            self._submit_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         # Create a thread pool with a reasonable number of workers
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures = []
@@ -2177,6 +2193,12 @@ class Team:
     ) -> AsyncIterator[TeamRunResponseEvent]:
         self.memory = cast(Memory, self.memory)
         self.run_response = cast(TeamRunResponse, self.run_response)
+
+        # Hand off to the background pipeline, so the response does not wait for memories and summaries
+        if self.memory.pipeline is not None:
+            self._submit_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         tasks = []
 
         user_message_str = (
@@ -2206,6 +2228,30 @@ class Team:
                     create_team_memory_update_completed_event(from_run_response=self.run_response), self.run_response
                 )
 
+    def _submit_memories_and_summaries(
+        self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
+    ) -> None:
+        """Queue memory and summary creation on the memory pipeline"""
+        self.memory = cast(Memory, self.memory)
+        pipeline = cast(MemoryPipeline, self.memory.pipeline)
+
+        messages: List[Message] = []
+        user_message_str = (
+            run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
+        )
+        if self.enable_user_memories and user_message_str:
+            messages.append(Message(role="user", content=user_message_str))
+
+        if messages or self.enable_session_summaries:
+            log_debug("Queueing memories and session summary on the memory pipeline.")
+            pipeline.submit(
+                memory=self.memory,
+                session_id=session_id,
+                user_id=user_id,
+                messages=messages,
+                create_summary=self.enable_session_summaries,
+            )
+
     def _get_response_format(self, model: Optional[Model] = None) -> Optional[Union[Dict, Type[BaseModel]]]:
         model = cast(Model, model or self.model)
         if self.response_model is None:
@@ -4255,13 +4301,111 @@ class Team:
             aggregated_metrics = dict(aggregated_metrics)
         return aggregated_metrics
 
-    def _get_reasoning_agent(self, reasoning_model: Model) -> Optional[Agent]:
-        return Agent(
-            model=reasoning_model,
-            monitoring=self.monitoring,
-            telemetry=self.telemetry,
-            debug_mode=self.debug_mode,
-            debug_level=self.debug_level,
+    def _get_reasoning_model(self) -> Optional[Model]:
+        """Return the reasoning model, or a copy of the Team's model that is made once and reused across runs"""
+        if self.reasoning_model is not None:
+            return self.reasoning_model
+        if self.model is None:
+            return None
+        if self._reasoning_model is None or self._reasoning_model_source is not self.model:
+            from copy import deepcopy
+
+            self._reasoning_model = deepcopy(self.model)
+            self._reasoning_model_source = self.model
+        return self._reasoning_model
+
+    def _get_reasoning_agent(self, reasoning_model: Model, default_reasoning: bool) -> Optional[Agent]:
+        """Return the reasoning agent, reusing the one built for a previous run while the configuration is unchanged"""
+        if self.reasoning_agent is not None:
+            return self.reasoning_agent
+
+        config = (
+            default_reasoning,
+            id(reasoning_model),
+            self.reasoning_min_steps,
+            self.reasoning_max_steps,
+            self.use_json_mode,
+            self.monitoring,
+            self.telemetry,
+            self.debug_mode,
+            self.debug_level,
+        )
+        if self._reasoning_agent_cache is None or self._reasoning_agent_cache[0] != config:
+            reasoning_agent = self._build_reasoning_agent(
+                reasoning_model=reasoning_model, default_reasoning=default_reasoning
+            )
+            if reasoning_agent is None:
+                return None
+            self._reasoning_agent_cache = (config, reasoning_agent)
+
+        # Concurrent runs share the cached reasoning agent, so each run gets its own shallow copy
+        reasoning_agent = copy(self._reasoning_agent_cache[1])
+        # Runs of the reasoning agent are not needed after reasoning, start each run with a fresh memory
+        reasoning_agent.memory = None
+        return reasoning_agent
+
+    def _build_reasoning_agent(self, reasoning_model: Model, default_reasoning: bool) -> Optional[Agent]:
+        if default_reasoning:
+            from globalgenie.reasoning.default import get_default_reasoning_agent
+
+            reasoning_agent = get_default_reasoning_agent(
+                reasoning_model=reasoning_model,
+                min_steps=self.reasoning_min_steps,
+                max_steps=self.reasoning_max_steps,
+                monitoring=self.monitoring,
+                telemetry=self.telemetry,
+                debug_mode=self.debug_mode,
+                debug_level=self.debug_level,
+                use_json_mode=self.use_json_mode,
+            )
+        else:
+            from globalgenie.reasoning.helpers import get_reasoning_agent
+
+            reasoning_agent = get_reasoning_agent(
+                reasoning_model=reasoning_model,
+                monitoring=self.monitoring,
+                telemetry=self.telemetry,
+                debug_mode=self.debug_mode,
+                debug_level=self.debug_level,
+            )
+        return reasoning_agent
+
+    def _get_reasoning_trace(
+        self, run_messages: RunMessages, reasoning_model: Model
+    ) -> Tuple[Optional[str], Optional[ReasoningTrace]]:
+        """Return the reasoning cache key for the run input and the cached reasoning trace, if any"""
+        if self.reasoning_cache is None:
+            return None, None
+        cache_key = self.reasoning_cache.get_key(
+            messages=run_messages.get_input_messages(),
+            reasoning_model=reasoning_model,
+            min_steps=self.reasoning_min_steps,
+            max_steps=self.reasoning_max_steps,
+        )
+        if cache_key is None:
+            return None, None
+        return cache_key, self.reasoning_cache.get(cache_key)
+
+    def _cache_reasoning_trace(self, cache_key: Optional[str], reasoning_trace: ReasoningTrace) -> None:
+        if self.reasoning_cache is not None and cache_key is not None:
+            self.reasoning_cache.set(cache_key, reasoning_trace)
+
+    def _apply_reasoning_trace(
+        self, run_response: TeamRunResponse, run_messages: RunMessages, reasoning_trace: ReasoningTrace
+    ) -> None:
+        """Add a cached reasoning trace to the run messages and run response"""
+        from globalgenie.reasoning.helpers import update_messages_with_reasoning
+
+        if reasoning_trace.native:
+            run_messages.messages.extend(reasoning_trace.reasoning_messages)
+        else:
+            update_messages_with_reasoning(
+                run_messages=run_messages, reasoning_messages=reasoning_trace.reasoning_messages
+            )
+        update_run_response_with_reasoning(
+            run_response=run_response,
+            reasoning_steps=reasoning_trace.reasoning_steps,
+            reasoning_agent_messages=reasoning_trace.reasoning_agent_messages,
         )
 
     def _format_reasoning_step_content(self, run_response: TeamRunResponse, reasoning_step: ReasoningStep) -> str:
@@ -4298,28 +4442,41 @@ class Team:
         use_default_reasoning = False
 
         # Get the reasoning model
-        reasoning_model: Optional[Model] = self.reasoning_model
-        reasoning_model_provided = reasoning_model is not None
-        if reasoning_model is None and self.model is not None:
-            from copy import deepcopy
-
-            reasoning_model = deepcopy(self.model)
+        reasoning_model: Optional[Model] = self._get_reasoning_model()
+        reasoning_model_provided = self.reasoning_model is not None
         if reasoning_model is None:
             log_warning("Reasoning error. Reasoning model is None, continuing regular session...")
             return
 
+        # Reuse the reasoning of a previous run with the same input
+        reasoning_cache_key, reasoning_trace = self._get_reasoning_trace(
+            run_messages=run_messages, reasoning_model=reasoning_model
+        )
+        if reasoning_trace is not None:
+            log_debug("Using cached reasoning", center=True, symbol="=")
+            self._apply_reasoning_trace(
+                run_response=run_response, run_messages=run_messages, reasoning_trace=reasoning_trace
+            )
+            if self.stream_intermediate_steps:
+                yield self._handle_event(
+                    create_team_reasoning_completed_event(
+                        from_run_response=run_response,
+                        content=ReasoningSteps(reasoning_steps=reasoning_trace.reasoning_steps),
+                        content_type=ReasoningSteps.__name__,
+                    ),
+                    run_response,
+                )
+            return
+
         # If a reasoning model is provided, use it to generate reasoning
         if reasoning_model_provided:
             from globalgenie.reasoning.azure_ai_foundry import is_ai_foundry_reasoning_model
             from globalgenie.reasoning.deepseek import is_deepseek_reasoning_model
             from globalgenie.reasoning.groq import is_groq_reasoning_model
-            from globalgenie.reasoning.helpers import get_reasoning_agent
             from globalgenie.reasoning.ollama import is_ollama_reasoning_model
             from globalgenie.reasoning.openai import is_openai_reasoning_model
 
-            reasoning_agent = self.reasoning_agent or get_reasoning_agent(
-                reasoning_model=reasoning_model, monitoring=self.monitoring
-            )
+            reasoning_agent = self._get_reasoning_agent(reasoning_model=reasoning_model, default_reasoning=False)
             is_deepseek = is_deepseek_reasoning_model(reasoning_model)
             is_groq = is_groq_reasoning_model(reasoning_model)
             is_openai = is_openai_reasoning_model(reasoning_model)
@@ -4375,6 +4532,15 @@ class Team:
                     reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
                     reasoning_agent_messages=[reasoning_message],
                 )
+                self._cache_reasoning_trace(
+                    cache_key=reasoning_cache_key,
+                    reasoning_trace=ReasoningTrace(
+                        reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
+                        reasoning_messages=[reasoning_message],
+                        reasoning_agent_messages=[reasoning_message],
+                        native=True,
+                    ),
+                )
                 if self.stream_intermediate_steps:
                     yield self._handle_event(
                         create_team_reasoning_completed_event(
@@ -4394,24 +4560,12 @@ class Team:
             use_default_reasoning = True
 
         if use_default_reasoning:
-            from globalgenie.reasoning.default import get_default_reasoning_agent
             from globalgenie.reasoning.helpers import get_next_action, update_messages_with_reasoning
 
             # Get default reasoning agent
-            use_json_mode: bool = self.use_json_mode
-
-            reasoning_agent: Optional[Agent] = self.reasoning_agent  # type: ignore
-            if reasoning_agent is None:
-                reasoning_agent = get_default_reasoning_agent(
-                    reasoning_model=reasoning_model,
-                    min_steps=self.reasoning_min_steps,
-                    max_steps=self.reasoning_max_steps,
-                    monitoring=self.monitoring,
-                    telemetry=self.telemetry,
-                    debug_mode=self.debug_mode,
-                    debug_level=self.debug_level,
-                    use_json_mode=use_json_mode,
-                )
+            reasoning_agent: Optional[Agent] = self._get_reasoning_agent(  # type: ignore
+                reasoning_model=reasoning_model, default_reasoning=True
+            )
 
             # Validate reasoning agent
             if reasoning_agent is None:
@@ -4432,6 +4586,7 @@ class Team:
             next_action = NextAction.CONTINUE
             reasoning_messages: List[Message] = []
             all_reasoning_steps: List[ReasoningStep] = []
+            all_reasoning_agent_messages: List[Message] = []
             log_debug("Starting Reasoning", center=True, symbol="=")
             while next_action == NextAction.CONTINUE and step_count < self.reasoning_max_steps:
                 log_debug(f"Step {step_count}", center=True, symbol="-")
@@ -4481,6 +4636,7 @@ class Team:
                         reasoning_steps=reasoning_steps,
                         reasoning_agent_messages=reasoning_agent_response.messages,
                     )
+                    all_reasoning_agent_messages.extend(reasoning_agent_response.messages)
 
                     # Get the next action
                     next_action = get_next_action(reasoning_steps[-1])
@@ -4498,6 +4654,15 @@ class Team:
                 run_messages=run_messages,
                 reasoning_messages=reasoning_messages,
             )
+            if all_reasoning_steps and reasoning_messages:
+                self._cache_reasoning_trace(
+                    cache_key=reasoning_cache_key,
+                    reasoning_trace=ReasoningTrace(
+                        reasoning_steps=all_reasoning_steps,
+                        reasoning_messages=reasoning_messages,
+                        reasoning_agent_messages=all_reasoning_agent_messages,
+                    ),
+                )
 
             # Yield the final reasoning completed event
             if self.stream_intermediate_steps:
@@ -4521,28 +4686,41 @@ class Team:
         use_default_reasoning = False
 
         # Get the reasoning model
-        reasoning_model: Optional[Model] = self.reasoning_model
-        reasoning_model_provided = reasoning_model is not None
-        if reasoning_model is None and self.model is not None:
-            from copy import deepcopy
-
-            reasoning_model = deepcopy(self.model)
+        reasoning_model: Optional[Model] = self._get_reasoning_model()
+        reasoning_model_provided = self.reasoning_model is not None
         if reasoning_model is None:
             log_warning("Reasoning error. Reasoning model is None, continuing regular session...")
             return
 
+        # Reuse the reasoning of a previous run with the same input
+        reasoning_cache_key, reasoning_trace = self._get_reasoning_trace(
+            run_messages=run_messages, reasoning_model=reasoning_model
+        )
+        if reasoning_trace is not None:
+            log_debug("Using cached reasoning", center=True, symbol="=")
+            self._apply_reasoning_trace(
+                run_response=run_response, run_messages=run_messages, reasoning_trace=reasoning_trace
+            )
+            if self.stream_intermediate_steps:
+                yield self._handle_event(
+                    create_team_reasoning_completed_event(
+                        from_run_response=run_response,
+                        content=ReasoningSteps(reasoning_steps=reasoning_trace.reasoning_steps),
+                        content_type=ReasoningSteps.__name__,
+                    ),
+                    run_response,
+                )
+            return
+
         # If a reasoning model is provided, use it to generate reasoning
         if reasoning_model_provided:
             from globalgenie.reasoning.azure_ai_foundry import is_ai_foundry_reasoning_model
             from globalgenie.reasoning.deepseek import is_deepseek_reasoning_model
             from globalgenie.reasoning.groq import is_groq_reasoning_model
-            from globalgenie.reasoning.helpers import get_reasoning_agent
             from globalgenie.reasoning.ollama import is_ollama_reasoning_model
             from globalgenie.reasoning.openai import is_openai_reasoning_model
 
-            reasoning_agent = self.reasoning_agent or get_reasoning_agent(
-                reasoning_model=reasoning_model, monitoring=self.monitoring
-            )
+            reasoning_agent = self._get_reasoning_agent(reasoning_model=reasoning_model, default_reasoning=False)
             is_deepseek = is_deepseek_reasoning_model(reasoning_model)
             is_groq = is_groq_reasoning_model(reasoning_model)
             is_openai = is_openai_reasoning_model(reasoning_model)
@@ -4597,6 +4775,15 @@ class Team:
                     reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
                     reasoning_agent_messages=[reasoning_message],
                 )
+                self._cache_reasoning_trace(
+                    cache_key=reasoning_cache_key,
+                    reasoning_trace=ReasoningTrace(
+                        reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
+                        reasoning_messages=[reasoning_message],
+                        reasoning_agent_messages=[reasoning_message],
+                        native=True,
+                    ),
+                )
                 if self.stream_intermediate_steps:
                     yield self._handle_event(
                         create_team_reasoning_completed_event(
@@ -4616,23 +4803,12 @@ class Team:
             use_default_reasoning = True
 
         if use_default_reasoning:
-            from globalgenie.reasoning.default import get_default_reasoning_agent
             from globalgenie.reasoning.helpers import get_next_action, update_messages_with_reasoning
 
             # Get default reasoning agent
-            use_json_mode: bool = self.use_json_mode
-            reasoning_agent: Optional[Agent] = self.reasoning_agent  # type: ignore
-            if reasoning_agent is None:
-                reasoning_agent = get_default_reasoning_agent(  # type: ignore
-                    reasoning_model=reasoning_model,
-                    min_steps=self.reasoning_min_steps,
-                    max_steps=self.reasoning_max_steps,
-                    monitoring=self.monitoring,
-                    telemetry=self.telemetry,
-                    debug_mode=self.debug_mode,
-                    debug_level=self.debug_level,
-                    use_json_mode=use_json_mode,
-                )
+            reasoning_agent: Optional[Agent] = self._get_reasoning_agent(  # type: ignore
+                reasoning_model=reasoning_model, default_reasoning=True
+            )
 
             # Validate reasoning agent
             if reasoning_agent is None:
@@ -4654,6 +4830,7 @@ class Team:
             next_action = NextAction.CONTINUE
             reasoning_messages: List[Message] = []
             all_reasoning_steps: List[ReasoningStep] = []
+            all_reasoning_agent_messages: List[Message] = []
             log_debug("Starting Reasoning", center=True, symbol="=")
             while next_action == NextAction.CONTINUE and step_count < self.reasoning_max_steps:
                 log_debug(f"Step {step_count}", center=True, symbol="-")
@@ -4703,6 +4880,7 @@ class Team:
                         reasoning_steps=reasoning_steps,
                         reasoning_agent_messages=reasoning_agent_response.messages,
                     )
+                    all_reasoning_agent_messages.extend(reasoning_agent_response.messages)
 
                     # Get the next action
                     next_action = get_next_action(reasoning_steps[-1])
@@ -4720,6 +4898,15 @@ class Team:
                 run_messages=run_messages,
                 reasoning_messages=reasoning_messages,
             )
+            if all_reasoning_steps and reasoning_messages:
+                self._cache_reasoning_trace(
+                    cache_key=reasoning_cache_key,
+                    reasoning_trace=ReasoningTrace(
+                        reasoning_steps=all_reasoning_steps,
+                        reasoning_messages=reasoning_messages,
+                        reasoning_agent_messages=all_reasoning_agent_messages,
+                    ),
+                )
 
             # Yield the final reasoning completed event
             if self.stream_intermediate_steps:
@@ -5009,6 +5196,20 @@ class Team:
                 except Exception as e:
                     log_warning(f"Could not add tool {tool}: {e}")
 
+        # Add the functions to page through tool results that exceed their size limit
+        if any(func.result_policy is not None for func in self._functions_for_model.values()):
+            from globalgenie.tools.result_policy import get_tool_result_functions
+
+            for func in get_tool_result_functions():
+                if func.name not in self._functions_for_model:
+                    func._agent = self
+                    func._team = self
+                    if strict:
+                        func.strict = True
+                    self._functions_for_model[func.name] = func
+                    self._tools_for_model.append({"type": "function", "function": func.to_dict()})
+                    log_debug(f"Added tool {func.name}")
+
     def get_members_system_message_content(self, indent: int = 0) -> str:
         system_message_content = ""
         for idx, member in enumerate(self.members):
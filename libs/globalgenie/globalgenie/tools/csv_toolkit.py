@@ -1,9 +1,11 @@
 import csv
 import json
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from globalgenie.tools import Toolkit
+from globalgenie.tools.result_policy import ToolResultPolicy
 from globalgenie.utils.log import log_debug, log_info, logger
 
 
@@ -48,6 +50,8 @@ class CsvTools(Toolkit):
             except ImportError:
                 logger.warning("`duckdb` not installed. Query functionality disabled.")
 
+        # Csv files can be large, page them instead of returning them at once
+        kwargs.setdefault("result_policy", ToolResultPolicy())
         super().__init__(name="csv_tools", tools=tools, **kwargs)
 
     def list_csv_files(self) -> str:
@@ -75,15 +79,11 @@ class CsvTools(Toolkit):
             log_info(f"Reading file: {csv_name}")
             file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
 
-            # Read the csv file
-            csv_data = []
+            # Read the csv file, stopping after the row limit
             _row_limit = row_limit or self.row_limit
             with open(str(file_path), newline="") as csvfile:
                 reader = csv.DictReader(csvfile)
-                if _row_limit is not None:
-                    csv_data = [row for row in reader][:_row_limit]
-                else:
-                    csv_data = [row for row in reader]
+                csv_data = list(islice(reader, _row_limit))
             return json.dumps(csv_data)
         except Exception as e:
             logger.error(f"Error reading csv: {e}")
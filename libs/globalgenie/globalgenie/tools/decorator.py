@@ -2,6 +2,7 @@ from functools import update_wrapper, wraps
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, overload
 
 from globalgenie.tools.function import Function, get_entrypoint_docstring
+from globalgenie.tools.result_policy import ToolResultPolicy
 from globalgenie.utils.log import logger
 
 # Type variable for better type hints
@@ -77,6 +78,7 @@ def tool(
     cache_results: bool = False,
     cache_dir: Optional[str] = None,
     cache_ttl: int = 3600,
+    result_policy: Optional[ToolResultPolicy] = None,
 ) -> Callable[[F], Function]: ...
 
 
@@ -106,6 +108,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         cache_results: bool - If True, enable caching of function results
         cache_dir: Optional[str] - Directory to store cache files
         cache_ttl: int - Time-to-live for cached results in seconds
+        result_policy: Optional[ToolResultPolicy] - Size limit for results sent to the model, larger results are paged
 
     Returns:
         Union[Function, Callable[[F], Function]]: Decorated function or decorator
@@ -144,6 +147,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "cache_results",
             "cache_dir",
             "cache_ttl",
+            "result_policy",
         }
     )
 
@@ -6,6 +6,7 @@ from docstring_parser import parse
 from pydantic import BaseModel, Field, validate_call
 
 from globalgenie.exceptions import AgentRunException
+from globalgenie.tools.result_policy import ToolResultPolicy
 from globalgenie.utils.log import log_debug, log_error, log_exception, log_warning
 
 T = TypeVar("T")
@@ -116,6 +117,9 @@ class Function(BaseModel):
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
 
+    # Limits the size of results sent to the model, larger results are spilled and paged
+    result_policy: Optional[ToolResultPolicy] = None
+
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
     _agent: Optional[Any] = None
@@ -604,7 +608,7 @@ class FunctionCall(BaseModel):
         if self.function.entrypoint is None:
             return FunctionExecutionResult(status="failure", error="Entrypoint is not set")
 
-        log_debug(f"Running: {self.get_call_str()}")
+        log_debug(lambda: f"Running: {self.get_call_str()}")
 
         # Execute pre-hook if it exists
         self._handle_pre_hook()
@@ -618,7 +622,7 @@ class FunctionCall(BaseModel):
             cached_result = self.function._get_cached_result(cache_file)
 
             if cached_result is not None:
-                log_debug(f"Cache hit for: {self.get_call_str()}")
+                log_debug(lambda: f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
                 return FunctionExecutionResult(status="success", result=cached_result)
 
@@ -784,7 +788,7 @@ class FunctionCall(BaseModel):
         if self.function.entrypoint is None:
             return FunctionExecutionResult(status="failure", error="Entrypoint is not set")
 
-        log_debug(f"Running: {self.get_call_str()}")
+        log_debug(lambda: f"Running: {self.get_call_str()}")
 
         # Execute pre-hook if it exists
         if iscoroutinefunction(self.function.pre_hook):
@@ -802,7 +806,7 @@ class FunctionCall(BaseModel):
             cache_file = self.function._get_cache_file_path(cache_key)
             cached_result = self.function._get_cached_result(cache_file)
             if cached_result is not None:
-                log_debug(f"Cache hit for: {self.get_call_str()}")
+                log_debug(lambda: f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
                 return FunctionExecutionResult(status="success", result=cached_result)
 
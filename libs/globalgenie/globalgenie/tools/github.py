@@ -3,6 +3,7 @@ from os import getenv
 from typing import Any, List, Optional
 
 from globalgenie.tools import Toolkit
+from globalgenie.tools.result_policy import ToolResultPolicy
 from globalgenie.utils.log import log_debug, logger
 
 try:
@@ -144,6 +145,8 @@ class GithubTools(Toolkit):
         if create_review_request:
             tools.append(self.create_review_request)
 
+        # Diffs and file contents can be large, page them instead of returning them at once
+        kwargs.setdefault("result_policy", ToolResultPolicy())
         super().__init__(name="github", tools=tools, **kwargs)
 
     def authenticate(self):
@@ -1,8 +1,12 @@
+import asyncio
+import json
 from contextlib import AsyncExitStack
 from dataclasses import asdict, dataclass
 from datetime import timedelta
+from time import monotonic
 from types import TracebackType
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from globalgenie.tools import Toolkit
 from globalgenie.tools.function import Function
@@ -39,6 +43,230 @@ class StreamableHTTPClientParams:
     terminate_on_close: Optional[bool] = None
 
 
+MCPServerParams = Union[StdioServerParameters, SSEClientParams, StreamableHTTPClientParams]
+
+# Errors that mean the connection to the MCP server is lost
+_CONNECTION_ERRORS: Tuple[type, ...] = (ConnectionError, EOFError, OSError)
+try:
+    import anyio
+
+    _CONNECTION_ERRORS += (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+except ImportError:
+    pass
+
+
+def _get_transport_context(server_params: MCPServerParams):
+    """Return the client context of the transport for the server params"""
+    if isinstance(server_params, SSEClientParams):
+        return sse_client(**asdict(server_params))
+    if isinstance(server_params, StreamableHTTPClientParams):
+        return streamablehttp_client(**asdict(server_params))
+    return stdio_client(server_params)
+
+
+class MCPConnection:
+    """A long-lived connection to an MCP server, shared by the toolkits that use the same server.
+
+    The transport and ClientSession are owned by a background task, as their contexts must be entered and exited
+    in the same task. The session is pinged before use if it was idle for `health_check_interval` seconds, and the
+    connection is re-established if the ping or a tool call fails because the connection was lost. Tool calls
+    can run concurrently on the session. The tool list is cached until the server notifies that it changed.
+    """
+
+    def __init__(self, server_params: MCPServerParams, timeout_seconds: int = 5, health_check_interval: float = 60):
+        self.server_params = server_params
+        self.timeout_seconds = timeout_seconds
+        self.health_check_interval = health_check_interval
+
+        self.session: Optional[ClientSession] = None
+        # Incremented when the tool list changes, so toolkits know when to register the tools again
+        self.tools_version = 0
+        self._tools: Optional[List[Any]] = None
+        self._last_used = 0.0
+        self._runner: Optional[asyncio.Task] = None
+        self._close_event: Optional[asyncio.Event] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_connected(self) -> bool:
+        return self.session is not None and self._runner is not None and not self._runner.done()
+
+    async def _message_handler(self, message: Any) -> None:
+        method = getattr(getattr(message, "root", message), "method", None)
+        if method == "notifications/tools/list_changed":
+            log_debug("MCP server tool list changed")
+            self._tools = None
+            self.tools_version += 1
+
+    async def _run(self, ready: "asyncio.Future[ClientSession]", close_event: asyncio.Event) -> None:
+        session: Optional[ClientSession] = None
+        try:
+            async with AsyncExitStack() as stack:
+                transport = await stack.enter_async_context(_get_transport_context(self.server_params))
+                read, write = transport[0:2]
+                session = await stack.enter_async_context(
+                    ClientSession(
+                        read,
+                        write,
+                        read_timeout_seconds=timedelta(seconds=self.timeout_seconds),  # type: ignore
+                        message_handler=self._message_handler,  # type: ignore
+                    )
+                )
+                await session.initialize()
+                ready.set_result(session)
+                await close_event.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            elif not isinstance(e, asyncio.CancelledError):
+                log_warning(f"MCP connection closed: {e}")
+        finally:
+            # A new connection may already be established if this one was slow to close
+            if session is not None and self.session is session:
+                self.session = None
+
+    async def connect(self) -> ClientSession:
+        """Connect to the server and initialize the session, if not connected yet"""
+        async with self._lock:
+            if self.is_connected:
+                return self.session  # type: ignore
+            await self._close()
+            ready: "asyncio.Future[ClientSession]" = asyncio.get_running_loop().create_future()
+            self._close_event = asyncio.Event()
+            self._runner = asyncio.create_task(self._run(ready, self._close_event))
+            self.session = await ready
+            self._tools = None
+            self.tools_version += 1
+            self._last_used = monotonic()
+            log_debug("MCP connection established")
+            return self.session
+
+    async def reconnect(self, failed_session: Optional[ClientSession] = None) -> ClientSession:
+        """Re-establish the connection, unless another caller already replaced the failed session"""
+        async with self._lock:
+            if failed_session is None or self.session is failed_session:
+                await self._close()
+        return await self.connect()
+
+    async def get_session(self) -> ClientSession:
+        """Return a connected session, checking its health if it was idle"""
+        if not self.is_connected:
+            return await self.connect()
+        if monotonic() - self._last_used > self.health_check_interval:
+            try:
+                await asyncio.wait_for(self.session.send_ping(), timeout=self.timeout_seconds)  # type: ignore
+            except Exception as e:
+                log_warning(f"MCP server did not respond to ping, reconnecting: {e}")
+                return await self.reconnect(self.session)
+        self._last_used = monotonic()
+        return self.session  # type: ignore
+
+    async def list_tools(self) -> List[Any]:
+        """Return the tools of the server, cached until the server notifies that they changed"""
+        session = await self.get_session()
+        if self._tools is None:
+            self._tools = (await session.list_tools()).tools
+        return self._tools
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Any:
+        session = await self.get_session()
+        try:
+            return await session.call_tool(name, arguments)
+        except _CONNECTION_ERRORS as e:
+            log_warning(f"MCP connection lost calling '{name}', reconnecting: {e}")
+            session = await self.reconnect(session)
+            return await session.call_tool(name, arguments)
+
+    async def _close(self) -> None:
+        if self._close_event is not None:
+            self._close_event.set()
+        if self._runner is not None:
+            try:
+                await asyncio.wait_for(self._runner, timeout=self.timeout_seconds)
+            except Exception:
+                self._runner.cancel()
+        self._runner = None
+        self._close_event = None
+        self.session = None
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._close()
+
+
+class MCPConnectionManager:
+    """Keeps MCP connections alive across runs, one per server and event loop.
+
+    Use with `MCPTools(..., keep_alive=True)` to reuse the server process or HTTP connection, the initialized
+    session and the tool list across `async with` blocks, instead of starting them for every request.
+
+    Connections are bound to their event loop. The connections of closed loops are dropped: `asyncio.run()`
+    cancels their tasks when the loop finishes, which closes their sessions and stops stdio server processes.
+    """
+
+    def __init__(self, health_check_interval: float = 60):
+        """
+        Args:
+            health_check_interval: Seconds a connection can be idle before it is pinged on its next use.
+        """
+        self.health_check_interval = health_check_interval
+        self._connections: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, MCPConnection]]" = (
+            WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _get_params_key(server_params: MCPServerParams) -> str:
+        if isinstance(server_params, (SSEClientParams, StreamableHTTPClientParams)):
+            data: Any = asdict(server_params)
+        else:
+            data = server_params.model_dump()
+        return f"{type(server_params).__name__}:{json.dumps(data, sort_keys=True, default=str)}"
+
+    def _drop_closed_loops(self) -> None:
+        # The connections of a closed loop can not be used or closed from another loop
+        for loop in [loop for loop in list(self._connections.keys()) if loop.is_closed()]:
+            connections = self._connections.pop(loop, None) or {}
+            if connections:
+                log_debug(f"Dropping {len(connections)} MCP connections of a closed event loop")
+
+    def get_connection(self, server_params: MCPServerParams, timeout_seconds: int = 5) -> MCPConnection:
+        """Return the connection for the server params in the running event loop, creating it if needed"""
+        self._drop_closed_loops()
+        connections = self._connections.setdefault(asyncio.get_running_loop(), {})
+        key = self._get_params_key(server_params)
+        connection = connections.get(key)
+        if connection is None:
+            connection = MCPConnection(
+                server_params, timeout_seconds=timeout_seconds, health_check_interval=self.health_check_interval
+            )
+            connections[key] = connection
+        return connection
+
+    async def close(self) -> None:
+        """Close the connections of the running event loop"""
+        self._drop_closed_loops()
+        connections = self._connections.pop(asyncio.get_running_loop(), None) or {}
+        for connection in connections.values():
+            await connection.close()
+
+
+_mcp_connection_manager: Optional[MCPConnectionManager] = None
+
+
+def get_mcp_connection_manager() -> MCPConnectionManager:
+    """Return the process-wide MCP connection manager"""
+    global _mcp_connection_manager
+    if _mcp_connection_manager is None:
+        _mcp_connection_manager = MCPConnectionManager()
+    return _mcp_connection_manager
+
+
+def set_mcp_connection_manager(manager: MCPConnectionManager) -> None:
+    """Replace the process-wide MCP connection manager"""
+    global _mcp_connection_manager
+    _mcp_connection_manager = manager
+
+
 class MCPTools(Toolkit):
     """
     A toolkit for integrating Model Context Protocol (MCP) servers with GlobalGenie agents.
@@ -63,6 +291,8 @@ class MCPTools(Toolkit):
         client=None,
         include_tools: Optional[list[str]] = None,
         exclude_tools: Optional[list[str]] = None,
+        keep_alive: bool = False,
+        connection_manager: Optional[MCPConnectionManager] = None,
         **kwargs,
     ):
         """
@@ -79,6 +309,9 @@ class MCPTools(Toolkit):
             include_tools: Optional list of tool names to include (if None, includes all)
             exclude_tools: Optional list of tool names to exclude (if None, excludes none)
             transport: The transport protocol to use, either "stdio" or "sse" or "streamable-http"
+            keep_alive: Keep the connection to the server open after the context manager exits, and reuse it
+                the next time the context manager is entered, by this or any other MCPTools for the same server.
+            connection_manager: The manager of kept alive connections. Defaults to the process-wide manager.
         """
         super().__init__(name="MCPTools", **kwargs)
 
@@ -152,9 +385,40 @@ class MCPTools(Toolkit):
         self._session_context = None
         self._initialized = False
 
+        self.keep_alive = keep_alive
+        self.connection_manager = connection_manager
+        self._connection: Optional[MCPConnection] = None
+        self._tools_version: Optional[int] = None
+
+    def _get_server_params(self) -> MCPServerParams:
+        if self.server_params is not None:
+            return self.server_params
+        if self.transport == "sse":
+            return SSEClientParams(url=self.url)  # type: ignore
+        if self.transport == "streamable-http":
+            return StreamableHTTPClientParams(url=self.url)  # type: ignore
+        raise ValueError("server_params must be provided when using stdio transport.")
+
+    async def _enter_kept_alive_connection(self) -> "MCPTools":
+        """Use a kept alive connection, registering the tools again only if the tool list changed"""
+        if self._connection is None:
+            manager = self.connection_manager or get_mcp_connection_manager()
+            self._connection = manager.get_connection(self._get_server_params(), timeout_seconds=self.timeout_seconds)
+        tools = await self._connection.list_tools()
+        self.session = self._connection.session
+        if not self._initialized or self._tools_version != self._connection.tools_version:
+            self.functions = {}
+            self._register_tools(tools, self._connection)
+            self._tools_version = self._connection.tools_version
+            self._initialized = True
+        return self
+
     async def __aenter__(self) -> "MCPTools":
         """Enter the async context manager."""
 
+        if self.keep_alive and (self.session is None or self._connection is not None):
+            return await self._enter_kept_alive_connection()
+
         if self.session is not None:
             # Already has a session, just initialize
             if not self._initialized:
@@ -195,6 +459,10 @@ class MCPTools(Toolkit):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit the async context manager."""
+        if self._connection is not None:
+            # The connection is kept alive for the next use
+            return
+
         if self._session_context is not None:
             await self._session_context.__aexit__(exc_type, exc_val, exc_tb)
             self.session = None
@@ -221,47 +489,51 @@ class MCPTools(Toolkit):
             # Get the list of tools from the MCP server
             available_tools = await self.session.list_tools()
 
-            self._check_tools_filters(
-                available_tools=[tool.name for tool in available_tools.tools],
-                include_tools=self.include_tools,
-                exclude_tools=self.exclude_tools,
-            )
-
-            # Filter tools based on include/exclude lists
-            filtered_tools = []
-            for tool in available_tools.tools:
-                if self.exclude_tools and tool.name in self.exclude_tools:
-                    continue
-                if self.include_tools is None or tool.name in self.include_tools:
-                    filtered_tools.append(tool)
-
-            # Register the tools with the toolkit
-            for tool in filtered_tools:
-                try:
-                    # Get an entrypoint for the tool
-                    entrypoint = get_entrypoint_for_tool(tool, self.session)
-                    # Create a Function for the tool
-                    f = Function(
-                        name=tool.name,
-                        description=tool.description,
-                        parameters=tool.inputSchema,
-                        entrypoint=entrypoint,
-                        # Set skip_entrypoint_processing to True to avoid processing the entrypoint
-                        skip_entrypoint_processing=True,
-                    )
-
-                    # Register the Function with the toolkit
-                    self.functions[f.name] = f
-                    log_debug(f"Function: {f.name} registered with {self.name}")
-                except Exception as e:
-                    logger.error(f"Failed to register tool {tool.name}: {e}")
-
-            log_debug(f"{self.name} initialized with {len(filtered_tools)} tools")
+            self._register_tools(available_tools.tools, self.session)
             self._initialized = True
         except Exception as e:
             logger.error(f"Failed to get MCP tools: {e}")
             raise
 
+    def _register_tools(self, tools: List[Any], session: Union[ClientSession, MCPConnection]) -> None:
+        """Register the tools of the MCP server that pass the include/exclude filters with the toolkit"""
+        self._check_tools_filters(
+            available_tools=[tool.name for tool in tools],
+            include_tools=self.include_tools,
+            exclude_tools=self.exclude_tools,
+        )
+
+        # Filter tools based on include/exclude lists
+        filtered_tools = []
+        for tool in tools:
+            if self.exclude_tools and tool.name in self.exclude_tools:
+                continue
+            if self.include_tools is None or tool.name in self.include_tools:
+                filtered_tools.append(tool)
+
+        # Register the tools with the toolkit
+        for tool in filtered_tools:
+            try:
+                # Get an entrypoint for the tool
+                entrypoint = get_entrypoint_for_tool(tool, session)
+                # Create a Function for the tool
+                f = Function(
+                    name=tool.name,
+                    description=tool.description,
+                    parameters=tool.inputSchema,
+                    entrypoint=entrypoint,
+                    # Set skip_entrypoint_processing to True to avoid processing the entrypoint
+                    skip_entrypoint_processing=True,
+                )
+
+                # Register the Function with the toolkit
+                self.functions[f.name] = f
+                log_debug(f"Function: {f.name} registered with {self.name}")
+            except Exception as e:
+                logger.error(f"Failed to register tool {tool.name}: {e}")
+
+        log_debug(f"{self.name} initialized with {len(filtered_tools)} tools")
+
 
 class MultiMCPTools(Toolkit):
     """
@@ -288,6 +560,8 @@ class MultiMCPTools(Toolkit):
         client=None,
         include_tools: Optional[list[str]] = None,
         exclude_tools: Optional[list[str]] = None,
+        keep_alive: bool = False,
+        connection_manager: Optional[MCPConnectionManager] = None,
         **kwargs,
     ):
         """
@@ -303,6 +577,9 @@ class MultiMCPTools(Toolkit):
             timeout_seconds: Timeout in seconds for managing timeouts for Client Session if Agent or Tool doesn't respond.
             include_tools: Optional list of tool names to include (if None, includes all).
             exclude_tools: Optional list of tool names to exclude (if None, excludes none).
+            keep_alive: Keep the connections to the servers open after the context manager exits, and reuse them
+                the next time the context manager is entered.
+            connection_manager: The manager of kept alive connections. Defaults to the process-wide manager.
         """
         super().__init__(name="MultiMCPTools", **kwargs)
 
@@ -367,10 +644,21 @@ class MultiMCPTools(Toolkit):
         self._async_exit_stack = AsyncExitStack()
 
         self._client = client
+        self.keep_alive = keep_alive
+        self.connection_manager = connection_manager
 
     async def __aenter__(self) -> "MultiMCPTools":
         """Enter the async context manager."""
 
+        if self.keep_alive:
+            manager = self.connection_manager or get_mcp_connection_manager()
+            for server_params in self.server_params_list:
+                connection = manager.get_connection(server_params, timeout_seconds=self.timeout_seconds)
+                # The tool list is cached by the connection, so only the Functions are created again
+                self._register_tools(await connection.list_tools(), connection)
+            self._initialized = True
+            return self
+
         for server_params in self.server_params_list:
             # Handle stdio connections
             if isinstance(server_params, StdioServerParameters):
@@ -419,38 +707,42 @@ class MultiMCPTools(Toolkit):
             # Get the list of tools from the MCP server
             available_tools = await session.list_tools()
 
-            # Filter tools based on include/exclude lists
-            filtered_tools = []
-            for tool in available_tools.tools:
-                if self.exclude_tools and tool.name in self.exclude_tools:
-                    continue
-                if self.include_tools is None or tool.name in self.include_tools:
-                    filtered_tools.append(tool)
-
-            # Register the tools with the toolkit
-            for tool in filtered_tools:
-                try:
-                    # Get an entrypoint for the tool
-                    entrypoint = get_entrypoint_for_tool(tool, session)
-
-                    # Create a Function for the tool
-                    f = Function(
-                        name=tool.name,
-                        description=tool.description,
-                        parameters=tool.inputSchema,
-                        entrypoint=entrypoint,
-                        # Set skip_entrypoint_processing to True to avoid processing the entrypoint
-                        skip_entrypoint_processing=True,
-                    )
-
-                    # Register the Function with the toolkit
-                    self.functions[f.name] = f
-                    log_debug(f"Function: {f.name} registered with {self.name}")
-                except Exception as e:
-                    logger.error(f"Failed to register tool {tool.name}: {e}")
-
-            log_debug(f"{self.name} initialized with {len(filtered_tools)} tools")
+            self._register_tools(available_tools.tools, session)
             self._initialized = True
         except Exception as e:
             logger.error(f"Failed to get MCP tools: {e}")
             raise
+
+    def _register_tools(self, tools: List[Any], session: Union[ClientSession, MCPConnection]) -> None:
+        """Register the tools of an MCP server that pass the include/exclude filters with the toolkit"""
+        # Filter tools based on include/exclude lists
+        filtered_tools = []
+        for tool in tools:
+            if self.exclude_tools and tool.name in self.exclude_tools:
+                continue
+            if self.include_tools is None or tool.name in self.include_tools:
+                filtered_tools.append(tool)
+
+        # Register the tools with the toolkit
+        for tool in filtered_tools:
+            try:
+                # Get an entrypoint for the tool
+                entrypoint = get_entrypoint_for_tool(tool, session)
+
+                # Create a Function for the tool
+                f = Function(
+                    name=tool.name,
+                    description=tool.description,
+                    parameters=tool.inputSchema,
+                    entrypoint=entrypoint,
+                    # Set skip_entrypoint_processing to True to avoid processing the entrypoint
+                    skip_entrypoint_processing=True,
+                )
+
+                # Register the Function with the toolkit
+                self.functions[f.name] = f
+                log_debug(f"Function: {f.name} registered with {self.name}")
+            except Exception as e:
+                logger.error(f"Failed to register tool {tool.name}: {e}")
+
+        log_debug(f"{self.name} initialized with {len(filtered_tools)} tools")
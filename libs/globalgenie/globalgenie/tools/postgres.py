@@ -12,6 +12,7 @@ except ImportError:
     )
 
 from globalgenie.tools import Toolkit
+from globalgenie.tools.result_policy import ToolResultPolicy
 from globalgenie.utils.log import log_debug, log_error
 
 
@@ -52,6 +53,8 @@ class PostgresTools(Toolkit):
         if export_tables:
             tools.append(self.export_table_to_path)
 
+        # Query results can be large, page them instead of returning them at once
+        kwargs.setdefault("result_policy", ToolResultPolicy())
         super().__init__(name="postgres_tools", tools=tools, **kwargs)
 
     @property
@@ -0,0 +1,175 @@
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import gettempdir
+from typing import TYPE_CHECKING, List, Optional
+
+from globalgenie.utils.log import log_debug
+from globalgenie.utils.tokens import CHARS_PER_TOKEN, estimate_tokens
+
+if TYPE_CHECKING:
+    from globalgenie.media_store.base import MediaStore
+    from globalgenie.tools.function import Function
+
+
+@dataclass
+class ToolResultPolicy:
+    """Limits the size of tool results sent to the Model.
+
+    Results larger than `max_tokens` or `max_bytes` are spilled to the tool result store, and the Model receives
+    a preview of the result and a handle instead. The Model can page through the stored result with
+    `read_tool_result` and search it with `search_tool_result`, which are added to the tools automatically.
+    """
+
+    # Maximum estimated number of tokens of a result sent to the Model as is
+    max_tokens: Optional[int] = 10000
+    # Maximum size of a result in bytes sent to the Model as is
+    max_bytes: Optional[int] = None
+    # Number of tokens of a spilled result included in the preview
+    preview_tokens: int = 2000
+    # Number of tokens the Model is asked to read per page
+    page_tokens: int = 4000
+
+    def exceeds_limit(self, output: str) -> bool:
+        if self.max_tokens is not None and estimate_tokens(output) > self.max_tokens:
+            return True
+        if self.max_bytes is not None and len(output) > self.max_bytes // 4:
+            # Only encode the output if it could exceed the limit, as a character is at most 4 bytes
+            return len(output.encode("utf-8")) > self.max_bytes
+        return False
+
+    def apply(self, function_name: str, output: str) -> str:
+        """Return the output as is if it is within the limits, otherwise spill it and return a preview"""
+        if not output or not self.exceeds_limit(output):
+            return output
+
+        result_id = get_tool_result_store().put(output.encode("utf-8"))
+        preview = _get_page(output, offset=0, limit=self.preview_tokens * CHARS_PER_TOKEN)
+        log_debug(f"Result of {function_name} spilled to the tool result store: {result_id} ({len(output)} characters)")
+        return (
+            f"{preview}\n\n"
+            f"[Result truncated: showing characters 0-{len(preview)} of {len(output)}, "
+            f"about {estimate_tokens(output)} tokens in total. The full result is stored as "
+            f'result_id="{result_id}". Call read_tool_result(result_id="{result_id}", offset={len(preview)}, '
+            f"limit={self.page_tokens * CHARS_PER_TOKEN}) to read the next page, or "
+            f'search_tool_result(result_id="{result_id}", query="...") to find specific text. '
+            "Only read further if the preview is not enough to answer.]"
+        )
+
+
+def _get_page(text: str, offset: int, limit: int) -> str:
+    """Return up to `limit` characters of the text from `offset`, ending at a line break where possible"""
+    page = text[offset : offset + limit]
+    if offset + limit < len(text):
+        line_end = page.rfind("\n")
+        if line_end > limit // 2:
+            page = page[: line_end + 1]
+    return page
+
+
+_tool_result_store: Optional["MediaStore"] = None
+
+# Number of seconds spilled results are kept in the default store
+TOOL_RESULT_TTL = 24 * 60 * 60
+
+
+def get_tool_result_store() -> "MediaStore":
+    """Return the store for spilled tool results, by default a local store in the temp directory.
+
+    Results in the default store expire after TOOL_RESULT_TTL seconds.
+    """
+    global _tool_result_store
+    if _tool_result_store is None:
+        from globalgenie.media_store.local import LocalMediaStore
+
+        _tool_result_store = LocalMediaStore(
+            base_dir=Path(gettempdir()) / "globalgenie_cache" / "tool_results", ttl=TOOL_RESULT_TTL
+        )
+    return _tool_result_store
+
+
+def set_tool_result_store(store: "MediaStore") -> None:
+    """Replace the store for spilled tool results, e.g. with a shared S3MediaStore"""
+    global _tool_result_store
+    _tool_result_store = store
+
+
+def _get_tool_result(result_id: str) -> Optional[bytes]:
+    # The result_id comes from the Model, so only look up ids that have the format of a store key
+    from globalgenie.media_store.base import MediaStore
+
+    if not MediaStore.is_valid_key(result_id):
+        return None
+    return get_tool_result_store().get(result_id)
+
+
+# Upper bound for the number of characters returned by read_tool_result
+MAX_PAGE_CHARS = 32000
+
+
+def read_tool_result(result_id: str, offset: int = 0, limit: int = 16000) -> str:
+    """Use this function to read a page of a tool result that was too large to return at once.
+
+    Args:
+        result_id (str): The result_id of the truncated tool result.
+        offset (int): The character offset to start reading from.
+        limit (int): The maximum number of characters to read.
+
+    Returns:
+        str: The requested page of the result, followed by the offset of the next page.
+    """
+    content = _get_tool_result(result_id)
+    if content is None:
+        return f"Tool result {result_id} not found"
+
+    text = content.decode("utf-8")
+    offset = max(0, offset)
+    if offset >= len(text):
+        return f"Offset {offset} is past the end of the result ({len(text)} characters)"
+
+    page = _get_page(text, offset=offset, limit=max(1, min(limit, MAX_PAGE_CHARS)))
+    end = offset + len(page)
+    if end < len(text):
+        return f"{page}\n\n[Showing characters {offset}-{end} of {len(text)}. Next page: offset={end}]"
+    return f"{page}\n\n[Showing characters {offset}-{end} of {len(text)}. End of result]"
+
+
+def search_tool_result(result_id: str, query: str, max_matches: int = 20) -> str:
+    """Use this function to find where a search term occurs in a truncated tool result.
+
+    Args:
+        result_id (str): The result_id of the truncated tool result.
+        query (str): The text to search for, case insensitive.
+        max_matches (int): The maximum number of matches to return.
+
+    Returns:
+        str: The text around each match with its character offset.
+    """
+    content = _get_tool_result(result_id)
+    if content is None:
+        return f"Tool result {result_id} not found"
+    if not query:
+        return "Please provide a query"
+
+    text = content.decode("utf-8")
+    haystack = text.lower()
+    needle = query.lower()
+    context_chars = 200
+    matches: List[str] = []
+    position = haystack.find(needle)
+    while position != -1 and len(matches) < max_matches:
+        start = max(0, position - context_chars)
+        end = min(len(text), position + len(needle) + context_chars)
+        matches.append(f"[offset={start}] {text[start:end]}")
+        # Skip matches that are already included in this snippet
+        position = haystack.find(needle, end)
+
+    if not matches:
+        return f"No matches for '{query}' in tool result {result_id}"
+    return "\n\n".join(matches)
+
+
+def get_tool_result_functions() -> List["Function"]:
+    """Return the functions the Model uses to page through spilled tool results"""
+    from globalgenie.tools.function import Function
+
+    return [Function.from_callable(read_tool_result), Function.from_callable(search_tool_result)]
@@ -2,6 +2,7 @@ import json
 from typing import Any, Dict, List, Optional
 
 from globalgenie.tools import Toolkit
+from globalgenie.tools.result_policy import ToolResultPolicy
 from globalgenie.utils.log import log_debug, logger
 
 try:
@@ -60,6 +61,8 @@ class SQLTools(Toolkit):
         if run_sql_query:
             tools.append(self.run_sql_query)
 
+        # Query results can be large, page them instead of returning them at once
+        kwargs.setdefault("result_policy", ToolResultPolicy())
         super().__init__(name="sql_tools", tools=tools, **kwargs)
 
     def list_tables(self) -> str:
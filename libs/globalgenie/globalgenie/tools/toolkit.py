@@ -2,6 +2,7 @@ from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional
 
 from globalgenie.tools.function import Function
+from globalgenie.tools.result_policy import ToolResultPolicy
 from globalgenie.utils.log import log_debug, log_warning, logger
 
 
@@ -21,6 +22,7 @@ class Toolkit:
         cache_results: bool = False,
         cache_ttl: int = 3600,
         cache_dir: Optional[str] = None,
+        result_policy: Optional[ToolResultPolicy] = None,
         auto_register: bool = True,
     ):
         """Initialize a new Toolkit.
@@ -37,6 +39,7 @@ class Toolkit:
             cache_results (bool): Enable in-memory caching of function results.
             cache_ttl (int): Time-to-live for cached results in seconds.
             cache_dir (Optional[str]): Directory to store cache files. Defaults to system temp dir.
+            result_policy (Optional[ToolResultPolicy]): Size limit for results sent to the model.
             auto_register (bool): Whether to automatically register all methods in the class.
             stop_after_tool_call_tools (Optional[List[str]]): List of function names that should stop the agent after execution.
             show_result_tools (Optional[List[str]]): List of function names whose results should be shown.
@@ -64,6 +67,8 @@ class Toolkit:
         self.cache_ttl: int = cache_ttl
         self.cache_dir: Optional[str] = cache_dir
 
+        self.result_policy: Optional[ToolResultPolicy] = result_policy
+
         # Automatically register all methods if auto_register is True
         if auto_register and self.tools:
             self._register_tools()
@@ -128,6 +133,7 @@ class Toolkit:
                 cache_results=self.cache_results,
                 cache_dir=self.cache_dir,
                 cache_ttl=self.cache_ttl,
+                result_policy=self.result_policy,
                 requires_confirmation=tool_name in self.requires_confirmation_tools,
                 external_execution=tool_name in self.external_execution_required_tools,
                 stop_after_tool_call=tool_name in self.stop_after_tool_call_tools,
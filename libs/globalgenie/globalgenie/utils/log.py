@@ -174,13 +174,27 @@ def use_workflow_logger():
     logger = workflow_logger
 
 
+def debug_enabled(log_level: Literal[1, 2] = 1) -> bool:
+    """Return True if debug messages of the given level are logged.
+    Use it to guard debug logging that is expensive to prepare.
+    """
+    return debug_on and debug_level >= log_level
+
+
 def log_debug(msg, center: bool = False, symbol: str = "*", log_level: Literal[1, 2] = 1, *args, **kwargs):
+    """Log a debug message.
+
+    `msg` can be a callable returning the message, in which case it is only called if debug logging is enabled,
+    e.g. `log_debug(lambda: f"Query: {stmt}")`.
+    """
     global logger
     global debug_on
     global debug_level
 
     if debug_on:
         if debug_level >= log_level:
+            if callable(msg):
+                msg = msg()
             logger.debug(msg, center, symbol, *args, **kwargs)
 
 
@@ -1,4 +1,5 @@
 from functools import partial
+from typing import TYPE_CHECKING, Union
 from uuid import uuid4
 
 from globalgenie.utils.log import log_debug, log_exception
@@ -13,14 +14,17 @@ except (ImportError, ModuleNotFoundError):
 
 from globalgenie.media import ImageArtifact
 
+if TYPE_CHECKING:
+    from globalgenie.tools.mcp import MCPConnection
 
-def get_entrypoint_for_tool(tool: MCPTool, session: ClientSession):
+
+def get_entrypoint_for_tool(tool: MCPTool, session: Union[ClientSession, "MCPConnection"]):
     """
     Return an entrypoint for an MCP tool.
 
     Args:
         tool: The MCP tool to create an entrypoint for
-        session: The session to use
+        session: The session to use, or a kept alive MCPConnection that reconnects if the connection is lost
 
     Returns:
         Callable: The entrypoint function for the tool
@@ -0,0 +1,284 @@
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+from pathlib import Path
+from time import time
+from typing import Dict, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
+
+import httpx
+
+from globalgenie.utils.log import log_debug, log_warning
+
+
+@dataclass
+class FetchedMedia:
+    """Content of a media URL, as cached by the MediaFetcher"""
+
+    url: str
+    content: bytes
+    content_type: Optional[str] = None
+    etag: Optional[str] = None
+    # Unix timestamp of the last download or revalidation
+    fetched_at: float = 0.0
+
+    @property
+    def mime_type(self) -> str:
+        return (self.content_type or "").split(";")[0]
+
+
+class MediaFetcher:
+    """Downloads media URLs once and serves them from a cache afterwards.
+
+    Responses are cached in a size-bounded in-memory LRU cache and, if `cache_dir` is set, on disk. Cached
+    content is served without a request for `max_age` seconds, after which it is revalidated using its ETag.
+    Concurrent requests for the same URL share a single download, and all downloads reuse one connection pool
+    (one per event loop for async downloads).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+        max_age: float = 300.0,
+        timeout: float = 60.0,
+    ):
+        """
+        Args:
+            cache_dir: Directory for the on-disk cache. The on-disk cache is disabled if not set.
+            max_memory_bytes: Maximum total size of the content in the in-memory cache.
+            max_disk_bytes: Maximum total size of the content in the on-disk cache.
+            max_age: Seconds cached content is used without revalidating it.
+            timeout: Timeout for downloads, in seconds.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age = max_age
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, FetchedMedia]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: Optional[int] = None
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._async_in_flight: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._client: Optional[httpx.Client] = None
+        self._async_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = WeakKeyDictionary()
+
+    # -*- Public Functions
+    def fetch(self, url: str) -> FetchedMedia:
+        """Return the content of a URL, downloading it only if it is not cached or has changed"""
+        cached = self._get_cached(url)
+        if cached is not None and self._is_fresh(cached):
+            return cached
+
+        with self._lock:
+            event = self._in_flight.get(url)
+            is_owner = event is None
+            if is_owner:
+                event = threading.Event()
+                self._in_flight[url] = event
+
+        if not is_owner:
+            # Another thread is downloading this URL, use its result
+            event.wait(timeout=self.timeout)  # type: ignore
+            cached = self._get_cached(url)
+            if cached is not None and self._is_fresh(cached):
+                return cached
+
+        try:
+            response = self._get_client().get(url, headers=self._conditional_headers(cached))
+            return self._handle_response(url, response, cached)
+        finally:
+            if is_owner:
+                with self._lock:
+                    self._in_flight.pop(url, None)
+                event.set()  # type: ignore
+
+    async def afetch(self, url: str) -> FetchedMedia:
+        """Return the content of a URL without blocking the event loop, downloading it only if needed"""
+        cached = self._get_cached_from_memory(url)
+        if cached is None and self.cache_dir is not None:
+            cached = await asyncio.to_thread(self._get_cached_from_disk, url)
+        if cached is not None and self._is_fresh(cached):
+            return cached
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), url)
+        future = self._async_in_flight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        self._async_in_flight[key] = future
+        try:
+            response = await self._get_async_client(loop).get(url, headers=self._conditional_headers(cached))
+            fetched = self._handle_response(url, response, cached, write_to_disk=False)
+            if self.cache_dir is not None:
+                await asyncio.to_thread(self._write_to_disk, fetched)
+            future.set_result(fetched)
+            return fetched
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, waiters (if any) get it as well
+            future.exception()
+            raise
+        finally:
+            self._async_in_flight.pop(key, None)
+
+    async def aprefetch(self, urls: List[str]) -> None:
+        """Download the given URLs concurrently, so later reads are served from the cache"""
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*[self.afetch(url) for url in unique_urls], return_exceptions=True)
+        for url, result in zip(unique_urls, results):
+            if isinstance(result, BaseException):
+                log_warning(f"Could not prefetch {url}: {result}")
+
+    def clear(self) -> None:
+        """Clear the in-memory cache"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    # -*- Internal Functions
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(timeout=self.timeout, follow_redirects=True)
+        return self._client
+
+    def _get_async_client(self, loop: asyncio.AbstractEventLoop) -> httpx.AsyncClient:
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+            self._async_clients[loop] = client
+        return client
+
+    def _is_fresh(self, fetched: FetchedMedia) -> bool:
+        return time() - fetched.fetched_at < self.max_age
+
+    def _conditional_headers(self, cached: Optional[FetchedMedia]) -> Dict[str, str]:
+        if cached is not None and cached.etag:
+            return {"If-None-Match": cached.etag}
+        return {}
+
+    def _handle_response(
+        self, url: str, response: httpx.Response, cached: Optional[FetchedMedia], write_to_disk: bool = True
+    ) -> FetchedMedia:
+        if response.status_code == 304 and cached is not None:
+            log_debug(f"Media not modified: {url}")
+            cached.fetched_at = time()
+            fetched = cached
+        else:
+            response.raise_for_status()
+            log_debug(f"Downloaded media: {url} ({len(response.content)} bytes)")
+            fetched = FetchedMedia(
+                url=url,
+                content=response.content,
+                content_type=response.headers.get("Content-Type"),
+                etag=response.headers.get("ETag"),
+                fetched_at=time(),
+            )
+        self._add_to_memory(fetched)
+        if write_to_disk and self.cache_dir is not None:
+            self._write_to_disk(fetched)
+        return fetched
+
+    def _get_cached(self, url: str) -> Optional[FetchedMedia]:
+        cached = self._get_cached_from_memory(url)
+        if cached is None and self.cache_dir is not None:
+            cached = self._get_cached_from_disk(url)
+        return cached
+
+    def _get_cached_from_memory(self, url: str) -> Optional[FetchedMedia]:
+        with self._lock:
+            cached = self._memory.get(url)
+            if cached is not None:
+                self._memory.move_to_end(url)
+            return cached
+
+    def _add_to_memory(self, fetched: FetchedMedia) -> None:
+        size = len(fetched.content)
+        if size > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(fetched.url, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous.content)
+            self._memory[fetched.url] = fetched
+            self._memory_bytes += size
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted.content)
+
+    def _disk_paths(self, url: str) -> Tuple[Path, Path]:
+        key = sha256(url.encode()).hexdigest()
+        return self.cache_dir / key, self.cache_dir / f"{key}.json"  # type: ignore
+
+    def _get_cached_from_disk(self, url: str) -> Optional[FetchedMedia]:
+        content_path, meta_path = self._disk_paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+            content = content_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        fetched = FetchedMedia(content=content, **meta)
+        self._add_to_memory(fetched)
+        return fetched
+
+    def _write_to_disk(self, fetched: FetchedMedia) -> None:
+        if len(fetched.content) > self.max_disk_bytes:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)  # type: ignore
+            content_path, meta_path = self._disk_paths(fetched.url)
+            meta = {k: v for k, v in asdict(fetched).items() if k != "content"}
+            is_new = not content_path.exists()
+            content_path.write_bytes(fetched.content)
+            meta_path.write_text(json.dumps(meta))
+            if is_new:
+                self._prune_disk(added_bytes=len(fetched.content))
+        except OSError as e:
+            log_warning(f"Could not write media to the disk cache: {e}")
+
+    def _prune_disk(self, added_bytes: int) -> None:
+        """Remove the least recently fetched files once the on-disk cache exceeds max_disk_bytes"""
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(p.stat().st_size for p in self.cache_dir.iterdir() if p.suffix != ".json")  # type: ignore
+            else:
+                self._disk_bytes += added_bytes
+            if self._disk_bytes <= self.max_disk_bytes:
+                return
+
+            content_paths = sorted(
+                (p for p in self.cache_dir.iterdir() if p.suffix != ".json"),  # type: ignore
+                key=lambda p: p.stat().st_mtime,
+            )
+            for path in content_paths:
+                if self._disk_bytes <= self.max_disk_bytes:
+                    break
+                self._disk_bytes -= path.stat().st_size
+                path.unlink(missing_ok=True)
+                path.with_suffix(".json").unlink(missing_ok=True)
+
+
+_media_fetcher: Optional[MediaFetcher] = None
+
+
+def get_media_fetcher() -> MediaFetcher:
+    """Return the process-wide media fetcher"""
+    global _media_fetcher
+    if _media_fetcher is None:
+        _media_fetcher = MediaFetcher()
+    return _media_fetcher
+
+
+def set_media_fetcher(media_fetcher: MediaFetcher) -> None:
+    """Replace the process-wide media fetcher, e.g. to enable the on-disk cache"""
+    global _media_fetcher
+    _media_fetcher = media_fetcher
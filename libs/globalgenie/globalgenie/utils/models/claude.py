@@ -202,10 +202,78 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
     return None
 
 
+def _format_message(message: Message) -> Optional[Dict[str, Any]]:
+    """Format a user or assistant message for the Claude API. Returns None for an empty assistant message."""
+    content = message.content or ""
+    if message.role == "user":
+        # Copy the content, so the media added below is not added to the message itself
+        content = [{"type": "text", "text": content}] if isinstance(content, str) else list(content)
+
+        if message.images is not None:
+            for image in message.images:
+                image_content = _format_image_for_message(image)
+                if image_content:
+                    content.append(image_content)
+
+        if message.files is not None:
+            for file in message.files:
+                file_content = _format_file_for_message(file)
+                if file_content:
+                    content.append(file_content)
+
+        if message.audio is not None and len(message.audio) > 0:
+            log_warning("Audio input is currently unsupported.")
+
+        if message.videos is not None and len(message.videos) > 0:
+            log_warning("Video input is currently unsupported.")
+
+    elif message.role == "assistant":
+        content = []
+
+        if message.thinking is not None and message.provider_data is not None:
+            from anthropic.types import RedactedThinkingBlock, ThinkingBlock
+
+            content.append(
+                ThinkingBlock(
+                    thinking=message.thinking,
+                    signature=message.provider_data.get("signature"),
+                    type="thinking",
+                )
+            )
+
+        if message.redacted_thinking is not None:
+            from anthropic.types import RedactedThinkingBlock
+
+            content.append(RedactedThinkingBlock(data=message.redacted_thinking, type="redacted_thinking"))
+
+        if isinstance(message.content, str) and message.content and len(message.content.strip()) > 0:
+            content.append(TextBlock(text=message.content, type="text"))
+
+        if message.tool_calls:
+            for tool_call in message.tool_calls:
+                content.append(
+                    ToolUseBlock(
+                        id=tool_call["id"],
+                        input=json.loads(tool_call["function"]["arguments"])
+                        if "arguments" in tool_call["function"]
+                        else {},
+                        name=tool_call["function"]["name"],
+                        type="tool_use",
+                    )
+                )
+        # Skip empty assistant responses
+        if not content:
+            return None
+
+    return {"role": ROLE_MAP[message.role], "content": content}
+
+
 def format_messages(messages: List[Message]) -> Tuple[List[Dict[str, str]], str]:
     """
     Process the list of messages and separate them into API messages and system messages.
 
+    Messages are formatted once and reused across the requests of a run, see `Message.get_formatted`.
+
     Args:
         messages (List[Message]): The list of messages to process.
 
@@ -216,70 +284,11 @@ def format_messages(messages: List[Message]) -> Tuple[List[Dict[str, str]], str]
     system_messages: List[str] = []
 
     for message in messages:
-        content = message.content or ""
         if message.role == "system":
-            if content is not None:
-                system_messages.append(content)  # type: ignore
-            continue
-        elif message.role == "user":
-            if isinstance(content, str):
-                content = [{"type": "text", "text": content}]
-
-            if message.images is not None:
-                for image in message.images:
-                    image_content = _format_image_for_message(image)
-                    if image_content:
-                        content.append(image_content)
-
-            if message.files is not None:
-                for file in message.files:
-                    file_content = _format_file_for_message(file)
-                    if file_content:
-                        content.append(file_content)
-
-            if message.audio is not None and len(message.audio) > 0:
-                log_warning("Audio input is currently unsupported.")
-
-            if message.videos is not None and len(message.videos) > 0:
-                log_warning("Video input is currently unsupported.")
-
-        elif message.role == "assistant":
-            content = []
-
-            if message.thinking is not None and message.provider_data is not None:
-                from anthropic.types import RedactedThinkingBlock, ThinkingBlock
-
-                content.append(
-                    ThinkingBlock(
-                        thinking=message.thinking,
-                        signature=message.provider_data.get("signature"),
-                        type="thinking",
-                    )
-                )
-
-            if message.redacted_thinking is not None:
-                from anthropic.types import RedactedThinkingBlock
-
-                content.append(RedactedThinkingBlock(data=message.redacted_thinking, type="redacted_thinking"))
-
-            if isinstance(message.content, str) and message.content and len(message.content.strip()) > 0:
-                content.append(TextBlock(text=message.content, type="text"))
-
-            if message.tool_calls:
-                for tool_call in message.tool_calls:
-                    content.append(
-                        ToolUseBlock(
-                            id=tool_call["id"],
-                            input=json.loads(tool_call["function"]["arguments"])
-                            if "arguments" in tool_call["function"]
-                            else {},
-                            name=tool_call["function"]["name"],
-                            type="tool_use",
-                        )
-                    )
-        # Skip empty assistant responses
-        if message.role == "assistant" and not content:
+            system_messages.append(message.content or "")  # type: ignore
             continue
 
-        chat_messages.append({"role": ROLE_MAP[message.role], "content": content})  # type: ignore
+        formatted_message = message.get_formatted("claude", lambda: _format_message(message))
+        if formatted_message is not None:
+            chat_messages.append(formatted_message)  # type: ignore
     return chat_messages, " ".join(system_messages)
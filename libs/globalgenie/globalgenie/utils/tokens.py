@@ -0,0 +1,78 @@
+import json
+from typing import Callable, Dict, Optional
+
+from globalgenie.models.message import Message
+
+# Approximate number of characters per token, used when no tokenizer is registered for a model
+CHARS_PER_TOKEN = 4
+# Tokens added by providers for the role and separators of each message
+TOKENS_PER_MESSAGE = 4
+# Flat estimate for an image, audio or video attachment
+TOKENS_PER_MEDIA = 765
+
+# Token counting functions, keyed by model id prefix
+_tokenizers: Dict[str, Callable[[str], int]] = {}
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a text from its length"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def register_tokenizer(model_id_prefix: str, count_tokens: Callable[[str], int]) -> None:
+    """Register a token counting function for all models whose id starts with model_id_prefix"""
+    _tokenizers[model_id_prefix] = count_tokens
+
+
+def _get_tiktoken_counter(model_id: str) -> Optional[Callable[[str], int]]:
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        encoding = tiktoken.encoding_for_model(model_id)
+    except KeyError:
+        encoding = tiktoken.get_encoding("o200k_base")
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def get_tokenizer(model_id: Optional[str] = None) -> Callable[[str], int]:
+    """Return the token counting function for a model.
+
+    The registered tokenizer with the longest matching prefix is used. OpenAI models fall back to `tiktoken`
+    if it is installed, and all other models to a character based estimate.
+    """
+    if model_id is None:
+        return estimate_tokens
+
+    matches = [prefix for prefix in _tokenizers if model_id.startswith(prefix)]
+    if matches:
+        return _tokenizers[max(matches, key=len)]
+
+    if model_id.startswith(("gpt-", "o1", "o3", "o4", "chatgpt-")):
+        counter = _get_tiktoken_counter(model_id)
+        if counter is not None:
+            # Cache the counter, so the encoding is only loaded once
+            register_tokenizer(model_id, counter)
+            return counter
+
+    return estimate_tokens
+
+
+def count_message_tokens(message: Message, model_id: Optional[str] = None) -> int:
+    """Estimate the number of prompt tokens a message uses"""
+    count_tokens = get_tokenizer(model_id)
+
+    num_tokens = TOKENS_PER_MESSAGE
+    content = message.get_content_string()
+    if content:
+        num_tokens += count_tokens(content)
+    if message.tool_calls:
+        num_tokens += count_tokens(json.dumps(message.tool_calls, default=str))
+    if message.thinking:
+        num_tokens += count_tokens(message.thinking)
+
+    num_media = sum(len(media) for media in (message.images, message.audio, message.videos, message.files) if media)
+    num_tokens += num_media * TOKENS_PER_MEDIA
+    return num_tokens
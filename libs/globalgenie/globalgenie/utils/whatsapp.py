@@ -194,7 +194,7 @@ async def send_image_message_async(
         async with httpx.AsyncClient() as client:
             import json
 
-            log_debug(f"Request data: {json.dumps(data, indent=2)}")
+            log_debug(lambda: f"Request data: {json.dumps(data, indent=2)}")
             response = await client.post(url, headers=headers, json=data)
             response.raise_for_status()
             log_debug(f"Response: {response.text}")
@@ -243,7 +243,7 @@ def send_image_message(
     try:
         import json
 
-        log_debug(f"Request data: {json.dumps(data, indent=2)}")
+        log_debug(lambda: f"Request data: {json.dumps(data, indent=2)}")
         response = requests.post(url, headers=headers, json=data)
         response.raise_for_status()
         log_debug(f"Response: {response.text}")
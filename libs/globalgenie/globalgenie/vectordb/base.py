@@ -1,7 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-from globalgenie.document import Document
+from globalgenie.document import Document, get_document_id
 
 
 class VectorDb(ABC):
@@ -23,6 +24,24 @@ class VectorDb(ABC):
     async def async_doc_exists(self, document: Document) -> bool:
         raise NotImplementedError
 
+    @staticmethod
+    def get_document_key(document: Document) -> str:
+        """Return the key `existing_ids` identifies a document by: its id, or the id derived from its content"""
+        return document.id or get_document_id(document.content)
+
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys (see `get_document_key`) of the given documents that already exist in the vector db.
+
+        This is the batched form of `doc_exists`: backends match each document by whatever they store rows under,
+        e.g. a hash of the content or the document id. It checks one document at a time with `doc_exists`;
+        backends that can check many documents in a single round trip override it.
+        """
+        return {self.get_document_key(document) for document in documents if self.doc_exists(document)}
+
+    async def async_existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist in the vector db, without blocking the event loop"""
+        return await asyncio.to_thread(self.existing_ids, documents)
+
     @abstractmethod
     def name_exists(self, name: str) -> bool:
         raise NotImplementedError
@@ -34,6 +53,19 @@ class VectorDb(ABC):
     def id_exists(self, id: str) -> bool:
         raise NotImplementedError
 
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """Return the given ids that exist in the vector db.
+
+        The ids are the ids the backend stores rows under, e.g. the deterministic document ids or a hash of the
+        content. Checks one id at a time with `id_exists`; backends that can check many ids in a single query
+        override it.
+        """
+        return {id for id in ids if self.id_exists(id)}
+
+    async def async_ids_exist(self, ids: List[str]) -> Set[str]:
+        """Return the given ids that exist in the vector db, without blocking the event loop"""
+        return await asyncio.to_thread(self.ids_exist, ids)
+
     @abstractmethod
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         raise NotImplementedError
@@ -94,3 +126,11 @@ class VectorDb(ABC):
     @abstractmethod
     def delete(self) -> bool:
         raise NotImplementedError
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        """Delete the documents whose metadata contains all the given key-value pairs.
+
+        Returns:
+            bool: True if the documents were deleted, False otherwise.
+        """
+        raise NotImplementedError
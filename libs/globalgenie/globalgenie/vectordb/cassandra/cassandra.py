@@ -1,5 +1,10 @@
 import asyncio
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+try:
+    from cassio.table.utils import call_wrapped_async
+except (ImportError, ModuleNotFoundError):
+    raise ImportError("Could not import cassio python package. Please install it with pip install cassio.")
 
 from globalgenie.document import Document
 from globalgenie.embedder import Embedder
@@ -9,6 +14,9 @@ from globalgenie.vectordb.cassandra.index import GlobalGenieMetadataVectorCassan
 
 
 class Cassandra(VectorDb):
+    """Cassandra vector db. The async methods use the driver's async execution on the same session, so they do not
+    block a thread while waiting for the cluster."""
+
     def __init__(
         self,
         table_name: str,
@@ -36,15 +44,20 @@ class Cassandra(VectorDb):
         self.keyspace: str = keyspace
         self.initialize_table()
 
-    def initialize_table(self):
+    def initialize_table(self, async_setup: bool = False):
         self.table = GlobalGenieMetadataVectorCassandraTable(
             session=self.session,
             keyspace=self.keyspace,
             vector_dimension=1024,
             table=self.table_name,
             primary_key_type="TEXT",
+            async_setup=async_setup,
         )
 
+    async def _aexecute(self, query: str, parameters: Optional[Any] = None) -> Any:
+        """Execute a query with the driver's async execution and await its result"""
+        return await call_wrapped_async(self.session.execute_async, query, parameters)
+
     def create(self) -> None:
         """Create the table in Cassandra for storing vectors and metadata."""
         if not self.exists():
@@ -52,8 +65,11 @@ class Cassandra(VectorDb):
             self.initialize_table()
 
     async def async_create(self) -> None:
-        """Create the table asynchronously by running in a thread."""
-        await asyncio.to_thread(self.create)
+        """Create the table asynchronously."""
+        if not await self.async_exists():
+            log_debug(f"Cassandra VectorDB : Creating table {self.table_name}")
+            self.initialize_table(async_setup=True)
+            await self.table.db_setup_task
 
     def _row_to_document(self, row: Dict[str, Any]) -> Document:
         return Document(
@@ -72,7 +88,31 @@ class Cassandra(VectorDb):
 
     async def async_doc_exists(self, document: Document) -> bool:
         """Check if a document exists asynchronously."""
-        return await asyncio.to_thread(self.doc_exists, document)
+        query = f"SELECT COUNT(*) FROM {self.keyspace}.{self.table_name} WHERE row_id = %s"
+        result = await self._aexecute(query, (document.id,))
+        return result.one()[0] > 0
+
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist, in a single query. Rows are keyed by document id."""
+        doc_ids = list({document.id for document in documents if document.id})
+        if not doc_ids:
+            return set()
+        from cassandra.query import ValueSequence
+
+        query = f"SELECT row_id FROM {self.keyspace}.{self.table_name} WHERE row_id IN %s"
+        result = self.session.execute(query, (ValueSequence(doc_ids),))
+        return {row[0] for row in result}
+
+    async def async_existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist asynchronously, in a single query."""
+        doc_ids = list({document.id for document in documents if document.id})
+        if not doc_ids:
+            return set()
+        from cassandra.query import ValueSequence
+
+        query = f"SELECT row_id FROM {self.keyspace}.{self.table_name} WHERE row_id IN %s"
+        result = await self._aexecute(query, (ValueSequence(doc_ids),))
+        return {row[0] for row in result}
 
     def name_exists(self, name: str) -> bool:
         """Check if a document exists by name."""
@@ -82,7 +122,9 @@ class Cassandra(VectorDb):
 
     async def async_name_exists(self, name: str) -> bool:
         """Check if a document with given name exists asynchronously."""
-        return await asyncio.to_thread(self.name_exists, name)
+        query = f"SELECT COUNT(*) FROM {self.keyspace}.{self.table_name} WHERE document_name = %s ALLOW FILTERING"
+        result = await self._aexecute(query, (name,))
+        return result.one()[0] > 0
 
     def id_exists(self, id: str) -> bool:
         """Check if a document exists by ID."""
@@ -90,36 +132,63 @@ class Cassandra(VectorDb):
         result = self.session.execute(query, (id,))
         return result.one()[0] > 0
 
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """Return the IDs of the documents that exist, in a single query."""
+        if not ids:
+            return set()
+        from cassandra.query import ValueSequence
+
+        query = f"SELECT row_id FROM {self.keyspace}.{self.table_name} WHERE row_id IN %s"
+        result = self.session.execute(query, (ValueSequence(ids),))
+        return {row[0] for row in result}
+
+    async def async_ids_exist(self, ids: List[str]) -> Set[str]:
+        """Return the IDs of the documents that exist asynchronously, in a single query."""
+        if not ids:
+            return set()
+        from cassandra.query import ValueSequence
+
+        query = f"SELECT row_id FROM {self.keyspace}.{self.table_name} WHERE row_id IN %s"
+        result = await self._aexecute(query, (ValueSequence(ids),))
+        return {row[0] for row in result}
+
+    def _get_row(self, doc: Document) -> Dict[str, Any]:
+        doc.embed(embedder=self.embedder)
+        metadata = {key: str(value) for key, value in doc.meta_data.items()}
+        return dict(
+            row_id=doc.id,
+            vector=doc.embedding,
+            metadata=metadata or {},
+            body_blob=doc.content,
+            document_name=doc.name,
+        )
+
+    def _get_rows(self, documents: List[Document]) -> List[Dict[str, Any]]:
+        return [self._get_row(doc) for doc in documents]
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         log_debug(f"Cassandra VectorDB : Inserting Documents to the table {self.table_name}")
         futures = []
         for doc in documents:
-            doc.embed(embedder=self.embedder)
-            metadata = {key: str(value) for key, value in doc.meta_data.items()}
-            futures.append(
-                self.table.put_async(
-                    row_id=doc.id,
-                    vector=doc.embedding,
-                    metadata=metadata or {},
-                    body_blob=doc.content,
-                    document_name=doc.name,
-                )
-            )
+            futures.append(self.table.put_async(**self._get_row(doc)))
 
         for f in futures:
             f.result()
 
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.insert, documents, filters)
+        """Insert documents asynchronously, writing the rows concurrently."""
+        log_debug(f"Cassandra VectorDB : Inserting Documents to the table {self.table_name}")
+        # Embedders are synchronous, so embed in a thread to keep the event loop free
+        rows = await asyncio.to_thread(self._get_rows, documents)
+        await asyncio.gather(*[self.table.aput(**row) for row in rows])
 
     def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert or update documents based on primary key."""
         self.insert(documents, filters)
 
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Upsert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.upsert, documents, filters)
+        """Insert or update documents asynchronously based on primary key."""
+        await self.async_insert(documents, filters)
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """Keyword-based search on document metadata."""
@@ -129,8 +198,17 @@ class Cassandra(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        """Vector similarity search, asynchronously."""
+        log_debug(f"Cassandra VectorDB : Performing Vector Search on {self.table_name} with query {query}")
+        query_embedding = await asyncio.to_thread(self.embedder.get_embedding, query)
+        hits = list(
+            await self.table.ametric_ann_search(
+                vector=query_embedding,
+                n=limit,
+                metric="cos",
+            )
+        )
+        return self._search_to_documents(hits)
 
     def _search_to_documents(
         self,
@@ -158,8 +236,10 @@ class Cassandra(VectorDb):
         self.session.execute(drop_table_query)
 
     async def async_drop(self) -> None:
-        """Drop the table asynchronously by running in a thread."""
-        await asyncio.to_thread(self.drop)
+        """Drop the vector table in Cassandra asynchronously."""
+        log_debug(f"Cassandra VectorDB : Dropping Table {self.table_name}")
+        drop_table_query = f"DROP TABLE IF EXISTS {self.keyspace}.{self.table_name}"
+        await self._aexecute(drop_table_query)
 
     def exists(self) -> bool:
         """Check if the table exists in Cassandra."""
@@ -171,8 +251,13 @@ class Cassandra(VectorDb):
         return bool(result.one())
 
     async def async_exists(self) -> bool:
-        """Check if table exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.exists)
+        """Check if the table exists in Cassandra asynchronously."""
+        check_table_query = """
+        SELECT * FROM system_schema.tables
+        WHERE keyspace_name = %s AND table_name = %s
+        """
+        result = await self._aexecute(check_table_query, (self.keyspace, self.table_name))
+        return bool(result.one())
 
     def delete(self) -> bool:
         """Delete all documents in the table."""
@@ -1,11 +1,14 @@
 import asyncio
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 try:
+    from chromadb import AsyncHttpClient, HttpClient
     from chromadb import Client as ChromaDbClient
     from chromadb import PersistentClient as PersistentChromaDbClient
+    from chromadb.api import AsyncClientAPI
     from chromadb.api.client import ClientAPI
+    from chromadb.api.models.AsyncCollection import AsyncCollection
     from chromadb.api.models.Collection import Collection
     from chromadb.api.types import GetResult, QueryResult
 
@@ -21,6 +24,12 @@ from globalgenie.vectordb.distance import Distance
 
 
 class ChromaDb(VectorDb):
+    """Chroma vector db, in process, or on a Chroma server if `host` is set.
+
+    With a server, the async methods use a single AsyncHttpClient, so they do not block a thread while waiting for
+    the server. With an in-process client, they run the sync methods in a thread.
+    """
+
     def __init__(
         self,
         collection: str,
@@ -29,6 +38,8 @@ class ChromaDb(VectorDb):
         path: str = "tmp/chromadb",
         persistent_client: bool = False,
         reranker: Optional[Reranker] = None,
+        host: Optional[str] = None,
+        port: int = 8000,
         **kwargs,
     ):
         # Collection attributes
@@ -54,6 +65,14 @@ class ChromaDb(VectorDb):
         self.persistent_client: bool = persistent_client
         self.path: str = path
 
+        # Chroma server address, used instead of an in-process client if set
+        self.host: Optional[str] = host
+        self.port: int = port
+
+        # Async Chroma client and collection instances, reused across requests
+        self._async_client: Optional[AsyncClientAPI] = None
+        self._async_collection: Optional[AsyncCollection] = None
+
         # Reranker instance
         self.reranker: Optional[Reranker] = reranker
 
@@ -63,7 +82,14 @@ class ChromaDb(VectorDb):
     @property
     def client(self) -> ClientAPI:
         if self._client is None:
-            if not self.persistent_client:
+            if self.host is not None:
+                log_debug(f"Creating Chroma Http Client for {self.host}:{self.port}")
+                self._client = HttpClient(
+                    host=self.host,
+                    port=self.port,
+                    **self.kwargs,
+                )
+            elif not self.persistent_client:
                 log_debug("Creating Chroma Client")
                 self._client = ChromaDbClient(
                     **self.kwargs,
@@ -76,6 +102,23 @@ class ChromaDb(VectorDb):
                 )
         return self._client
 
+    async def get_async_client(self) -> AsyncClientAPI:
+        """Get or create the async client of the Chroma server."""
+        if self._async_client is None:
+            log_debug(f"Creating Async Chroma Http Client for {self.host}:{self.port}")
+            self._async_client = await AsyncHttpClient(
+                host=self.host,  # type: ignore
+                port=self.port,
+                **self.kwargs,
+            )
+        return self._async_client
+
+    async def _get_async_collection(self) -> AsyncCollection:
+        if self._async_collection is None:
+            client = await self.get_async_client()
+            self._async_collection = await client.get_collection(name=self.collection_name)
+        return self._async_collection
+
     def create(self) -> None:
         """Create the collection in ChromaDb."""
         if self.exists():
@@ -88,8 +131,16 @@ class ChromaDb(VectorDb):
             )
 
     async def async_create(self) -> None:
-        """Create the collection asynchronously by running in a thread."""
-        await asyncio.to_thread(self.create)
+        """Create the collection asynchronously."""
+        if self.host is None:
+            await asyncio.to_thread(self.create)
+            return
+
+        client = await self.get_async_client()
+        log_debug(f"Getting or creating collection: {self.collection_name}")
+        self._async_collection = await client.get_or_create_collection(
+            name=self.collection_name, metadata={"hnsw:space": self.distance.value}
+        )
 
     def doc_exists(self, document: Document) -> bool:
         """Check if a document exists in the collection.
@@ -115,7 +166,70 @@ class ChromaDb(VectorDb):
 
     async def async_doc_exists(self, document: Document) -> bool:
         """Check if a document exists asynchronously."""
-        return await asyncio.to_thread(self.doc_exists, document)
+        if self.host is None:
+            return await asyncio.to_thread(self.doc_exists, document)
+        return len(await self.async_existing_ids([document])) > 0
+
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist in the collection, in a single request.
+        Args:
+            documents (List[Document]): Documents to check.
+        Returns:
+            Set[str]: Keys (see `VectorDb.get_document_key`) of the documents that exist."""
+        if not self.client:
+            logger.warning("Client not initialized")
+            return set()
+        if not documents:
+            return set()
+
+        doc_ids = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        try:
+            existing_doc_ids = self.ids_exist(list(set(doc_ids)))
+        except Exception as e:
+            logger.error(f"Error checking if documents exist: {e}")
+            return set()
+        return {
+            self.get_document_key(document)
+            for document, doc_id in zip(documents, doc_ids)
+            if doc_id in existing_doc_ids
+        }
+
+    async def async_existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist in the collection asynchronously, in a single request."""
+        if self.host is None:
+            return await asyncio.to_thread(self.existing_ids, documents)
+        if not documents:
+            return set()
+
+        doc_ids = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        try:
+            existing_doc_ids = await self.async_ids_exist(list(set(doc_ids)))
+        except Exception as e:
+            logger.error(f"Error checking if documents exist: {e}")
+            return set()
+        return {
+            self.get_document_key(document)
+            for document, doc_id in zip(documents, doc_ids)
+            if doc_id in existing_doc_ids
+        }
+
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """Return the given document ids that exist in the collection, in a single request."""
+        if not ids:
+            return set()
+        collection: Collection = self.client.get_collection(name=self.collection_name)
+        collection_data: GetResult = collection.get(ids=ids, include=[])  # type: ignore
+        return set(collection_data.get("ids", []))
+
+    async def async_ids_exist(self, ids: List[str]) -> Set[str]:
+        """Return the given document ids that exist in the collection asynchronously, in a single request."""
+        if self.host is None:
+            return await asyncio.to_thread(self.ids_exist, ids)
+        if not ids:
+            return set()
+        collection = await self._get_async_collection()
+        collection_data: GetResult = await collection.get(ids=ids, include=[])  # type: ignore
+        return set(collection_data.get("ids", []))
 
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection.
@@ -145,14 +259,27 @@ class ChromaDb(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to merge with document metadata
         """
         log_debug(f"Inserting {len(documents)} documents")
+        if not self._collection:
+            self._collection = self.client.get_collection(name=self.collection_name)
+
+        ids, docs, docs_embeddings, docs_metadata = self._prepare_documents(documents, filters)
+
+        if self._collection is None:
+            logger.warning("Collection does not exist")
+        else:
+            if len(docs) > 0:
+                self._collection.add(ids=ids, embeddings=docs_embeddings, documents=docs, metadatas=docs_metadata)
+                log_debug(f"Committed {len(docs)} documents")
+
+    def _prepare_documents(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List, List, List, List]:
+        """Embed documents and return their ids, contents, embeddings and metadata, merged with the filters."""
         ids: List = []
         docs: List = []
         docs_embeddings: List = []
         docs_metadata: List = []
 
-        if not self._collection:
-            self._collection = self.client.get_collection(name=self.collection_name)
-
         for document in documents:
             document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -168,17 +295,21 @@ class ChromaDb(VectorDb):
             ids.append(doc_id)
             docs_metadata.append(metadata)
             log_debug(f"Prepared document: {document.id} | {document.name} | {metadata}")
-
-        if self._collection is None:
-            logger.warning("Collection does not exist")
-        else:
-            if len(docs) > 0:
-                self._collection.add(ids=ids, embeddings=docs_embeddings, documents=docs, metadatas=docs_metadata)
-                log_debug(f"Committed {len(docs)} documents")
+        return ids, docs, docs_embeddings, docs_metadata
 
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.insert, documents, filters)
+        """Insert documents into the collection asynchronously."""
+        if self.host is None:
+            await asyncio.to_thread(self.insert, documents, filters)
+            return
+
+        log_debug(f"Inserting {len(documents)} documents")
+        collection = await self._get_async_collection()
+        # Embedders are synchronous, so embed in a thread to keep the event loop free
+        ids, docs, docs_embeddings, docs_metadata = await asyncio.to_thread(self._prepare_documents, documents, filters)
+        if len(docs) > 0:
+            await collection.add(ids=ids, embeddings=docs_embeddings, documents=docs, metadatas=docs_metadata)
+            log_debug(f"Committed {len(docs)} documents")
 
     def upsert_available(self) -> bool:
         """Check if upsert is available in ChromaDB."""
@@ -192,23 +323,10 @@ class ChromaDb(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         log_debug(f"Upserting {len(documents)} documents")
-        ids: List = []
-        docs: List = []
-        docs_embeddings: List = []
-        docs_metadata: List = []
-
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
-        for document in documents:
-            document.embed(embedder=self.embedder)
-            cleaned_content = document.content.replace("\x00", "\ufffd")
-            doc_id = md5(cleaned_content.encode()).hexdigest()
-            docs_embeddings.append(document.embedding)
-            docs.append(cleaned_content)
-            ids.append(doc_id)
-            docs_metadata.append(document.meta_data)
-            log_debug(f"Upserted document: {document.id} | {document.name} | {document.meta_data}")
+        ids, docs, docs_embeddings, docs_metadata = self._prepare_documents(documents)
 
         if self._collection is None:
             logger.warning("Collection does not exist")
@@ -218,8 +336,17 @@ class ChromaDb(VectorDb):
                 log_debug(f"Committed {len(docs)} documents")
 
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Upsert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.upsert, documents, filters)
+        """Upsert documents into the collection asynchronously."""
+        if self.host is None:
+            await asyncio.to_thread(self.upsert, documents, filters)
+            return
+
+        log_debug(f"Upserting {len(documents)} documents")
+        collection = await self._get_async_collection()
+        ids, docs, docs_embeddings, docs_metadata = await asyncio.to_thread(self._prepare_documents, documents)
+        if len(docs) > 0:
+            await collection.upsert(ids=ids, embeddings=docs_embeddings, documents=docs, metadatas=docs_metadata)
+            log_debug(f"Committed {len(docs)} documents")
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """Search the collection for a query.
@@ -254,7 +381,14 @@ class ChromaDb(VectorDb):
             include=["metadatas", "documents", "embeddings", "distances", "uris"],
         )
 
-        # Build search results
+        search_results = self._build_search_results(result)
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def _build_search_results(self, result: QueryResult) -> List[Document]:
         search_results: List[Document] = []
 
         ids = result.get("ids", [[]])[0]
@@ -279,11 +413,6 @@ class ChromaDb(VectorDb):
                 )
         except Exception as e:
             logger.error(f"Error building search results: {e}")
-
-        if self.reranker:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
-
-        log_info(f"Found {len(search_results)} documents")
         return search_results
 
     def _convert_filters(self, filters: Dict[str, Any]) -> Dict[str, Any]:
@@ -314,8 +443,30 @@ class ChromaDb(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        """Search the collection for a query asynchronously."""
+        if self.host is None:
+            return await asyncio.to_thread(self.search, query, limit, filters)
+
+        query_embedding = await asyncio.to_thread(self.embedder.get_embedding, query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        collection = await self._get_async_collection()
+        where_filter = self._convert_filters(filters) if filters else None
+        result: QueryResult = await collection.query(
+            query_embeddings=query_embedding,
+            n_results=limit,
+            where=where_filter,
+            include=["metadatas", "documents", "embeddings", "distances", "uris"],  # type: ignore
+        )
+
+        search_results = self._build_search_results(result)
+        if self.reranker:
+            search_results = await asyncio.to_thread(self.reranker.rerank, query=query, documents=search_results)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
 
     def drop(self) -> None:
         """Delete the collection."""
@@ -324,8 +475,16 @@ class ChromaDb(VectorDb):
             self.client.delete_collection(name=self.collection_name)
 
     async def async_drop(self) -> None:
-        """Drop the collection asynchronously by running in a thread."""
-        await asyncio.to_thread(self.drop)
+        """Delete the collection asynchronously."""
+        if self.host is None:
+            await asyncio.to_thread(self.drop)
+            return
+
+        if await self.async_exists():
+            log_debug(f"Deleting collection: {self.collection_name}")
+            client = await self.get_async_client()
+            await client.delete_collection(name=self.collection_name)
+            self._async_collection = None
 
     def exists(self) -> bool:
         """Check if the collection exists."""
@@ -337,8 +496,17 @@ class ChromaDb(VectorDb):
         return False
 
     async def async_exists(self) -> bool:
-        """Check if collection exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.exists)
+        """Check if the collection exists asynchronously."""
+        if self.host is None:
+            return await asyncio.to_thread(self.exists)
+
+        try:
+            client = await self.get_async_client()
+            await client.get_collection(name=self.collection_name)
+            return True
+        except Exception as e:
+            log_debug(f"Collection does not exist: {e}")
+        return False
 
     def get_count(self) -> int:
         """Get the count of documents in the collection."""
@@ -360,3 +528,16 @@ class ChromaDb(VectorDb):
         except Exception as e:
             logger.error(f"Error clearing collection: {e}")
             return False
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        """Delete the documents whose metadata contains all the given key-value pairs"""
+        try:
+            if not self._collection:
+                self._collection = self.client.get_collection(name=self.collection_name)
+            conditions = [{key: {"$eq": value}} for key, value in metadata.items()]
+            where = conditions[0] if len(conditions) == 1 else {"$and": conditions}
+            self._collection.delete(where=where)  # type: ignore
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents by metadata: {e}")
+            return False
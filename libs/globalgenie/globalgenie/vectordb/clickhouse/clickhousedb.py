@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from globalgenie.vectordb.clickhouse.index import HNSW
 
@@ -242,6 +242,55 @@ class Clickhouse(VectorDb):
         )
         return bool(result.result_rows)
 
+    def _get_content_hashes(self, documents: List[Document]) -> List[str]:
+        return [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """
+        Return the keys of the given documents whose content hash exists in the table, in a single query
+
+        Args:
+            documents (List[Document]): Documents to check
+        """
+        if not documents:
+            return set()
+        content_hashes = self._get_content_hashes(documents)
+        parameters = self._get_base_parameters()
+        parameters["content_hashes"] = list(set(content_hashes))
+
+        result = self.client.query(
+            "SELECT content_hash FROM {database_name:Identifier}.{table_name:Identifier} "
+            "WHERE content_hash IN {content_hashes:Array(String)}",
+            parameters=parameters,
+        )
+        existing_hashes = {row[0] for row in result.result_rows}
+        return {
+            self.get_document_key(document)
+            for document, content_hash in zip(documents, content_hashes)
+            if content_hash in existing_hashes
+        }
+
+    async def async_existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents whose content hash exists in the table asynchronously."""
+        if not documents:
+            return set()
+        content_hashes = self._get_content_hashes(documents)
+        async_client = await self._ensure_async_client()
+        parameters = self._get_base_parameters()
+        parameters["content_hashes"] = list(set(content_hashes))
+
+        result = await async_client.query(
+            "SELECT content_hash FROM {database_name:Identifier}.{table_name:Identifier} "
+            "WHERE content_hash IN {content_hashes:Array(String)}",
+            parameters=parameters,
+        )
+        existing_hashes = {row[0] for row in result.result_rows}
+        return {
+            self.get_document_key(document)
+            for document, content_hash in zip(documents, content_hashes)
+            if content_hash in existing_hashes
+        }
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -287,6 +336,38 @@ class Clickhouse(VectorDb):
         )
         return bool(result)
 
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """
+        Return the ids of the rows that exist, in a single query
+
+        Args:
+            ids (List[str]): Ids to check
+        """
+        if not ids:
+            return set()
+        parameters = self._get_base_parameters()
+        parameters["ids"] = ids
+
+        result = self.client.query(
+            "SELECT id FROM {database_name:Identifier}.{table_name:Identifier} WHERE id IN {ids:Array(String)}",
+            parameters=parameters,
+        )
+        return {row[0] for row in result.result_rows}
+
+    async def async_ids_exist(self, ids: List[str]) -> Set[str]:
+        """Return the ids of the rows that exist asynchronously, in a single query."""
+        if not ids:
+            return set()
+        parameters = self._get_base_parameters()
+        async_client = await self._ensure_async_client()
+        parameters["ids"] = ids
+
+        result = await async_client.query(
+            "SELECT id FROM {database_name:Identifier}.{table_name:Identifier} WHERE id IN {ids:Array(String)}",
+            parameters=parameters,
+        )
+        return {row[0] for row in result.result_rows}
+
     def insert(
         self,
         documents: List[Document],
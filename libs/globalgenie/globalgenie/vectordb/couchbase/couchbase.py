@@ -1,7 +1,7 @@
 import asyncio
 import time
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 from globalgenie.document import Document
 from globalgenie.embedder import Embedder
@@ -292,6 +292,29 @@ class CouchbaseSearch(VectorDb):
         doc_id = md5(document.content.encode("utf-8")).hexdigest()
         return self.id_exists(doc_id)
 
+    def _get_existing_ids_query(self) -> str:
+        keyspace = f"{self.bucket_name}.{self.scope_name}.{self.collection_name}"
+        return f"SELECT RAW META().id FROM {keyspace} USE KEYS $ids"
+
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist in the bucket, checking their content ids in one query."""
+        if not documents:
+            return set()
+        doc_ids = [md5(document.content.encode("utf-8")).hexdigest() for document in documents]
+        try:
+            result = self.scope.query(
+                self._get_existing_ids_query(), QueryOptions(named_parameters={"ids": list(set(doc_ids))})
+            )
+            existing_doc_ids = set(result.rows())
+        except Exception as e:
+            logger.error(f"Error checking document existence: {e}")
+            return set()
+        return {
+            self.get_document_key(document)
+            for document, doc_id in zip(documents, doc_ids)
+            if doc_id in existing_doc_ids
+        }
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Insert documents into the Couchbase bucket. Fails if any document already exists.
@@ -617,6 +640,17 @@ class CouchbaseSearch(VectorDb):
             logger.error(f"Error checking document existence: {e}")
             return False
 
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """Return the IDs of the documents that exist in the bucket, in a single query."""
+        if not ids:
+            return set()
+        try:
+            result = self.scope.query(self._get_existing_ids_query(), QueryOptions(named_parameters={"ids": ids}))
+            return set(result.rows())
+        except Exception as e:
+            logger.error(f"Error checking document existence: {e}")
+            return set()
+
     # === ASYNC SUPPORT USING acouchbase ===
 
     async def _create_async_cluster_instance(self) -> AsyncCluster:
@@ -821,6 +855,38 @@ class CouchbaseSearch(VectorDb):
             logger.error(f"[async] Error checking document existence: {e}")
             return False
 
+    async def async_existing_ids(self, documents: List[Document]) -> Set[str]:
+        if not documents:
+            return set()
+        doc_ids = [md5(document.content.encode("utf-8")).hexdigest() for document in documents]
+        try:
+            async_scope_instance = await self.get_async_scope()
+            result = async_scope_instance.query(
+                self._get_existing_ids_query(), QueryOptions(named_parameters={"ids": list(set(doc_ids))})
+            )
+            existing_doc_ids = {row async for row in result.rows()}
+        except Exception as e:
+            logger.error(f"[async] Error checking document existence: {e}")
+            return set()
+        return {
+            self.get_document_key(document)
+            for document, doc_id in zip(documents, doc_ids)
+            if doc_id in existing_doc_ids
+        }
+
+    async def async_ids_exist(self, ids: List[str]) -> Set[str]:
+        if not ids:
+            return set()
+        try:
+            async_scope_instance = await self.get_async_scope()
+            result = async_scope_instance.query(
+                self._get_existing_ids_query(), QueryOptions(named_parameters={"ids": ids})
+            )
+            return {row async for row in result.rows()}
+        except Exception as e:
+            logger.error(f"[async] Error checking document existence: {e}")
+            return set()
+
     async def async_name_exists(self, name: str) -> bool:
         try:
             query = f"SELECT name FROM {self.bucket_name}.{self.scope_name}.{self.collection_name} WHERE name = $name LIMIT 1"
@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import lancedb
@@ -204,6 +204,47 @@ class LanceDb(VectorDb):
             self.table = self.connection.open_table(name=self.table_name)
         return self.doc_exists(document)
 
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """
+        Return the keys of the given documents that exist in the table, in a single query
+
+        Args:
+            documents (List[Document]): Documents to check
+        """
+        if self.table is None or not documents:
+            return set()
+        doc_ids = [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+        unique_doc_ids = set(doc_ids)
+        id_list = ", ".join(f"'{doc_id}'" for doc_id in unique_doc_ids)
+        try:
+            result = (
+                self.table.search()
+                .where(f"{self._id} IN ({id_list})")
+                .select([self._id])
+                .limit(len(unique_doc_ids))
+                .to_arrow()
+            )
+            existing_doc_ids = set(result[self._id].to_pylist())
+        except Exception:
+            # Search sometimes fails with stale cache data, it means the docs don't exist
+            return set()
+        return {
+            self.get_document_key(document)
+            for document, doc_id in zip(documents, doc_ids)
+            if doc_id in existing_doc_ids
+        }
+
+    async def async_existing_ids(self, documents: List[Document]) -> Set[str]:
+        """
+        Asynchronously return the keys of the given documents that exist in the table
+
+        Args:
+            documents (List[Document]): Documents to check
+        """
+        if self.connection:
+            self.table = self.connection.open_table(name=self.table_name)
+        return self.existing_ids(documents)
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Insert documents into the database.
@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 try:
     import asyncio
@@ -328,6 +328,38 @@ class Milvus(VectorDb):
         )
         return len(collection_points) > 0
 
+    def _get_doc_ids(self, documents: List[Document]) -> List[str]:
+        return [md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents]
+
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """
+        Return the keys of the given documents that exist in the collection, in a single request
+
+        Args:
+            documents (List[Document]): Documents to check
+        """
+        if not self.client or not documents:
+            return set()
+        doc_ids = self._get_doc_ids(documents)
+        existing_doc_ids = self.ids_exist(list(set(doc_ids)))
+        return {
+            self.get_document_key(document)
+            for document, doc_id in zip(documents, doc_ids)
+            if doc_id in existing_doc_ids
+        }
+
+    async def async_existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist in the collection asynchronously, in a single request."""
+        if not documents:
+            return set()
+        doc_ids = self._get_doc_ids(documents)
+        existing_doc_ids = await self.async_ids_exist(list(set(doc_ids)))
+        return {
+            self.get_document_key(document)
+            for document, doc_id in zip(documents, doc_ids)
+            if doc_id in existing_doc_ids
+        }
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -357,6 +389,26 @@ class Milvus(VectorDb):
             return len(collection_points) > 0
         return False
 
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        if self.client and ids:
+            collection_points = self.client.get(
+                collection_name=self.collection,
+                ids=ids,
+                output_fields=["id"],
+            )
+            return {point["id"] for point in collection_points}
+        return set()
+
+    async def async_ids_exist(self, ids: List[str]) -> Set[str]:
+        if not ids:
+            return set()
+        collection_points = await self.async_client.get(
+            collection_name=self.collection,
+            ids=ids,
+            output_fields=["id"],
+        )
+        return {point["id"] for point in collection_points}
+
     def _insert_hybrid_document(self, document: Document) -> None:
         """Insert a document with both dense and sparse vectors."""
         data = self._prepare_document_data(document, include_vectors=True)
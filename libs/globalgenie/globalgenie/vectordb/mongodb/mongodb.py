@@ -1,6 +1,6 @@
 import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from bson import ObjectId
 
@@ -463,6 +463,24 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document existence: {e}")
             return False
 
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist in the collection, in a single query."""
+        if not documents:
+            return set()
+        try:
+            collection = self._get_collection()
+            doc_ids = [md5(document.content.encode("utf-8")).hexdigest() for document in documents]
+            existing_doc_ids = {doc["_id"] for doc in collection.find({"_id": {"$in": list(set(doc_ids))}}, {"_id": 1})}
+            log_debug(f"{len(existing_doc_ids)} of {len(documents)} documents exist")
+            return {
+                self.get_document_key(document)
+                for document, doc_id in zip(documents, doc_ids)
+                if doc_id in existing_doc_ids
+            }
+        except Exception as e:
+            logger.error(f"Error checking document existence: {e}")
+            return set()
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection."""
         try:
@@ -485,6 +503,19 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document ID existence: {e}")
             return False
 
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """Return the given IDs that exist in the collection, in a single query."""
+        if not ids:
+            return set()
+        try:
+            collection = self._get_collection()
+            existing_ids = {doc["_id"] for doc in collection.find({"_id": {"$in": ids}}, {"_id": 1})}
+            log_debug(f"{len(existing_ids)} of {len(ids)} document IDs exist")
+            return existing_ids
+        except Exception as e:
+            logger.error(f"Error checking document ID existence: {e}")
+            return set()
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents into the MongoDB collection."""
         log_debug(f"Inserting {len(documents)} documents")
@@ -962,6 +993,25 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document existence asynchronously: {e}")
             return False
 
+    async def async_existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist in the collection asynchronously, in a single query."""
+        if not documents:
+            return set()
+        try:
+            collection = await self._get_async_collection()
+            doc_ids = [md5(document.content.encode("utf-8")).hexdigest() for document in documents]
+            cursor = collection.find({"_id": {"$in": list(set(doc_ids))}}, {"_id": 1})
+            existing_doc_ids = {doc["_id"] async for doc in cursor}
+            log_debug(f"{len(existing_doc_ids)} of {len(documents)} documents exist")
+            return {
+                self.get_document_key(document)
+                for document, doc_id in zip(documents, doc_ids)
+                if doc_id in existing_doc_ids
+            }
+        except Exception as e:
+            logger.error(f"Error checking document existence asynchronously: {e}")
+            return set()
+
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents asynchronously."""
         log_debug(f"Inserting {len(documents)} documents asynchronously")
@@ -1,6 +1,6 @@
 import asyncio
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Set, Union, cast
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -28,6 +28,9 @@ from globalgenie.vectordb.distance import Distance
 from globalgenie.vectordb.pgvector.index import HNSW, Ivfflat
 from globalgenie.vectordb.search import SearchType
 
+# Number of content hashes or ids checked per query by `existing_ids` and `ids_exist`
+EXISTING_IDS_BATCH_SIZE = 1000
+
 
 class PgVector(VectorDb):
     """
@@ -246,6 +249,40 @@ class PgVector(VectorDb):
         """Check if document exists asynchronously by running in a thread."""
         return await asyncio.to_thread(self.doc_exists, document)
 
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """
+        Return the keys of the given documents whose content hash exists in the table.
+
+        The content hashes are checked in batches of `EXISTING_IDS_BATCH_SIZE`, one query per batch, to stay well
+        below the bind parameter limit of PostgreSQL.
+
+        Args:
+            documents (List[Document]): The documents to check.
+
+        Returns:
+            Set[str]: The keys (see `VectorDb.get_document_key`) of the documents that exist.
+
+        Raises:
+            Exception: If a query fails, so that existing documents are not inserted again.
+        """
+        content_hashes = [safe_content_hash(document.content) for document in documents]
+        unique_hashes = list(dict.fromkeys(content_hashes))
+        existing_hashes: Set[str] = set()
+        try:
+            with self.Session() as sess, sess.begin():
+                for start in range(0, len(unique_hashes), EXISTING_IDS_BATCH_SIZE):
+                    batch = unique_hashes[start : start + EXISTING_IDS_BATCH_SIZE]
+                    stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(batch))
+                    existing_hashes.update(row[0] for row in sess.execute(stmt))
+        except Exception as e:
+            logger.error(f"Error checking if records exist: {e}")
+            raise
+        return {
+            self.get_document_key(document)
+            for document, content_hash in zip(documents, content_hashes)
+            if content_hash in existing_hashes
+        }
+
     def name_exists(self, name: str) -> bool:
         """
         Check if a document with the given name exists in the table.
@@ -274,6 +311,30 @@ class PgVector(VectorDb):
         """
         return self._record_exists(self.table.c.id, id)
 
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """
+        Return the given IDs that exist in the table, with one query per `EXISTING_IDS_BATCH_SIZE` IDs.
+
+        Args:
+            ids (List[str]): The IDs to check.
+
+        Returns:
+            Set[str]: The IDs that exist.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        existing: Set[str] = set()
+        try:
+            with self.Session() as sess, sess.begin():
+                for start in range(0, len(unique_ids), EXISTING_IDS_BATCH_SIZE):
+                    stmt = select(self.table.c.id).where(
+                        self.table.c.id.in_(unique_ids[start : start + EXISTING_IDS_BATCH_SIZE])
+                    )
+                    existing.update(row[0] for row in sess.execute(stmt))
+        except Exception as e:
+            logger.error(f"Error checking if records exist: {e}")
+            raise
+        return existing
+
     def _clean_content(self, content: str) -> str:
         """
         Clean the content by replacing null characters.
@@ -513,7 +574,7 @@ class PgVector(VectorDb):
             stmt = stmt.limit(limit)
 
             # Log the query for debugging
-            log_debug(f"Vector search query: {stmt}")
+            log_debug(lambda: f"Vector search query: {stmt}")
 
             # Execute the query
             try:
@@ -615,7 +676,7 @@ class PgVector(VectorDb):
             stmt = stmt.limit(limit)
 
             # Log the query for debugging
-            log_debug(f"Keyword search query: {stmt}")
+            log_debug(lambda: f"Keyword search query: {stmt}")
 
             # Execute the query
             try:
@@ -736,7 +797,7 @@ class PgVector(VectorDb):
             stmt = stmt.limit(limit)
 
             # Log the query for debugging
-            log_debug(f"Hybrid search query: {stmt}")
+            log_debug(lambda: f"Hybrid search query: {stmt}")
 
             # Execute the query
             try:
@@ -1038,6 +1099,28 @@ class PgVector(VectorDb):
             sess.rollback()
             return False
 
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        """
+        Delete the records whose metadata contains all the given key-value pairs.
+
+        Args:
+            metadata (Dict[str, Any]): Key-value pairs to match.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        from sqlalchemy import delete
+
+        try:
+            with self.Session() as sess:
+                sess.execute(delete(self.table).where(self.table.c.meta_data.contains(metadata)))
+                sess.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Error deleting rows by metadata from table '{self.table.fullname}': {e}")
+            sess.rollback()
+            return False
+
     def __deepcopy__(self, memo):
         """
         Create a deep copy of the PgVector instance, handling unpickleable attributes.
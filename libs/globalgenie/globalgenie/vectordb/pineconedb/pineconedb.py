@@ -1,5 +1,8 @@
 import asyncio
-from typing import Any, Dict, List, Optional, Union
+from os import getenv
+from typing import Any, Dict, List, Optional, Set, Union
+
+import httpx
 
 try:
     from packaging import version
@@ -17,6 +20,7 @@ try:
 
     from pinecone import Pinecone, PodSpec, ServerlessSpec
     from pinecone.config import Config
+    from pinecone.core.openapi.shared import API_VERSION
 
 except ImportError:
     raise ImportError("The `pinecone` package is not installed, please install using `pip install pinecone`.")
@@ -45,6 +49,8 @@ class PineconeDb(VectorDb):
         api_key (Optional[str], optional): The Pinecone API key. Defaults to None.
         host (Optional[str], optional): The Pinecone host. Defaults to None.
         config (Optional[Config], optional): The Pinecone config. Defaults to None.
+        max_concurrent_requests (int, optional): The maximum number of batches `async_upsert` embeds and sends at
+            the same time. Defaults to 10.
         **kwargs: Additional keyword arguments.
 
     Attributes:
@@ -62,6 +68,9 @@ class PineconeDb(VectorDb):
         metric (Optional[str]): The metric used for similarity search.
         timeout (Optional[int]): The timeout for Pinecone operations.
         kwargs (Optional[Dict[str, str]]): Additional keyword arguments.
+
+    The async methods call the Pinecone REST API with a shared `httpx.AsyncClient`, as the v5 client has no asyncio
+    support. Embedding documents and creating the index still run in a thread.
     """
 
     def __init__(
@@ -82,10 +91,14 @@ class PineconeDb(VectorDb):
         use_hybrid_search: bool = False,
         hybrid_alpha: float = 0.5,
         reranker: Optional[Reranker] = None,
+        max_concurrent_requests: int = 10,
         **kwargs,
     ):
         self._client = None
         self._index = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._index_host: Optional[str] = None
         self.api_key: Optional[str] = api_key
         self.host: Optional[str] = host
         self.config: Optional[Config] = config
@@ -101,6 +114,7 @@ class PineconeDb(VectorDb):
         self.kwargs: Optional[Dict[str, str]] = kwargs
         self.use_hybrid_search: bool = use_hybrid_search
         self.hybrid_alpha: float = hybrid_alpha
+        self.max_concurrent_requests: int = max_concurrent_requests
         if self.use_hybrid_search:
             try:
                 from pinecone_text.sparse import BM25Encoder
@@ -155,6 +169,51 @@ class PineconeDb(VectorDb):
             self._index = self.client.Index(self.name)
         return self._index
 
+    def get_async_client(self) -> httpx.AsyncClient:
+        """The httpx client used by the async methods, shared by all requests made on the same event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed or self._async_client_loop is not loop:
+            log_debug("Creating Pinecone async client")
+            api_key = self.api_key or getenv("PINECONE_API_KEY")
+            if api_key is None:
+                raise ValueError("Pinecone API key is not set. Set `api_key` or the PINECONE_API_KEY env variable.")
+            headers = {"Api-Key": api_key, "X-Pinecone-API-Version": API_VERSION, **self.additional_headers}
+            self._async_client = httpx.AsyncClient(headers=headers, timeout=self.timeout or 30)
+            self._async_client_loop = loop
+        return self._async_client
+
+    def _get_control_plane_url(self, path: str) -> str:
+        host = self.host or "https://api.pinecone.io"
+        if not host.startswith("http"):
+            host = f"https://{host}"
+        return f"{host.rstrip('/')}{path}"
+
+    async def _aget_index_url(self, path: str) -> str:
+        """Return the URL of a data plane endpoint of the index, looking up the index host once."""
+        if self._index_host is None:
+            response = await self.get_async_client().get(self._get_control_plane_url(f"/indexes/{self.name}"))
+            response.raise_for_status()
+            self._index_host = response.json()["host"]
+        return f"https://{self._index_host}{path}"
+
+    async def _arequest(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send a request to a data plane endpoint of the index.
+
+        A 404 means the cached index host is stale, e.g. because the index was recreated by another process, so the
+        host is looked up again and the request retried once.
+        """
+        response = await self.get_async_client().request(method, await self._aget_index_url(path), **kwargs)
+        if response.status_code == 404:
+            log_debug(f"Pinecone index host {self._index_host} not found, looking it up again")
+            self._index_host = None
+            response = await self.get_async_client().request(method, await self._aget_index_url(path), **kwargs)
+        response.raise_for_status()
+        return response
+
+    async def _afetch(self, ids: List[str]) -> Dict[str, Any]:
+        response = await self._arequest("GET", "/vectors/fetch", params={"ids": ids, "namespace": self.namespace or ""})
+        return response.json().get("vectors", {})
+
     def exists(self) -> bool:
         """Check if the index exists.
 
@@ -167,7 +226,7 @@ class PineconeDb(VectorDb):
 
     async def async_exists(self) -> bool:
         """Check if the index exists asynchronously."""
-        return await asyncio.to_thread(self.exists)
+        return await self.async_name_exists(self.name)
 
     def create(self) -> None:
         """Create the index if it does not exist."""
@@ -210,7 +269,35 @@ class PineconeDb(VectorDb):
 
     async def async_doc_exists(self, document: Document) -> bool:
         """Check if a document exists in the index asynchronously."""
-        return await asyncio.to_thread(self.doc_exists, document)
+        if not document.id:
+            return False
+        vectors = await self._afetch([document.id])
+        return len(vectors) > 0
+
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist in the index, in a single fetch.
+
+        Args:
+            documents (List[Document]): The documents to check.
+
+        Returns:
+            Set[str]: The keys of the documents that exist. Documents are stored by id, so those without one
+                never exist.
+
+        """
+        doc_ids = list({document.id for document in documents if document.id})
+        if not doc_ids:
+            return set()
+        response = self.index.fetch(ids=doc_ids, namespace=self.namespace)
+        return set(response.vectors.keys())
+
+    async def async_existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist in the index, in a single fetch, asynchronously."""
+        doc_ids = list({document.id for document in documents if document.id})
+        if not doc_ids:
+            return set()
+        vectors = await self._afetch(doc_ids)
+        return set(vectors.keys())
 
     def name_exists(self, name: str) -> bool:
         """Check if an index with the given name exists.
@@ -229,8 +316,12 @@ class PineconeDb(VectorDb):
             return False
 
     async def async_name_exists(self, name: str) -> bool:
-        """Check if an index with the given name exists asynchronously."""
-        return await asyncio.to_thread(self.name_exists, name)
+        """Check if an index with the given name exists asynchronously. Errors other than a 404 are raised."""
+        response = await self.get_async_client().get(self._get_control_plane_url(f"/indexes/{name}"))
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        return True
 
     def upsert(
         self,
@@ -291,20 +382,19 @@ class PineconeDb(VectorDb):
         batches = [documents[i : i + _batch_size] for i in range(0, len(documents), _batch_size)]
         log_debug(f"Processing {len(documents)} documents in {len(batches)} batches for upsert")
 
-        # Process each batch in parallel
-        async def process_batch(batch_docs):
-            return await asyncio.to_thread(self._prepare_vectors, batch_docs)
-
-        # Run all batches in parallel
-        batch_vectors = await asyncio.gather(*[process_batch(batch) for batch in batches])
+        # Embed and upsert the batches concurrently, at most max_concurrent_requests at a time
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
 
-        # Flatten vectors
-        all_vectors = [vector for batch in batch_vectors for vector in batch]
+        async def upsert_batch(batch_docs: List[Document]) -> None:
+            async with semaphore:
+                vectors = await asyncio.to_thread(self._prepare_vectors, batch_docs)
+                body = {
+                    "vectors": [self._to_rest_vector(vector) for vector in vectors],
+                    "namespace": namespace or self.namespace or "",
+                }
+                await self._arequest("POST", "/vectors/upsert", json=body)
 
-        # Upsert all vectors
-        await asyncio.to_thread(
-            self._upsert_vectors, all_vectors, namespace or self.namespace, batch_size, show_progress
-        )
+        await asyncio.gather(*[upsert_batch(batch) for batch in batches])
 
         log_debug(f"Finished async upsert of {len(documents)} documents")
 
@@ -324,14 +414,13 @@ class PineconeDb(VectorDb):
             vectors.append(data_to_upsert)
         return vectors
 
-    def _upsert_vectors(self, vectors, namespace, batch_size, show_progress):
-        """Upsert vectors to the index."""
-        self.index.upsert(
-            vectors=vectors,
-            namespace=namespace,
-            batch_size=batch_size,
-            show_progress=show_progress,
-        )
+    @staticmethod
+    def _to_rest_vector(vector: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a vector prepared for the Pinecone client to the format of the REST API."""
+        rest_vector = {key: value for key, value in vector.items() if key != "sparse_values"}
+        if vector.get("sparse_values") is not None:
+            rest_vector["sparseValues"] = vector["sparse_values"]
+        return rest_vector
 
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Pinecone doesn't support insert. Raise an error."""
@@ -454,7 +543,45 @@ class PineconeDb(VectorDb):
         include_values: Optional[bool] = None,
     ) -> List[Document]:
         """Search for similar documents in the index asynchronously."""
-        return await asyncio.to_thread(self.search, query, limit, filters, namespace, include_values)
+        # Embedders are synchronous, so embed in a thread to keep the event loop free
+        dense_embedding = await asyncio.to_thread(self.embedder.get_embedding, query)
+        if dense_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        body: Dict[str, Any] = {
+            "topK": limit,
+            "namespace": namespace or self.namespace or "",
+            "includeValues": bool(include_values),
+            "includeMetadata": True,
+        }
+        if filters:
+            body["filter"] = filters
+        if self.use_hybrid_search:
+            sparse_embedding = await asyncio.to_thread(self.sparse_encoder.encode_queries, query)
+            body["vector"], body["sparseVector"] = self._hybrid_scale(
+                dense_embedding, sparse_embedding, alpha=self.hybrid_alpha
+            )
+        else:
+            body["vector"] = dense_embedding
+
+        response = await self._arequest("POST", "/query", json=body)
+
+        search_results = []
+        for match in response.json().get("matches", []):
+            metadata = match.get("metadata")
+            search_results.append(
+                Document(
+                    content=(metadata.get("text", "") if metadata is not None else ""),
+                    id=match["id"],
+                    embedding=match.get("values") or None,
+                    meta_data=metadata,
+                )
+            )
+
+        if self.reranker:
+            search_results = await asyncio.to_thread(self.reranker.rerank, query=query, documents=search_results)
+        return search_results
 
     def optimize(self) -> None:
         """Optimize the index.
@@ -478,4 +605,9 @@ class PineconeDb(VectorDb):
             return False
 
     async def async_drop(self) -> None:
-        raise NotImplementedError(f"Async not supported on {self.__class__.__name__}.")
+        """Delete the index asynchronously if it exists."""
+        if await self.async_exists():
+            log_debug(f"Deleting index: {self.name}")
+            response = await self.get_async_client().delete(self._get_control_plane_url(f"/indexes/{self.name}"))
+            response.raise_for_status()
+            self._index_host = None
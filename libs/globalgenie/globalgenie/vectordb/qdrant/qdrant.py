@@ -1,5 +1,6 @@
+import uuid
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
@@ -12,7 +13,7 @@ except ImportError:
 from globalgenie.document import Document
 from globalgenie.embedder import Embedder
 from globalgenie.reranker.base import Reranker
-from globalgenie.utils.log import log_debug, log_info
+from globalgenie.utils.log import log_debug, log_error, log_info, log_warning
 from globalgenie.vectordb.base import VectorDb
 from globalgenie.vectordb.distance import Distance
 from globalgenie.vectordb.search import SearchType
@@ -20,6 +21,8 @@ from globalgenie.vectordb.search import SearchType
 DEFAULT_DENSE_VECTOR_NAME = "dense"
 DEFAULT_SPARSE_VECTOR_NAME = "sparse"
 DEFAULT_SPARSE_MODEL = "Qdrant/bm25"
+# Number of point ids retrieved per request by `ids_exist`
+EXISTING_IDS_BATCH_SIZE = 1000
 
 
 class Qdrant(VectorDb):
@@ -260,6 +263,86 @@ class Qdrant(VectorDb):
         )
         return len(collection_points) > 0
 
+    def _get_point_ids(self, documents: List[Document]) -> List[str]:
+        """Return the point ids of documents, the md5 hash of their content in uuid format as returned by Qdrant"""
+        return [
+            str(uuid.UUID(hex=md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest()))
+            for document in documents
+        ]
+
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """
+        Return the given point ids that exist in the collection, retrieving `EXISTING_IDS_BATCH_SIZE` points per request
+
+        Args:
+            ids (List[str]): Point ids to check
+
+        Raises:
+            Exception: If a request fails, so that existing documents are not inserted again
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        existing: Set[str] = set()
+        try:
+            for start in range(0, len(unique_ids), EXISTING_IDS_BATCH_SIZE):
+                collection_points = self.client.retrieve(
+                    collection_name=self.collection,
+                    ids=unique_ids[start : start + EXISTING_IDS_BATCH_SIZE],  # type: ignore
+                    with_payload=False,
+                    with_vectors=False,
+                )
+                existing.update(str(point.id) for point in collection_points)
+        except Exception as e:
+            log_error(f"Error checking if documents exist: {e}")
+            raise
+        return existing
+
+    async def async_ids_exist(self, ids: List[str]) -> Set[str]:
+        """Return the given point ids that exist in the collection asynchronously, in batched requests."""
+        unique_ids = list(dict.fromkeys(ids))
+        existing: Set[str] = set()
+        try:
+            for start in range(0, len(unique_ids), EXISTING_IDS_BATCH_SIZE):
+                collection_points = await self.async_client.retrieve(
+                    collection_name=self.collection,
+                    ids=unique_ids[start : start + EXISTING_IDS_BATCH_SIZE],  # type: ignore
+                    with_payload=False,
+                    with_vectors=False,
+                )
+                existing.update(str(point.id) for point in collection_points)
+        except Exception as e:
+            log_error(f"Error checking if documents exist: {e}")
+            raise
+        return existing
+
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """
+        Return the keys of the given documents that exist in the collection, checking their point ids with `ids_exist`
+
+        Args:
+            documents (List[Document]): Documents to check
+        """
+        if not self.client or not documents:
+            return set()
+        point_ids = self._get_point_ids(documents)
+        existing_point_ids = self.ids_exist(point_ids)
+        return {
+            self.get_document_key(document)
+            for document, point_id in zip(documents, point_ids)
+            if point_id in existing_point_ids
+        }
+
+    async def async_existing_ids(self, documents: List[Document]) -> Set[str]:
+        """Return the keys of the given documents that exist in the collection asynchronously."""
+        if not documents:
+            return set()
+        point_ids = self._get_point_ids(documents)
+        existing_point_ids = await self.async_ids_exist(point_ids)
+        return {
+            self.get_document_key(document)
+            for document, point_id in zip(documents, point_ids)
+            if point_id in existing_point_ids
+        }
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -704,3 +787,15 @@ class Qdrant(VectorDb):
 
     def delete(self) -> bool:
         return self.client.delete_collection(collection_name=self.collection)
+
+    def delete_by_metadata(self, metadata: Dict[str, Any]) -> bool:
+        """Delete the points whose metadata contains all the given key-value pairs"""
+        try:
+            self.client.delete(
+                collection_name=self.collection,
+                points_selector=models.FilterSelector(filter=self._format_filters(metadata)),  # type: ignore
+            )
+            return True
+        except Exception as e:
+            log_warning(f"Error deleting points by metadata: {e}")
+            return False
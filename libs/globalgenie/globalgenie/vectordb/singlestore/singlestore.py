@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from sqlalchemy.dialects import mysql
@@ -137,6 +137,27 @@ class SingleStore(VectorDb):
             result = sess.execute(stmt).first()
             return result is not None
 
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """
+        Return the keys of the given documents whose content hash exists in the table, in a single query
+
+        Args:
+            documents (List[Document]): Documents to check
+        """
+        if not documents:
+            return set()
+        content_hashes = [
+            md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents
+        ]
+        with self.Session.begin() as sess:
+            stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(set(content_hashes)))
+            existing_hashes = {row[0] for row in sess.execute(stmt)}
+        return {
+            self.get_document_key(document)
+            for document, content_hash in zip(documents, content_hashes)
+            if content_hash in existing_hashes
+        }
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -161,6 +182,19 @@ class SingleStore(VectorDb):
             result = sess.execute(stmt).first()
             return result is not None
 
+    def ids_exist(self, ids: List[str]) -> Set[str]:
+        """
+        Return the ids of the rows that exist, in a single query
+
+        Args:
+            ids (List[str]): Ids to check
+        """
+        if not ids:
+            return set()
+        with self.Session.begin() as sess:
+            stmt = select(self.table.c.id).where(self.table.c.id.in_(ids))
+            return {row[0] for row in sess.execute(stmt)}
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, batch_size: int = 10) -> None:
         """
         Insert documents into the table.
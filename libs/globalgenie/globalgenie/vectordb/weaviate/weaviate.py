@@ -2,7 +2,7 @@ import json
 import uuid
 from hashlib import md5
 from os import getenv
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from warnings import filterwarnings
@@ -201,6 +201,75 @@ class Weaviate(VectorDb):
         finally:
             await client.close()
 
+    def _get_doc_uuids(self, documents: List[Document]) -> List[uuid.UUID]:
+        """Return the UUIDs of documents, generated from their content like on insert"""
+        return [
+            uuid.UUID(hex=md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest()[:32])
+            for document in documents
+        ]
+
+    def existing_ids(self, documents: List[Document]) -> Set[str]:
+        """
+        Return the keys of the given documents that exist, in a single query.
+
+        Args:
+            documents (List[Document]): Documents to check
+
+        Returns:
+            Set[str]: Keys (see `VectorDb.get_document_key`) of the documents that exist
+        """
+        documents = [document for document in documents if document and document.content]
+        if not documents:
+            return set()
+        doc_uuids = self._get_doc_uuids(documents)
+        unique_doc_uuids = list(set(doc_uuids))
+
+        collection = self.get_client().collections.get(self.collection)
+        response = collection.query.fetch_objects(
+            filters=Filter.by_id().contains_any(unique_doc_uuids),
+            limit=len(unique_doc_uuids),
+            return_properties=[],
+        )
+        existing_uuids = {obj.uuid for obj in response.objects}
+        return {
+            self.get_document_key(document)
+            for document, doc_uuid in zip(documents, doc_uuids)
+            if doc_uuid in existing_uuids
+        }
+
+    async def async_existing_ids(self, documents: List[Document]) -> Set[str]:
+        """
+        Return the keys of the given documents that exist asynchronously, in a single query.
+
+        Args:
+            documents (List[Document]): Documents to check
+
+        Returns:
+            Set[str]: Keys (see `VectorDb.get_document_key`) of the documents that exist
+        """
+        documents = [document for document in documents if document and document.content]
+        if not documents:
+            return set()
+        doc_uuids = self._get_doc_uuids(documents)
+        unique_doc_uuids = list(set(doc_uuids))
+
+        client = await self.get_async_client()
+        try:
+            collection = client.collections.get(self.collection)
+            response = await collection.query.fetch_objects(
+                filters=Filter.by_id().contains_any(unique_doc_uuids),
+                limit=len(unique_doc_uuids),
+                return_properties=[],
+            )
+        finally:
+            await client.close()
+        existing_uuids = {obj.uuid for obj in response.objects}
+        return {
+            self.get_document_key(document)
+            for document, doc_uuid in zip(documents, doc_uuids)
+            if doc_uuid in existing_uuids
+        }
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a document with the given name exists in Weaviate.
@@ -1,4 +1,6 @@
+from globalgenie.workflow.v2.cache import FileStepCache, InMemoryStepCache, StepCache
 from globalgenie.workflow.v2.condition import Condition
+from globalgenie.workflow.v2.execution import ExecutionContext, get_execution_context, set_execution_context
 from globalgenie.workflow.v2.loop import Loop
 from globalgenie.workflow.v2.parallel import Parallel
 from globalgenie.workflow.v2.router import Router
@@ -18,4 +20,10 @@ __all__ = [
     "WorkflowExecutionInput",
     "StepInput",
     "StepOutput",
+    "StepCache",
+    "InMemoryStepCache",
+    "FileStepCache",
+    "ExecutionContext",
+    "get_execution_context",
+    "set_execution_context",
 ]
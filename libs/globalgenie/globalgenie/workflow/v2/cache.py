@@ -0,0 +1,192 @@
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from tempfile import gettempdir
+from time import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from globalgenie.utils.log import log_debug, log_warning
+from globalgenie.workflow.v2.types import StepInput, StepOutput
+
+CachedStepOutput = Union[StepOutput, List[StepOutput]]
+
+
+def as_step_output_list(step_output: CachedStepOutput) -> List[StepOutput]:
+    return step_output if isinstance(step_output, list) else [step_output]
+
+
+async def aiter_step_outputs(step_output: CachedStepOutput) -> AsyncIterator[StepOutput]:
+    """Yield cached step outputs, in place of the events of a streaming step"""
+    for output in as_step_output_list(step_output):
+        yield output
+
+
+async def aiter_events(events: List[Any]) -> AsyncIterator[Any]:
+    """Yield the events of a list, e.g. the replayed events of a cached step"""
+    for event in events:
+        yield event
+
+
+def _to_jsonable(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(exclude_none=True)
+    return value
+
+
+def hash_step_input(step_input: StepInput) -> str:
+    """Hash the content of a StepInput.
+
+    Only the content that is passed to the step is hashed, not run ids or timestamps of previous responses,
+    so the same input produces the same hash across runs.
+    """
+    previous_step_content = {
+        name: _to_jsonable(output.content) for name, output in (step_input.previous_step_outputs or {}).items()
+    }
+    data = {
+        "message": _to_jsonable(step_input.message),
+        "previous_step_content": _to_jsonable(step_input.previous_step_content),
+        "previous_step_outputs": previous_step_content,
+        "additional_data": step_input.additional_data,
+        "images": [img.to_dict() for img in step_input.images or []],
+        "videos": [vid.to_dict() for vid in step_input.videos or []],
+        "audio": [aud.to_dict() for aud in step_input.audio or []],
+    }
+    return sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class StepCache(ABC):
+    """Caches the outputs of workflow steps, keyed by the identity of the step and a hash of its input.
+
+    Only successful outputs are cached. The identity of a step is its position, type and name, so change the
+    step name (or clear the cache) when the agent or function behind a step changes.
+    """
+
+    def __init__(self, ttl: Optional[float] = 24 * 60 * 60):
+        """
+        Args:
+            ttl: Seconds after which a cached output expires. Outputs never expire if None.
+        """
+        self.ttl = ttl
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Return the timestamp and serialized outputs stored for a key"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write(self, key: str, created_at: float, data: Any) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def get_key(self, workflow: str, step_index: int, step: Any, step_input: StepInput) -> str:
+        step_name = getattr(step, "name", None) or f"step_{step_index + 1}"
+        step_id = getattr(step, "step_id", None) or ""
+        identity = f"{workflow}:{step_index}:{type(step).__name__}:{step_name}:{step_id}"
+        return sha256(f"{identity}:{hash_step_input(step_input)}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedStepOutput]:
+        entry = self._read(key)
+        if entry is None:
+            return None
+        created_at, data = entry
+        if self.ttl is not None and time() - created_at > self.ttl:
+            self._delete(key)
+            return None
+        try:
+            if isinstance(data, list):
+                return [StepOutput.from_dict(output) for output in data]
+            return StepOutput.from_dict(data)
+        except Exception as e:
+            log_warning(f"Could not read cached step output: {e}")
+            return None
+
+    def set(self, key: str, step_output: CachedStepOutput) -> None:
+        outputs = as_step_output_list(step_output)
+        if not outputs or not all(output.success for output in outputs):
+            return
+        try:
+            if isinstance(step_output, list):
+                data: Any = [output.to_dict() for output in step_output]
+            else:
+                data = step_output.to_dict()
+            self._write(key, time(), data)
+        except Exception as e:
+            log_warning(f"Could not cache step output: {e}")
+
+
+class InMemoryStepCache(StepCache):
+    """Keeps step outputs in process memory, bounded to `max_entries`"""
+
+    def __init__(self, ttl: Optional[float] = 24 * 60 * 60, max_entries: int = 1000):
+        super().__init__(ttl=ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _write(self, key: str, created_at: float, data: Any) -> None:
+        with self._lock:
+            self._entries[key] = (created_at, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileStepCache(StepCache):
+    """Stores step outputs as json files, so they survive process restarts"""
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, ttl: Optional[float] = 24 * 60 * 60):
+        super().__init__(ttl=ttl)
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(gettempdir()) / "globalgenie_cache" / "workflow_steps"
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            entry: Dict[str, Any] = json.loads(self._path(key).read_text())
+        except (OSError, ValueError):
+            return None
+        return entry.get("created_at", 0), entry.get("data")
+
+    def _write(self, key: str, created_at: float, data: Any) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"created_at": created_at, "data": data}, default=str))
+        tmp_path.replace(path)
+        log_debug(f"Cached step output: {key}")
+
+    def _delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
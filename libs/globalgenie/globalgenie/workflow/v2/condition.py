@@ -44,6 +44,9 @@ class Condition:
     name: Optional[str] = None
     description: Optional[str] = None
 
+    # Names of the steps whose outputs this step uses. Steps of a workflow run as a dependency graph if set
+    depends_on: Optional[List[str]] = None
+
     def _prepare_steps(self):
         """Prepare the steps for execution - mirrors workflow logic"""
         from globalgenie.agent.agent import Agent
@@ -0,0 +1,248 @@
+import asyncio
+import queue
+import threading
+from collections import deque
+from functools import partial
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from globalgenie.utils.log import log_debug
+from globalgenie.workflow.v2.execution import get_execution_context
+
+# Yielded by the DagScheduler after the last item of a step
+STEP_DONE = object()
+
+
+def get_step_name(step: Any, index: int) -> str:
+    return getattr(step, "name", None) or f"step_{index + 1}"
+
+
+class StepGraph:
+    """The dependency graph of workflow steps, built from the `depends_on` names declared by each step.
+
+    Steps that do not declare dependencies can start right away.
+    """
+
+    def __init__(self, steps: Sequence[Any]):
+        self.names: List[str] = [get_step_name(step, i) for i, step in enumerate(steps)]
+        index_by_name: Dict[str, int] = {}
+        for i, name in enumerate(self.names):
+            if name in index_by_name:
+                raise ValueError(f"Step names must be unique to declare dependencies, found '{name}' twice")
+            index_by_name[name] = i
+
+        self.dependencies: List[List[int]] = []
+        self.dependents: List[List[int]] = [[] for _ in steps]
+        for i, step in enumerate(steps):
+            dependencies: List[int] = []
+            for name in getattr(step, "depends_on", None) or []:
+                if name not in index_by_name:
+                    raise ValueError(f"Step '{self.names[i]}' depends on unknown step '{name}'")
+                dependencies.append(index_by_name[name])
+                self.dependents[index_by_name[name]].append(i)
+            self.dependencies.append(dependencies)
+
+        self._check_for_cycles()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _check_for_cycles(self) -> None:
+        remaining = [len(dependencies) for dependencies in self.dependencies]
+        ready = [i for i, count in enumerate(remaining) if count == 0]
+        visited = 0
+        while ready:
+            i = ready.pop()
+            visited += 1
+            for dependent in self.dependents[i]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if visited < len(self):
+            cycle = [self.names[i] for i, count in enumerate(remaining) if count > 0]
+            raise ValueError(f"Step dependencies contain a cycle between: {', '.join(cycle)}")
+
+    def get_downstream(self, index: int) -> Set[int]:
+        """Return all steps that depend on a step, directly or indirectly"""
+        downstream: Set[int] = set()
+        stack = list(self.dependents[index])
+        while stack:
+            i = stack.pop()
+            if i not in downstream:
+                downstream.add(i)
+                stack.extend(self.dependents[i])
+        return downstream
+
+
+class DagScheduler:
+    """Runs the steps of a StepGraph concurrently, as soon as the steps they depend on are done.
+
+    At most `max_concurrency` steps run at the same time, in the shared ExecutionContext, so they count towards its
+    thread and async step limits. Items produced by the steps are yielded in the order the steps are declared,
+    whatever order they run in, so events are deterministic: the items of the first unfinished step are yielded
+    as they are produced, the items of later steps are buffered until it is done.
+    Each step's items are followed by STEP_DONE. If a step fails, the error is raised when its items are
+    reached, and the steps that depend on it are not run.
+    """
+
+    def __init__(self, graph: StepGraph, max_concurrency: int = 4, completed: Optional[Set[int]] = None):
+        """
+        Args:
+            graph: The step dependency graph.
+            max_concurrency: Maximum number of steps running at the same time.
+            completed: Steps that already completed, e.g. in a resumed run. They are not run or yielded.
+        """
+        self.graph = graph
+        self.max_concurrency = max(1, max_concurrency)
+        self.completed: Set[int] = completed or set()
+
+    def _get_pending(self) -> Tuple[List[int], Dict[int, int]]:
+        pending = [i for i in range(len(self.graph)) if i not in self.completed]
+        remaining = {
+            i: sum(1 for dependency in self.graph.dependencies[i] if dependency not in self.completed) for i in pending
+        }
+        return pending, remaining
+
+    def run(self, run_step: Callable[[int], Iterator[Any]]) -> Generator[Tuple[int, Any], None, None]:
+        """Run the steps in the shared workflow thread pool, yielding (step index, item) for the items produced
+        by `run_step`
+        """
+        pending, remaining = self._get_pending()
+        step_queues: Dict[int, "queue.Queue[Tuple[str, Any]]"] = {i: queue.Queue() for i in pending}
+        ready: Deque[int] = deque(i for i in pending if remaining[i] == 0)
+        condition = threading.Condition()
+        running = 0
+        stopped = False
+        execution_context = get_execution_context()
+
+        def fail(index: int, error: BaseException) -> None:
+            step_queues[index].put(("error", error))
+            for downstream in self.graph.get_downstream(index):
+                step_queues[downstream].put(("error", error))
+
+        def take_ready() -> List[int]:
+            # Called with the condition held
+            nonlocal running
+            started: List[int] = []
+            while ready and not stopped and running < self.max_concurrency:
+                started.append(ready.popleft())
+                running += 1
+            return started
+
+        def worker(index: int, queue_time: float = 0.0) -> None:
+            nonlocal running
+            while True:
+                failed = True
+                try:
+                    if not stopped:
+                        for item in run_step(index):
+                            step_queues[index].put(("item", item))
+                    failed = False
+                except Exception as e:
+                    fail(index, e)
+                finally:
+                    with condition:
+                        running -= 1
+                        if not failed and not stopped:
+                            step_queues[index].put(("done", None))
+                            for dependent in self.graph.dependents[index]:
+                                remaining[dependent] -= 1
+                                if remaining[dependent] == 0:
+                                    ready.append(dependent)
+                        next_steps = take_ready()
+                        condition.notify_all()
+                if not next_steps:
+                    return
+                # Run the first ready step in this worker and submit the others
+                index = next_steps[0]
+                start(next_steps[1:])
+
+        def start(indexes: List[int]) -> None:
+            for i in indexes:
+                execution_context.submit(partial(worker, i))
+
+        try:
+            with condition:
+                next_steps = take_ready()
+            start(next_steps)
+
+            for i in pending:
+                log_debug(f"Waiting for step {i + 1}: {self.graph.names[i]}")
+                while True:
+                    kind, item = step_queues[i].get()
+                    if kind == "error":
+                        raise item
+                    if kind == "done":
+                        yield i, STEP_DONE
+                        break
+                    yield i, item
+        finally:
+            with condition:
+                stopped = True
+                condition.wait_for(lambda: running == 0)
+
+    async def arun(self, arun_step: Callable[[int], AsyncIterator[Any]]) -> AsyncGenerator[Tuple[int, Any], None]:
+        """Run the steps as asyncio tasks, yielding (step index, item) for the items produced by `arun_step`"""
+        pending, remaining = self._get_pending()
+        step_queues: Dict[int, "asyncio.Queue[Tuple[str, Any]]"] = {i: asyncio.Queue() for i in pending}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        execution_context = get_execution_context()
+        tasks: Set[asyncio.Task] = set()
+
+        def fail(index: int, error: BaseException) -> None:
+            step_queues[index].put_nowait(("error", error))
+            for downstream in self.graph.get_downstream(index):
+                step_queues[downstream].put_nowait(("error", error))
+
+        async def worker(index: int) -> None:
+            async with semaphore, execution_context.async_slot():
+                try:
+                    async for item in arun_step(index):
+                        step_queues[index].put_nowait(("item", item))
+                except Exception as e:
+                    fail(index, e)
+                    return
+            step_queues[index].put_nowait(("done", None))
+            for dependent in self.graph.dependents[index]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    start(dependent)
+
+        def start(index: int) -> None:
+            task = asyncio.create_task(worker(index))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        try:
+            for i in pending:
+                if remaining[i] == 0:
+                    start(i)
+
+            for i in pending:
+                log_debug(f"Waiting for step {i + 1}: {self.graph.names[i]}")
+                while True:
+                    kind, item = await step_queues[i].get()
+                    if kind == "error":
+                        raise item
+                    if kind == "done":
+                        yield i, STEP_DONE
+                        break
+                    yield i, item
+        finally:
+            for task in list(tasks):
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,231 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+from globalgenie.utils.log import log_debug
+from globalgenie.workflow.v2.types import StepOutput
+
+T = TypeVar("T")
+
+# Set in tasks that hold an async step slot, so nested Parallel blocks do not wait for slots held by their parents
+_holds_async_slot: ContextVar[bool] = ContextVar("holds_async_slot", default=False)
+
+
+class ExecutionContext:
+    """Bounded resources shared by the steps of all workflows in the process.
+
+    Parallel blocks run their steps in one shared thread pool of `max_workers` threads instead of a new pool per
+    execution. When all workers are busy, the remaining steps run in the calling thread, so nested Parallel blocks
+    never wait on each other and the number of threads stays bounded. Async Parallel blocks run at most
+    `max_async_steps` steps at the same time per event loop.
+
+    `provider_limits` caps the number of agent and team steps running at the same time per model provider, e.g.
+    {"openai": 8}, across all workflows. The time a step waits for a worker or a provider slot is recorded as
+    `queue_time` in its metrics.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 32,
+        max_async_steps: int = 64,
+        provider_limits: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Args:
+            max_workers: Number of threads shared by Parallel blocks.
+            max_async_steps: Maximum number of steps of async Parallel blocks running at the same time.
+            provider_limits: Maximum number of concurrent steps per model provider, keyed by provider name.
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_async_steps = max(1, max_async_steps)
+        self.provider_limits: Dict[str, int] = {
+            provider.lower(): max(1, limit) for provider, limit in (provider_limits or {}).items()
+        }
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._worker_slots = threading.BoundedSemaphore(self.max_workers)
+        self._provider_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            WeakKeyDictionary()
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="workflow")
+            return self._executor
+
+    def _get_async_semaphore(self, key: str, limit: int) -> asyncio.Semaphore:
+        # asyncio semaphores are bound to an event loop, so keep one set per loop
+        semaphores = self._async_semaphores.setdefault(asyncio.get_running_loop(), {})
+        if key not in semaphores:
+            semaphores[key] = asyncio.Semaphore(limit)
+        return semaphores[key]
+
+    def _run_in_worker(self, func: Callable[[float], T], queued_at: float) -> T:
+        try:
+            return func(monotonic() - queued_at)
+        finally:
+            self._worker_slots.release()
+
+    def _submit(self, func: Callable[[float], T], queued_at: float) -> Optional["Future[T]"]:
+        if self._worker_slots.acquire(blocking=False):
+            return self._get_executor().submit(self._run_in_worker, func, queued_at)
+        return None
+
+    def submit(self, func: Callable[[float], Any]) -> None:
+        """Run the function in the shared thread pool without waiting for it, or in the calling thread if all
+        workers are busy. The function is called with the number of seconds it waited to start.
+        """
+        queued_at = monotonic()
+        if self._submit(func, queued_at) is None:
+            log_debug("All workflow workers are busy, running step in the calling thread")
+            func(monotonic() - queued_at)
+
+    def run_concurrently(self, funcs: Sequence[Callable[[float], T]]) -> List[T]:
+        """Run the functions in the shared thread pool and return their results in order.
+
+        Each function is called with the number of seconds it waited to start.
+        """
+        queued_at = monotonic()
+        results: List[Any] = [None] * len(funcs)
+        futures: List[Tuple[int, "Future[T]"]] = []
+        for i, func in enumerate(funcs):
+            future = self._submit(func, queued_at)
+            if future is not None:
+                futures.append((i, future))
+            else:
+                log_debug("All workflow workers are busy, running step in the calling thread")
+                results[i] = func(monotonic() - queued_at)
+        for i, future in futures:
+            results[i] = future.result()
+        return results
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[float]:
+        """Hold one of the `max_async_steps` slots of the running event loop. Yields the seconds waited for it.
+
+        Nested in a step that already holds a slot, no slot is taken.
+        """
+        if _holds_async_slot.get():
+            yield 0.0
+            return
+
+        semaphore = self._get_async_semaphore("steps", self.max_async_steps)
+        started_at = monotonic()
+        async with semaphore:
+            token = _holds_async_slot.set(True)
+            try:
+                yield monotonic() - started_at
+            finally:
+                _holds_async_slot.reset(token)
+
+    async def arun_concurrently(self, funcs: Sequence[Callable[[float], Awaitable[T]]]) -> List[T]:
+        """Run the coroutine functions concurrently, at most `max_async_steps` at a time, returning results in order.
+
+        Each function is called with the number of seconds it waited to start.
+        """
+
+        async def run(func: Callable[[float], Awaitable[T]]) -> T:
+            async with self.async_slot() as queue_time:
+                return await func(queue_time)
+
+        return list(await asyncio.gather(*[run(func) for func in funcs]))
+
+    @contextmanager
+    def provider_slot(self, provider: Optional[str]) -> Iterator[float]:
+        """Hold a slot of the provider's concurrency limit, if it has one. Yields the seconds waited for it."""
+        key = provider.lower() if provider else ""
+        limit = self.provider_limits.get(key)
+        if limit is None:
+            yield 0.0
+            return
+
+        with self._lock:
+            if key not in self._provider_semaphores:
+                self._provider_semaphores[key] = threading.BoundedSemaphore(limit)
+            semaphore = self._provider_semaphores[key]
+        started_at = monotonic()
+        semaphore.acquire()
+        try:
+            yield monotonic() - started_at
+        finally:
+            semaphore.release()
+
+    @asynccontextmanager
+    async def aprovider_slot(self, provider: Optional[str]) -> AsyncIterator[float]:
+        """Hold a slot of the provider's concurrency limit in async code. Yields the seconds waited for it."""
+        key = provider.lower() if provider else ""
+        limit = self.provider_limits.get(key)
+        if limit is None:
+            yield 0.0
+            return
+
+        semaphore = self._get_async_semaphore(f"provider:{key}", limit)
+        started_at = monotonic()
+        async with semaphore:
+            yield monotonic() - started_at
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+def add_queue_time(step_output: Union[StepOutput, List[StepOutput]], queue_time: float) -> None:
+    """Add the time a step waited for a worker or provider slot to its metrics. Waits under 1ms are ignored."""
+    if queue_time < 0.001:
+        return
+    for output in step_output if isinstance(step_output, list) else [step_output]:
+        if output.metrics is None:
+            output.metrics = {
+                "step_name": output.step_name,
+                "executor_type": output.executor_type or "unknown",
+                "executor_name": output.executor_name or "unknown",
+                "metrics": None,
+            }
+        output.metrics["queue_time"] = output.metrics.get("queue_time", 0.0) + queue_time
+
+
+_execution_context: Optional[ExecutionContext] = None
+_execution_context_lock = threading.Lock()
+
+
+def get_execution_context() -> ExecutionContext:
+    """Return the process-wide execution context for workflow steps"""
+    global _execution_context
+    if _execution_context is None:
+        with _execution_context_lock:
+            if _execution_context is None:
+                _execution_context = ExecutionContext()
+    return _execution_context
+
+
+def set_execution_context(execution_context: ExecutionContext) -> None:
+    """Replace the process-wide execution context, e.g. to set provider limits"""
+    global _execution_context
+    with _execution_context_lock:
+        previous = _execution_context
+        _execution_context = execution_context
+    if previous is not None and previous is not execution_context:
+        previous.shutdown()
@@ -43,6 +43,9 @@ class Loop:
     max_iterations: int = 3  # Default to 3
     end_condition: Optional[Callable[[List[StepOutput]], bool]] = None
 
+    # Names of the steps whose outputs this step uses. Steps of a workflow run as a dependency graph if set
+    depends_on: Optional[List[str]] = None
+
     def __init__(
         self,
         steps: WorkflowSteps,
@@ -50,12 +53,14 @@ class Loop:
         description: Optional[str] = None,
         max_iterations: int = 3,
         end_condition: Optional[Callable[[List[StepOutput]], bool]] = None,
+        depends_on: Optional[List[str]] = None,
     ):
         self.steps = steps
         self.name = name
         self.description = description
         self.max_iterations = max_iterations
         self.end_condition = end_condition
+        self.depends_on = depends_on
 
     def _prepare_steps(self):
         """Prepare the steps for execution - mirrors workflow logic"""
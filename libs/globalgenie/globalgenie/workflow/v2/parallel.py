@@ -1,6 +1,5 @@
-import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Union
 
 from globalgenie.run.response import RunResponseEvent
@@ -13,6 +12,7 @@ from globalgenie.run.v2.workflow import (
 )
 from globalgenie.utils.log import log_debug, logger
 from globalgenie.workflow.v2.condition import Condition
+from globalgenie.workflow.v2.execution import add_queue_time, get_execution_context
 from globalgenie.workflow.v2.step import Step
 from globalgenie.workflow.v2.steps import Steps
 from globalgenie.workflow.v2.types import StepInput, StepOutput
@@ -41,15 +41,20 @@ class Parallel:
     name: Optional[str] = None
     description: Optional[str] = None
 
+    # Names of the steps whose outputs this step uses. Steps of a workflow run as a dependency graph if set
+    depends_on: Optional[List[str]] = None
+
     def __init__(
         self,
         *steps: WorkflowSteps,
         name: Optional[str] = None,
         description: Optional[str] = None,
+        depends_on: Optional[List[str]] = None,
     ):
         self.steps = list(steps)
         self.name = name
         self.description = description
+        self.depends_on = depends_on
 
     def _prepare_steps(self):
         """Prepare the steps for execution - mirrors workflow logic"""
@@ -164,6 +169,7 @@ class Parallel:
                     "executor_type": executor_type,
                     "executor_name": executor_name,
                     "metrics": actual_metrics,
+                    "queue_time": result.metrics.get("queue_time") if isinstance(result.metrics, dict) else None,
                 }
             else:
                 # Even if no metrics, record the step execution
@@ -219,11 +225,12 @@ class Parallel:
 
         self._prepare_steps()
 
-        def execute_step_with_index(step_with_index):
+        def execute_step_with_index(step_with_index, queue_time: float = 0.0):
             """Execute a single step and preserve its original index"""
             index, step = step_with_index
             try:
                 result = step.execute(step_input, session_id=session_id, user_id=user_id)  # type: ignore[union-attr]
+                add_queue_time(result, queue_time)
                 return (index, result)
             except Exception as e:
                 step_name = getattr(step, "name", f"step_{index}")
@@ -238,39 +245,14 @@ class Parallel:
         # Use index to preserve order
         indexed_steps = list(enumerate(self.steps))
 
-        with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
-            # Submit all tasks with their original indices
-            future_to_index = {
-                executor.submit(execute_step_with_index, indexed_step): indexed_step[0]
-                for indexed_step in indexed_steps
-            }
-
-            # Collect results
-            results_with_indices = []
-            for future in as_completed(future_to_index):
-                try:
-                    index, result = future.result()
-                    results_with_indices.append((index, result))
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    log_debug(f"Parallel step {step_name} completed")
-                except Exception as e:
-                    index = future_to_index[future]
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    logger.error(f"Parallel step {step_name} failed: {e}")
-                    results_with_indices.append(
-                        (
-                            index,
-                            StepOutput(
-                                step_name=step_name,
-                                content=f"Step {step_name} failed: {str(e)}",
-                                success=False,
-                                error=str(e),
-                            ),
-                        )
-                    )
+        # Run the steps in the shared, bounded thread pool of the execution context
+        results_with_indices = get_execution_context().run_concurrently(
+            [partial(execute_step_with_index, indexed_step) for indexed_step in indexed_steps]
+        )
+        for index, _ in results_with_indices:
+            step_name = getattr(self.steps[index], "name", f"step_{index}")
+            log_debug(f"Parallel step {step_name} completed")
 
-        # Sort by original index to preserve order
-        results_with_indices.sort(key=lambda x: x[0])
         results = [result for _, result in results_with_indices]
 
         # Flatten results - handle steps that return List[StepOutput] (like Condition/Loop)
@@ -315,7 +297,7 @@ class Parallel:
                 parallel_step_count=len(self.steps),
             )
 
-        def execute_step_stream_with_index(step_with_index):
+        def execute_step_stream_with_index(step_with_index, queue_time: float = 0.0):
             """Execute a single step with streaming and preserve its original index"""
             index, step = step_with_index
             try:
@@ -339,6 +321,8 @@ class Parallel:
                     workflow_run_response=workflow_run_response,
                     step_index=sub_step_index,
                 ):
+                    if isinstance(event, StepOutput):
+                        add_queue_time(event, queue_time)
                     events.append(event)
                 return (index, events)
             except Exception as e:
@@ -358,44 +342,20 @@ class Parallel:
 
         # Use index to preserve order
         indexed_steps = list(enumerate(self.steps))
-        all_events_with_indices = []
         step_results = []
 
-        with ThreadPoolExecutor(max_workers=len(self.steps)) as executor:
-            # Submit all tasks with their original indices
-            future_to_index = {
-                executor.submit(execute_step_stream_with_index, indexed_step): indexed_step[0]
-                for indexed_step in indexed_steps
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_index):
-                try:
-                    index, events = future.result()
-                    all_events_with_indices.append((index, events))
-
-                    # Extract StepOutput from events for the final result
-                    step_outputs = [event for event in events if isinstance(event, StepOutput)]
-                    if step_outputs:
-                        step_results.extend(step_outputs)
-
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    log_debug(f"Parallel step {step_name} streaming completed")
-                except Exception as e:
-                    index = future_to_index[future]
-                    step_name = getattr(self.steps[index], "name", f"step_{index}")
-                    logger.error(f"Parallel step {step_name} streaming failed: {e}")
-                    error_event = StepOutput(
-                        step_name=step_name,
-                        content=f"Step {step_name} failed: {str(e)}",
-                        success=False,
-                        error=str(e),
-                    )
-                    all_events_with_indices.append((index, [error_event]))
-                    step_results.append(error_event)
+        # Run the steps in the shared, bounded thread pool of the execution context
+        all_events_with_indices = get_execution_context().run_concurrently(
+            [partial(execute_step_stream_with_index, indexed_step) for indexed_step in indexed_steps]
+        )
+        for index, events in all_events_with_indices:
+            # Extract StepOutput from events for the final result
+            step_outputs = [event for event in events if isinstance(event, StepOutput)]
+            if step_outputs:
+                step_results.extend(step_outputs)
 
-        # Sort events by original index to preserve order
-        all_events_with_indices.sort(key=lambda x: x[0])
+            step_name = getattr(self.steps[index], "name", f"step_{index}")
+            log_debug(f"Parallel step {step_name} streaming completed")
 
         # Yield all collected streaming events in order (but not final StepOutputs)
         for _, events in all_events_with_indices:
@@ -445,11 +405,12 @@ class Parallel:
 
         self._prepare_steps()
 
-        async def execute_step_async_with_index(step_with_index):
+        async def execute_step_async_with_index(step_with_index, queue_time: float = 0.0):
             """Execute a single step asynchronously and preserve its original index"""
             index, step = step_with_index
             try:
                 result = await step.aexecute(step_input, session_id=session_id, user_id=user_id)  # type: ignore[union-attr]
+                add_queue_time(result, queue_time)
                 return (index, result)
             except Exception as e:
                 step_name = getattr(step, "name", f"step_{index}")
@@ -467,11 +428,10 @@ class Parallel:
         # Use index to preserve order
         indexed_steps = list(enumerate(self.steps))
 
-        # Create tasks for all steps with their indices
-        tasks = [execute_step_async_with_index(indexed_step) for indexed_step in indexed_steps]
-
-        # Execute all tasks concurrently
-        results_with_indices = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute all steps concurrently, bounded by the execution context
+        results_with_indices = await get_execution_context().arun_concurrently(
+            [partial(execute_step_async_with_index, indexed_step) for indexed_step in indexed_steps]
+        )
 
         # Process results and handle exceptions, preserving order
         processed_results_with_indices = []
@@ -542,7 +502,7 @@ class Parallel:
                 parallel_step_count=len(self.steps),
             )
 
-        async def execute_step_stream_async_with_index(step_with_index):
+        async def execute_step_stream_async_with_index(step_with_index, queue_time: float = 0.0):
             """Execute a single step with async streaming and preserve its original index"""
             index, step = step_with_index
             try:
@@ -566,6 +526,8 @@ class Parallel:
                     workflow_run_response=workflow_run_response,
                     step_index=sub_step_index,
                 ):  # type: ignore[union-attr]
+                    if isinstance(event, StepOutput):
+                        add_queue_time(event, queue_time)
                     events.append(event)
                 return (index, events)
             except Exception as e:
@@ -588,11 +550,10 @@ class Parallel:
         all_events_with_indices = []
         step_results = []
 
-        # Create tasks for all steps with their indices
-        tasks = [execute_step_stream_async_with_index(indexed_step) for indexed_step in indexed_steps]
-
-        # Execute all tasks concurrently
-        results_with_indices = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute all steps concurrently, bounded by the execution context
+        results_with_indices = await get_execution_context().arun_concurrently(
+            [partial(execute_step_stream_async_with_index, indexed_step) for indexed_step in indexed_steps]
+        )
 
         # Process results and handle exceptions, preserving order
         for i, result in enumerate(results_with_indices):
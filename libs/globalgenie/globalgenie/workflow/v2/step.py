@@ -16,6 +16,7 @@ from globalgenie.run.v2.workflow import (
 )
 from globalgenie.team import Team
 from globalgenie.utils.log import log_debug, logger, use_agent_logger, use_team_logger, use_workflow_logger
+from globalgenie.workflow.v2.execution import add_queue_time, get_execution_context
 from globalgenie.workflow.v2.types import StepInput, StepOutput
 
 StepExecutor = Callable[
@@ -56,6 +57,9 @@ class Step:
     # If False, only warn about missing inputs
     strict_input_validation: bool = False
 
+    # Names of the steps whose outputs this step uses. Steps of a workflow run as a dependency graph if set
+    depends_on: Optional[List[str]] = None
+
     _retry_count: int = 0
 
     def __init__(
@@ -70,6 +74,7 @@ class Step:
         timeout_seconds: Optional[int] = None,
         skip_on_failure: bool = False,
         strict_input_validation: bool = False,
+        depends_on: Optional[List[str]] = None,
     ):
         # Auto-detect name for function executors if not provided
         if name is None and executor is not None:
@@ -89,6 +94,7 @@ class Step:
         self.timeout_seconds = timeout_seconds
         self.skip_on_failure = skip_on_failure
         self.strict_input_validation = strict_input_validation
+        self.depends_on = depends_on
 
         # Set the active executor
         self._set_active_executor()
@@ -150,6 +156,11 @@ class Step:
         else:
             raise ValueError("No executor configured")
 
+    def _get_model_provider(self) -> Optional[str]:
+        """Get the model provider of the agent or team, used for provider concurrency limits"""
+        model = getattr(self.active_executor, "model", None)
+        return model.get_provider() if model is not None else None
+
     def _extract_metrics_from_response(self, response: Union[RunResponse, TeamRunResponse]) -> Optional[Dict[str, Any]]:
         """Extract metrics from agent or team response"""
         if hasattr(response, "metrics") and response.metrics:
@@ -174,6 +185,7 @@ class Step:
         for attempt in range(self.max_retries + 1):
             try:
                 response: Union[RunResponse, TeamRunResponse, StepOutput]
+                queue_time = 0.0
                 if self._executor_type == "function":
                     if inspect.iscoroutinefunction(self.active_executor) or inspect.isasyncgenfunction(
                         self.active_executor
@@ -234,14 +246,15 @@ class Step:
                             self._convert_video_artifacts_to_videos(step_input.videos) if step_input.videos else None
                         )
                         audios = self._convert_audio_artifacts_to_audio(step_input.audio) if step_input.audio else None
-                        response = self.active_executor.run(  # type: ignore[misc]
-                            message=message,
-                            images=images,
-                            videos=videos,
-                            audio=audios,
-                            session_id=session_id,
-                            user_id=user_id,
-                        )
+                        with get_execution_context().provider_slot(self._get_model_provider()) as queue_time:
+                            response = self.active_executor.run(  # type: ignore[misc]
+                                message=message,
+                                images=images,
+                                videos=videos,
+                                audio=audios,
+                                session_id=session_id,
+                                user_id=user_id,
+                            )
 
                         # Switch back to workflow logger after execution
                         use_workflow_logger()
@@ -250,6 +263,7 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                add_queue_time(step_output, queue_time)
 
                 return step_output
 
@@ -358,20 +372,24 @@ class Step:
                             self._convert_video_artifacts_to_videos(step_input.videos) if step_input.videos else None
                         )
                         audios = self._convert_audio_artifacts_to_audio(step_input.audio) if step_input.audio else None
-                        response_stream = self.active_executor.run(  # type: ignore[call-overload, misc]
-                            message=message,
-                            images=images,
-                            videos=videos,
-                            audio=audios,
-                            session_id=session_id,
-                            user_id=user_id,
-                            stream=True,
-                            stream_intermediate_steps=stream_intermediate_steps,
-                        )
-
-                        for event in response_stream:
-                            yield event  # type: ignore[misc]
-                        final_response = self._process_step_output(self.active_executor.run_response)  # type: ignore
+                        with get_execution_context().provider_slot(self._get_model_provider()) as queue_time:
+                            response_stream = self.active_executor.run(  # type: ignore[call-overload, misc]
+                                message=message,
+                                images=images,
+                                videos=videos,
+                                audio=audios,
+                                session_id=session_id,
+                                user_id=user_id,
+                                stream=True,
+                                stream_intermediate_steps=stream_intermediate_steps,
+                            )
+
+                            for event in response_stream:
+                                yield event  # type: ignore[misc]
+                            final_response = self._process_step_output(
+                                self.active_executor.run_response  # type: ignore
+                            )
+                            add_queue_time(final_response, queue_time)
 
                     else:
                         raise ValueError(f"Unsupported executor type: {self._executor_type}")
@@ -432,6 +450,7 @@ class Step:
         # Execute with retries
         for attempt in range(self.max_retries + 1):
             try:
+                queue_time = 0.0
                 if self._executor_type == "function":
                     import inspect
 
@@ -509,14 +528,15 @@ class Step:
                             self._convert_video_artifacts_to_videos(step_input.videos) if step_input.videos else None
                         )
                         audios = self._convert_audio_artifacts_to_audio(step_input.audio) if step_input.audio else None
-                        response = await self.active_executor.arun(  # type: ignore
-                            message=message,
-                            images=images,
-                            videos=videos,
-                            audio=audios,
-                            session_id=session_id,
-                            user_id=user_id,
-                        )
+                        async with get_execution_context().aprovider_slot(self._get_model_provider()) as queue_time:
+                            response = await self.active_executor.arun(  # type: ignore
+                                message=message,
+                                images=images,
+                                videos=videos,
+                                audio=audios,
+                                session_id=session_id,
+                                user_id=user_id,
+                            )
 
                         # Switch back to workflow logger after execution
                         use_workflow_logger()
@@ -525,6 +545,7 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                add_queue_time(step_output, queue_time)
 
                 return step_output
 
@@ -651,21 +672,25 @@ class Step:
                             self._convert_video_artifacts_to_videos(step_input.videos) if step_input.videos else None
                         )
                         audios = self._convert_audio_artifacts_to_audio(step_input.audio) if step_input.audio else None
-                        response_stream = await self.active_executor.arun(  # type: ignore
-                            message=message,
-                            images=images,
-                            videos=videos,
-                            audio=audios,
-                            session_id=session_id,
-                            user_id=user_id,
-                            stream=True,
-                            stream_intermediate_steps=stream_intermediate_steps,
-                        )
-
-                        async for event in response_stream:
-                            log_debug(f"Received async event from agent: {type(event).__name__}")
-                            yield event  # type: ignore[misc]
-                        final_response = self._process_step_output(self.active_executor.run_response)  # type: ignore
+                        async with get_execution_context().aprovider_slot(self._get_model_provider()) as queue_time:
+                            response_stream = await self.active_executor.arun(  # type: ignore
+                                message=message,
+                                images=images,
+                                videos=videos,
+                                audio=audios,
+                                session_id=session_id,
+                                user_id=user_id,
+                                stream=True,
+                                stream_intermediate_steps=stream_intermediate_steps,
+                            )
+
+                            async for event in response_stream:
+                                log_debug(f"Received async event from agent: {type(event).__name__}")
+                                yield event  # type: ignore[misc]
+                            final_response = self._process_step_output(
+                                self.active_executor.run_response  # type: ignore
+                            )
+                            add_queue_time(final_response, queue_time)
                     else:
                         raise ValueError(f"Unsupported executor type: {self._executor_type}")
 
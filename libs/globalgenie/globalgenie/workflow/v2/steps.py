@@ -38,12 +38,20 @@ class Steps:
     name: Optional[str] = None
     description: Optional[str] = None
 
+    # Names of the steps whose outputs this step uses. Steps of a workflow run as a dependency graph if set
+    depends_on: Optional[List[str]] = None
+
     def __init__(
-        self, name: Optional[str] = None, description: Optional[str] = None, steps: Optional[List[Any]] = None
-    ):  # Change to List[Any]
+        self,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        steps: Optional[List[Any]] = None,  # Change to List[Any]
+        depends_on: Optional[List[str]] = None,
+    ):
         self.name = name
         self.description = description
         self.steps = steps if steps else []
+        self.depends_on = depends_on
 
     def _prepare_steps(self):
         """Prepare the steps for execution - mirrors workflow logic"""
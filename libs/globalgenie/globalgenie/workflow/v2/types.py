@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel
@@ -56,6 +56,20 @@ class WorkflowExecutionInput:
             "audio": [aud.to_dict() for aud in self.audio] if self.audio else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowExecutionInput":
+        """Create WorkflowExecutionInput from dictionary"""
+        images = data.get("images")
+        videos = data.get("videos")
+        audio = data.get("audio")
+        return cls(
+            message=data.get("message"),
+            additional_data=data.get("additional_data"),
+            images=[ImageArtifact.model_validate(img) for img in images] if images else None,
+            videos=[VideoArtifact.model_validate(vid) for vid in videos] if videos else None,
+            audio=[AudioArtifact.model_validate(aud) for aud in audio] if audio else None,
+        )
+
 
 @dataclass
 class StepInput:
@@ -220,7 +234,14 @@ class StepOutput:
                 content_dict = str(self.content)
 
         return {
+            "step_name": self.step_name,
+            "step_id": self.step_id,
+            "executor_type": self.executor_type,
+            "executor_name": self.executor_name,
             "content": content_dict,
+            "parallel_step_outputs": {name: output.to_dict() for name, output in self.parallel_step_outputs.items()}
+            if self.parallel_step_outputs
+            else None,
             "response": self.response.to_dict() if self.response else None,
             "images": [img.to_dict() for img in self.images] if self.images else None,
             "videos": [vid.to_dict() for vid in self.videos] if self.videos else None,
@@ -260,8 +281,17 @@ class StepOutput:
         if audio:
             audio = [AudioArtifact.model_validate(aud) for aud in audio]
 
+        parallel_step_outputs = data.get("parallel_step_outputs")
+        if parallel_step_outputs:
+            parallel_step_outputs = {name: cls.from_dict(output) for name, output in parallel_step_outputs.items()}
+
         return cls(
+            step_name=data.get("step_name"),
+            step_id=data.get("step_id"),
+            executor_type=data.get("executor_type"),
+            executor_name=data.get("executor_name"),
             content=data.get("content"),
+            parallel_step_outputs=parallel_step_outputs,
             response=response,
             images=images,
             videos=videos,
@@ -287,6 +317,9 @@ class StepMetrics:
     # For parallel steps: nested step metrics
     parallel_steps: Optional[Dict[str, "StepMetrics"]] = None
 
+    # Seconds the step waited for a worker or a provider slot before it started
+    queue_time: Optional[float] = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary - only include relevant fields"""
         result = {
@@ -301,6 +334,8 @@ class StepMetrics:
         elif self.executor_type != "parallel":
             # For non-parallel steps, include metrics (even if None)
             result["metrics"] = self.metrics  # type: ignore[assignment]
+        if self.queue_time is not None:
+            result["queue_time"] = self.queue_time  # type: ignore[assignment]
 
         return result
 
@@ -319,6 +354,7 @@ class StepMetrics:
             executor_name=data["executor_name"],
             metrics=data.get("metrics") if data.get("executor_type") != "parallel" else None,
             parallel_steps=parallel_steps,
+            queue_time=data.get("queue_time"),
         )
 
 
@@ -345,3 +381,53 @@ class WorkflowMetrics:
             total_steps=data["total_steps"],
             steps=steps,
         )
+
+
+@dataclass
+class WorkflowCheckpoint:
+    """Progress of a workflow run, used to resume the run from the last completed step"""
+
+    # The input the run was started with
+    execution_input: Optional[Dict[str, Any]] = None
+    # Number of top-level steps that completed successfully
+    completed_steps: int = 0
+    # Output of each completed step, a list for steps that return multiple outputs
+    step_outputs: List[Union[StepOutput, List[StepOutput]]] = field(default_factory=list)
+
+    def add_step_output(self, step_index: int, step_output: Union[StepOutput, List[StepOutput]]) -> None:
+        """Record a completed step. Steps are only recorded in order and while all previous steps succeeded."""
+        if step_index != self.completed_steps:
+            return
+        outputs = step_output if isinstance(step_output, list) else [step_output]
+        if not all(output.success for output in outputs):
+            return
+        self.step_outputs.append(step_output)
+        self.completed_steps += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "execution_input": self.execution_input,
+            "completed_steps": self.completed_steps,
+            "step_outputs": [
+                [output.to_dict() for output in step_output]
+                if isinstance(step_output, list)
+                else step_output.to_dict()
+                for step_output in self.step_outputs
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkflowCheckpoint":
+        """Create WorkflowCheckpoint from dictionary"""
+        step_outputs: List[Union[StepOutput, List[StepOutput]]] = [
+            [StepOutput.from_dict(output) for output in step_output]
+            if isinstance(step_output, list)
+            else StepOutput.from_dict(step_output)
+            for step_output in data.get("step_outputs", [])
+        ]
+        return cls(
+            execution_input=data.get("execution_input"),
+            completed_steps=data.get("completed_steps", len(step_outputs)),
+            step_outputs=step_outputs,
+        )
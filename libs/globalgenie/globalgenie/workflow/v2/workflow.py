@@ -12,6 +12,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     Union,
     overload,
 )
@@ -54,7 +55,15 @@ from globalgenie.utils.log import (
     set_log_level_to_info,
     use_workflow_logger,
 )
+from globalgenie.workflow.v2.cache import (
+    CachedStepOutput,
+    StepCache,
+    aiter_events,
+    aiter_step_outputs,
+    as_step_output_list,
+)
 from globalgenie.workflow.v2.condition import Condition
+from globalgenie.workflow.v2.dag import STEP_DONE, DagScheduler, StepGraph, get_step_name
 from globalgenie.workflow.v2.loop import Loop
 from globalgenie.workflow.v2.parallel import Parallel
 from globalgenie.workflow.v2.router import Router
@@ -64,6 +73,7 @@ from globalgenie.workflow.v2.types import (
     StepInput,
     StepMetrics,
     StepOutput,
+    WorkflowCheckpoint,
     WorkflowExecutionInput,
     WorkflowMetrics,
 )
@@ -128,6 +138,20 @@ class Workflow:
     store_events: bool = False
     events_to_skip: Optional[List[WorkflowRunEvent]] = None
 
+    # --- Workflow Checkpoints ---
+    # Reuse the outputs of steps that already ran with the same input
+    step_cache: Optional[StepCache] = None
+    # Save the run to storage after each step, so runs can be resumed with resume() even if the process exits
+    # mid-run. Runs that fail with an error are saved with their checkpoint either way
+    save_checkpoints: bool = False
+
+    # Maximum number of steps that run at the same time when steps declare `depends_on`
+    max_concurrency: int = 4
+
+    # Maximum number of finished runs kept in memory. Older runs are read from storage when requested.
+    # Only applies if the storage saves runs separately from the session, e.g. SqliteStorage in workflow_v2 mode
+    max_runs_in_memory: Optional[int] = None
+
     def __init__(
         self,
         workflow_id: Optional[str] = None,
@@ -144,6 +168,10 @@ class Workflow:
         stream_intermediate_steps: bool = False,
         store_events: bool = False,
         events_to_skip: Optional[List[WorkflowRunEvent]] = None,
+        step_cache: Optional[StepCache] = None,
+        save_checkpoints: bool = False,
+        max_concurrency: int = 4,
+        max_runs_in_memory: Optional[int] = None,
     ):
         self.workflow_id = workflow_id
         self.name = name
@@ -159,6 +187,10 @@ class Workflow:
         self.events_to_skip = events_to_skip or []
         self.stream = stream
         self.stream_intermediate_steps = stream_intermediate_steps
+        self.step_cache = step_cache
+        self.save_checkpoints = save_checkpoints
+        self.max_concurrency = max_concurrency
+        self.max_runs_in_memory = max_runs_in_memory
 
     @property
     def run_parameters(self) -> Dict[str, Any]:
@@ -367,6 +399,7 @@ class Workflow:
                 "executor_name": metrics_dict.get("executor_name", "unknown"),
                 "metrics": metrics_dict.get("metrics"),
                 "parallel_steps": metrics_dict.get("parallel_steps"),
+                "queue_time": metrics_dict.get("queue_time"),
             }
         )
 
@@ -400,6 +433,367 @@ class Workflow:
             steps=steps_dict,
         )
 
+    def _get_cached_step_output(
+        self, step_index: int, step: Any, step_input: StepInput
+    ) -> Tuple[Optional[str], Optional[CachedStepOutput]]:
+        """Return the step cache key and the cached output of the step, if any"""
+        if self.step_cache is None:
+            return None, None
+        cache_key = self.step_cache.get_key(
+            workflow=self.name or self.workflow_id or "", step_index=step_index, step=step, step_input=step_input
+        )
+        cached_output = self.step_cache.get(cache_key)
+        if cached_output is not None:
+            log_debug(f"Using cached output for step {step_index + 1}: {getattr(step, 'name', None)}")
+        return cache_key, cached_output
+
+    def _cache_step_output(self, cache_key: Optional[str], step_output: CachedStepOutput) -> None:
+        if self.step_cache is not None and cache_key is not None:
+            if isinstance(step_output, list) and len(step_output) == 1:
+                step_output = step_output[0]
+            self.step_cache.set(cache_key, step_output)
+
+    def _start_checkpoint(
+        self, execution_input: WorkflowExecutionInput, workflow_run_response: WorkflowRunResponse
+    ) -> WorkflowCheckpoint:
+        """Return the checkpoint of the run, creating it for new runs"""
+        if workflow_run_response.checkpoint is None:
+            workflow_run_response.checkpoint = WorkflowCheckpoint(execution_input=execution_input.to_dict())
+        return workflow_run_response.checkpoint
+
+    def _restore_from_checkpoint(
+        self,
+        checkpoint: WorkflowCheckpoint,
+        previous_step_outputs: Dict[str, StepOutput],
+        shared_images: List[ImageArtifact],
+        shared_videos: List[VideoArtifact],
+        shared_audio: List[AudioArtifact],
+        output_images: List[ImageArtifact],
+        output_videos: List[VideoArtifact],
+        output_audio: List[AudioArtifact],
+        flatten: bool = False,
+    ) -> List[Union[StepOutput, List[StepOutput]]]:
+        """Restore the step outputs and media of the completed steps, and return the outputs to collect"""
+        restored_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
+        steps = self._get_step_list()
+        for i, step_output in enumerate(checkpoint.step_outputs):
+            step_name = get_step_name(steps[i], i) if i < len(steps) else f"step_{i + 1}"
+            outputs = as_step_output_list(step_output)
+            if outputs:
+                previous_step_outputs[step_name] = outputs[-1]
+            for output in outputs:
+                shared_images.extend(output.images or [])
+                shared_videos.extend(output.videos or [])
+                shared_audio.extend(output.audio or [])
+                output_images.extend(output.images or [])
+                output_videos.extend(output.videos or [])
+                output_audio.extend(output.audio or [])
+            if flatten:
+                restored_step_outputs.extend(outputs)
+            else:
+                restored_step_outputs.append(step_output)
+
+        if checkpoint.completed_steps > 0:
+            log_debug(f"Resuming run from step {checkpoint.completed_steps + 1}/{self._get_step_count()}")
+        return restored_step_outputs
+
+    def _get_step_list(self) -> List[Any]:
+        """Return the steps of the workflow as a list, empty if the steps are a function"""
+        if self.steps is None or callable(self.steps):
+            return []
+        if isinstance(self.steps, Steps):
+            return list(self.steps.steps)
+        return list(self.steps)
+
+    def _get_cached_step_events(
+        self,
+        step: Any,
+        step_index: int,
+        cached_output: CachedStepOutput,
+        workflow_run_response: WorkflowRunResponse,
+        stream_intermediate_steps: bool = False,
+    ) -> List[Any]:
+        """Return the events to stream for a cached step, in place of the events of running it"""
+        outputs = as_step_output_list(cached_output)
+        if not stream_intermediate_steps:
+            return list(outputs)
+        step_name = getattr(step, "name", None)
+        return [
+            StepStartedEvent(
+                run_id=workflow_run_response.run_id or "",
+                workflow_name=workflow_run_response.workflow_name or "",
+                workflow_id=workflow_run_response.workflow_id or "",
+                session_id=workflow_run_response.session_id or "",
+                step_name=step_name,
+                step_index=step_index,
+            ),
+            *outputs,
+            StepCompletedEvent(
+                run_id=workflow_run_response.run_id or "",
+                workflow_name=workflow_run_response.workflow_name or "",
+                workflow_id=workflow_run_response.workflow_id or "",
+                session_id=workflow_run_response.session_id or "",
+                step_name=step_name,
+                step_index=step_index,
+                content=outputs[-1].content if outputs else None,
+                step_response=outputs[-1] if outputs else None,
+            ),
+        ]
+
+    def _save_checkpoint(
+        self, workflow_run_response: WorkflowRunResponse, step_index: int, step_output: CachedStepOutput
+    ) -> None:
+        """Record a completed step and save the run, so it can be resumed from the next step"""
+        if workflow_run_response.checkpoint is None:
+            return
+        if isinstance(step_output, list) and len(step_output) == 1:
+            step_output = step_output[0]
+        workflow_run_response.checkpoint.add_step_output(step_index, step_output)
+        if self.save_checkpoints and self.storage is not None:
+            self._save_run_to_storage(workflow_run_response)
+
+    def _has_step_dependencies(self) -> bool:
+        """Return True if steps declare the steps they depend on, in which case they run as a dependency graph"""
+        if self.steps is None or callable(self.steps):
+            return False
+        return any(getattr(step, "depends_on", None) is not None for step in self.steps)  # type: ignore[union-attr]
+
+    def _create_dag_step_input(
+        self,
+        execution_input: WorkflowExecutionInput,
+        graph: StepGraph,
+        step_index: int,
+        step_outputs: Dict[int, List[StepOutput]],
+    ) -> StepInput:
+        """Create the input of a step from the outputs and media of the steps it depends on"""
+        previous_step_outputs: Dict[str, StepOutput] = {}
+        images: List[ImageArtifact] = list(execution_input.images or [])
+        videos: List[VideoArtifact] = list(execution_input.videos or [])
+        audio: List[AudioArtifact] = list(execution_input.audio or [])
+        for dependency in graph.dependencies[step_index]:
+            outputs = step_outputs.get(dependency) or []
+            if outputs:
+                previous_step_outputs[graph.names[dependency]] = outputs[-1]
+            for output in outputs:
+                images.extend(output.images or [])
+                videos.extend(output.videos or [])
+                audio.extend(output.audio or [])
+
+        return self._create_step_input(
+            execution_input=execution_input,
+            previous_step_outputs=previous_step_outputs,
+            shared_images=images,
+            shared_videos=videos,
+            shared_audio=audio,
+        )
+
+    def _get_dag_stream_event(
+        self, step: Any, step_index: int, event: Any, workflow_run_response: WorkflowRunResponse
+    ) -> Optional[Any]:
+        """Return the event to stream for an item produced by a step, mirroring sequential streaming"""
+        if isinstance(event, StepOutput):
+            # Only yield StepOutputEvent for function executors, not for agents/teams
+            if getattr(step, "executor_type", None) == "function":
+                return self._transform_step_output_to_event(event, workflow_run_response, step_index=step_index)
+            return None
+        if isinstance(event, WorkflowRunResponseEvent):  # type: ignore
+            return self._handle_event(event, workflow_run_response)  # type: ignore
+        return event
+
+    def _complete_dag_step(
+        self,
+        step_index: int,
+        outputs: List[StepOutput],
+        workflow_run_response: WorkflowRunResponse,
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+        output_images: List[ImageArtifact],
+        output_videos: List[VideoArtifact],
+        output_audio: List[AudioArtifact],
+    ) -> bool:
+        """Collect the outputs of a completed step. Returns True if the step requested early termination."""
+        if not outputs:
+            return False
+        for output in outputs:
+            output_images.extend(output.images or [])
+            output_videos.extend(output.videos or [])
+            output_audio.extend(output.audio or [])
+        step_output: Union[StepOutput, List[StepOutput]] = outputs[0] if len(outputs) == 1 else outputs
+        collected_step_outputs.append(step_output)
+
+        self._collect_workflow_session_state_from_agents_and_teams()
+        self._save_checkpoint(workflow_run_response, step_index=step_index, step_output=step_output)
+
+        if any(output.stop for output in outputs):
+            logger.info(f"Early termination requested by step {outputs[-1].step_name or step_index + 1}")
+            return True
+        return False
+
+    def _run_dag_steps(
+        self,
+        execution_input: WorkflowExecutionInput,
+        workflow_run_response: WorkflowRunResponse,
+        checkpoint: WorkflowCheckpoint,
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+        output_images: List[ImageArtifact],
+        output_videos: List[VideoArtifact],
+        output_audio: List[AudioArtifact],
+        stream: bool = False,
+        stream_intermediate_steps: bool = False,
+    ) -> Iterator[WorkflowRunResponseEvent]:
+        """Run the steps as a dependency graph in a thread pool.
+
+        Each step receives the outputs of the steps it depends on, and independent steps run concurrently.
+        Events are yielded in the order the steps are declared, if streaming.
+        """
+        steps: List[Any] = self.steps  # type: ignore[assignment]
+        graph = StepGraph(steps)
+        step_outputs: Dict[int, List[StepOutput]] = {
+            i: as_step_output_list(output) for i, output in enumerate(checkpoint.step_outputs)
+        }
+        log_debug(f"Running {len(graph)} steps as a dependency graph, {self.max_concurrency} at a time")
+
+        def run_step(step_index: int) -> Iterator[Any]:
+            step = steps[step_index]
+            step_input = self._create_dag_step_input(execution_input, graph, step_index, step_outputs)
+            log_debug(f"Executing step {step_index + 1}/{len(graph)}: {graph.names[step_index]}")
+
+            outputs: List[StepOutput] = []
+            cache_key, cached_output = self._get_cached_step_output(step_index, step, step_input)
+            if cached_output is not None:
+                step_events: Iterator[Any] = iter(
+                    self._get_cached_step_events(
+                        step, step_index, cached_output, workflow_run_response, stream and stream_intermediate_steps
+                    )
+                )
+            elif stream:
+                step_events = step.execute_stream(
+                    step_input,
+                    session_id=self.session_id,
+                    user_id=self.user_id,
+                    stream_intermediate_steps=stream_intermediate_steps,
+                    workflow_run_response=workflow_run_response,
+                    step_index=step_index,
+                )
+            else:
+                step_output = step.execute(step_input, session_id=self.session_id, user_id=self.user_id)
+                step_events = iter(as_step_output_list(step_output))
+
+            for event in step_events:
+                if isinstance(event, StepOutput):
+                    outputs.append(event)
+                yield event
+
+            if cached_output is None and outputs:
+                self._cache_step_output(cache_key, outputs)
+            step_outputs[step_index] = outputs
+
+        scheduler = DagScheduler(
+            graph, max_concurrency=self.max_concurrency, completed=set(range(checkpoint.completed_steps))
+        )
+        dag_events = scheduler.run(run_step)
+        try:
+            for step_index, event in dag_events:
+                if event is STEP_DONE:
+                    if self._complete_dag_step(
+                        step_index,
+                        step_outputs.get(step_index) or [],
+                        workflow_run_response=workflow_run_response,
+                        collected_step_outputs=collected_step_outputs,
+                        output_images=output_images,
+                        output_videos=output_videos,
+                        output_audio=output_audio,
+                    ):
+                        break
+                elif stream:
+                    stream_event = self._get_dag_stream_event(
+                        steps[step_index], step_index, event, workflow_run_response
+                    )
+                    if stream_event is not None:
+                        yield stream_event
+        finally:
+            dag_events.close()
+
+    async def _arun_dag_steps(
+        self,
+        execution_input: WorkflowExecutionInput,
+        workflow_run_response: WorkflowRunResponse,
+        checkpoint: WorkflowCheckpoint,
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+        output_images: List[ImageArtifact],
+        output_videos: List[VideoArtifact],
+        output_audio: List[AudioArtifact],
+        stream: bool = False,
+        stream_intermediate_steps: bool = False,
+    ) -> AsyncIterator[WorkflowRunResponseEvent]:
+        """Run the steps as a dependency graph with asyncio, see _run_dag_steps()"""
+        steps: List[Any] = self.steps  # type: ignore[assignment]
+        graph = StepGraph(steps)
+        step_outputs: Dict[int, List[StepOutput]] = {
+            i: as_step_output_list(output) for i, output in enumerate(checkpoint.step_outputs)
+        }
+        log_debug(f"Running {len(graph)} steps as a dependency graph, {self.max_concurrency} at a time")
+
+        async def arun_step(step_index: int) -> AsyncIterator[Any]:
+            step = steps[step_index]
+            step_input = self._create_dag_step_input(execution_input, graph, step_index, step_outputs)
+            log_debug(f"Executing step {step_index + 1}/{len(graph)}: {graph.names[step_index]}")
+
+            outputs: List[StepOutput] = []
+            cache_key, cached_output = self._get_cached_step_output(step_index, step, step_input)
+            if cached_output is not None:
+                step_events: AsyncIterator[Any] = aiter_events(
+                    self._get_cached_step_events(
+                        step, step_index, cached_output, workflow_run_response, stream and stream_intermediate_steps
+                    )
+                )
+            elif stream:
+                step_events = step.aexecute_stream(
+                    step_input,
+                    session_id=self.session_id,
+                    user_id=self.user_id,
+                    stream_intermediate_steps=stream_intermediate_steps,
+                    workflow_run_response=workflow_run_response,
+                    step_index=step_index,
+                )
+            else:
+                step_output = await step.aexecute(step_input, session_id=self.session_id, user_id=self.user_id)
+                step_events = aiter_step_outputs(step_output)
+
+            async for event in step_events:
+                if isinstance(event, StepOutput):
+                    outputs.append(event)
+                yield event
+
+            if cached_output is None and outputs:
+                self._cache_step_output(cache_key, outputs)
+            step_outputs[step_index] = outputs
+
+        scheduler = DagScheduler(
+            graph, max_concurrency=self.max_concurrency, completed=set(range(checkpoint.completed_steps))
+        )
+        dag_events = scheduler.arun(arun_step)
+        try:
+            async for step_index, event in dag_events:
+                if event is STEP_DONE:
+                    if self._complete_dag_step(
+                        step_index,
+                        step_outputs.get(step_index) or [],
+                        workflow_run_response=workflow_run_response,
+                        collected_step_outputs=collected_step_outputs,
+                        output_images=output_images,
+                        output_videos=output_videos,
+                        output_audio=output_audio,
+                    ):
+                        break
+                elif stream:
+                    stream_event = self._get_dag_stream_event(
+                        steps[step_index], step_index, event, workflow_run_response
+                    )
+                    if stream_event is not None:
+                        yield stream_event
+        finally:
+            await dag_events.aclose()
+
     def _call_custom_function(
         self, func: Callable, workflow: "Workflow", execution_input: WorkflowExecutionInput, **kwargs: Any
     ) -> Any:
@@ -474,57 +868,91 @@ class Workflow:
                 shared_audio: List[AudioArtifact] = execution_input.audio or []
                 output_audio: List[AudioArtifact] = (execution_input.audio or []).copy()  # Start with input audio
 
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
-                    step_name = getattr(step, "name", f"step_{i + 1}")
-                    log_debug(f"Executing step {i + 1}/{self._get_step_count()}: {step_name}")
-
-                    # Create enhanced StepInput
-                    step_input = self._create_step_input(
-                        execution_input=execution_input,
+                # Restore the outputs of the steps that completed before the run failed or was interrupted
+                checkpoint = self._start_checkpoint(execution_input, workflow_run_response)
+                collected_step_outputs.extend(
+                    self._restore_from_checkpoint(
+                        checkpoint,
                         previous_step_outputs=previous_step_outputs,
                         shared_images=shared_images,
                         shared_videos=shared_videos,
                         shared_audio=shared_audio,
+                        output_images=output_images,
+                        output_videos=output_videos,
+                        output_audio=output_audio,
                     )
+                )
+
+                if self._has_step_dependencies():
+                    for _ in self._run_dag_steps(
+                        execution_input=execution_input,
+                        workflow_run_response=workflow_run_response,
+                        checkpoint=checkpoint,
+                        collected_step_outputs=collected_step_outputs,
+                        output_images=output_images,
+                        output_videos=output_videos,
+                        output_audio=output_audio,
+                    ):
+                        pass
+                else:
+                    for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                        if i < checkpoint.completed_steps:
+                            continue
+                        step_name = getattr(step, "name", f"step_{i + 1}")
+                        log_debug(f"Executing step {i + 1}/{self._get_step_count()}: {step_name}")
+
+                        # Create enhanced StepInput
+                        step_input = self._create_step_input(
+                            execution_input=execution_input,
+                            previous_step_outputs=previous_step_outputs,
+                            shared_images=shared_images,
+                            shared_videos=shared_videos,
+                            shared_audio=shared_audio,
+                        )
 
-                    step_output = step.execute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
+                        # Use the cached output of the step if there is one
+                        cache_key, step_output = self._get_cached_step_output(i, step, step_input)
+                        if step_output is None:
+                            step_output = step.execute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
+                            self._cache_step_output(cache_key, step_output)
 
-                    # Update the workflow-level previous_step_outputs dictionary
-                    if isinstance(step_output, list):
-                        log_debug(f"Step returned {len(step_output)} outputs")
-                        # For multiple outputs (from Loop, Condition, etc.), store the last one
-                        if step_output:
-                            previous_step_outputs[step_name] = step_output[-1]
-                            if any(output.stop for output in step_output):
+                        # Update the workflow-level previous_step_outputs dictionary
+                        if isinstance(step_output, list):
+                            log_debug(f"Step returned {len(step_output)} outputs")
+                            # For multiple outputs (from Loop, Condition, etc.), store the last one
+                            if step_output:
+                                previous_step_outputs[step_name] = step_output[-1]
+                                if any(output.stop for output in step_output):
+                                    logger.info(f"Early termination requested by step {step_name}")
+                                    break
+                        else:
+                            # Single output
+                            previous_step_outputs[step_name] = step_output
+                            if step_output.stop:
                                 logger.info(f"Early termination requested by step {step_name}")
                                 break
-                    else:
-                        # Single output
-                        previous_step_outputs[step_name] = step_output
-                        if step_output.stop:
-                            logger.info(f"Early termination requested by step {step_name}")
-                            break
 
-                    # Update shared media for next step
-                    if isinstance(step_output, list):
-                        for output in step_output:
-                            shared_images.extend(output.images or [])
-                            shared_videos.extend(output.videos or [])
-                            shared_audio.extend(output.audio or [])
-                            output_images.extend(output.images or [])
-                            output_videos.extend(output.videos or [])
-                            output_audio.extend(output.audio or [])
-                    else:
-                        shared_images.extend(step_output.images or [])
-                        shared_videos.extend(step_output.videos or [])
-                        shared_audio.extend(step_output.audio or [])
-                        output_images.extend(step_output.images or [])
-                        output_videos.extend(step_output.videos or [])
-                        output_audio.extend(step_output.audio or [])
+                        # Update shared media for next step
+                        if isinstance(step_output, list):
+                            for output in step_output:
+                                shared_images.extend(output.images or [])
+                                shared_videos.extend(output.videos or [])
+                                shared_audio.extend(output.audio or [])
+                                output_images.extend(output.images or [])
+                                output_videos.extend(output.videos or [])
+                                output_audio.extend(output.audio or [])
+                        else:
+                            shared_images.extend(step_output.images or [])
+                            shared_videos.extend(step_output.videos or [])
+                            shared_audio.extend(step_output.audio or [])
+                            output_images.extend(step_output.images or [])
+                            output_videos.extend(step_output.videos or [])
+                            output_audio.extend(step_output.audio or [])
 
-                    collected_step_outputs.append(step_output)
+                        collected_step_outputs.append(step_output)
 
-                    self._collect_workflow_session_state_from_agents_and_teams()
+                        self._collect_workflow_session_state_from_agents_and_teams()
+                        self._save_checkpoint(workflow_run_response, step_index=i, step_output=step_output)
 
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
@@ -544,6 +972,8 @@ class Workflow:
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
+                # The checkpoint is only needed to resume runs that did not complete
+                workflow_run_response.checkpoint = None
 
             except Exception as e:
                 import traceback
@@ -609,45 +1039,105 @@ class Workflow:
                 shared_audio: List[AudioArtifact] = execution_input.audio or []
                 output_audio: List[AudioArtifact] = (execution_input.audio or []).copy()  # Start with input audio
 
-                early_termination = False
-
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
-                    step_name = getattr(step, "name", f"step_{i + 1}")
-                    log_debug(f"Streaming step {i + 1}/{self._get_step_count()}: {step_name}")
-
-                    # Create enhanced StepInput
-                    step_input = self._create_step_input(
-                        execution_input=execution_input,
+                # Restore the outputs of the steps that completed before the run failed or was interrupted
+                checkpoint = self._start_checkpoint(execution_input, workflow_run_response)
+                collected_step_outputs.extend(
+                    self._restore_from_checkpoint(
+                        checkpoint,
                         previous_step_outputs=previous_step_outputs,
                         shared_images=shared_images,
                         shared_videos=shared_videos,
                         shared_audio=shared_audio,
+                        output_images=output_images,
+                        output_videos=output_videos,
+                        output_audio=output_audio,
+                        flatten=True,
                     )
+                )
 
-                    # Execute step with streaming and yield all events
-                    for event in step.execute_stream(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=self.session_id,
-                        user_id=self.user_id,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        workflow_run_response=workflow_run_response,
-                        step_index=i,
-                    ):
-                        # Handle events
-                        if isinstance(event, StepOutput):
-                            step_output = event
-                            collected_step_outputs.append(step_output)
+                early_termination = False
 
-                            # Update the workflow-level previous_step_outputs dictionary
-                            previous_step_outputs[step_name] = step_output
+                if self._has_step_dependencies():
+                    yield from self._run_dag_steps(
+                        execution_input=execution_input,
+                        workflow_run_response=workflow_run_response,
+                        checkpoint=checkpoint,
+                        collected_step_outputs=collected_step_outputs,
+                        output_images=output_images,
+                        output_videos=output_videos,
+                        output_audio=output_audio,
+                        stream=True,
+                        stream_intermediate_steps=stream_intermediate_steps,
+                    )
+                else:
+                    for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                        if i < checkpoint.completed_steps:
+                            continue
+                        step_name = getattr(step, "name", f"step_{i + 1}")
+                        log_debug(f"Streaming step {i + 1}/{self._get_step_count()}: {step_name}")
+
+                        # Create enhanced StepInput
+                        step_input = self._create_step_input(
+                            execution_input=execution_input,
+                            previous_step_outputs=previous_step_outputs,
+                            shared_images=shared_images,
+                            shared_videos=shared_videos,
+                            shared_audio=shared_audio,
+                        )
 
-                            # Transform StepOutput to StepOutputEvent for consistent streaming interface
-                            step_output_event = self._transform_step_output_to_event(
-                                step_output, workflow_run_response, step_index=i
+                        # Use the cached output of the step if there is one, otherwise execute it with streaming
+                        cache_key, cached_output = self._get_cached_step_output(i, step, step_input)
+                        if cached_output is not None:
+                            step_events: Iterator[Any] = iter(
+                                self._get_cached_step_events(
+                                    step, i, cached_output, workflow_run_response, stream_intermediate_steps
+                                )
+                            )
+                        else:
+                            step_events = step.execute_stream(  # type: ignore[union-attr]
+                                step_input,
+                                session_id=self.session_id,
+                                user_id=self.user_id,
+                                stream_intermediate_steps=stream_intermediate_steps,
+                                workflow_run_response=workflow_run_response,
+                                step_index=i,
                             )
 
-                            if step_output.stop:
-                                logger.info(f"Early termination requested by step {step_name}")
+                        # Yield all events of the step
+                        step_outputs: List[StepOutput] = []
+                        for event in step_events:
+                            # Handle events
+                            if isinstance(event, StepOutput):
+                                step_output = event
+                                collected_step_outputs.append(step_output)
+                                step_outputs.append(step_output)
+
+                                # Update the workflow-level previous_step_outputs dictionary
+                                previous_step_outputs[step_name] = step_output
+
+                                # Transform StepOutput to StepOutputEvent for consistent streaming interface
+                                step_output_event = self._transform_step_output_to_event(
+                                    step_output, workflow_run_response, step_index=i
+                                )
+
+                                if step_output.stop:
+                                    logger.info(f"Early termination requested by step {step_name}")
+                                    # Update shared media for next step
+                                    shared_images.extend(step_output.images or [])
+                                    shared_videos.extend(step_output.videos or [])
+                                    shared_audio.extend(step_output.audio or [])
+                                    output_images.extend(step_output.images or [])
+                                    output_videos.extend(step_output.videos or [])
+                                    output_audio.extend(step_output.audio or [])
+
+                                    # Only yield StepOutputEvent for function executors, not for agents/teams
+                                    if getattr(step, "executor_type", None) == "function":
+                                        yield step_output_event
+
+                                    # Break out of the step loop
+                                    early_termination = True
+                                    break
+
                                 # Update shared media for next step
                                 shared_images.extend(step_output.images or [])
                                 shared_videos.extend(step_output.videos or [])
@@ -656,37 +1146,25 @@ class Workflow:
                                 output_videos.extend(step_output.videos or [])
                                 output_audio.extend(step_output.audio or [])
 
-                                # Only yield StepOutputEvent for function executors, not for agents/teams
+                                # Only yield StepOutputEvent for generator functions, not for agents/teams
                                 if getattr(step, "executor_type", None) == "function":
                                     yield step_output_event
 
-                                # Break out of the step loop
-                                early_termination = True
-                                break
+                            elif isinstance(event, WorkflowRunResponseEvent):  # type: ignore
+                                yield self._handle_event(event, workflow_run_response)  # type: ignore
 
-                            # Update shared media for next step
-                            shared_images.extend(step_output.images or [])
-                            shared_videos.extend(step_output.videos or [])
-                            shared_audio.extend(step_output.audio or [])
-                            output_images.extend(step_output.images or [])
-                            output_videos.extend(step_output.videos or [])
-                            output_audio.extend(step_output.audio or [])
-
-                            # Only yield StepOutputEvent for generator functions, not for agents/teams
-                            if getattr(step, "executor_type", None) == "function":
-                                yield step_output_event
-
-                        elif isinstance(event, WorkflowRunResponseEvent):  # type: ignore
-                            yield self._handle_event(event, workflow_run_response)  # type: ignore
-
-                        else:
-                            # Yield other internal events
-                            yield event  # type: ignore
-                    # Break out of main step loop if early termination was requested
-                    if "early_termination" in locals() and early_termination:
-                        break
+                            else:
+                                # Yield other internal events
+                                yield event  # type: ignore
+                        # Break out of main step loop if early termination was requested
+                        if "early_termination" in locals() and early_termination:
+                            break
 
-                    self._collect_workflow_session_state_from_agents_and_teams()
+                        self._collect_workflow_session_state_from_agents_and_teams()
+                        if step_outputs:
+                            if cached_output is None:
+                                self._cache_step_output(cache_key, step_outputs)
+                            self._save_checkpoint(workflow_run_response, step_index=i, step_output=step_outputs)
 
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
@@ -706,6 +1184,8 @@ class Workflow:
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
+                # The checkpoint is only needed to resume runs that did not complete
+                workflow_run_response.checkpoint = None
 
             except Exception as e:
                 logger.error(f"Workflow execution failed: {e}")
@@ -837,56 +1317,90 @@ class Workflow:
                 shared_audio: List[AudioArtifact] = execution_input.audio or []
                 output_audio: List[AudioArtifact] = (execution_input.audio or []).copy()  # Start with input audio
 
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
-                    step_name = getattr(step, "name", f"step_{i + 1}")
-                    log_debug(f"Async Executing step {i + 1}/{self._get_step_count()}: {step_name}")
-
-                    # Create enhanced StepInput
-                    step_input = self._create_step_input(
-                        execution_input=execution_input,
+                # Restore the outputs of the steps that completed before the run failed or was interrupted
+                checkpoint = self._start_checkpoint(execution_input, workflow_run_response)
+                collected_step_outputs.extend(
+                    self._restore_from_checkpoint(
+                        checkpoint,
                         previous_step_outputs=previous_step_outputs,
                         shared_images=shared_images,
                         shared_videos=shared_videos,
                         shared_audio=shared_audio,
+                        output_images=output_images,
+                        output_videos=output_videos,
+                        output_audio=output_audio,
                     )
+                )
+
+                if self._has_step_dependencies():
+                    async for _ in self._arun_dag_steps(
+                        execution_input=execution_input,
+                        workflow_run_response=workflow_run_response,
+                        checkpoint=checkpoint,
+                        collected_step_outputs=collected_step_outputs,
+                        output_images=output_images,
+                        output_videos=output_videos,
+                        output_audio=output_audio,
+                    ):
+                        pass
+                else:
+                    for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                        if i < checkpoint.completed_steps:
+                            continue
+                        step_name = getattr(step, "name", f"step_{i + 1}")
+                        log_debug(f"Async Executing step {i + 1}/{self._get_step_count()}: {step_name}")
+
+                        # Create enhanced StepInput
+                        step_input = self._create_step_input(
+                            execution_input=execution_input,
+                            previous_step_outputs=previous_step_outputs,
+                            shared_images=shared_images,
+                            shared_videos=shared_videos,
+                            shared_audio=shared_audio,
+                        )
 
-                    step_output = await step.aexecute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
+                        # Use the cached output of the step if there is one
+                        cache_key, step_output = self._get_cached_step_output(i, step, step_input)
+                        if step_output is None:
+                            step_output = await step.aexecute(step_input, session_id=self.session_id, user_id=self.user_id)  # type: ignore[union-attr]
+                            self._cache_step_output(cache_key, step_output)
 
-                    # Update the workflow-level previous_step_outputs dictionary
-                    if isinstance(step_output, list):
-                        # For multiple outputs (from Loop, Condition, etc.), store the last one
-                        if step_output:
-                            previous_step_outputs[step_name] = step_output[-1]
-                            if any(output.stop for output in step_output):
+                        # Update the workflow-level previous_step_outputs dictionary
+                        if isinstance(step_output, list):
+                            # For multiple outputs (from Loop, Condition, etc.), store the last one
+                            if step_output:
+                                previous_step_outputs[step_name] = step_output[-1]
+                                if any(output.stop for output in step_output):
+                                    logger.info(f"Early termination requested by step {step_name}")
+                                    break
+                        else:
+                            # Single output
+                            previous_step_outputs[step_name] = step_output
+                            if step_output.stop:
                                 logger.info(f"Early termination requested by step {step_name}")
                                 break
-                    else:
-                        # Single output
-                        previous_step_outputs[step_name] = step_output
-                        if step_output.stop:
-                            logger.info(f"Early termination requested by step {step_name}")
-                            break
 
-                    # Update shared media for next step
-                    if isinstance(step_output, list):
-                        for output in step_output:
-                            shared_images.extend(output.images or [])
-                            shared_videos.extend(output.videos or [])
-                            shared_audio.extend(output.audio or [])
-                            output_images.extend(output.images or [])
-                            output_videos.extend(output.videos or [])
-                            output_audio.extend(output.audio or [])
-                    else:
-                        shared_images.extend(step_output.images or [])
-                        shared_videos.extend(step_output.videos or [])
-                        shared_audio.extend(step_output.audio or [])
-                        output_images.extend(step_output.images or [])
-                        output_videos.extend(step_output.videos or [])
-                        output_audio.extend(step_output.audio or [])
+                        # Update shared media for next step
+                        if isinstance(step_output, list):
+                            for output in step_output:
+                                shared_images.extend(output.images or [])
+                                shared_videos.extend(output.videos or [])
+                                shared_audio.extend(output.audio or [])
+                                output_images.extend(output.images or [])
+                                output_videos.extend(output.videos or [])
+                                output_audio.extend(output.audio or [])
+                        else:
+                            shared_images.extend(step_output.images or [])
+                            shared_videos.extend(step_output.videos or [])
+                            shared_audio.extend(step_output.audio or [])
+                            output_images.extend(step_output.images or [])
+                            output_videos.extend(step_output.videos or [])
+                            output_audio.extend(step_output.audio or [])
 
-                    collected_step_outputs.append(step_output)
+                        collected_step_outputs.append(step_output)
 
-                    self._collect_workflow_session_state_from_agents_and_teams()
+                        self._collect_workflow_session_state_from_agents_and_teams()
+                        self._save_checkpoint(workflow_run_response, step_index=i, step_output=step_output)
 
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
@@ -906,6 +1420,8 @@ class Workflow:
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
+                # The checkpoint is only needed to resume runs that did not complete
+                workflow_run_response.checkpoint = None
 
             except Exception as e:
                 logger.error(f"Workflow execution failed: {e}")
@@ -977,44 +1493,104 @@ class Workflow:
                 shared_audio: List[AudioArtifact] = execution_input.audio or []
                 output_audio: List[AudioArtifact] = (execution_input.audio or []).copy()  # Start with input audio
 
-                early_termination = False
-
-                for i, step in enumerate(self.steps):  # type: ignore[arg-type]
-                    step_name = getattr(step, "name", f"step_{i + 1}")
-                    log_debug(f"Async streaming step {i + 1}/{self._get_step_count()}: {step_name}")
-
-                    # Create enhanced StepInput
-                    step_input = self._create_step_input(
-                        execution_input=execution_input,
+                # Restore the outputs of the steps that completed before the run failed or was interrupted
+                checkpoint = self._start_checkpoint(execution_input, workflow_run_response)
+                collected_step_outputs.extend(
+                    self._restore_from_checkpoint(
+                        checkpoint,
                         previous_step_outputs=previous_step_outputs,
                         shared_images=shared_images,
                         shared_videos=shared_videos,
                         shared_audio=shared_audio,
+                        output_images=output_images,
+                        output_videos=output_videos,
+                        output_audio=output_audio,
+                        flatten=True,
                     )
+                )
 
-                    # Execute step with streaming and yield all events
-                    async for event in step.aexecute_stream(  # type: ignore[union-attr]
-                        step_input,
-                        session_id=self.session_id,
-                        user_id=self.user_id,
-                        stream_intermediate_steps=stream_intermediate_steps,
+                early_termination = False
+
+                if self._has_step_dependencies():
+                    async for event in self._arun_dag_steps(
+                        execution_input=execution_input,
                         workflow_run_response=workflow_run_response,
-                        step_index=i,
+                        checkpoint=checkpoint,
+                        collected_step_outputs=collected_step_outputs,
+                        output_images=output_images,
+                        output_videos=output_videos,
+                        output_audio=output_audio,
+                        stream=True,
+                        stream_intermediate_steps=stream_intermediate_steps,
                     ):
-                        if isinstance(event, StepOutput):
-                            step_output = event
-                            collected_step_outputs.append(step_output)
-
-                            # Update the workflow-level previous_step_outputs dictionary
-                            previous_step_outputs[step_name] = step_output
+                        yield event
+                else:
+                    for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                        if i < checkpoint.completed_steps:
+                            continue
+                        step_name = getattr(step, "name", f"step_{i + 1}")
+                        log_debug(f"Async streaming step {i + 1}/{self._get_step_count()}: {step_name}")
+
+                        # Create enhanced StepInput
+                        step_input = self._create_step_input(
+                            execution_input=execution_input,
+                            previous_step_outputs=previous_step_outputs,
+                            shared_images=shared_images,
+                            shared_videos=shared_videos,
+                            shared_audio=shared_audio,
+                        )
 
-                            # Transform StepOutput to StepOutputEvent for consistent streaming interface
-                            step_output_event = self._transform_step_output_to_event(
-                                step_output, workflow_run_response, step_index=i
+                        # Use the cached output of the step if there is one, otherwise execute it with streaming
+                        cache_key, cached_output = self._get_cached_step_output(i, step, step_input)
+                        if cached_output is not None:
+                            step_events: AsyncIterator[Any] = aiter_events(
+                                self._get_cached_step_events(
+                                    step, i, cached_output, workflow_run_response, stream_intermediate_steps
+                                )
+                            )
+                        else:
+                            step_events = step.aexecute_stream(  # type: ignore[union-attr]
+                                step_input,
+                                session_id=self.session_id,
+                                user_id=self.user_id,
+                                stream_intermediate_steps=stream_intermediate_steps,
+                                workflow_run_response=workflow_run_response,
+                                step_index=i,
                             )
 
-                            if step_output.stop:
-                                logger.info(f"Early termination requested by step {step_name}")
+                        # Yield all events of the step
+                        step_outputs: List[StepOutput] = []
+                        async for event in step_events:
+                            if isinstance(event, StepOutput):
+                                step_output = event
+                                collected_step_outputs.append(step_output)
+                                step_outputs.append(step_output)
+
+                                # Update the workflow-level previous_step_outputs dictionary
+                                previous_step_outputs[step_name] = step_output
+
+                                # Transform StepOutput to StepOutputEvent for consistent streaming interface
+                                step_output_event = self._transform_step_output_to_event(
+                                    step_output, workflow_run_response, step_index=i
+                                )
+
+                                if step_output.stop:
+                                    logger.info(f"Early termination requested by step {step_name}")
+                                    # Update shared media for next step
+                                    shared_images.extend(step_output.images or [])
+                                    shared_videos.extend(step_output.videos or [])
+                                    shared_audio.extend(step_output.audio or [])
+                                    output_images.extend(step_output.images or [])
+                                    output_videos.extend(step_output.videos or [])
+                                    output_audio.extend(step_output.audio or [])
+
+                                    if getattr(step, "executor_type", None) == "function":
+                                        yield step_output_event
+
+                                    # Break out of the step loop
+                                    early_termination = True
+                                    break
+
                                 # Update shared media for next step
                                 shared_images.extend(step_output.images or [])
                                 shared_videos.extend(step_output.videos or [])
@@ -1023,37 +1599,26 @@ class Workflow:
                                 output_videos.extend(step_output.videos or [])
                                 output_audio.extend(step_output.audio or [])
 
+                                # Only yield StepOutputEvent for generator functions, not for agents/teams
                                 if getattr(step, "executor_type", None) == "function":
                                     yield step_output_event
 
-                                # Break out of the step loop
-                                early_termination = True
-                                break
+                            elif isinstance(event, WorkflowRunResponseEvent):  # type: ignore
+                                yield self._handle_event(event, workflow_run_response)  # type: ignore
 
-                            # Update shared media for next step
-                            shared_images.extend(step_output.images or [])
-                            shared_videos.extend(step_output.videos or [])
-                            shared_audio.extend(step_output.audio or [])
-                            output_images.extend(step_output.images or [])
-                            output_videos.extend(step_output.videos or [])
-                            output_audio.extend(step_output.audio or [])
-
-                            # Only yield StepOutputEvent for generator functions, not for agents/teams
-                            if getattr(step, "executor_type", None) == "function":
-                                yield step_output_event
-
-                        elif isinstance(event, WorkflowRunResponseEvent):  # type: ignore
-                            yield self._handle_event(event, workflow_run_response)  # type: ignore
-
-                        else:
-                            # Yield other internal events
-                            yield event  # type: ignore
+                            else:
+                                # Yield other internal events
+                                yield event  # type: ignore
 
-                    # Break out of main step loop if early termination was requested
-                    if "early_termination" in locals() and early_termination:
-                        break
+                        # Break out of main step loop if early termination was requested
+                        if "early_termination" in locals() and early_termination:
+                            break
 
-                    self._collect_workflow_session_state_from_agents_and_teams()
+                        self._collect_workflow_session_state_from_agents_and_teams()
+                        if step_outputs:
+                            if cached_output is None:
+                                self._cache_step_output(cache_key, step_outputs)
+                            self._save_checkpoint(workflow_run_response, step_index=i, step_output=step_outputs)
 
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
@@ -1073,6 +1638,8 @@ class Workflow:
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
                 workflow_run_response.status = RunStatus.completed
+                # The checkpoint is only needed to resume runs that did not complete
+                workflow_run_response.checkpoint = None
 
             except Exception as e:
                 logger.error(f"Workflow execution failed: {e}")
@@ -1204,15 +1771,15 @@ class Workflow:
         return workflow_run_response
 
     def get_run(self, run_id: str) -> Optional[WorkflowRunResponse]:
-        """Get the status and details of a background workflow run - SIMPLIFIED"""
+        """Get the status and details of a workflow run, e.g. a background run"""
         if self.storage is not None and self.session_id is not None:
-            session = self.storage.read(session_id=self.session_id)
-            if session and isinstance(session, WorkflowSessionV2) and session.runs:
-                # Find the run by ID
-                for run in session.runs:
-                    if run.run_id == run_id:
-                        return run
+            # Read from storage, as the run may be updated by another process
+            run = self.storage.read_workflow_run(session_id=self.session_id, run_id=run_id)
+            if run is not None:
+                return run
 
+        if self.workflow_session is not None:
+            return self.workflow_session.get_run(run_id)
         return None
 
     @overload
@@ -1457,6 +2024,105 @@ class Workflow:
         else:
             return await self._aexecute(execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs)
 
+    def _prepare_resume(
+        self, run_id: Optional[str], workflow_run_response: Optional[WorkflowRunResponse]
+    ) -> WorkflowRunResponse:
+        """Load the run to resume and prepare the workflow to continue it"""
+        if workflow_run_response is None:
+            if run_id is None and self.run_response is not None:
+                workflow_run_response = self.run_response
+            elif run_id is not None:
+                if self.run_response is not None and self.run_response.run_id == run_id:
+                    workflow_run_response = self.run_response
+                else:
+                    self.load_session()
+                    workflow_run_response = self.get_run(run_id)
+        if workflow_run_response is None:
+            raise ValueError(f"Workflow run {run_id} not found")
+        if workflow_run_response.status != RunStatus.completed and workflow_run_response.checkpoint is None:
+            raise ValueError(f"Workflow run {workflow_run_response.run_id} has no checkpoint to resume from")
+
+        self.run_id = workflow_run_response.run_id
+        if workflow_run_response.session_id is not None:
+            self.session_id = workflow_run_response.session_id
+        if self.session_id is None:
+            self.session_id = str(uuid4())
+
+        self.initialize_workflow()
+        self.load_session()
+        self._prepare_steps()
+        self.run_response = workflow_run_response
+        self.update_agents_and_teams_session_info()
+        return workflow_run_response
+
+    def resume(
+        self,
+        run_id: Optional[str] = None,
+        workflow_run_response: Optional[WorkflowRunResponse] = None,
+        stream: bool = False,
+        stream_intermediate_steps: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Union[WorkflowRunResponse, Iterator[WorkflowRunResponseEvent]]:
+        """Resume a failed or interrupted run from the step after the last completed step.
+
+        The run is read from storage by `run_id`, or the last run of this workflow is resumed if no run is given.
+        Completed runs are returned as is.
+        """
+        self._set_debug()
+
+        workflow_run_response = self._prepare_resume(run_id=run_id, workflow_run_response=workflow_run_response)
+        if workflow_run_response.status == RunStatus.completed:
+            return workflow_run_response
+
+        stream = stream or self.stream or False
+        stream_intermediate_steps = (stream_intermediate_steps or self.stream_intermediate_steps or False) and stream
+
+        checkpoint: WorkflowCheckpoint = workflow_run_response.checkpoint  # type: ignore[assignment]
+        log_debug(f"Workflow Resume: {self.name}, run {self.run_id} from step {checkpoint.completed_steps + 1}")
+        inputs = WorkflowExecutionInput.from_dict(checkpoint.execution_input or {})
+
+        if stream:
+            return self._execute_stream(
+                execution_input=inputs,
+                workflow_run_response=workflow_run_response,
+                stream_intermediate_steps=stream_intermediate_steps,
+                **kwargs,
+            )
+        else:
+            return self._execute(execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs)
+
+    async def aresume(
+        self,
+        run_id: Optional[str] = None,
+        workflow_run_response: Optional[WorkflowRunResponse] = None,
+        stream: bool = False,
+        stream_intermediate_steps: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Union[WorkflowRunResponse, AsyncIterator[WorkflowRunResponseEvent]]:
+        """Resume a failed or interrupted run asynchronously, see resume()"""
+        self._set_debug()
+
+        workflow_run_response = self._prepare_resume(run_id=run_id, workflow_run_response=workflow_run_response)
+        if workflow_run_response.status == RunStatus.completed:
+            return workflow_run_response
+
+        stream = stream or self.stream or False
+        stream_intermediate_steps = (stream_intermediate_steps or self.stream_intermediate_steps or False) and stream
+
+        checkpoint: WorkflowCheckpoint = workflow_run_response.checkpoint  # type: ignore[assignment]
+        log_debug(f"Async Workflow Resume: {self.name}, run {self.run_id} from step {checkpoint.completed_steps + 1}")
+        inputs = WorkflowExecutionInput.from_dict(checkpoint.execution_input or {})
+
+        if stream:
+            return self._aexecute_stream(
+                execution_input=inputs,
+                workflow_run_response=workflow_run_response,
+                stream_intermediate_steps=stream_intermediate_steps,
+                **kwargs,
+            )
+        else:
+            return await self._aexecute(execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs)
+
     def _prepare_steps(self):
         """Prepare the steps for execution"""
         if not callable(self.steps) and self.steps is not None:
@@ -1507,6 +2173,15 @@ class Workflow:
         if self.session_id is None:
             raise ValueError("Session ID is required")
 
+        if self.workflow_session is not None and self.workflow_session.session_id == self.session_id:
+            # Update the session in place, so its run index and unsaved runs are kept
+            self.workflow_session.user_id = self.user_id
+            self.workflow_session.workflow_id = self.workflow_id
+            self.workflow_session.workflow_name = self.name
+            self.workflow_session.workflow_data = workflow_data
+            self.workflow_session.session_data = {}
+            return self.workflow_session
+
         return WorkflowSessionV2(
             session_id=self.session_id,
             user_id=self.user_id,
@@ -1529,12 +2204,14 @@ class Workflow:
             self.name = session.workflow_name
 
         self.workflow_session = session
+        self._trim_runs_in_memory()
         log_debug(f"Loaded WorkflowSessionV2: {session.session_id}")
 
     def read_from_storage(self) -> Optional[WorkflowSessionV2]:
         """Load the WorkflowSessionV2 from storage"""
         if self.storage is not None and self.session_id is not None:
-            session = self.storage.read(session_id=self.session_id)
+            max_runs = self.max_runs_in_memory if self.storage.stores_runs_separately else None
+            session = self.storage.read_workflow_session(session_id=self.session_id, max_runs=max_runs)
             if session and isinstance(session, WorkflowSessionV2):
                 self.load_workflow_session(session)
                 return session
@@ -1547,6 +2224,7 @@ class Workflow:
             saved_session = self.storage.upsert(session=session_to_save)
             if saved_session and isinstance(saved_session, WorkflowSessionV2):
                 self.workflow_session = saved_session
+                self._trim_runs_in_memory()
                 return saved_session
         return None
 
@@ -3225,8 +3903,24 @@ class Workflow:
     def _save_run_to_storage(self, workflow_run_response: WorkflowRunResponse) -> None:
         """Helper method to save workflow run response to storage"""
         if self.workflow_session:
-            self.workflow_session.upsert_run(workflow_run_response)
-            self.write_to_storage()
+            if self.storage is not None:
+                self.storage.upsert_workflow_run(self.workflow_session, workflow_run_response)
+                self._trim_runs_in_memory()
+            else:
+                self.workflow_session.upsert_run(workflow_run_response)
+
+    def _trim_runs_in_memory(self) -> None:
+        """Drop the oldest finished runs from memory, if the storage can read them back one by one"""
+        if (
+            self.max_runs_in_memory is None
+            or self.workflow_session is None
+            or self.storage is None
+            or not self.storage.stores_runs_separately
+        ):
+            return
+        removed = self.workflow_session.trim_runs(self.max_runs_in_memory)
+        if removed:
+            log_debug(f"Removed {removed} runs from memory, they can be read from storage with get_run()")
 
     def update_agents_and_teams_session_info(self):
         """Update agents and teams with workflow session information"""
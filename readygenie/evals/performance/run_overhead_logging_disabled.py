@@ -0,0 +1,67 @@
+"""Measure the per-run framework overhead of an Agent with debug logging disabled.
+
+The model returns a canned response without any network I/O, so the measured time is spent entirely in the
+framework: building messages, formatting, tool setup, logging and metrics. Run with `--debug` to compare
+against a run with debug logging enabled.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator
+
+from globalgenie.agent import Agent
+from globalgenie.eval.performance import PerformanceEval
+from globalgenie.models.base import Model
+from globalgenie.models.message import Message
+from globalgenie.models.response import ModelResponse
+from globalgenie.tools.calculator import CalculatorTools
+
+
+@dataclass
+class EchoModel(Model):
+    """Model that replies with a fixed message, without calling a provider"""
+
+    id: str = "echo"
+    name: str = "EchoModel"
+    provider: str = "Echo"
+
+    def invoke(self, *args, **kwargs) -> Any:
+        return "The capital of France is Paris."
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        return self.invoke()
+
+    def invoke_stream(self, *args, **kwargs) -> Iterator[Any]:
+        yield self.invoke()
+
+    async def ainvoke_stream(self, *args, **kwargs) -> AsyncIterator[Any]:  # type: ignore
+        yield self.invoke()
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+
+agent = Agent(
+    model=EchoModel(),
+    tools=[CalculatorTools(add=True, subtract=True, multiply=True, divide=True)],
+    system_message="Be concise, reply with one sentence.",
+    add_history_to_messages=True,
+    num_history_runs=5,
+    debug_mode="--debug" in sys.argv,
+    telemetry=False,
+)
+
+
+def run_agent():
+    return agent.run(Message(role="user", content="What is the capital of France?"))
+
+
+run_overhead_perf = PerformanceEval(
+    name="Run Overhead (debug logging disabled)", func=run_agent, num_iterations=200, warmup_runs=10
+)
+
+if __name__ == "__main__":
+    run_overhead_perf.run(print_results=True, print_summary=True)